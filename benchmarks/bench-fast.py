@@ -0,0 +1,66 @@
+##
+# benchmarks/bench-fast.py
+#   pytibrv.fast (unchecked) vs pytibrv.msg/tport (checked)
+#
+#   python benchmarks/bench-fast.py [loops]
+#
+import sys
+import timeit
+
+from pytibrv.api import *
+from pytibrv.status import *
+from pytibrv.msg import *
+from pytibrv.tport import *
+import pytibrv.fast as fast
+
+
+def bench(name: str, func, loops: int) -> float:
+    t = min(timeit.repeat(func, number=loops, repeat=3))
+    usec = t / loops * 1e6
+    print('{:<32s} {:10.3f} usec/op'.format(name, usec))
+    return usec
+
+
+def main(loops: int):
+    status = tibrv_Open()
+    assert TIBRV_OK == status, tibrvStatus_GetText(status)
+
+    status, tx = tibrvTransport_Create(None, None, None)
+    assert TIBRV_OK == status, tibrvStatus_GetText(status)
+
+    status, msg = tibrvMsg_Create()
+    tibrvMsg_SetSendSubject(msg, 'BENCH.FAST')
+    tibrvMsg_AddF64(msg, 'price', 100.25)
+    tibrvMsg_AddI32(msg, 'size', 1000)
+    tibrvMsg_AddString(msg, 'symbol', 'TEST')
+
+    rows = [
+        ('UpdateF64',
+         lambda: tibrvMsg_UpdateF64(msg, 'price', 100.5),
+         lambda: fast.tibrvMsg_UpdateF64(msg, b'price', 100.5, 0)),
+        ('GetF64',
+         lambda: tibrvMsg_GetF64(msg, 'price'),
+         lambda: fast.tibrvMsg_GetF64(msg, b'price')),
+        ('GetI32',
+         lambda: tibrvMsg_GetI32(msg, 'size'),
+         lambda: fast.tibrvMsg_GetI32(msg, b'size')),
+        ('GetString',
+         lambda: tibrvMsg_GetString(msg, 'symbol'),
+         lambda: fast.tibrvMsg_GetString(msg, b'symbol')),
+        ('Send',
+         lambda: tibrvTransport_Send(tx, msg),
+         lambda: fast.tibrvTransport_Send(tx, msg)),
+    ]
+
+    for name, checked, unchecked in rows:
+        t1 = bench(name + ' checked', checked, loops)
+        t2 = bench(name + ' fast', unchecked, loops)
+        print('{:<32s} {:10.3f} usec/op saved, {:.2f}x'.format(name, t1 - t2, t1 / t2))
+
+    tibrvMsg_Destroy(msg)
+    tibrvTransport_Destroy(tx)
+    tibrv_Close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
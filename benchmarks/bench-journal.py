@@ -0,0 +1,90 @@
+##
+# benchmarks/bench-journal.py
+#   TibrvJournalWriter throughput vs ConvertToString dump, and reader scan
+#
+#   python benchmarks/bench-journal.py [records]
+#
+import os
+import sys
+import time
+import tempfile
+
+from pytibrv.Tibrv import *
+from pytibrv.journal import *
+
+
+def report(name: str, n: int, nbytes: int, t: float):
+    print('{:<24s} {:10.0f} msgs/s {:10.1f} MB/s {:8.3f} usec/op'.format(
+          name, n / t, nbytes / t / 1e6, t / n * 1e6))
+
+
+def main(n: int):
+    status = Tibrv.open()
+    assert TIBRV_OK == status, TibrvStatus.text(status)
+
+    msg = TibrvMsg.create()
+    msg.sendSubject = 'BENCH.JOURNAL.IBM'
+    msg.setStr('symbol', 'IBM')
+    msg.setF64('price', 100.25)
+    msg.setI32('size', 1000)
+    msg.setF64('curve', [0.01 * x for x in range(32)])
+
+    with tempfile.TemporaryDirectory() as path:
+
+        # text dump, as tibrvlisten
+        fn = os.path.join(path, 'dump.txt')
+        t = time.perf_counter()
+        with open(fn, 'w') as f:
+            for x in range(n):
+                msg.setI32('seq', x)
+                f.write(str(msg))
+                f.write('\n')
+        t = time.perf_counter() - t
+        report('ConvertToString dump', n, os.path.getsize(fn), t)
+
+        # journal, TibrvMsg
+        jw = TibrvJournalWriter()
+        jw.open(os.path.join(path, 'msg'))
+        t = time.perf_counter()
+        for x in range(n):
+            msg.setI32('seq', x)
+            jw.append(msg)
+        t = time.perf_counter() - t
+        report('journal append(msg)', n, jw.stats()['bytes'], t)
+        jw.close()
+
+        # journal, raw bytes
+        data = bytes(msg)
+        jw = TibrvJournalWriter()
+        jw.open(os.path.join(path, 'raw'))
+        t = time.perf_counter()
+        for x in range(n):
+            jw.write(data, 'BENCH.JOURNAL.IBM')
+        t = time.perf_counter() - t
+        report('journal write(bytes)', n, jw.stats()['bytes'], t)
+        jw.close()
+
+        # reader, zero-copy scan
+        jr = TibrvJournalReader()
+        jr.open(os.path.join(path, 'msg'))
+        t = time.perf_counter()
+        nbytes = 0
+        for rec in jr.read():
+            nbytes = nbytes + len(rec.data)
+        t = time.perf_counter() - t
+        report('journal read()', jr.count(), nbytes, t)
+
+        t = time.perf_counter()
+        cnt = sum(1 for rec in jr.read(subject='BENCH.JOURNAL.IBM'))
+        t = time.perf_counter() - t
+        report('journal read(subject)', cnt, nbytes, t)
+
+        del rec
+        jr.close()
+
+    msg.destroy()
+    Tibrv.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,65 @@
+##
+# benchmarks/bench-pool.py
+#   TibrvMsgPool vs TibrvMsg.create()/destroy() in send loop
+#
+#   python benchmarks/bench-pool.py [loops]
+#
+import sys
+import timeit
+
+from pytibrv.Tibrv import *
+
+
+def bench(name: str, func, loops: int) -> float:
+    t = min(timeit.repeat(func, number=loops, repeat=3))
+    usec = t / loops * 1e6
+    print('{:<24s} {:10.3f} usec/op'.format(name, usec))
+    return usec
+
+
+def main(loops: int):
+    status = Tibrv.open()
+    assert TIBRV_OK == status, TibrvStatus.text(status)
+
+    tx = TibrvTx()
+    status = tx.create(None, None, None)
+    assert TIBRV_OK == status, TibrvStatus.text(status)
+
+    pool = TibrvMsgPool(16)
+
+    def unpooled():
+        msg = TibrvMsg.create()
+        msg.setStr('symbol', 'TEST')
+        msg.setF64('price', 100.25)
+        msg.setI32('size', 1000)
+        tx.send(msg, 'BENCH.POOL')
+        msg.destroy()
+
+    def pooled_with():
+        with pool.message() as msg:
+            msg.setStr('symbol', 'TEST')
+            msg.setF64('price', 100.25)
+            msg.setI32('size', 1000)
+            tx.send(msg, 'BENCH.POOL')
+
+    def pooled_acquire():
+        msg = pool.acquire()
+        msg.setStr('symbol', 'TEST')
+        msg.setF64('price', 100.25)
+        msg.setI32('size', 1000)
+        tx.send(msg, 'BENCH.POOL')
+
+    t1 = bench('create/destroy', unpooled, loops)
+    t2 = bench('pool.message()', pooled_with, loops)
+    t3 = bench('pool.acquire()', pooled_acquire, loops)
+
+    print('speedup with {:.2f}x, acquire {:.2f}x'.format(t1 / t2, t1 / t3))
+    print('pool', pool.stats())
+
+    pool.destroy()
+    tx.destroy()
+    Tibrv.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,94 @@
+##
+# benchmarks/bench-schema.py
+#   @tibrv_message codec vs TibrvMsg.addXXX/getXXX
+#
+#   python benchmarks/bench-schema.py [loops]
+#
+import sys
+import timeit
+
+from pytibrv.Tibrv import *
+
+
+@tibrv_message
+class Quote:
+    symbol: tibrv_str
+    bid: tibrv_f64
+    ask: tibrv_f64
+    bidSize: tibrv_i32
+    askSize: tibrv_i32
+    last: tibrv_f64
+    volume: tibrv_i64
+    seq: tibrv_u32
+
+
+def encode_fields(q: Quote) -> TibrvMsg:
+    msg = TibrvMsg.create()
+    msg.addStr('symbol', q.symbol)
+    msg.addF64('bid', q.bid)
+    msg.addF64('ask', q.ask)
+    msg.addI32('bidSize', q.bidSize)
+    msg.addI32('askSize', q.askSize)
+    msg.addF64('last', q.last)
+    msg.addI64('volume', q.volume)
+    msg.addU32('seq', q.seq)
+    return msg
+
+
+def decode_fields(msg: TibrvMsg) -> Quote:
+    q = Quote()
+    q.symbol = msg.getStr('symbol')
+    q.bid = msg.getF64('bid')
+    q.ask = msg.getF64('ask')
+    q.bidSize = msg.getI32('bidSize')
+    q.askSize = msg.getI32('askSize')
+    q.last = msg.getF64('last')
+    q.volume = msg.getI64('volume')
+    q.seq = msg.getU32('seq')
+    return q
+
+
+def encode_schema(q: Quote) -> TibrvMsg:
+    return Quote.encode(q)
+
+
+def decode_schema(msg: TibrvMsg) -> Quote:
+    return Quote.decode(msg)
+
+
+def bench(name: str, func, loops: int) -> float:
+    t = min(timeit.repeat(func, number=loops, repeat=3))
+    usec = t / loops * 1e6
+    print('{:<24s} {:10.3f} usec/op'.format(name, usec))
+    return usec
+
+
+def main(loops: int):
+    status = Tibrv.open()
+    assert TIBRV_OK == status, TibrvStatus.text(status)
+
+    q = Quote()
+    q.symbol = 'TEST'
+    q.bid = 100.25
+    q.ask = 100.50
+    q.bidSize = 1000
+    q.askSize = 2000
+    q.last = 100.375
+    q.volume = 123456789
+    q.seq = 1
+
+    msg = encode_schema(q)
+
+    e1 = bench('encode TibrvMsg.addXXX', lambda: encode_fields(q).destroy(), loops)
+    e2 = bench('encode @tibrv_message', lambda: encode_schema(q).destroy(), loops)
+    d1 = bench('decode TibrvMsg.getXXX', lambda: decode_fields(msg), loops)
+    d2 = bench('decode @tibrv_message', lambda: decode_schema(msg), loops)
+
+    print('encode speedup {:.2f}x, decode speedup {:.2f}x'.format(e1 / e2, d1 / d2))
+
+    msg.destroy()
+    Tibrv.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
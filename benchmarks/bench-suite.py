@@ -0,0 +1,498 @@
+##
+# benchmarks/bench-suite.py
+#   cost of each layer, side by side
+#
+#   c       : C function by ctypes (_rv), arguments prepared by caller
+#   api     : pytibrv.api, tibrvMsg_XXX
+#   object  : pytibrv.Tibrv, TibrvMsg
+#
+#   python benchmarks/bench-suite.py [-n loops] [-k filter] [-o result.json] [-c base.json]
+#
+#   -o : save result as JSON, to compare over time
+#   -c : compare with saved result, ratio > 1.0 is faster than base
+#
+#   ops/sec   : best of 3 repeats
+#   peakBytes : max Python heap allocated in one call (tracemalloc)
+#   netBlocks : Python memory blocks not freed after call, should be 0
+#               (dispatch : per send + dispatch cycle)
+#
+#   PYTIBRV_BACKEND=memory to run without TIBRV
+#
+import sys
+import gc
+import json
+import time
+import ctypes
+import platform
+import argparse
+import tracemalloc
+
+import pytibrv
+from pytibrv.api import *
+from pytibrv.status import *
+from pytibrv.msg import *
+from pytibrv.tport import *
+from pytibrv.queue import *
+from pytibrv.events import *
+from pytibrv.Tibrv import *
+from pytibrv.api import _rv, _c_tibrvMsg, _c_tibrvEvent, _c_tibrvEventCallback, \
+                        _c_tibrv_i8, _c_tibrv_u8, _c_tibrv_i16, _c_tibrv_u16, \
+                        _c_tibrv_i32, _c_tibrv_u32, _c_tibrv_i64, _c_tibrv_u64, \
+                        _c_tibrv_f32, _c_tibrv_f64, _c_tibrv_str, _c_tibrv_f64_p
+from pytibrv.msg import _c_tibrvMsgField
+
+LAYERS = ('c', 'api', 'object')
+
+byref = ctypes.byref
+
+
+##-----------------------------------------------------------------------------
+# Measure
+##-----------------------------------------------------------------------------
+def measure(func, loops: int, repeat: int = 3) -> float:
+    # seconds per call, best of repeat
+    best = None
+    for r in range(repeat):
+        t = time.perf_counter()
+        for x in range(loops):
+            func()
+        t = time.perf_counter() - t
+        if best is None or t < best:
+            best = t
+
+    return best / loops
+
+
+def allocs(func, loops: int, prepare = None) -> (int, float):
+    # peak bytes in one call, net blocks per call
+    # prepare(n) : queue n events for func, not in peakBytes,
+    #              netBlocks is per prepare + func cycle, events are freed by func
+    n1 = min(loops, 100)
+    n2 = min(loops, 1000)
+
+    if prepare is not None:
+        prepare(1)
+    func()
+    gc.collect()
+
+    if prepare is not None:
+        prepare(n1)
+
+    tracemalloc.start()
+    peak = 0
+    for x in range(n1):
+        cur = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func()
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - cur)
+    tracemalloc.stop()
+
+    # cycles are not leaks, collect before count
+    gc.collect()
+    b = sys.getallocatedblocks()
+    if prepare is not None:
+        prepare(n2)
+    for x in range(n2):
+        func()
+    gc.collect()
+    net = (sys.getallocatedblocks() - b) / n2
+
+    return peak, net
+
+
+##-----------------------------------------------------------------------------
+# Cases
+#   case(loops) -> dict(layer: func), func is called loops times
+#   or dict(layer: (prepare, func)), prepare(n) queue n events before func is called n times
+#   objects created by case are kept in Env, destroyed by Env.close()
+##-----------------------------------------------------------------------------
+SCALARS = [
+    # type, value, c type
+    ('I8',  -8,     _c_tibrv_i8),
+    ('U8',  8,      _c_tibrv_u8),
+    ('I16', -16,    _c_tibrv_i16),
+    ('U16', 16,     _c_tibrv_u16),
+    ('I32', -32,    _c_tibrv_i32),
+    ('U32', 32,     _c_tibrv_u32),
+    ('I64', -64,    _c_tibrv_i64),
+    ('U64', 64,     _c_tibrv_u64),
+    ('F32', 32.5,   _c_tibrv_f32),
+    ('F64', 64.5,   _c_tibrv_f64),
+]
+
+ARRAYS = [1, 16, 256, 4096]
+
+
+class Env:
+    # objects shared by cases, one per layer
+
+    def __init__(self):
+        status, self.msg = tibrvMsg_Create()
+        self.obj = TibrvMsg.create()
+
+        status, self.tx = tibrvTransport_Create(None, None, None)
+        if status != TIBRV_OK:
+            # no rvd, intra-process transport
+            self.tx = TIBRV_PROCESS_TRANSPORT
+        self.txobj = TibrvTx(self.tx)
+
+        self.ques = []
+        self.msgs = []              # tibrvMsg
+        self.events = []            # tibrvEvent
+        self.objs = []              # TibrvMsg, TibrvListener
+        self.cbs = []               # C callbacks, keep until events destroyed
+
+    def queue(self) -> int:
+        status, que = tibrvQueue_Create()
+        self.ques.append(que)
+        return que
+
+    def close(self):
+        for ev in self.events:
+            tibrvEvent_Destroy(ev)
+        for obj in reversed(self.objs):
+            obj.destroy()
+        for msg in self.msgs:
+            tibrvMsg_Destroy(msg)
+        for que in self.ques:
+            tibrvQueue_Destroy(que)
+        tibrvMsg_Destroy(self.msg)
+        self.obj.destroy()
+        if self.tx != TIBRV_PROCESS_TRANSPORT:
+            tibrvTransport_Destroy(self.tx)
+
+
+def case_create(env: Env) -> dict:
+
+    def c():
+        m = _c_tibrvMsg(0)
+        _rv.tibrvMsg_Create(byref(m))
+        _rv.tibrvMsg_Destroy(m)
+
+    def api():
+        status, m = tibrvMsg_Create()
+        tibrvMsg_Destroy(m)
+
+    def obj():
+        TibrvMsg.create().destroy()
+
+    return dict(c=c, api=api, object=obj)
+
+
+def case_scalar(env: Env, t: str, value, c_type, get: bool) -> dict:
+
+    name = t
+    bname = name.encode()
+    msg = env.msg
+    m = env.obj
+
+    c_update = getattr(_rv, 'tibrvMsg_Update' + t + 'Ex')
+    c_get = getattr(_rv, 'tibrvMsg_Get' + t + 'Ex')
+    api_update = globals()['tibrvMsg_Update' + t]
+    api_get = globals()['tibrvMsg_Get' + t]
+    obj_set = getattr(m, 'set' + t)
+    obj_get = getattr(m, 'get' + t)
+
+    api_update(msg, name, value)
+    obj_set(name, value)
+
+    if not get:
+        return dict(c=lambda: c_update(msg, bname, value, 0),
+                    api=lambda: api_update(msg, name, value),
+                    object=lambda: obj_set(name, value))
+
+    def c():
+        v = c_type()
+        c_get(msg, bname, byref(v), 0)
+        return v.value
+
+    return dict(c=c,
+                api=lambda: api_get(msg, name),
+                object=lambda: obj_get(name))
+
+
+def case_string(env: Env, codepage: str, get: bool) -> dict:
+
+    msg = env.msg
+    m = env.obj
+    value = '中文 TEST' if codepage is not None else 'ASCII TEST'
+    raw = value.encode(codepage or 'utf-8')
+
+    tibrvMsg_UpdateString(msg, 'STR', value, codepage=codepage)
+    m.setStr('STR', value, codepage=codepage)
+
+    if not get:
+        return dict(c=lambda: _rv.tibrvMsg_UpdateStringEx(msg, b'STR', value.encode(codepage or 'utf-8'), 0),
+                    api=lambda: tibrvMsg_UpdateString(msg, 'STR', value, codepage=codepage),
+                    object=lambda: m.setStr('STR', value, codepage=codepage))
+
+    def c():
+        v = _c_tibrv_str()
+        _rv.tibrvMsg_GetStringEx(msg, b'STR', byref(v), 0)
+        return v.value.decode(codepage or 'utf-8')
+
+    return dict(c=c,
+                api=lambda: tibrvMsg_GetString(msg, 'STR', codepage=codepage),
+                object=lambda: m.getStr('STR', codepage=codepage))
+
+
+def case_array(env: Env, size: int, get: bool) -> dict:
+
+    msg = env.msg
+    m = env.obj
+    data = [x * 0.5 for x in range(size)]
+    arr = (ctypes.c_double * size)(*data)
+
+    tibrvMsg_UpdateF64Array(msg, 'ARR', data)
+    m.setF64('ARR', data)
+
+    if not get:
+        return dict(c=lambda: _rv.tibrvMsg_UpdateF64ArrayEx(msg, b'ARR', arr, size, 0),
+                    api=lambda: tibrvMsg_UpdateF64Array(msg, 'ARR', data),
+                    object=lambda: m.setF64('ARR', data))
+
+    def c():
+        p = _c_tibrv_f64_p()
+        n = _c_tibrv_u32()
+        _rv.tibrvMsg_GetF64ArrayEx(msg, b'ARR', byref(p), byref(n), 0)
+        return p[:n.value]
+
+    return dict(c=c,
+                api=lambda: tibrvMsg_GetF64Array(msg, 'ARR'),
+                object=lambda: m.listF64('ARR'))
+
+
+def case_array_view(env: Env, size: int) -> dict:
+
+    msg = env.msg
+    m = env.obj
+    data = [x * 0.5 for x in range(size)]
+
+    tibrvMsg_UpdateF64Array(msg, 'ARR', data)
+    m.setF64('ARR', data)
+
+    def c():
+        p = _c_tibrv_f64_p()
+        n = _c_tibrv_u32()
+        _rv.tibrvMsg_GetF64ArrayEx(msg, b'ARR', byref(p), byref(n), 0)
+        return (ctypes.c_double * n.value).from_address(ctypes.addressof(p.contents))
+
+    def obj():
+        # views are released with message
+        ret = m.listF64('ARR', as_array=True)
+        m._release()
+        return ret
+
+    return dict(c=c,
+                api=lambda: tibrvMsg_GetF64ArrayView(msg, 'ARR'),
+                object=obj)
+
+
+def case_walk(env: Env, fields: int) -> dict:
+
+    status, msg = tibrvMsg_Create()
+    m = TibrvMsg.create()
+    env.msgs.append(msg)
+    env.objs.append(m)
+    for x in range(fields):
+        tibrvMsg_AddI32(msg, 'F{}'.format(x), x)
+        m.addI32('F{}'.format(x), x)
+
+    def c():
+        fld = _c_tibrvMsgField()
+        for x in range(fields):
+            _rv.tibrvMsg_GetFieldByIndex(msg, byref(fld), x)
+
+    def api():
+        for x in range(fields):
+            tibrvMsg_GetFieldByIndex(msg, x)
+
+    def obj():
+        for x in range(fields):
+            m.getByIndex(x)
+
+    return dict(c=c, api=api, object=obj)
+
+
+def case_send(env: Env) -> dict:
+
+    msg = env.msg
+    m = env.obj
+    tx = env.tx
+    txobj = env.txobj
+
+    tibrvMsg_SetSendSubject(msg, 'BENCH.SEND')
+    m.sendSubject = 'BENCH.SEND'
+
+    return dict(c=lambda: _rv.tibrvTransport_Send(tx, msg),
+                api=lambda: tibrvTransport_Send(tx, msg),
+                object=lambda: txobj.send(m))
+
+
+def case_dispatch(env: Env, loops: int) -> dict:
+    # prepare(n) : send n msgs to the queue of layer, not measured
+    # func       : dispatch one msg
+
+    status, msg = tibrvMsg_Create()
+    env.msgs.append(msg)
+    tibrvMsg_AddI32(msg, 'SEQ', 1)
+
+    def listen(layer: str) -> (int, str):
+        que = env.queue()
+        subj = 'BENCH.DISPATCH.' + layer.upper()
+        return que, subj
+
+    # c
+    que_c, subj_c = listen('c')
+    ev = _c_tibrvEvent(0)
+    cb = _c_tibrvEventCallback(lambda event, m, closure: None)
+    env.cbs.append(cb)
+    _rv.tibrvEvent_CreateListener(byref(ev), que_c, cb, env.tx, subj_c.encode(), None)
+    env.events.append(ev.value)
+
+    # api
+    que_api, subj_api = listen('api')
+    status, ev = tibrvEvent_CreateListener(que_api, lambda event, m, closure: None, env.tx, subj_api)
+    env.events.append(ev)
+
+    # object
+    que_obj, subj_obj = listen('object')
+    q = TibrvQueue(que_obj)
+    lst = TibrvListener()
+    env.objs.append(lst)
+    lst.create(q, TibrvMsgCallback(lambda event, m, closure: None), env.txobj, subj_obj)
+
+    def prepare(subj):
+        def send(n: int):
+            tibrvMsg_SetSendSubject(msg, subj)
+            for x in range(n):
+                tibrvTransport_Send(env.tx, msg)
+        return send
+
+    return dict(c=(prepare(subj_c), lambda: _rv.tibrvQueue_TimedDispatch(que_c, 0.0)),
+                api=(prepare(subj_api), lambda: tibrvQueue_Poll(que_api)),
+                object=(prepare(subj_obj), lambda: q.poll()))
+
+
+def cases(env: Env, loops: int):
+    # (group, case, factory)
+    yield 'msg', 'create/destroy', lambda: case_create(env)
+
+    for t, value, c_type in SCALARS:
+        yield 'scalar', 'update ' + t, lambda t=t, v=value, c=c_type: case_scalar(env, t, v, c, False)
+        yield 'scalar', 'get ' + t, lambda t=t, v=value, c=c_type: case_scalar(env, t, v, c, True)
+
+    yield 'string', 'update', lambda: case_string(env, None, False)
+    yield 'string', 'get', lambda: case_string(env, None, True)
+    yield 'string', 'update big5', lambda: case_string(env, 'big5', False)
+    yield 'string', 'get big5', lambda: case_string(env, 'big5', True)
+
+    for n in ARRAYS:
+        yield 'array', 'update F64[{}]'.format(n), lambda n=n: case_array(env, n, False)
+        yield 'array', 'get F64[{}]'.format(n), lambda n=n: case_array(env, n, True)
+        yield 'array', 'view F64[{}]'.format(n), lambda n=n: case_array_view(env, n)
+
+    yield 'walk', 'GetFieldByIndex x20', lambda: case_walk(env, 20)
+    yield 'send', 'send', lambda: case_send(env)
+    yield 'dispatch', 'listener', lambda: case_dispatch(env, loops)
+
+
+##-----------------------------------------------------------------------------
+# Main
+##-----------------------------------------------------------------------------
+def run(loops: int, pattern: str = None) -> list:
+
+    env = Env()
+    ret = []
+
+    print('{:<10s} {:<24s} {:>8s} {:>12s} {:>10s} {:>10s} {:>8s}'.format(
+          'group', 'case', 'layer', 'ops/sec', 'usec/op', 'peakBytes', 'net'))
+
+    for group, name, factory in cases(env, loops):
+        if pattern is not None and pattern not in group + ' ' + name:
+            continue
+
+        funcs = factory()
+        for layer in LAYERS:
+            func = funcs.get(layer)
+            if func is None:
+                continue
+
+            if isinstance(func, tuple):
+                prepare, func = func
+                best = None
+                for r in range(3):
+                    prepare(loops)
+                    t = measure(func, loops, 1)
+                    best = t if best is None else min(best, t)
+                peak, net = allocs(func, loops, prepare)
+            else:
+                best = measure(func, loops)
+                peak, net = allocs(func, loops)
+
+            row = dict(group=group, case=name, layer=layer,
+                       opsPerSec=1.0 / best, usPerOp=best * 1e6,
+                       peakBytes=peak, netBlocks=net)
+            ret.append(row)
+
+            print('{:<10s} {:<24s} {:>8s} {:>12.0f} {:>10.3f} {:>10d} {:>8.2f}'.format(
+                  group, name, layer, row['opsPerSec'], row['usPerOp'], peak, net))
+
+    env.close()
+
+    return ret
+
+
+def compare(ret: list, base: dict):
+
+    old = {(r['group'], r['case'], r['layer']): r for r in base['results']}
+
+    print('')
+    print('compare with', base['meta'].get('time'), base['meta'].get('backend'))
+    print('{:<10s} {:<24s} {:>8s} {:>12s} {:>12s} {:>8s}'.format(
+          'group', 'case', 'layer', 'base ops', 'ops/sec', 'ratio'))
+
+    for r in ret:
+        o = old.get((r['group'], r['case'], r['layer']))
+        if o is None:
+            continue
+
+        print('{:<10s} {:<24s} {:>8s} {:>12.0f} {:>12.0f} {:>8.2f}'.format(
+              r['group'], r['case'], r['layer'], o['opsPerSec'], r['opsPerSec'],
+              r['opsPerSec'] / o['opsPerSec']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='pytibrv benchmark suite')
+    parser.add_argument('-n', '--loops', type=int, default=10000)
+    parser.add_argument('-k', '--filter', default=None, help='run cases contains text')
+    parser.add_argument('-o', '--output', default=None, help='save result as JSON')
+    parser.add_argument('-c', '--compare', default=None, help='compare with JSON result')
+    args = parser.parse_args()
+
+    status = tibrv_Open()
+    assert TIBRV_OK == status, tibrvStatus_GetText(status)
+
+    meta = dict(time=time.strftime('%Y-%m-%dT%H:%M:%S'),
+                python=platform.python_version(),
+                platform=platform.platform(),
+                pytibrv=pytibrv.__version__,
+                backend=pytibrv.backend(),
+                tibrv=tibrv_Version(),
+                loops=args.loops)
+
+    ret = run(args.loops, args.filter)
+
+    tibrv_Close()
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump(dict(meta=meta, results=ret), f, indent=1)
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            compare(ret, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -42,6 +42,86 @@
 #
 #    It is caller's responsibility to call destroy() after created
 #
+# 7. Numeric array as numpy.ndarray
+#    TibrvMsg.listF64(name, as_array=True)
+#       return memoryview over the TIBRV array, no copy
+#       it is valid until the message was updated, reset or destroyed,
+#       for message in callback, until callback returned.
+#       view is released then, access raise ValueError
+#
+#       numpy.asarray(view) holds TIBRV storage after view was released:
+#       destroy()/reset() return TIBRV_NOT_PERMITTED until array was dropped,
+#       message in callback is detached, caller should destroy() it
+#
+#    TibrvMsg.listF64(name, as_array=True, copy=True)
+#       return a copy, (numpy.ndarray or array.array)
+#       for numpy, or data to be kept after callback returned
+#
+# 8. Message Codec
+#    TibrvMsgProjection : extract a fixed set of fields into tuple
+#    @tibrv_message     : generate encode()/decode() from class annotations
+#                         see TibrvSchema
+#
+# 9. Name Cache
+#    field name and subject (str) are encoded once and cached (LRU)
+#    Tibrv.nameCache()           -> dict(hits, misses, size, maxsize)
+#    Tibrv.nameCache(maxsize)    -> resize, 0 to disable
+#    Tibrv.nameCacheClear()
+#
+# 10. Message Pool
+#    TibrvMsgPool : recycle TibrvMsg by tibrvMsg_Reset
+#                   pool.message() for with-statement
+#                   pool.acquire() returned to pool after TibrvTx.send()
+#
+# 11. Vector Listener
+#    TibrvVectorListener + TibrvMsgVectorCallback
+#       callback(event, msgs, closure) once per batch of messages
+#       msgs (list) and TibrvMsg in it are reused for next batch
+#       copy the list or detach() the message to keep it
+#    TibrvVectorListener.stats() -> dict(batches, messages, last, max)
+#
+#    TibrvGroupVectorListener + TibrvMsgGroupCallback
+#       many subjects in one group, add()/remove() subject
+#       callback(group, msgs, subjects, closure) once per batch of all subjects
+#       subjects[x] is the send subject of msgs[x]
+#
+# 12. Request/Reply without blocking
+#    fut = tx.requestFuture(msg, timeout)        -> concurrent.futures.Future
+#    status, reply = await tx.request(msg, timeout)
+#       one dispatch thread per TibrvTx for all pending requests
+#       result is (status, reply), TIBRV_TIMEOUT if no reply
+#       reply should be destroyed by caller
+#
+#    status, replies = tx.gather(msg, subj, timeout, maxReplies)
+#    fut = tx.gatherFuture(msg, subj, timeout, maxReplies)
+#    async for reply in tx.gatherIter(msg, subj, timeout, maxReplies):
+#       all replies to one request, until timeout or maxReplies arrived
+#
+#    pool = tx.createInboxPool(size, quarantine)
+#       reuse inbox listeners for requests above, pool.stats() for metrics
+#
+# 13. Queue Group
+#    TibrvQueueGroup : dispatch queues by TibrvQueue.priority, highest first
+#                      one TibrvDispatcher for many queues
+#       grp.add(ctrl)
+#       grp.add(data)
+#       disp.create(grp)
+#
+# 14. Sharded Dispatcher
+#    TibrvShardedDispatcher(n_workers, key_fn)
+#       dispatch queues in one TibrvDispatcher, hand off msgs to n worker threads
+#       msgs with same key (field or subject) are processed by the same worker, in order
+#       sd.create([que1, que2], onPressure=cb)
+#       lst.create(que1, sd.callback(my_cb), tx, 'MD.>')
+#       bounded buffer per worker: block or discard when full
+#       sd.stats() -> per shard depth, maxDepth, processed, dropped, blocked, pressure
+#
+# 15. Wire Format
+#    msg.asBytes()              -> memoryview, NO copy, lifetime as array view (7)
+#    bytes(msg)                 -> bytes, copy
+#    TibrvMsg.from_bytes(data)  -> new TibrvMsg
+#    pickle.dumps(msg)          -> wire format with send/reply subject
+#
 #
 # CHANGED LOGS
 # -----------------------------------------------------------------------------
@@ -53,10 +133,39 @@
 #   CREATED
 #
 import inspect as _inspect
+import array as _array
+import threading as _threading
+import weakref as _weakref
+import heapq as _heapq
+import time as _time
+import asyncio as _asyncio
+import concurrent.futures as _futures
+from collections import deque as _deque
 from .types import *
 
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
 TibrvMsgDateTime = tibrvMsgDateTime
 
+def _is_array(value) -> bool:
+    # list[] or buffer (array.array, numpy.ndarray, memoryview, ...)
+    t = type(value)
+    if t is list:
+        return True
+
+    # scalar, skip the buffer protocol (TypeError is slow)
+    if t is int or t is float or t is bool or t is str:
+        return False
+
+    try:
+        return memoryview(value).ndim > 0
+    except TypeError:
+        return False
+
+
 class TibrvMsgField(tibrvMsgField):
 
     @property
@@ -124,7 +233,7 @@ class tibrv_str(tibrv_type):
 ##-----------------------------------------------------------------------------
 # Tibrv
 ##-----------------------------------------------------------------------------
-from .api import tibrv_Open, tibrv_Close, tibrv_Version
+from .api import tibrv_Open, tibrv_Close, tibrv_Version, _name_cache
 
 class Tibrv:
 
@@ -143,6 +252,16 @@ class Tibrv:
         ver = tibrv_Version()
         return ver
 
+    @staticmethod
+    def nameCache(maxsize: int = None) -> dict:
+        if maxsize is not None:
+            _name_cache.resize(maxsize)
+        return _name_cache.info()
+
+    @staticmethod
+    def nameCacheClear():
+        _name_cache.clear()
+
 ##-----------------------------------------------------------------------------
 # TibrvStatus
 ##-----------------------------------------------------------------------------
@@ -206,7 +325,7 @@ class TibrvStatus:
 from .msg import tibrvMsg, tibrvMsgDateTime, tibrvMsgField, \
                  tibrvMsg_Create, tibrvMsg_Destroy, tibrvMsg_Detach, \
                  tibrvMsg_Reset, tibrvMsg_ConvertToString, \
-                 tibrvMsg_CreateCopy, tibrvMsg_Expand, \
+                 tibrvMsg_CreateCopy, tibrvMsg_Expand, tibrvMsg_DecodeAll, \
                  tibrvMsg_AddDateTime, tibrvMsg_AddBool, tibrvMsg_AddI8, tibrvMsg_AddU8, \
                  tibrvMsg_AddI16, tibrvMsg_AddU16, tibrvMsg_AddI32, tibrvMsg_AddU32, \
                  tibrvMsg_AddI64, tibrvMsg_AddU64, tibrvMsg_AddF32, tibrvMsg_AddF64, \
@@ -216,7 +335,8 @@ from .msg import tibrvMsg, tibrvMsgDateTime, tibrvMsgField, \
                  tibrvMsg_AddI64Array, tibrvMsg_AddU64Array, tibrvMsg_AddF32Array, \
                  tibrvMsg_AddF64Array, tibrvMsg_AddStringArray, tibrvMsg_AddMsgArray, \
                  tibrvMsg_GetBool, tibrvMsg_GetString, tibrvMsg_GetSendSubject, \
-                 tibrvMsg_GetByteSize, tibrvMsg_GetClosure, tibrvMsg_GetCurrentTime, \
+                 tibrvMsg_GetByteSize, tibrvMsg_GetAsBytes, tibrvMsg_GetAsBytesCopy, \
+                 tibrvMsg_CreateFromBytes, tibrvMsg_GetClosure, tibrvMsg_GetCurrentTime, \
                  tibrvMsg_GetCurrentTimeString, tibrvMsg_GetDateTime, tibrvMsg_GetEvent, \
                  tibrvMsg_GetF32, tibrvMsg_GetF32Array, tibrvMsg_GetF64, tibrvMsg_GetF64Array, \
                  tibrvMsg_GetField, tibrvMsg_GetFieldByIndex, tibrvMsg_GetFieldInstance, \
@@ -236,7 +356,11 @@ from .msg import tibrvMsg, tibrvMsgDateTime, tibrvMsgField, \
                  tibrvMsg_UpdateString, tibrvMsg_UpdateStringArray, tibrvMsg_UpdateU8, \
                  tibrvMsg_UpdateU8Array, tibrvMsg_UpdateU16, tibrvMsg_UpdateU16Array, \
                  tibrvMsg_UpdateU32, tibrvMsg_UpdateU32Array, tibrvMsg_UpdateU64, \
-                 tibrvMsg_UpdateU64Array
+                 tibrvMsg_UpdateU64Array, \
+                 tibrvMsg_GetI8ArrayView, tibrvMsg_GetU8ArrayView, tibrvMsg_GetI16ArrayView, \
+                 tibrvMsg_GetU16ArrayView, tibrvMsg_GetI32ArrayView, tibrvMsg_GetU32ArrayView, \
+                 tibrvMsg_GetI64ArrayView, tibrvMsg_GetU64ArrayView, tibrvMsg_GetF32ArrayView, \
+                 tibrvMsg_GetF64ArrayView
 
 class TibrvMsg:
 
@@ -246,6 +370,9 @@ class TibrvMsg:
     def __init__(self, msg: tibrvMsg = 0):
         self._err = None
         self._msg = 0
+        self._views = None
+        self._pool = None
+        self._sendRelease = False
 
         # For exist msg
         if msg is not None and msg != 0:
@@ -273,12 +400,68 @@ class TibrvMsg:
             self._err = TibrvStatus.error(status)
             return status
 
+        if self._pool is not None:
+            # pooled message, return to pool
+            return self._pool.release(self)
+
+        if not self._release():
+            # array view was exported, TIBRV storage is still in use
+            status = TIBRV_NOT_PERMITTED
+            self._err = TibrvStatus.error(status)
+            return status
+
         status = tibrvMsg_Destroy(self.id())
         self._msg = 0
         self._err = TibrvStatus.error(status)
 
         return status;
 
+    def _release(self) -> bool:
+        # invalidate array views, before TIBRV free the message
+        # return False if TIBRV storage is still exported,
+        #   numpy.asarray(view) holds the buffer under the view (view.obj),
+        #   not the view itself, it is alive after view was released.
+        # those are kept, caller should not free the message
+        if self._views is None:
+            return True
+
+        busy = []
+        for ref, obj in self._views:
+            v = ref()
+            if v is not None:
+                try:
+                    v.release()
+                except BufferError:
+                    busy.append((ref, obj))
+                    continue
+            if obj is not None and obj() is not None:
+                busy.append((ref, obj))
+
+        if len(busy) > 0:
+            self._views = busy
+            return False
+
+        self._views = None
+        return True
+
+    def _track(self, view: memoryview):
+        # weak reference to view and the buffer under it (view.obj),
+        # views dropped by caller are not kept alive,
+        # dead references are pruned every 32 views
+        if self._views is None:
+            self._views = []
+        elif len(self._views) % 32 == 0:
+            self._views = [(ref, obj) for ref, obj in self._views
+                           if ref() is not None or (obj is not None and obj() is not None)]
+
+        try:
+            obj = _weakref.ref(view.obj)
+        except TypeError:
+            # empty array, not TIBRV storage
+            obj = None
+
+        self._views.append((_weakref.ref(view), obj))
+
     def __str__(self, codepage: str = None):
         if self.id() == 0:
             return None
@@ -314,6 +497,45 @@ class TibrvMsg:
 
         return ret
 
+    def asBytes(self) -> memoryview:
+        # wire format, NO copy
+        # it is valid until the message was updated, reset or destroyed,
+        # for message in callback, until callback returned.
+
+        status, ret = tibrvMsg_GetAsBytes(self.id())
+        self._err = TibrvStatus.error(status)
+
+        if status == TIBRV_OK:
+            self._track(ret)
+
+        return ret
+
+    def __bytes__(self) -> bytes:
+
+        status, ret = tibrvMsg_GetAsBytesCopy(self.id())
+        self._err = TibrvStatus.error(status)
+
+        if status != TIBRV_OK:
+            raise TibrvError(status)
+
+        return ret
+
+    @staticmethod
+    def from_bytes(data) -> 'TibrvMsg':
+        # data : bytes, bytearray, memoryview
+        # To be simple, return None if failed
+        status, ret = tibrvMsg_CreateFromBytes(data)
+        if status == TIBRV_OK:
+            msg = TibrvMsg(ret)
+            msg._copied = False
+            return msg
+
+        return None
+
+    def __reduce__(self):
+        # pickle as wire format, subjects are kept
+        return (_TibrvMsg_unpickle, (bytes(self), self.sendSubject, self.replySubject))
+
     def copy(self):
 
         status, m = tibrvMsg_CreateCopy(self.id())
@@ -333,8 +555,20 @@ class TibrvMsg:
 
         return ret
 
+    def toDict(self, codepage: str = None) -> dict:
+
+        status, ret = tibrvMsg_DecodeAll(self.id(), codepage)
+        self._err = TibrvStatus.error(status)
+
+        return ret
+
     def reset(self):
 
+        if not self._release():
+            # array view was exported, TIBRV storage is still in use
+            self._err = TibrvStatus.error(TIBRV_NOT_PERMITTED)
+            return
+
         status = tibrvMsg_Reset(self.id())
         self._err = TibrvStatus.error(status)
 
@@ -389,7 +623,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_AddI8(self.id(), name, value, id)
             else:
                 status = tibrvMsg_AddI8Array(self.id(), name, value, id)
@@ -401,7 +635,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_AddU8(self.id(), name, value, id)
             else:
                 status = tibrvMsg_AddU8Array(self.id(), name, value, id)
@@ -413,7 +647,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_AddI16(self.id(), name, value, id)
             else:
                 status = tibrvMsg_AddI16Array(self.id(), name, value, id)
@@ -425,7 +659,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_AddU16(self.id(), name, value, id)
             else:
                 status = tibrvMsg_AddU16Array(self.id(), name, value, id)
@@ -437,7 +671,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_AddI32(self.id(), name, value, id)
             else:
                 status = tibrvMsg_AddI32Array(self.id(), name, value, id)
@@ -449,7 +683,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_AddU32(self.id(), name, value, id)
             else:
                 status = tibrvMsg_AddU32Array(self.id(), name, value, id)
@@ -461,7 +695,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_AddI64(self.id(), name, value, id)
             else:
                 status = tibrvMsg_AddI64Array(self.id(), name, value, id)
@@ -473,7 +707,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_AddU64(self.id(), name, value, id)
             else:
                 status = tibrvMsg_AddU64Array(self.id(), name, value, id)
@@ -485,7 +719,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_AddF32(self.id(), name, value, id)
             else:
                 status = tibrvMsg_AddF32Array(self.id(), name, value, id)
@@ -497,7 +731,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_AddF64(self.id(), name, value, id)
             else:
                 status = tibrvMsg_AddF64Array(self.id(), name, value, id)
@@ -551,7 +785,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_UpdateI8(self.id(), name, value, id)
             else:
                 status = tibrvMsg_UpdateI8Array(self.id(), name, value, id)
@@ -563,7 +797,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_UpdateU8(self.id(), name, value, id)
             else:
                 status = tibrvMsg_UpdateU8Array(self.id(), name, value, id)
@@ -575,7 +809,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_UpdateI16(self.id(), name, value, id)
             else:
                 status = tibrvMsg_UpdateI16Array(self.id(), name, value, id)
@@ -587,7 +821,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_UpdateU16(self.id(), name, value, id)
             else:
                 status = tibrvMsg_UpdateU16Array(self.id(), name, value, id)
@@ -599,7 +833,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_UpdateI32(self.id(), name, value, id)
             else:
                 status = tibrvMsg_UpdateI32Array(self.id(), name, value, id)
@@ -611,7 +845,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_UpdateU32(self.id(), name, value, id)
             else:
                 status = tibrvMsg_UpdateU32Array(self.id(), name, value, id)
@@ -623,7 +857,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_UpdateI64(self.id(), name, value, id)
             else:
                 status = tibrvMsg_UpdateI64Array(self.id(), name, value, id)
@@ -635,7 +869,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_UpdateU64(self.id(), name, value, id)
             else:
                 status = tibrvMsg_UpdateU64Array(self.id(), name, value, id)
@@ -647,7 +881,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_UpdateF32(self.id(), name, value, id)
             else:
                 status = tibrvMsg_UpdateF32Array(self.id(), name, value, id)
@@ -659,7 +893,7 @@ class TibrvMsg:
         if self.id() == 0:
             status = TIBRV_INVALID_MSG
         else:
-            if type(value) is not list:
+            if not _is_array(value):
                 status = tibrvMsg_UpdateF64(self.id(), name, value, id)
             else:
                 status = tibrvMsg_UpdateF64Array(self.id(), name, value, id)
@@ -913,7 +1147,37 @@ class TibrvMsg:
         return self.__default(ret, status, kwargs)
 
 
-    def listI8(self, name: str, id: int = 0, **kwargs) -> list:
+    def __array(self, func, name: str, id: int, copy: bool, kwargs):
+        # as_array = True
+        #   copy = False : memoryview over TIBRV array, no copy
+        #                  released when message was reset or destroyed
+        #   copy = True  : numpy.ndarray/array.array, copy once
+        ret = None
+
+        if self.id() == 0:
+            status = TIBRV_INVALID_MSG
+        else:
+            status, view = func(self.id(), name, id)
+
+            if status == TIBRV_OK:
+                if copy:
+                    if _np is not None:
+                        ret = _np.frombuffer(view, view.format).copy()
+                    else:
+                        ret = _array.array(view.format)
+                        ret.frombytes(view.cast('B'))
+                    view.release()
+                else:
+                    self._track(view)
+                    ret = view
+
+        return self.__default(ret, status, kwargs)
+
+    def listI8(self, name: str, id: int = 0, as_array: bool = False, copy: bool = False,
+               **kwargs) -> list:
+
+        if as_array:
+            return self.__array(tibrvMsg_GetI8ArrayView, name, id, copy, kwargs)
 
         ret = []
 
@@ -924,7 +1188,11 @@ class TibrvMsg:
 
         return self.__default(ret, status, kwargs)
 
-    def listU8(self, name: str, id: int = 0, **kwargs) -> list:
+    def listU8(self, name: str, id: int = 0, as_array: bool = False, copy: bool = False,
+               **kwargs) -> list:
+
+        if as_array:
+            return self.__array(tibrvMsg_GetU8ArrayView, name, id, copy, kwargs)
 
         ret = None
 
@@ -936,7 +1204,11 @@ class TibrvMsg:
         return self.__default(ret, status, kwargs)
 
 
-    def listI16(self, name: str, id: int = 0, **kwargs) -> list:
+    def listI16(self, name: str, id: int = 0, as_array: bool = False, copy: bool = False,
+                **kwargs) -> list:
+
+        if as_array:
+            return self.__array(tibrvMsg_GetI16ArrayView, name, id, copy, kwargs)
 
         ret = None
 
@@ -947,7 +1219,11 @@ class TibrvMsg:
 
         return self.__default(ret, status, kwargs)
 
-    def listU16(self, name: str, id: int = 0, **kwargs) -> list:
+    def listU16(self, name: str, id: int = 0, as_array: bool = False, copy: bool = False,
+                **kwargs) -> list:
+
+        if as_array:
+            return self.__array(tibrvMsg_GetU16ArrayView, name, id, copy, kwargs)
 
         ret = None
 
@@ -958,7 +1234,11 @@ class TibrvMsg:
 
         return self.__default(ret, status, kwargs)
 
-    def listI32(self, name: str, id: int = 0, **kwargs) -> list:
+    def listI32(self, name: str, id: int = 0, as_array: bool = False, copy: bool = False,
+                **kwargs) -> list:
+
+        if as_array:
+            return self.__array(tibrvMsg_GetI32ArrayView, name, id, copy, kwargs)
 
         ret = None
 
@@ -969,7 +1249,11 @@ class TibrvMsg:
 
         return self.__default(ret, status, kwargs)
 
-    def listU32(self, name: str, id: int = 0, **kwargs) -> list:
+    def listU32(self, name: str, id: int = 0, as_array: bool = False, copy: bool = False,
+                **kwargs) -> list:
+
+        if as_array:
+            return self.__array(tibrvMsg_GetU32ArrayView, name, id, copy, kwargs)
 
         ret = None
 
@@ -981,7 +1265,11 @@ class TibrvMsg:
         return self.__default(ret, status, kwargs)
 
 
-    def listI64(self, name: str, id: int = 0, **kwargs) -> list:
+    def listI64(self, name: str, id: int = 0, as_array: bool = False, copy: bool = False,
+                **kwargs) -> list:
+
+        if as_array:
+            return self.__array(tibrvMsg_GetI64ArrayView, name, id, copy, kwargs)
 
         ret = None
 
@@ -993,7 +1281,11 @@ class TibrvMsg:
         return self.__default(ret, status, kwargs)
 
 
-    def listU64(self, name: str, id: int = 0, **kwargs) -> list:
+    def listU64(self, name: str, id: int = 0, as_array: bool = False, copy: bool = False,
+                **kwargs) -> list:
+
+        if as_array:
+            return self.__array(tibrvMsg_GetU64ArrayView, name, id, copy, kwargs)
 
         ret = None
 
@@ -1005,7 +1297,11 @@ class TibrvMsg:
         return self.__default(ret, status, kwargs)
 
 
-    def listF32(self, name: str, id: int = 0, **kwargs) -> list:
+    def listF32(self, name: str, id: int = 0, as_array: bool = False, copy: bool = False,
+                **kwargs) -> list:
+
+        if as_array:
+            return self.__array(tibrvMsg_GetF32ArrayView, name, id, copy, kwargs)
 
         ret = None
 
@@ -1017,7 +1313,11 @@ class TibrvMsg:
         return self.__default(ret, status, kwargs)
 
 
-    def listF64(self, name: str, id: int = 0, **kwargs) -> list:
+    def listF64(self, name: str, id: int = 0, as_array: bool = False, copy: bool = False,
+                **kwargs) -> list:
+
+        if as_array:
+            return self.__array(tibrvMsg_GetF64ArrayView, name, id, copy, kwargs)
 
         ret = None
 
@@ -1344,179 +1644,867 @@ class TibrvMsg:
         return self._err
 
 
+def _TibrvMsg_unpickle(data: bytes, sendSubject: str, replySubject: str) -> TibrvMsg:
+
+    msg = TibrvMsg.from_bytes(data)
+    if msg is None:
+        raise TibrvError(TIBRV_CORRUPT_MSG)
+
+    if sendSubject is not None:
+        msg.sendSubject = sendSubject
+    if replySubject is not None:
+        msg.replySubject = replySubject
+
+    return msg
+
+
 ##-----------------------------------------------------------------------------
-# TibrvQueue
+# TibrvMsgPool
+#   recycle TibrvMsg by tibrvMsg_Reset, instead of tibrvMsg_Create/Destroy
+#
+#   pool = TibrvMsgPool(16)
+#
+#   with pool.message() as msg:         # returned when block exit
+#       msg.setF64('price', 100.25)
+#       tx.send(msg, 'TEST')
+#
+#   msg = pool.acquire()                # returned after TibrvTx.send()
+#   msg.setF64('price', 100.25)
+#   tx.send(msg, 'TEST')
+#
+#   msg.destroy() of pooled message would return it to pool
+#   DO NOT use the message after it returned to pool
 ##-----------------------------------------------------------------------------
-from .queue import tibrvQueue,  \
-                   tibrvQueue_Create, tibrvQueue_Destroy, \
-                   tibrvQueue_Dispatch, tibrvQueue_GetCount, tibrvQueue_GetName, \
-                   tibrvQueue_GetLimitPolicy, tibrvQueue_GetPriority, \
-                   tibrvQueue_Poll, tibrvQueue_SetLimitPolicy, tibrvQueue_SetName, \
-                   tibrvQueue_SetPriority, tibrvQueue_TimedDispatch, \
-                   tibrvQueue_TimedDispatchOneEvent
-
+class _TibrvMsgPoolContext:
 
-class TibrvQueue:
+    def __init__(self, pool: 'TibrvMsgPool'):
+        self._pool = pool
+        self._msg = None
 
-    DISCARD_NONE    = TIBRVQUEUE_DISCARD_NONE
-    DISCARD_FIRST   = TIBRVQUEUE_DISCARD_FIRST
-    DISCARD_LAST    = TIBRVQUEUE_DISCARD_LAST
-    DISCARD_NEW     = TIBRVQUEUE_DISCARD_NEW
+    def __enter__(self) -> TibrvMsg:
+        self._msg = self._pool.acquire(sendRelease=False)
+        return self._msg
 
-    def __init__(self, que: tibrvQueue = TIBRV_DEFAULT_QUEUE):
-        self._que = 0
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._msg is not None:
+            self._pool.release(self._msg)
+            self._msg = None
+        return False
+
+
+class TibrvMsgPool:
+
+    def __init__(self, size: int = 16, initBytes: int = 0):
+        self._size = max(0, int(size))
+        self._initBytes = initBytes
+        self._free = _deque()
+        self._lock = _threading.Lock()
+        self._inUse = 0
+        self._highWater = 0
+        self._created = 0
+        self._reused = 0
+        self._dropped = 0
         self._err = None
-        self._policy = 0
-        self._maxEvents = 0
-        self._discard = 0
 
-        if que is not None:
-            self._que = tibrvQueue(que)
+    def acquire(self, sendRelease: bool = True) -> TibrvMsg:
+
+        with self._lock:
+            msg = self._free.pop() if self._free else None
+            if msg is not None:
+                self._reused = self._reused + 1
+            self._inUse = self._inUse + 1
+            if self._inUse > self._highWater:
+                self._highWater = self._inUse
+
+        if msg is None:
+            msg = TibrvMsg.create(self._initBytes)
+            if msg is None:
+                # NO MEMORY
+                with self._lock:
+                    self._inUse = self._inUse - 1
+                status = TIBRV_NO_MEMORY
+                self._err = TibrvStatus.error(status)
+                return None
 
-    def id(self):
-        return self._que
+            with self._lock:
+                self._created = self._created + 1
 
-    def create(self, name: str = None) -> tibrv_status:
+            msg._pool = self
 
-        if self._que != 0 and self._que != TIBRV_DEFAULT_QUEUE:
-            status = TIBRV_ID_IN_USE
+        msg._sendRelease = sendRelease
+        return msg
+
+    def message(self) -> _TibrvMsgPoolContext:
+        return _TibrvMsgPoolContext(self)
+
+    def release(self, msg: TibrvMsg) -> tibrv_status:
+
+        if msg is None or not isinstance(msg, TibrvMsg) or msg._pool is not self:
+            status = TIBRV_INVALID_MSG
             self._err = TibrvStatus.error(status)
             return status
 
-        status, que = tibrvQueue_Create()
-        if status == TIBRV_OK:
-            self._que = que
+        if msg._sendRelease is None:
+            # already released
+            return TIBRV_OK
+
+        msg._sendRelease = None
+        if not msg._release():
+            # array view was exported, not reused, caller should destroy it
+            with self._lock:
+                self._inUse = self._inUse - 1
+                self._dropped = self._dropped + 1
+            msg._pool = None
+            status = TIBRV_NOT_PERMITTED
+            self._err = TibrvStatus.error(status)
+            return status
 
-            s,p,m,d = tibrvQueue_GetLimitPolicy(que)
-            if s == TIBRV_OK:
-                self._policy = p
-                self._maxEvents = m
-                self._discard = d
+        status = tibrvMsg_Reset(msg.id())
 
-            if name is not None:
-                tibrvQueue_SetName(que, name)
+        with self._lock:
+            self._inUse = self._inUse - 1
+            keep = status == TIBRV_OK and len(self._free) < self._size
+            if keep:
+                self._free.append(msg)
+            else:
+                self._dropped = self._dropped + 1
 
-        self._err = TibrvStatus.error(status)
+        if not keep:
+            msg._pool = None
+            msg.destroy()
 
+        self._err = TibrvStatus.error(status)
         return status
 
     def destroy(self) -> tibrv_status:
+        # destroy free messages only
+        # messages in use would be destroyed when released
+        with self._lock:
+            free = list(self._free)
+            self._free.clear()
+            self._size = 0
 
-        if self._que == 0 or self._que == TIBRV_DEFAULT_QUEUE:
-            status = TIBRV_INVALID_QUEUE
-            self._err = TibrvStatus.error(status)
-            return status
+        for msg in free:
+            msg._pool = None
+            msg.destroy()
 
-        status = tibrvQueue_Destroy(self._que)
-        self._que = 0
-        self._err = TibrvStatus.error(status)
+        self._err = None
+        return TIBRV_OK
 
-        return status
+    def size(self) -> int:
+        return self._size
 
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(size=self._size, free=len(self._free), inUse=self._inUse,
+                        highWater=self._highWater, created=self._created,
+                        reused=self._reused, dropped=self._dropped)
 
-    @property
-    def name(self) -> str:
+    def error(self) -> TibrvError:
+        return self._err
 
-        status, ret = tibrvQueue_GetName(self.id())
-        self._err = TibrvStatus.error(status)
 
-        return ret
+##-----------------------------------------------------------------------------
+# TibrvMsgProjection
+##-----------------------------------------------------------------------------
+from .msg import _getter
+
+_tibrv_type = {
+    tibrv_i8:           TIBRVMSG_I8,
+    tibrv_u8:           TIBRVMSG_U8,
+    tibrv_i16:          TIBRVMSG_I16,
+    tibrv_u16:          TIBRVMSG_U16,
+    tibrv_i32:          TIBRVMSG_I32,
+    tibrv_u32:          TIBRVMSG_U32,
+    tibrv_i64:          TIBRVMSG_I64,
+    tibrv_u64:          TIBRVMSG_U64,
+    tibrv_f32:          TIBRVMSG_F32,
+    tibrv_f64:          TIBRVMSG_F64,
+    tibrv_str:          TIBRVMSG_STRING,
+    bool:               TIBRVMSG_BOOL,
+    TibrvMsg:           TIBRVMSG_MSG,
+    TibrvMsgDateTime:   TIBRVMSG_DATETIME,
+}
+
+class TibrvMsgProjection:
+    # Extract a fixed set of fields from message
+    #
+    #   proj = TibrvMsgProjection(['BID', 'ASK', ('SIZE', tibrv_i32, 0)])
+    #   bid, ask, size = proj.extract(msg)
+    #
+    #   field is declared as
+    #       name                        -> data_type, default
+    #       (name, data_type)           -> default
+    #       (name, data_type, default)
+    #
+    #   field name, id and TIBRV function are prepared in constructor,
+    #   missing field would be replaced by its default.
+    #
+    #   output buffer is reused by extract(),
+    #   DONT share one TibrvMsgProjection between threads
+
+    def __init__(self, fields: list, data_type = tibrv_f64, default = None, codepage: str = None):
+        self._err = None
+        self._names = []
+        self._getters = []
 
-    @name.setter
-    def name(self, sz: str) -> None:
-        status = tibrvQueue_SetName(self.id(), sz)
-        self._err = TibrvStatus.error(status)
+        for fld in fields:
+            if type(fld) is str:
+                fld = (fld,)
 
-    def dispatch(self) -> int:
+            name = fld[0]
+            dt = fld[1] if len(fld) > 1 else data_type
+            val = fld[2] if len(fld) > 2 else default
 
-        status = tibrvQueue_Dispatch(self.id())
-        self._err = TibrvStatus.error(status)
+            if dt not in _tibrv_type:
+                raise TypeError(getattr(dt, '__name__', str(dt)) + ' is not supported')
 
-        return status
+            get = _getter(_tibrv_type[dt], name, 0, codepage)
+            if dt is TibrvMsg:
+                get = self.__msg(get)
 
-    def count(self) -> int:
+            self._names.append(name)
+            self._getters.append((get, val))
 
-        status, ret = tibrvQueue_GetCount(self.id())
-        self._err = TibrvStatus.error(status)
+    @staticmethod
+    def __msg(get):
+        def _get(message):
+            status, ret = get(message)
+            if status == TIBRV_OK:
+                # owned by message, DONT destroy
+                ret = TibrvMsg(ret)
+            return status, ret
 
-        return ret
+        return _get
 
-    def setPolicy(self, policy: int, maxEvents: int, discardAmount: int) -> tibrv_status:
+    def __len__(self):
+        return len(self._getters)
 
-        status = tibrvQueue_SetLimitPolicy(self.id(), policy, maxEvents, discardAmount)
-        self._err = TibrvStatus.error(status)
+    def names(self) -> list:
+        return list(self._names)
 
-        if status == TIBRV_OK:
-            self._policy = int(policy)
-            self._maxEvents = int(maxEvents)
-            self._discard = int(discardAmount)
+    def extract(self, msg) -> tuple:
 
-        return status
+        m = msg.id() if isinstance(msg, TibrvMsg) else msg
+        if m is None or m == 0:
+            self._err = TibrvStatus.error(TIBRV_INVALID_MSG)
+            return None
 
-    def policy(self) -> int:
-        return self._policy
+        self._err = None
+        ret = []
 
-    def maxEvents(self) -> str:
-        return self._maxEvents
+        for get, default in self._getters:
+            status, val = get(m)
+            if status != TIBRV_OK:
+                if status != TIBRV_NOT_FOUND:
+                    self._err = TibrvStatus.error(status)
+                val = default
 
-    def discardAmount(self) -> str:
-        return self._discard
+            ret.append(val)
 
-    @property
-    def priority(self) -> str:
+        return tuple(ret)
 
-        status, ret = tibrvQueue_GetPriority(self.id())
-        self._err = TibrvStatus.error(status)
+    def error(self) -> TibrvError:
+        return self._err
 
-        return ret
 
-    @priority.setter
-    def priority(self, val: int) -> None:
+##-----------------------------------------------------------------------------
+# TibrvSchema
+##-----------------------------------------------------------------------------
+import ctypes as _ctypes
+from .api import _rv, _c_tibrvMsg, _c_tibrv_u32, _c_tibrv_str, \
+                 _c_tibrv_bool, _c_tibrv_i8, _c_tibrv_u8, _c_tibrv_i16, _c_tibrv_u16, \
+                 _c_tibrv_i32, _c_tibrv_u32, _c_tibrv_i64, _c_tibrv_u64, \
+                 _c_tibrv_f32, _c_tibrv_f64
+from .msg import _c_tibrvMsgDateTime, _c_array, _ARRAY_SIGNED, _ARRAY_UNSIGNED, _ARRAY_FLOAT
+
+# data_type -> (TIBRV function name, ctypes, array format)
+_schema_type = {
+    tibrv_i8:           ('I8', _c_tibrv_i8, _ARRAY_SIGNED),
+    tibrv_u8:           ('U8', _c_tibrv_u8, _ARRAY_UNSIGNED),
+    tibrv_i16:          ('I16', _c_tibrv_i16, _ARRAY_SIGNED),
+    tibrv_u16:          ('U16', _c_tibrv_u16, _ARRAY_UNSIGNED),
+    tibrv_i32:          ('I32', _c_tibrv_i32, _ARRAY_SIGNED),
+    tibrv_u32:          ('U32', _c_tibrv_u32, _ARRAY_UNSIGNED),
+    tibrv_i64:          ('I64', _c_tibrv_i64, _ARRAY_SIGNED),
+    tibrv_u64:          ('U64', _c_tibrv_u64, _ARRAY_UNSIGNED),
+    tibrv_f32:          ('F32', _c_tibrv_f32, _ARRAY_FLOAT),
+    tibrv_f64:          ('F64', _c_tibrv_f64, _ARRAY_FLOAT),
+    tibrv_str:          ('String', _c_tibrv_str, None),
+    bool:               ('Bool', _c_tibrv_bool, None),
+    TibrvMsgDateTime:   ('DateTime', _c_tibrvMsgDateTime, None),
+}
+
+class TibrvSchema:
+    # Message codec, generated from class annotations
+    #
+    #   @tibrv_message
+    #   class Leg:
+    #       symbol: tibrv_str
+    #       qty: tibrv_i32 = 0
+    #
+    #   @tibrv_message
+    #   class Order:
+    #       price: tibrv_f64
+    #       qty: tibrv_i32
+    #       curve: list[tibrv_f64]          -> F64 Array
+    #       legs: list[Leg]                 -> Msg Array
+    #
+    #   msg = Order.encode(order)           -> TibrvMsg, caller should destroy()
+    #   order = Order.decode(msg)
+    #   Order.__tibrv_schema__.error()      -> TibrvError of last encode()/decode()
+    #
+    #   data type:
+    #       tibrv_i8 ... tibrv_f64, tibrv_str, bool, TibrvMsgDateTime
+    #       class decorated by @tibrv_message   -> nested message
+    #       list[X]                             -> array of X, X is not bool/TibrvMsgDateTime
+    #
+    #   attribute name is field name, attribute starts with '_' is ignored
+    #   class attribute is default value,
+    #   for attribute not assigned when encode, and for missing field when decode.
+    #   default is None if there is no class attribute, field of None is not encoded
+    #
+    #   field names and TIBRV functions are bound when class was decorated.
+    #   the codec is generated Python source, without TibrvMsg.addXXX/getXXX.
+    #
+
+    def __init__(self, cls):
+        self._cls = cls
+        self._fields = []
+        self._err = None
 
-        status = tibrvQueue_SetPriority(self.id(), val)
-        self._err = TibrvStatus.error(status)
+        hints = getattr(cls, '__annotations__', {})
 
-    def poll(self) -> tibrv_status:
+        for attr, ann in hints.items():
+            if attr.startswith('_'):
+                continue
 
-        status = tibrvQueue_Poll(self.id())
-        self._err = TibrvStatus.error(status)
+            self._fields.append(self.__field(attr, ann))
 
-        return status
+        ns = {'_rv': _rv, '_ctypes': _ctypes, '_c_array': _c_array,
+              '_c_tibrvMsg': _c_tibrvMsg, '_c_tibrv_u32': _c_tibrv_u32, '_c_tibrv_str': _c_tibrv_str,
+              '_c_tibrvMsgDateTime': _c_tibrvMsgDateTime, 'TibrvMsgDateTime': TibrvMsgDateTime,
+              '_byref': _ctypes.byref, '_new': object.__new__, '_cls': cls,
+              '_OK': TIBRV_OK, '_NOT_FOUND': TIBRV_NOT_FOUND, '_INVALID_ARG': TIBRV_INVALID_ARG}
 
+        src = self.__source(ns)
+        exec(src, ns)
 
-    def timedDispatch(self, timeout: float) -> tibrv_status:
+        self._source = src
+        self._fill = ns['_fill']
+        self._read = ns['_read']
 
-        status = tibrvQueue_TimedDispatch(self.id(), timeout)
-        self._err = TibrvStatus.error(status)
+    @staticmethod
+    def __field(attr: str, ann):
 
-        return status
+        if isinstance(ann, str):
+            raise TypeError(attr + ': string annotation is not supported')
 
-    def error(self) -> TibrvError :
-        return self._err
+        array = False
+        if getattr(ann, '__origin__', None) is list:
+            args = getattr(ann, '__args__', None)
+            if not args or len(args) != 1:
+                raise TypeError(attr + ': list[] must declare item type')
+            array = True
+            ann = args[0]
 
+        if ann in _schema_type:
+            if array and ann in (bool, TibrvMsgDateTime):
+                raise TypeError(attr + ': array of ' + ann.__name__ + ' is not supported')
+            return attr, array, ann
 
-##-----------------------------------------------------------------------------
-## TibrvTx
-##-----------------------------------------------------------------------------
-from .tport import tibrvTransport, tibrvTransport_Create, tibrvTransport_Destroy, \
-                   tibrvTransport_CreateInbox, tibrvTransport_GetService, \
-                   tibrvTransport_GetDaemon, tibrvTransport_GetNetwork, tibrvTransport_GetDescription, \
-                   tibrvTransport_RequestReliability, tibrvTransport_SetDescription, \
-                   tibrvTransport_Send, tibrvTransport_SendRequest, tibrvTransport_SendReply
+        if isinstance(getattr(ann, '__tibrv_schema__', None), TibrvSchema):
+            return attr, array, ann
 
-class TibrvTx :
-    def __init__(self, tx: tibrvTransport = 0):
-        self._tx = 0
-        self._err = None
-        if tx is not None:
-            self._tx = tibrvTransport(tx)
+        raise TypeError(attr + ': ' + getattr(ann, '__name__', str(ann)) + ' is not supported')
 
-    def id(self):
-        return self._tx
+    def __source(self, ns: dict) -> str:
 
-    def create(self, service: str, network: str, daemon: str) -> int:
-        if self._tx != 0:
-            status = TIBRV_ID_IN_USE
+        enc = ['def _fill(obj, m):']
+        dec = ['def _read(m):',
+               '    obj = _new(_cls)']
+
+        for x in range(len(self._fields)):
+            attr, array, ann = self._fields[x]
+
+            ns['_n%d' % x] = attr.encode()
+            ns['_d%d' % x] = getattr(self._cls, attr, None)
+
+            enc.append('    v = getattr(obj, %r, None)' % attr)
+            enc.append('    if v is not None:')
+
+            if ann in _schema_type:
+                func, c_type, fmt = _schema_type[ann]
+                ns['_t%d' % x] = c_type
+                ns['_k%d' % x] = fmt
+            else:
+                func = 'Msg'
+                ns['_s%d' % x] = ann.__tibrv_schema__
+
+            if array:
+                ns['_a%d' % x] = getattr(_rv, 'tibrvMsg_Add%sArrayEx' % func)
+                ns['_g%d' % x] = getattr(_rv, 'tibrvMsg_Get%sArrayEx' % func)
+            else:
+                ns['_a%d' % x] = getattr(_rv, 'tibrvMsg_Add%sEx' % func)
+                ns['_g%d' % x] = getattr(_rv, 'tibrvMsg_Get%sEx' % func)
+
+            enc.extend(['        ' + ln % dict(x=x) for ln in self.__encode(func, array)])
+            enc.append('        if s != _OK:')
+            enc.append('            return s')
+
+            dec.extend(['    ' + ln % dict(x=x) for ln in self.__decode(func, array)])
+            dec.append('    if s == _OK:')
+            dec.append('        obj.%s = v' % attr)
+            dec.append('    elif s == _NOT_FOUND:')
+            dec.append('        obj.%s = _d%d' % (attr, x))
+            dec.append('    else:')
+            dec.append('        return s, None')
+
+        enc.append('    return _OK')
+        dec.append('    return _OK, obj')
+
+        return '\n'.join(enc) + '\n\n' + '\n'.join(dec) + '\n'
+
+    @staticmethod
+    def __encode(func: str, array: bool) -> list:
+
+        if func == 'Msg':
+            if array:
+                return ['h = [_c_tibrvMsg(0) for x in range(len(v))]',
+                        's = _OK',
+                        'for x in range(len(v)):',
+                        '    if s == _OK:',
+                        '        s = _rv.tibrvMsg_Create(_byref(h[x]))',
+                        '    if s == _OK:',
+                        '        s = _s%(x)d._fill(v[x], h[x].value)',
+                        'if s == _OK:',
+                        '    s = _a%(x)d(m, _n%(x)d, (_c_tibrvMsg * len(h))(*h), len(h), 0)',
+                        'for x in h:',
+                        '    if x.value:',
+                        '        _rv.tibrvMsg_Destroy(x)']
+
+            return ['h = _c_tibrvMsg(0)',
+                    's = _rv.tibrvMsg_Create(_byref(h))',
+                    'if s == _OK:',
+                    '    s = _s%(x)d._fill(v, h.value)',
+                    '    if s == _OK:',
+                    '        s = _a%(x)d(m, _n%(x)d, h, 0)',
+                    '    _rv.tibrvMsg_Destroy(h)']
+
+        if array:
+            if func == 'String':
+                return ['a = (_c_tibrv_str * len(v))(*[str(x).encode() for x in v])',
+                        's = _a%(x)d(m, _n%(x)d, a, len(v), 0)']
+
+            return ['try:',
+                    '    a, n = _c_array(v, _t%(x)d, _k%(x)d)',
+                    'except (TypeError, ValueError):',
+                    '    return _INVALID_ARG',
+                    's = _a%(x)d(m, _n%(x)d, a, n, 0)']
+
+        if func == 'String':
+            return ['s = _a%(x)d(m, _n%(x)d, str(v).encode(), 0)']
+
+        if func == 'Bool':
+            return ['s = _a%(x)d(m, _n%(x)d, 1 if v else 0, 0)']
+
+        if func == 'DateTime':
+            return ['s = _a%(x)d(m, _n%(x)d, _byref(_c_tibrvMsgDateTime(v)), 0)']
+
+        return ['s = _a%(x)d(m, _n%(x)d, v, 0)']
+
+    @staticmethod
+    def __decode(func: str, array: bool) -> list:
+
+        if array:
+            if func == 'Msg':
+                ret = ['p = _ctypes.POINTER(_c_tibrvMsg)()']
+            else:
+                ret = ['p = _ctypes.POINTER(_t%(x)d)()']
+
+            ret.extend(['n = _c_tibrv_u32(0)',
+                        's = _g%(x)d(m, _n%(x)d, _byref(p), _byref(n), 0)',
+                        'if s == _OK:',
+                        '    v = p[:n.value]'])
+
+            if func == 'String':
+                ret.append('    v = [x.decode() for x in v]')
+            elif func == 'Msg':
+                ret.extend(['    for x in range(len(v)):',
+                            '        if s == _OK:',
+                            '            s, v[x] = _s%(x)d._read(v[x])'])
+            return ret
+
+        if func == 'Msg':
+            return ['h = _c_tibrvMsg(0)',
+                    's = _g%(x)d(m, _n%(x)d, _byref(h), 0)',
+                    'if s == _OK:',
+                    '    s, v = _s%(x)d._read(h.value)']
+
+        ret = ['v = _t%(x)d()',
+               's = _g%(x)d(m, _n%(x)d, _byref(v), 0)']
+
+        if func == 'DateTime':
+            ret.extend(['dt = TibrvMsgDateTime()',
+                        'v.castTo(dt)',
+                        'v = dt'])
+        elif func == 'String':
+            ret.append('v = v.value.decode() if s == _OK else None')
+        elif func == 'Bool':
+            ret.append('v = v.value != 0')
+        else:
+            ret.append('v = v.value')
+
+        return ret
+
+    def fields(self) -> list:
+        return [x[0] for x in self._fields]
+
+    def encode(self, obj, msg: TibrvMsg = None) -> TibrvMsg:
+        # msg is optional, fields would be added into it
+
+        created = msg is None
+        if created:
+            status, m = tibrvMsg_Create()
+            if status != TIBRV_OK:
+                self._err = TibrvStatus.error(status)
+                return None
+
+            msg = TibrvMsg(m)
+            msg._copied = False
+
+        if msg.id() == 0:
+            status = TIBRV_INVALID_MSG
+            self._err = TibrvStatus.error(status)
+            return None
+
+        status = self._fill(obj, msg.id())
+        if status != TIBRV_OK:
+            if created:
+                msg.destroy()
+            self._err = TibrvStatus.error(status)
+            return None
+
+        self._err = TibrvStatus.error(status)
+
+        return msg
+
+    def decode(self, msg):
+        # msg is TibrvMsg or tibrvMsg
+
+        m = msg.id() if isinstance(msg, TibrvMsg) else msg
+        if m is None or m == 0:
+            status = TIBRV_INVALID_MSG
+            self._err = TibrvStatus.error(status)
+            return None
+
+        status, ret = self._read(m)
+        self._err = TibrvStatus.error(status)
+
+        if status != TIBRV_OK:
+            return None
+
+        return ret
+
+    def error(self) -> TibrvError:
+        return self._err
+
+
+def tibrv_message(cls):
+    # class decorator, see TibrvSchema
+    #   cls.__tibrv_schema__    TibrvSchema
+    #   cls.encode(obj)         -> TibrvMsg
+    #   cls.decode(msg)         -> cls
+    schema = TibrvSchema(cls)
+
+    cls.__tibrv_schema__ = schema
+    cls.encode = staticmethod(schema.encode)
+    cls.decode = staticmethod(schema.decode)
+
+    return cls
+
+
+##-----------------------------------------------------------------------------
+# TibrvQueue
+##-----------------------------------------------------------------------------
+from .queue import tibrvQueue,  \
+                   tibrvQueue_Create, tibrvQueue_Destroy, \
+                   tibrvQueue_Dispatch, tibrvQueue_GetCount, tibrvQueue_GetName, \
+                   tibrvQueue_GetLimitPolicy, tibrvQueue_GetPriority, \
+                   tibrvQueue_Poll, tibrvQueue_SetLimitPolicy, tibrvQueue_SetName, \
+                   tibrvQueue_SetPriority, tibrvQueue_TimedDispatch, \
+                   tibrvQueue_TimedDispatchOneEvent
+
+
+class TibrvQueue:
+
+    DISCARD_NONE    = TIBRVQUEUE_DISCARD_NONE
+    DISCARD_FIRST   = TIBRVQUEUE_DISCARD_FIRST
+    DISCARD_LAST    = TIBRVQUEUE_DISCARD_LAST
+    DISCARD_NEW     = TIBRVQUEUE_DISCARD_NEW
+
+    def __init__(self, que: tibrvQueue = TIBRV_DEFAULT_QUEUE):
+        self._que = 0
+        self._err = None
+        self._policy = 0
+        self._maxEvents = 0
+        self._discard = 0
+
+        if que is not None:
+            self._que = tibrvQueue(que)
+
+    def id(self):
+        return self._que
+
+    def create(self, name: str = None) -> tibrv_status:
+
+        if self._que != 0 and self._que != TIBRV_DEFAULT_QUEUE:
+            status = TIBRV_ID_IN_USE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        status, que = tibrvQueue_Create()
+        if status == TIBRV_OK:
+            self._que = que
+
+            s,p,m,d = tibrvQueue_GetLimitPolicy(que)
+            if s == TIBRV_OK:
+                self._policy = p
+                self._maxEvents = m
+                self._discard = d
+
+            if name is not None:
+                tibrvQueue_SetName(que, name)
+
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def destroy(self) -> tibrv_status:
+
+        if self._que == 0 or self._que == TIBRV_DEFAULT_QUEUE:
+            status = TIBRV_INVALID_QUEUE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        status = tibrvQueue_Destroy(self._que)
+        self._que = 0
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+
+    @property
+    def name(self) -> str:
+
+        status, ret = tibrvQueue_GetName(self.id())
+        self._err = TibrvStatus.error(status)
+
+        return ret
+
+    @name.setter
+    def name(self, sz: str) -> None:
+        status = tibrvQueue_SetName(self.id(), sz)
+        self._err = TibrvStatus.error(status)
+
+    def dispatch(self) -> int:
+
+        status = tibrvQueue_Dispatch(self.id())
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def count(self) -> int:
+
+        status, ret = tibrvQueue_GetCount(self.id())
+        self._err = TibrvStatus.error(status)
+
+        return ret
+
+    def setPolicy(self, policy: int, maxEvents: int, discardAmount: int) -> tibrv_status:
+
+        status = tibrvQueue_SetLimitPolicy(self.id(), policy, maxEvents, discardAmount)
+        self._err = TibrvStatus.error(status)
+
+        if status == TIBRV_OK:
+            self._policy = int(policy)
+            self._maxEvents = int(maxEvents)
+            self._discard = int(discardAmount)
+
+        return status
+
+    def policy(self) -> int:
+        return self._policy
+
+    def maxEvents(self) -> str:
+        return self._maxEvents
+
+    def discardAmount(self) -> str:
+        return self._discard
+
+    @property
+    def priority(self) -> str:
+
+        status, ret = tibrvQueue_GetPriority(self.id())
+        self._err = TibrvStatus.error(status)
+
+        return ret
+
+    @priority.setter
+    def priority(self, val: int) -> None:
+
+        status = tibrvQueue_SetPriority(self.id(), val)
+        self._err = TibrvStatus.error(status)
+
+    def poll(self) -> tibrv_status:
+
+        status = tibrvQueue_Poll(self.id())
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+
+    def timedDispatch(self, timeout: float) -> tibrv_status:
+
+        status = tibrvQueue_TimedDispatch(self.id(), timeout)
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def error(self) -> TibrvError :
+        return self._err
+
+
+##-----------------------------------------------------------------------------
+# TibrvQueueGroup
+##-----------------------------------------------------------------------------
+from .qgroup import tibrvQueueGroup, \
+                    tibrvQueueGroup_Create, tibrvQueueGroup_Destroy, \
+                    tibrvQueueGroup_Add, tibrvQueueGroup_Remove, \
+                    tibrvQueueGroup_Dispatch, tibrvQueueGroup_Poll, \
+                    tibrvQueueGroup_TimedDispatch
+
+class TibrvQueueGroup:
+
+    def __init__(self):
+        self._grp = tibrvQueueGroup(0)
+        self._err = None
+        self._queues = []
+
+    def id(self):
+        return self._grp
+
+    def create(self) -> tibrv_status:
+
+        if self._grp != 0:
+            status = TIBRV_ID_IN_USE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        status, grp = tibrvQueueGroup_Create()
+        if status == TIBRV_OK:
+            self._grp = grp
+
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def destroy(self) -> tibrv_status:
+
+        if self._grp == 0:
+            status = TIBRV_INVALID_QUEUE_GROUP
+            self._err = TibrvStatus.error(status)
+            return status
+
+        # queues in group are NOT destroyed
+        status = tibrvQueueGroup_Destroy(self._grp)
+        self._grp = 0
+        self._queues = []
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def add(self, que: TibrvQueue) -> tibrv_status:
+
+        if que is None or not isinstance(que, TibrvQueue):
+            status = TIBRV_INVALID_QUEUE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        status = tibrvQueueGroup_Add(self.id(), que.id())
+        if status == TIBRV_OK:
+            self._queues.append(que)
+
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def remove(self, que: TibrvQueue) -> tibrv_status:
+
+        if que is None or not isinstance(que, TibrvQueue):
+            status = TIBRV_INVALID_QUEUE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        status = tibrvQueueGroup_Remove(self.id(), que.id())
+        if status == TIBRV_OK and que in self._queues:
+            self._queues.remove(que)
+
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def queues(self) -> list:
+        return list(self._queues)
+
+    def dispatch(self) -> tibrv_status:
+
+        status = tibrvQueueGroup_Dispatch(self.id())
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def poll(self) -> tibrv_status:
+
+        status = tibrvQueueGroup_Poll(self.id())
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def timedDispatch(self, timeout: float) -> tibrv_status:
+
+        status = tibrvQueueGroup_TimedDispatch(self.id(), timeout)
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def error(self) -> TibrvError:
+        return self._err
+
+
+##-----------------------------------------------------------------------------
+## TibrvTx
+##-----------------------------------------------------------------------------
+from .tport import tibrvTransport, tibrvTransport_Create, tibrvTransport_Destroy, \
+                   tibrvTransport_CreateInbox, tibrvTransport_GetService, \
+                   tibrvTransport_GetDaemon, tibrvTransport_GetNetwork, tibrvTransport_GetDescription, \
+                   tibrvTransport_RequestReliability, tibrvTransport_SetDescription, \
+                   tibrvTransport_Send, tibrvTransport_SendRequest, tibrvTransport_SendReply
+
+class TibrvTx :
+    def __init__(self, tx: tibrvTransport = 0):
+        self._tx = 0
+        self._err = None
+        self._requester = None
+        if tx is not None:
+            self._tx = tibrvTransport(tx)
+
+    def id(self):
+        return self._tx
+
+    def create(self, service: str, network: str, daemon: str) -> int:
+        if self._tx != 0:
+            status = TIBRV_ID_IN_USE
             self._err = TibrvStatus.error(status)
             return status
 
@@ -1526,6 +2514,10 @@ class TibrvTx :
         return status
 
     def destroy(self) -> int:
+        if self._requester is not None:
+            self._requester.close()
+            self._requester = None
+
         status = tibrvTransport_Destroy(self._tx)
         self._tx = 0
 
@@ -1600,6 +2592,10 @@ class TibrvTx :
 
         status = tibrvTransport_Send(self.id(), msg.id())
 
+        if msg._sendRelease:
+            # from TibrvMsgPool.acquire()
+            msg._pool.release(msg)
+
         self._err = TibrvStatus.error(status)
 
         return status
@@ -1626,6 +2622,133 @@ class TibrvTx :
 
         return status, reply
 
+    def requestFuture(self, msg: TibrvMsg, timeout: float, subj: str = None) -> _futures.Future:
+        # non-blocking sendRequest()
+        # return concurrent.futures.Future, result is (status, reply)
+        # reply is owned by caller, should call reply.destroy()
+
+        status = self.__prepare(msg, subj)
+        if status != TIBRV_OK:
+            fut = _futures.Future()
+            fut.set_result((status, None))
+            return fut
+
+        return self._requester.request(msg, timeout)
+
+    async def request(self, msg: TibrvMsg, timeout: float, subj: str = None) -> (tibrv_status, TibrvMsg):
+        # status, reply = await tx.request(msg, 1.0)
+        fut = self.requestFuture(msg, timeout, subj)
+        return await _asyncio.wrap_future(fut)
+
+    def gatherFuture(self, msg: TibrvMsg, subj: str, timeout: float,
+                     maxReplies: int = 0) -> _futures.Future:
+        # send once, collect all replies until timeout, or maxReplies arrived
+        # return concurrent.futures.Future, result is (status, [replies])
+        # status is TIBRV_TIMEOUT if no reply
+        # status is TIBRV_INVALID_ARG if maxReplies = 0 and timeout is None or WAIT_FOREVER
+        # replies are owned by caller, should call reply.destroy()
+
+        status = self.__prepare(msg, subj)
+        if status != TIBRV_OK:
+            fut = _futures.Future()
+            fut.set_result((status, []))
+            return fut
+
+        return self._requester.gather(msg, timeout, maxReplies)
+
+    def gather(self, msg: TibrvMsg, subj: str, timeout: float,
+               maxReplies: int = 0) -> (tibrv_status, list):
+        # blocking gatherFuture()
+        return self.gatherFuture(msg, subj, timeout, maxReplies).result()
+
+    async def gatherIter(self, msg: TibrvMsg, subj: str, timeout: float, maxReplies: int = 0):
+        # async for reply in tx.gatherIter(msg, subj, 1.0):
+        #     ...
+        # reply is destroyed when next reply was fetched, call reply.copy() to keep it
+        # inbox listener is destroyed when async for exited, or timeout, or maxReplies arrived
+
+        status = self.__prepare(msg, subj)
+        if status != TIBRV_OK:
+            return
+
+        loop = _asyncio.get_running_loop()
+        que = _asyncio.Queue()
+        closed = [False]
+
+        def put(reply):
+            # loop thread
+            if closed[0]:
+                if reply is not None:
+                    reply.destroy()
+                return
+            que.put_nowait(reply)
+
+        fut = self._requester.gather(msg, timeout, maxReplies,
+                                     lambda r: loop.call_soon_threadsafe(put, r))
+        fut.add_done_callback(lambda f: loop.call_soon_threadsafe(put, None))
+
+        try:
+            while True:
+                reply = await que.get()
+                if reply is None:
+                    return
+
+                try:
+                    yield reply
+                finally:
+                    reply.destroy()
+        finally:
+            closed[0] = True
+            fut.cancel()
+            while not que.empty():
+                reply = que.get_nowait()
+                if reply is not None:
+                    reply.destroy()
+
+    def createInboxPool(self, size: int = 16, quarantine: float = 1.0) -> 'TibrvInboxPool':
+        # pool inbox listeners for requestFuture()/request()/gather()
+        if self.id() == 0:
+            status = TIBRV_INVALID_TRANSPORT
+            self._err = TibrvStatus.error(status)
+            return None
+
+        if self._requester is None:
+            self._requester = _TibrvRequester(self)
+
+        req = self._requester
+        if req._pool is not None:
+            req._pool.destroy()
+
+        req._pool = TibrvInboxPool(req, size, quarantine)
+        self._err = None
+
+        return req._pool
+
+    def inboxPool(self) -> 'TibrvInboxPool':
+        if self._requester is None:
+            return None
+
+        return self._requester._pool
+
+    def __prepare(self, msg: TibrvMsg, subj: str) -> tibrv_status:
+        # for requestFuture/gatherFuture
+
+        if msg is None or not isinstance(msg, TibrvMsg):
+            status = TIBRV_INVALID_MSG
+        elif self.id() == 0:
+            status = TIBRV_INVALID_TRANSPORT
+        elif subj is not None:
+            status = tibrvMsg_SetSendSubject(msg.id(), subj)
+        else:
+            status = TIBRV_OK
+
+        self._err = TibrvStatus.error(status)
+
+        if status == TIBRV_OK and self._requester is None:
+            self._requester = _TibrvRequester(self)
+
+        return status
+
     def sendReply(self, msg: TibrvMsg, request: TibrvMsg) -> tibrv_status:
         if msg is None or not isinstance(msg, TibrvMsg):
             status = TIBRV_INVALID_MSG
@@ -1649,10 +2772,12 @@ class TibrvTx :
 ##-----------------------------------------------------------------------------
 from .events import tibrvEvent, tibrvClosure,  \
                     tibrvEvent_CreateTimer, tibrvEvent_CreateListener, \
-                    tibrvEvent_CreateVectorListener, tibrvEvent_Destroy, \
+                    tibrvEvent_CreateVectorListener, tibrvEvent_CreateGroupVectorListener, \
+                    tibrvEvent_Destroy, \
                     tibrvEvent_GetType, tibrvEvent_ResetTimerInterval, \
                     tibrvEvent_GetTimerInterval, tibrvEvent_GetQueue, \
                     tibrvEvent_GetListenerSubject, tibrvEvent_GetListenerTransport
+from .api import _c_tibrvEventVectorCallback
 
 class TibrvTimerCallback:
 
@@ -1677,32 +2802,167 @@ class TibrvTimerCallback:
         return _cb
 
 
-class TibrvMsgCallback:
+class TibrvMsgCallback:
+
+    def __init__(self, cb = None):
+        if cb is not None:
+            self.callback = cb
+
+    def callback(self, event, msg: TibrvMsg, closure):
+        pass
+
+    def _register(self):
+        def _cb(event, msg, closure):
+            if event != 0:
+                ev = TibrvListener(event)
+            else:
+                ev = None
+
+            if msg != 0:
+                m = TibrvMsg(msg)
+            else:
+                m = None
+
+            cz = tibrvClosure(closure)
+
+            try:
+                self.callback(ev, m, cz)
+            finally:
+                # TIBRV would destroy msg after callback, unless detached
+                if m is not None and m._copied and not m._release():
+                    # array view was exported, keep it, owned by caller now
+                    m.detach()
+
+        return _cb
+
+
+class TibrvMsgVectorCallback:
+
+    def __init__(self, cb = None):
+        if cb is not None:
+            self.callback = cb
+
+    def callback(self, event, msgs: list, closure):
+        pass
+
+    def _register(self):
+        return _TibrvMsgVector(self)
+
+
+class _TibrvMsgVector:
+    # C callback for one vector listener
+    #   list and TibrvMsg objects are reused for every batch
+    #   callback should copy the list, or detach() the msg, to keep it
+
+    def __init__(self, callback: TibrvMsgVectorCallback):
+        self._callback = callback
+        self._batch = []
+        self._objs = []
+        self._batches = 0
+        self._messages = 0
+        self._last = 0
+        self._max = 0
+
+    def __call__(self, msgs, num):
+        n = int(num)
+        if n == 0:
+            return
+
+        self._batches = self._batches + 1
+        self._messages = self._messages + n
+        self._last = n
+        if n > self._max:
+            self._max = n
+
+        objs = self._objs
+        while len(objs) < n:
+            objs.append(TibrvMsg())
+
+        batch = self._batch
+        batch.clear()
+        for x in range(n):
+            m = objs[x]
+            m._msg = msgs[x]
+            m._copied = True
+            batch.append(m)
+
+        try:
+            self._invoke(batch)
+        finally:
+            # TIBRV would destroy msgs after callback, unless detached
+            for x in range(n):
+                m = objs[x]
+                if m._copied:
+                    if m._release():
+                        continue
+                    # array view was exported, keep it, owned by caller now
+                    m.detach()
+                # detached, owned by caller now
+                objs[x] = TibrvMsg()
+            batch.clear()
+
+    def _invoke(self, batch: list):
+        # same callback for all msgs in a batch, take event/closure from 1st
+        status, event = tibrvMsg_GetEvent(batch[0].id())
+        ev = TibrvVectorListener(event) if status == TIBRV_OK and event != 0 else None
+        status, cz = tibrvMsg_GetClosure(batch[0].id())
+
+        self._callback.callback(ev, batch, cz)
+
+    def stats(self) -> dict:
+        return dict(batches=self._batches, messages=self._messages,
+                    last=self._last, max=self._max)
+
+
+class TibrvMsgGroupCallback:
 
     def __init__(self, cb = None):
         if cb is not None:
             self.callback = cb
 
-    def callback(self, event, msg: TibrvMsg, closure):
+    def callback(self, group, msgs: list, subjects: list, closure):
         pass
 
-    def _register(self):
-        def _cb(event, msg, closure):
-            if event != 0:
-                ev = TibrvListener(event)
-            else:
-                ev = None
 
-            if msg != 0:
-                m = TibrvMsg(msg)
-            else:
-                m = None
+class _TibrvMsgGroupVector(_TibrvMsgVector):
+    # C callback for TibrvGroupVectorListener
+    #   subjects[x] is send subject of msgs[x], decoded str is interned
 
-            cz = tibrvClosure(closure)
+    _SUBJECT_MAX = 4096
 
-            self.callback(ev, m, cz)
+    def __init__(self, callback: TibrvMsgGroupCallback, group: 'TibrvGroupVectorListener'):
+        super().__init__(callback)
+        self._group = group
+        self._subjects = []
+        self._names = {}
+        self._sz = _c_tibrv_str()
+        self._ref = _ctypes.byref(self._sz)
 
-        return _cb
+    def _invoke(self, batch: list):
+        names = self._names
+        subjects = self._subjects
+        subjects.clear()
+
+        sz = self._sz
+        ref = self._ref
+        for m in batch:
+            if _rv.tibrvMsg_GetSendSubject(m.id(), ref) != TIBRV_OK or sz.value is None:
+                subjects.append(None)
+                continue
+
+            key = sz.value
+            subj = names.get(key)
+            if subj is None:
+                if len(names) >= self._SUBJECT_MAX:
+                    names.clear()
+                subj = key.decode()
+                names[key] = subj
+            subjects.append(subj)
+
+        try:
+            self._callback.callback(self._group, batch, subjects, self._group._closure)
+        finally:
+            subjects.clear()
 
 
 class TibrvEvent:
@@ -1841,6 +3101,534 @@ class TibrvListener(TibrvEvent):
         return ret
 
 
+class TibrvVectorListener(TibrvListener):
+
+    def __init__(self, event: tibrvEvent = 0):
+        super().__init__(event)
+        self._vector = None
+
+    def create(self, que: TibrvQueue, callback: TibrvMsgVectorCallback, tx: TibrvTx,
+               subject: str, closure = None) -> tibrv_status:
+
+        if self._event != 0:
+            status = TIBRV_ID_IN_USE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if que is None or not isinstance(que, TibrvQueue):
+            status = TIBRV_INVALID_QUEUE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if tx is None or not isinstance(tx, TibrvTx):
+            status = TIBRV_INVALID_TRANSPORT
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if callback is None or not isinstance(callback, TibrvMsgVectorCallback):
+            status = TIBRV_INVALID_CALLBACK
+            self._err = TibrvStatus.error(status)
+            return status
+
+        vector = callback._register()
+        status, self._event = tibrvEvent_CreateVectorListener(que.id(), vector,
+                                                              tx.id(), subject, closure)
+        if status == TIBRV_OK:
+            self._vector = vector
+
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def stats(self) -> dict:
+        # batch size: number of batches/messages, last and max batch size
+        if self._vector is None:
+            return dict(batches=0, messages=0, last=0, max=0)
+
+        return self._vector.stats()
+
+
+class TibrvGroupVectorListener:
+    # many subjects, one callback, one group
+    #   all listeners share one C callback pointer and groupId
+    #   TIBRV dispatch messages of all subjects in one vector
+
+    def __init__(self):
+        self._err = None
+        self._que = None
+        self._tx = None
+        self._vector = None
+        self._cb = None
+        self._closure = None
+        self._events = {}
+
+    def create(self, que: TibrvQueue, callback: TibrvMsgGroupCallback, tx: TibrvTx,
+               subjects: list = None, closure = None) -> tibrv_status:
+
+        if self._cb is not None:
+            status = TIBRV_ID_IN_USE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if que is None or not isinstance(que, TibrvQueue):
+            status = TIBRV_INVALID_QUEUE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if tx is None or not isinstance(tx, TibrvTx):
+            status = TIBRV_INVALID_TRANSPORT
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if callback is None or not isinstance(callback, TibrvMsgGroupCallback):
+            status = TIBRV_INVALID_CALLBACK
+            self._err = TibrvStatus.error(status)
+            return status
+
+        self._que = que
+        self._tx = tx
+        self._closure = closure
+        self._vector = _TibrvMsgGroupVector(callback, self)
+        self._cb = _c_tibrvEventVectorCallback(self._vector)
+
+        status = TIBRV_OK
+        if subjects is not None:
+            for subj in subjects:
+                status = self.add(subj)
+                if status != TIBRV_OK:
+                    break
+
+        self._err = TibrvStatus.error(status)
+        return status
+
+    def add(self, subject: str) -> tibrv_status:
+
+        if self._cb is None:
+            status = TIBRV_INVALID_EVENT
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if subject in self._events:
+            status = TIBRV_ID_IN_USE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        status, ev = tibrvEvent_CreateGroupVectorListener(self._que.id(), self._cb, self._tx.id(),
+                                                          subject, None, id(self))
+        if status == TIBRV_OK:
+            self._events[subject] = ev
+
+        self._err = TibrvStatus.error(status)
+        return status
+
+    def remove(self, subject: str) -> tibrv_status:
+
+        ev = self._events.pop(subject, None)
+        if ev is None:
+            status = TIBRV_INVALID_EVENT
+        else:
+            status = tibrvEvent_Destroy(ev)
+
+        self._err = TibrvStatus.error(status)
+        return status
+
+    def destroy(self) -> tibrv_status:
+
+        status = TIBRV_OK
+        for ev in self._events.values():
+            ret = tibrvEvent_Destroy(ev)
+            if ret != TIBRV_OK:
+                status = ret
+
+        self._events.clear()
+        self._cb = None
+
+        self._err = TibrvStatus.error(status)
+        return status
+
+    def subjects(self) -> list:
+        return list(self._events.keys())
+
+    def stats(self) -> dict:
+        if self._vector is None:
+            return dict(batches=0, messages=0, last=0, max=0)
+
+        return self._vector.stats()
+
+    def error(self) -> TibrvError:
+        return self._err
+
+    def __len__(self):
+        return len(self._events)
+
+
+##-----------------------------------------------------------------------------
+## _TibrvRequester
+##   non-blocking request/reply for TibrvTx.request()/requestFuture()/gather()
+##
+##   one private queue, one dispatch thread and one C callback per transport
+##   each request listens on its own inbox (TIBRV inbox could not be wildcard)
+##   replies/timeout complete a concurrent.futures.Future
+##     request : (status, reply)
+##     gather  : (status, [replies])
+##-----------------------------------------------------------------------------
+from .api import _c_tibrvEventCallback
+
+class _TibrvRequest:
+
+    def __init__(self, fut: _futures.Future, inbox: str, maxReplies: int, single: bool, onReply):
+        self.fut = fut
+        self.inbox = inbox
+        self.pool = None                # TibrvInboxPool, if inbox was leased
+        self.maxReplies = maxReplies
+        self.single = single
+        self.onReply = onReply
+        self.replies = []
+        self.count = 0
+
+
+class TibrvInboxPool:
+    # long-lived inbox listeners leased to TibrvTx.requestFuture()/gatherFuture()
+    #   created by TibrvTx.createInboxPool(size, quarantine)
+    #
+    #   inbox is returned to pool only if all replies expected had arrived,
+    #   otherwise (timeout, cancel, gather without maxReplies) it is destroyed.
+    #   returned inbox is not leased again in quarantine seconds,
+    #   late replies to it are discarded.
+    #   if all inboxes are leased (exhausted), a temporary inbox is used
+
+    def __init__(self, requester: '_TibrvRequester', size: int, quarantine: float):
+        self._requester = requester
+        self._size = max(0, int(size))
+        self._quarantine = max(0.0, float(quarantine))
+        self._lock = _threading.Lock()
+        self._free = _deque()               # (ready time, event, inbox)
+        self._total = 0
+        self._leased = 0
+        self._created = 0
+        self._reused = 0
+        self._exhausted = 0
+        self._discarded = 0
+        self._leaseCount = 0
+        self._leaseTime = 0.0
+        self._leaseMax = 0.0
+        self._closed = False
+
+    def _lease(self) -> (tibrv_status, tibrvEvent, str, bool):
+        t = _time.perf_counter()
+
+        item = None
+        create = False
+        with self._lock:
+            if self._free and self._free[0][0] <= _time.monotonic():
+                item = self._free.popleft()
+                self._reused = self._reused + 1
+            elif self._total < self._size:
+                self._total = self._total + 1
+                create = True
+            else:
+                self._exhausted = self._exhausted + 1
+
+        if item is not None:
+            ev, inbox, pooled = item[1], item[2], True
+            status = TIBRV_OK
+        else:
+            status, ev, inbox = self._requester._listen()
+            pooled = create
+            if create:
+                with self._lock:
+                    if status == TIBRV_OK:
+                        self._created = self._created + 1
+                    else:
+                        self._total = self._total - 1
+
+        t = _time.perf_counter() - t
+
+        with self._lock:
+            if status == TIBRV_OK and pooled:
+                self._leased = self._leased + 1
+            self._leaseCount = self._leaseCount + 1
+            self._leaseTime = self._leaseTime + t
+            if t > self._leaseMax:
+                self._leaseMax = t
+
+        return status, ev, inbox, pooled
+
+    def _release(self, ev, inbox: str, reuse: bool):
+        with self._lock:
+            self._leased = self._leased - 1
+            if reuse and not self._closed:
+                self._free.append((_time.monotonic() + self._quarantine, ev, inbox))
+                return
+
+            self._total = self._total - 1
+            self._discarded = self._discarded + 1
+
+        tibrvEvent_Destroy(ev)
+
+    def destroy(self):
+        # destroy free inboxes, leased inboxes would be destroyed when released
+        with self._lock:
+            self._closed = True
+            free = list(self._free)
+            self._free.clear()
+            self._total = self._total - len(free)
+
+        for item in free:
+            tibrvEvent_Destroy(item[1])
+
+    def size(self) -> int:
+        return self._size
+
+    def stats(self) -> dict:
+        # lease latency in micro-seconds
+        with self._lock:
+            avg = self._leaseTime / self._leaseCount if self._leaseCount > 0 else 0.0
+            return dict(size=self._size, total=self._total, free=len(self._free),
+                        leased=self._leased, created=self._created, reused=self._reused,
+                        exhausted=self._exhausted, discarded=self._discarded,
+                        leaseCount=self._leaseCount,
+                        leaseAvgUs=avg * 1e6, leaseMaxUs=self._leaseMax * 1e6)
+
+
+class _TibrvRequester:
+
+    WAIT = 0.1          # max wait of dispatch thread, timeout resolution
+
+    def __init__(self, tx: 'TibrvTx'):
+        self._tx = tx
+        self._lock = _threading.Lock()
+        self._pending = {}              # event -> _TibrvRequest
+        self._timeout = []              # heap of (deadline, seq, event)
+        self._seq = 0
+        self._que = 0
+        self._thread = None
+        self._closed = False
+        self._cb = _c_tibrvEventCallback(self._onReply)
+        self._pool = None
+
+    def _start(self) -> tibrv_status:
+        # call with _lock locked
+        if self._thread is not None:
+            return TIBRV_OK
+
+        status, que = tibrvQueue_Create()
+        if status != TIBRV_OK:
+            return status
+
+        self._que = que
+        self._thread = _threading.Thread(target=self._run, name='TibrvRequester', daemon=True)
+        self._thread.start()
+
+        return TIBRV_OK
+
+    def request(self, msg: TibrvMsg, timeout: float) -> _futures.Future:
+        return self._send(msg, timeout, 1, True, None)
+
+    def gather(self, msg: TibrvMsg, timeout: float, maxReplies: int = 0, onReply = None) -> _futures.Future:
+        # onReply(reply) : called in dispatch thread for each reply,
+        #                  reply is owned by onReply, not collected into list
+        # maxReplies = 0 : until timeout, timeout must not be None or WAIT_FOREVER
+
+        if maxReplies is None or maxReplies < 0 or \
+           (maxReplies == 0 and (timeout is None or timeout < 0)):
+            fut = _futures.Future()
+            fut.set_result((TIBRV_INVALID_ARG, []))
+            return fut
+
+        return self._send(msg, timeout, maxReplies, False, onReply)
+
+    def _send(self, msg: TibrvMsg, timeout: float, maxReplies: int, single: bool, onReply) -> _futures.Future:
+        fut = _futures.Future()
+        failed = None if single else []
+
+        with self._lock:
+            if self._closed:
+                status = TIBRV_INVALID_TRANSPORT
+            else:
+                status = self._start()
+
+        if status != TIBRV_OK:
+            fut.set_result((status, failed))
+            return fut
+
+        # listen before send, reply may come back immediately
+        pool = self._pool
+        if pool is not None:
+            status, ev, inbox, pooled = pool._lease()
+        else:
+            status, ev, inbox = self._listen()
+            pooled = False
+
+        if status != TIBRV_OK:
+            fut.set_result((status, failed))
+            return fut
+
+        req = _TibrvRequest(fut, inbox, maxReplies, single, onReply)
+        if pooled:
+            req.pool = pool
+
+        with self._lock:
+            self._pending[ev] = req
+            if timeout is not None and timeout >= 0:
+                self._seq = self._seq + 1
+                _heapq.heappush(self._timeout, (_time.monotonic() + timeout, self._seq, ev, req))
+
+        fut.add_done_callback(lambda f, ev=ev, req=req: self._cancel(ev, req) if f.cancelled() else None)
+
+        status = tibrvMsg_SetReplySubject(msg.id(), inbox)
+        if status == TIBRV_OK:
+            status = tibrvTransport_Send(self._tx.id(), msg.id())
+
+        if status != TIBRV_OK:
+            self._complete(ev, status)
+
+        return fut
+
+    def _listen(self) -> (tibrv_status, tibrvEvent, str):
+        status, inbox = tibrvTransport_CreateInbox(self._tx.id())
+        if status != TIBRV_OK:
+            return status, 0, None
+
+        status, ev = tibrvEvent_CreateListener(self._que, self._cb, self._tx.id(), inbox, None)
+        if status != TIBRV_OK:
+            return status, 0, None
+
+        return status, ev, inbox
+
+    def _unlisten(self, ev, req: _TibrvRequest, reuse: bool):
+        # reuse pooled inbox only if all replies expected had arrived
+        if req.pool is not None:
+            req.pool._release(ev, req.inbox, reuse)
+        else:
+            tibrvEvent_Destroy(ev)
+
+    def _complete(self, ev, status: tibrv_status) -> bool:
+        # status: TIBRV_OK, TIBRV_TIMEOUT or error
+        with self._lock:
+            req = self._pending.pop(ev, None)
+
+        if req is None:
+            return False
+
+        # stop listen before complete
+        reuse = status == TIBRV_OK and req.maxReplies > 0 and req.count >= req.maxReplies
+        self._unlisten(ev, req, reuse)
+
+        if status == TIBRV_TIMEOUT and req.count > 0:
+            status = TIBRV_OK
+
+        if req.single:
+            ret = (status, req.replies[0] if req.replies else None)
+        else:
+            ret = (status, req.replies)
+
+        if req.fut.done():
+            # cancelled
+            for r in req.replies:
+                r.destroy()
+            return False
+
+        req.fut.set_result(ret)
+        return True
+
+    def _cancel(self, ev, req: _TibrvRequest):
+        with self._lock:
+            if self._pending.get(ev) is not req:
+                # completed, inbox may be leased to others
+                return
+            del self._pending[ev]
+
+        self._unlisten(ev, req, False)
+
+        for r in req.replies:
+            r.destroy()
+
+    def _onReply(self, event, msg, closure):
+        # dispatch thread
+        if msg is None or msg == 0:
+            return
+
+        # under _lock, _cancel()/_complete() pop the request before reading replies,
+        # reply after that is not collected, destroyed by TIBRV
+        with self._lock:
+            req = self._pending.get(event)
+            if req is None:
+                # completed, msg would be destroyed by TIBRV
+                return
+
+            # keep msg after callback, owned by caller
+            if tibrvMsg_Detach(msg) != TIBRV_OK:
+                return
+
+            reply = TibrvMsg(msg)
+            reply._copied = False
+
+            req.count = req.count + 1
+            if req.onReply is None:
+                req.replies.append(reply)
+
+            done = req.maxReplies > 0 and req.count >= req.maxReplies
+
+        if req.onReply is not None:
+            req.onReply(reply)
+
+        if done:
+            self._complete(event, TIBRV_OK)
+
+    def _expire(self):
+        now = _time.monotonic()
+        expired = []
+
+        with self._lock:
+            while self._timeout and self._timeout[0][0] <= now:
+                deadline, seq, ev, req = _heapq.heappop(self._timeout)
+                if self._pending.get(ev) is req:
+                    expired.append(ev)
+
+        for ev in expired:
+            self._complete(ev, TIBRV_TIMEOUT)
+
+    def _wait(self) -> float:
+        with self._lock:
+            if not self._timeout:
+                return self.WAIT
+            wait = self._timeout[0][0] - _time.monotonic()
+
+        return min(max(wait, 0.0), self.WAIT)
+
+    def _run(self):
+        while not self._closed:
+            status = tibrvQueue_TimedDispatch(self._que, self._wait())
+            if status != TIBRV_OK and status != TIBRV_TIMEOUT:
+                # queue destroyed
+                break
+
+            self._expire()
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            pending = list(self._pending.keys())
+            thread = self._thread
+            self._thread = None
+
+        for ev in pending:
+            self._complete(ev, TIBRV_INVALID_TRANSPORT)
+
+        if self._pool is not None:
+            self._pool.destroy()
+            self._pool = None
+
+        if thread is not None:
+            thread.join()
+            tibrvQueue_Destroy(self._que)
+            self._que = 0
+
+
 ##-----------------------------------------------------------------------------
 ## TibrvDispatcher
 ##-----------------------------------------------------------------------------
@@ -1857,7 +3645,8 @@ class TibrvDispatcher :
     def id(self):
         return self._disp
 
-    def create(self, que: TibrvQueue, timeout: float = TIBRV_WAIT_FOREVER) -> tibrv_status:
+    def create(self, que, timeout: float = TIBRV_WAIT_FOREVER) -> tibrv_status:
+        # que : TibrvQueue or TibrvQueueGroup
 
         if self._disp != 0:
             status = TIBRV_ID_IN_USE
@@ -1865,7 +3654,7 @@ class TibrvDispatcher :
 
             return status
 
-        if que is None or not isinstance(que, TibrvQueue):
+        if que is None or not isinstance(que, (TibrvQueue, TibrvQueueGroup)):
             status = TIBRV_INVALID_QUEUE
             self._err = TibrvStatus.error(status)
 
@@ -1920,3 +3709,279 @@ class TibrvDispatcher :
     def error(self) -> TibrvError:
         return self._err
 
+
+
+##-----------------------------------------------------------------------------
+## TibrvShardedDispatcher
+##-----------------------------------------------------------------------------
+class _TibrvShard:
+
+    def __init__(self, index: int, maxsize: int):
+        self.index = index
+        self.maxsize = maxsize
+        self.high = max(1, maxsize * 8 // 10)
+        self.low = maxsize // 2
+        self.buf = _deque()
+        self.cv = _threading.Condition()
+        self.thread = None
+        self.pressure = False
+        self.maxDepth = 0
+        self.processed = 0
+        self.dropped = 0
+        self.blocked = 0
+        self.errors = 0
+
+    def stats(self) -> dict:
+        with self.cv:
+            return dict(shard=self.index, depth=len(self.buf), maxDepth=self.maxDepth,
+                        processed=self.processed, dropped=self.dropped,
+                        blocked=self.blocked, errors=self.errors,
+                        pressure=self.pressure)
+
+
+class TibrvShardedDispatcher:
+
+    WAIT = 0.1          # max wait of blocked intake, for destroy()
+
+    def __init__(self, n_workers: int = 4, key_fn = None, maxsize: int = 1000,
+                 policy: int = TibrvQueue.DISCARD_NONE):
+        # key_fn : key_fn(msg) -> hashable, str as field name, None is send subject
+        # maxsize: bounded buffer per worker
+        # policy : TibrvQueue.DISCARD_NONE  - block intake when full (default)
+        #          TibrvQueue.DISCARD_NEW   - discard incoming msg
+        #          TibrvQueue.DISCARD_FIRST - discard oldest msg in buffer
+        self._nWorkers = n_workers
+        self._keyFn = key_fn
+        self._maxsize = maxsize
+        self._policy = policy
+        self._shards = []
+        self._grp = None
+        self._disp = None
+        self._running = False
+        self._onPressure = None
+        self._err = None
+
+    def create(self, ques, timeout: float = TIBRV_WAIT_FOREVER, onPressure = None) -> tibrv_status:
+        # ques       : TibrvQueue or list of TibrvQueue, dispatched by priority
+        # onPressure : onPressure(shard, depth, high)
+        #              high is True when depth reached 80% of maxsize,
+        #              False when drained to 50%
+
+        if self._disp is not None:
+            status = TIBRV_ID_IN_USE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if isinstance(ques, TibrvQueue):
+            ques = [ques]
+
+        if ques is None or len(ques) == 0 or \
+           not all(isinstance(q, TibrvQueue) for q in ques):
+            status = TIBRV_INVALID_QUEUE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if self._nWorkers is None or self._nWorkers <= 0 or \
+           self._maxsize is None or self._maxsize <= 0 or \
+           self._policy not in (TibrvQueue.DISCARD_NONE, TibrvQueue.DISCARD_NEW,
+                                TibrvQueue.DISCARD_FIRST):
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if self._keyFn is None:
+            self._key = lambda msg: msg.sendSubject
+        elif isinstance(self._keyFn, str):
+            name = self._keyFn
+            self._key = lambda msg: msg.getStr(name)
+        elif callable(self._keyFn):
+            self._key = self._keyFn
+        else:
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if len(ques) == 1:
+            dispatchable = ques[0]
+        else:
+            self._grp = TibrvQueueGroup()
+            status = self._grp.create()
+            for q in ques:
+                if status == TIBRV_OK:
+                    status = self._grp.add(q)
+
+            if status != TIBRV_OK:
+                self._grp.destroy()
+                self._grp = None
+                self._err = TibrvStatus.error(status)
+                return status
+
+            dispatchable = self._grp
+
+        self._onPressure = onPressure
+        self._running = True
+        self._shards = [_TibrvShard(x, int(self._maxsize)) for x in range(int(self._nWorkers))]
+        for sh in self._shards:
+            sh.thread = _threading.Thread(target=self._run, args=(sh,),
+                                          name='TibrvShard-{}'.format(sh.index), daemon=True)
+            sh.thread.start()
+
+        disp = TibrvDispatcher()
+        status = disp.create(dispatchable, timeout)
+        if status != TIBRV_OK:
+            self._disp = disp
+            self.destroy()
+            self._err = TibrvStatus.error(status)
+            return status
+
+        self._disp = disp
+        self._err = None
+
+        return status
+
+    def destroy(self) -> tibrv_status:
+        # msgs not processed are discarded
+
+        if self._disp is None:
+            status = TIBRV_INVALID_DISPATCHER
+            self._err = TibrvStatus.error(status)
+            return status
+
+        self._running = False
+        for sh in self._shards:
+            with sh.cv:
+                sh.cv.notify_all()
+
+        status = TIBRV_OK
+        if self._disp.id() != 0:
+            status = self._disp.destroy()
+        self._disp = None
+
+        for sh in self._shards:
+            sh.thread.join()
+            while len(sh.buf) > 0:
+                sh.buf.popleft()[2].destroy()
+
+        if self._grp is not None:
+            self._grp.destroy()
+            self._grp = None
+
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def callback(self, cb) -> TibrvMsgCallback:
+        # cb : TibrvMsgCallback or callable(event, msg, closure)
+        #      called in worker thread, msgs with same key in order
+        #      msg is destroyed after cb returned
+
+        if not isinstance(cb, TibrvMsgCallback):
+            cb = TibrvMsgCallback(cb)
+
+        return TibrvMsgCallback(lambda ev, msg, closure: self._intake(cb, ev, msg, closure))
+
+    def shard(self, msg: TibrvMsg) -> int:
+        return hash(self._key(msg)) % len(self._shards)
+
+    def workers(self) -> int:
+        return len(self._shards)
+
+    def stats(self) -> list:
+        return [sh.stats() for sh in self._shards]
+
+    def pressure(self) -> list:
+        # index of shards under back-pressure
+        return [sh.index for sh in self._shards if sh.pressure]
+
+    def error(self) -> TibrvError:
+        return self._err
+
+    def _signal(self, sh: _TibrvShard, depth: int, high: bool):
+        if self._onPressure is None:
+            return
+        try:
+            self._onPressure(sh.index, depth, high)
+        except Exception:
+            pass
+
+    def _intake(self, cb: TibrvMsgCallback, ev, msg: TibrvMsg, closure):
+        # TibrvDispatcher thread
+        if msg is None or not self._running:
+            return
+
+        try:
+            sh = self._shards[self.shard(msg)]
+        except Exception:
+            sh = self._shards[0]
+
+        if msg.detach() != TIBRV_OK:
+            return
+
+        item = (cb, ev, msg, closure)
+        drop = None
+        signal = False
+
+        with sh.cv:
+            if len(sh.buf) >= sh.maxsize:
+                if self._policy == TibrvQueue.DISCARD_NEW:
+                    drop = msg
+                elif self._policy == TibrvQueue.DISCARD_FIRST:
+                    drop = sh.buf.popleft()[2]
+                else:
+                    sh.blocked = sh.blocked + 1
+                    while len(sh.buf) >= sh.maxsize and self._running:
+                        sh.cv.wait(self.WAIT)
+
+                    if not self._running:
+                        drop = msg
+
+            if drop is not None:
+                sh.dropped = sh.dropped + 1
+
+            if drop is not msg:
+                sh.buf.append(item)
+                depth = len(sh.buf)
+                if depth > sh.maxDepth:
+                    sh.maxDepth = depth
+                if depth >= sh.high and not sh.pressure:
+                    sh.pressure = True
+                    signal = True
+                sh.cv.notify_all()
+
+        if drop is not None:
+            drop.destroy()
+
+        if signal:
+            self._signal(sh, depth, True)
+
+    def _run(self, sh: _TibrvShard):
+        # worker thread, one per shard
+        while True:
+            signal = False
+            with sh.cv:
+                while len(sh.buf) == 0 and self._running:
+                    sh.cv.wait()
+
+                if not self._running:
+                    return
+
+                cb, ev, msg, closure = sh.buf.popleft()
+                depth = len(sh.buf)
+                if depth <= sh.low and sh.pressure:
+                    sh.pressure = False
+                    signal = True
+                sh.cv.notify_all()
+
+            if signal:
+                self._signal(sh, depth, False)
+
+            try:
+                cb.callback(ev, msg, closure)
+            except Exception:
+                with sh.cv:
+                    sh.errors = sh.errors + 1
+            finally:
+                msg.destroy()
+
+            with sh.cv:
+                sh.processed = sh.processed + 1
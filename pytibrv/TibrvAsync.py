@@ -0,0 +1,261 @@
+##
+# pytibrv/TibrvAsync.py
+#   TIBRV Library for PYTHON
+#   asyncio integration
+#
+# DESCRIPTIONS
+# -----------------------------------------------------------------------------
+# 1. AsyncTibrvQueue
+#    TibrvQueue dispatched by asyncio event loop, NO dispatcher thread
+#
+#    queue hook  : called by TIBRV internal thread when event was queued
+#                  -> write to eventfd (Linux) or pipe
+#    loop reader : fd readable, in asyncio loop thread
+#                  -> tibrvQueue_Poll() until queue is empty
+#
+#    ALL callbacks of events in this queue are called in asyncio loop thread
+#    DO NOT block in callback
+#
+#    que = AsyncTibrvQueue()
+#    que.create('MY QUE')              # in asyncio loop, or pass loop=
+#    ...
+#    que.destroy()
+#
+# 2. AsyncTibrvListener
+#    lst = AsyncTibrvListener()
+#    lst.create(que, tx, 'TEST.>')
+#
+#    async for msg in lst.messages():
+#        print(msg.getStr('DATA'))
+#
+#    msg is detached from TIBRV and destroyed when next msg was fetched,
+#    or async for was exited. call msg.copy() to keep it.
+#
+# 3. asyncio is NOT thread-safe
+#    create/destroy AsyncTibrvQueue and AsyncTibrvListener in loop thread
+#
+##
+import os as _os
+import asyncio as _asyncio
+
+from .status import TIBRV_OK, TIBRV_INVALID_QUEUE, TIBRV_INVALID_ARG
+
+from .queue import tibrvQueue_SetHook, tibrvQueue_Poll
+
+from .Tibrv import tibrv_status, TibrvStatus, TibrvQueue, TibrvTx, \
+                   TibrvListener, TibrvMsg, TibrvMsgCallback
+
+
+##-----------------------------------------------------------------------------
+# _Waker
+#   eventfd for Linux, otherwise pipe
+#   notify() is called in TIBRV thread, clear() in loop thread
+##-----------------------------------------------------------------------------
+class _Waker:
+
+    def __init__(self):
+        if hasattr(_os, 'eventfd'):
+            self._rfd = _os.eventfd(0, _os.EFD_NONBLOCK | _os.EFD_CLOEXEC)
+            self._wfd = self._rfd
+            self._eventfd = True
+        else:
+            self._rfd, self._wfd = _os.pipe()
+            _os.set_blocking(self._rfd, False)
+            _os.set_blocking(self._wfd, False)
+            self._eventfd = False
+
+    def fileno(self) -> int:
+        return self._rfd
+
+    def notify(self):
+        try:
+            if self._eventfd:
+                _os.eventfd_write(self._wfd, 1)
+            else:
+                _os.write(self._wfd, b'\x01')
+        except (BlockingIOError, OSError):
+            # full, reader would be waked anyway
+            pass
+
+    def clear(self):
+        try:
+            if self._eventfd:
+                _os.eventfd_read(self._rfd)
+            else:
+                while _os.read(self._rfd, 4096):
+                    pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def close(self):
+        _os.close(self._rfd)
+        if self._wfd != self._rfd:
+            _os.close(self._wfd)
+
+
+##-----------------------------------------------------------------------------
+# AsyncTibrvQueue
+##-----------------------------------------------------------------------------
+class AsyncTibrvQueue(TibrvQueue):
+
+    def __init__(self):
+        super().__init__(0)
+        self._loop = None
+        self._waker = None
+        self._pending = False
+        self._batch = 1000
+
+    def create(self, name: str = None, loop: _asyncio.AbstractEventLoop = None,
+               batch: int = 1000) -> tibrv_status:
+        # batch : max events dispatched per loop iteration
+
+        if batch is None or batch <= 0:
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        status = super().create(name)
+        if status != TIBRV_OK:
+            return status
+
+        if loop is None:
+            try:
+                loop = _asyncio.get_running_loop()
+            except RuntimeError:
+                loop = _asyncio.get_event_loop()
+
+        self._loop = loop
+        self._batch = int(batch)
+        self._waker = _Waker()
+
+        status = tibrvQueue_SetHook(self.id(), self._hook)
+        if status != TIBRV_OK:
+            self._waker.close()
+            self._waker = None
+            super().destroy()
+            self._err = TibrvStatus.error(status)
+            return status
+
+        loop.add_reader(self._waker.fileno(), self._drain)
+
+        # events queued before hook was set
+        self._loop.call_soon(self._drain)
+
+        self._err = None
+        return status
+
+    def destroy(self) -> tibrv_status:
+
+        if self._waker is None:
+            status = TIBRV_INVALID_QUEUE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        tibrvQueue_SetHook(self.id(), None)
+        self._loop.remove_reader(self._waker.fileno())
+        self._waker.close()
+        self._waker = None
+
+        return super().destroy()
+
+    def loop(self) -> _asyncio.AbstractEventLoop:
+        return self._loop
+
+    def _hook(self, que, closure):
+        # TIBRV thread, notify once until drained
+        if not self._pending:
+            self._pending = True
+            self._waker.notify()
+
+    def _drain(self):
+        # asyncio loop thread
+        if self._waker is None:
+            return
+
+        self._waker.clear()
+        self._pending = False
+
+        for x in range(self._batch):
+            status = tibrvQueue_Poll(self.id())
+            if status != TIBRV_OK:
+                # TIBRV_TIMEOUT: queue is empty
+                return
+
+            if self._waker is None:
+                # destroyed in callback
+                return
+
+        # more events, let others run
+        self._loop.call_soon(self._drain)
+
+
+##-----------------------------------------------------------------------------
+# AsyncTibrvListener
+##-----------------------------------------------------------------------------
+class AsyncTibrvListener(TibrvListener):
+
+    def __init__(self):
+        super().__init__()
+        self._inbox = None
+        self._callback = None
+        self._dropped = 0
+
+    def create(self, que: AsyncTibrvQueue, tx: TibrvTx, subject: str,
+               closure = None, maxsize: int = 0) -> tibrv_status:
+        # maxsize : max msgs not consumed, 0 is unlimited.
+        #           new msg would be discarded if full
+
+        if que is None or not isinstance(que, AsyncTibrvQueue):
+            status = TIBRV_INVALID_QUEUE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        self._inbox = _asyncio.Queue(maxsize)
+        self._callback = TibrvMsgCallback(self._onMsg)
+
+        return super().create(que, self._callback, tx, subject, closure)
+
+    def destroy(self) -> tibrv_status:
+
+        status = super().destroy()
+
+        if self._inbox is not None:
+            # destroy msgs not consumed, then stop messages()
+            while not self._inbox.empty():
+                msg = self._inbox.get_nowait()
+                if msg is not None:
+                    msg.destroy()
+
+            self._inbox.put_nowait(None)
+
+        return status
+
+    def dropped(self) -> int:
+        return self._dropped
+
+    def _onMsg(self, event, msg: TibrvMsg, closure):
+        # asyncio loop thread, dispatched by AsyncTibrvQueue
+        if msg.detach() != TIBRV_OK:
+            return
+
+        try:
+            self._inbox.put_nowait(msg)
+        except _asyncio.QueueFull:
+            self._dropped = self._dropped + 1
+            msg.destroy()
+
+    async def messages(self):
+
+        if self._inbox is None:
+            return
+
+        while True:
+            msg = await self._inbox.get()
+            if msg is None:
+                # listener destroyed
+                return
+
+            try:
+                yield msg
+            finally:
+                msg.destroy()
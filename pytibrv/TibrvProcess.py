@@ -0,0 +1,392 @@
+##
+# pytibrv/TibrvProcess.py
+#   TIBRV Library for PYTHON
+#   fan-out received messages to worker processes
+#
+# DESCRIPTIONS
+# -----------------------------------------------------------------------------
+# 1. TibrvProcessFanout
+#    CPU-heavy callbacks are bound to one core by GIL.
+#    TibrvProcessFanout hands off messages to worker processes
+#
+#    listener callback  : tibrvMsg_GetAsBytes -> shared memory ring of worker
+#    worker process     : tibrvMsg_CreateFromBytes -> handler(msg)
+#
+#    fan = TibrvProcessFanout(handler, 4, 'SYMBOL')
+#    fan.start()
+#    lst.create(que, fan.callback(), tx, 'MD.>')
+#    ...
+#    fan.stats()
+#    fan.stop()
+#
+#    handler(msg) is called in worker process, msg.sendSubject is set,
+#    msg is destroyed after handler returned.
+#    handler MUST be picklable (module level function) for 'spawn'
+#
+# 2. Ordering
+#    key_fn(msg) -> hashable, str as field name, None is send subject
+#    msgs with same key are sent to the same worker, in order.
+#    one ring per worker, single producer (callback) and single consumer
+#
+# 3. Back-pressure
+#    callback is blocked when ring of worker is full, at most WAIT (1.0) sec,
+#    TIBRV queue would grow and TibrvQueue limit policy would be applied.
+#    If the ring is still full after WAIT, the msg is DROPPED:
+#    send() return TIBRV_INSUFFICIENT_BUFFER, counted in stats() 'dropped'.
+#    msg larger than half of capacity is dropped also.
+#    Set TibrvProcessFanout.WAIT larger to wait longer.
+#    call from ONE dispatcher thread, rings are single producer.
+#
+# 4. Start Method
+#    default is 'spawn', TIBRV internal threads are not copied by fork.
+#    worker calls tibrv_Open()/tibrv_Close() itself.
+#
+# 5. Metrics
+#    fan.stats() -> list of dict per worker
+#       sent, processed, depth, dropped, blocked, errors
+#       blocked : ring was full, callback waited
+#       dropped : ring was still full after WAIT, or msg too large
+#       latencyAvgUs, latencyMaxUs : enqueue in callback -> handler returned
+#       utilization                : time in handler / time since start()
+#
+##
+import time as _time
+import struct as _struct
+import multiprocessing as _mp
+from multiprocessing import shared_memory as _shm
+
+from .status import TIBRV_OK, TIBRV_INVALID_ARG, TIBRV_INVALID_MSG, \
+                   TIBRV_ID_IN_USE, TIBRV_NOT_INITIALIZED, TIBRV_INSUFFICIENT_BUFFER
+
+from .api import tibrv_Open, tibrv_Close
+
+from .msg import tibrvMsg_GetAsBytes, tibrvMsg_CreateFromBytes, tibrvMsg_SetSendSubject
+
+from .Tibrv import tibrv_status, TibrvStatus, TibrvError, TibrvMsg, TibrvMsgCallback
+
+
+##-----------------------------------------------------------------------------
+# Shared Memory Ring
+#   | head | tail | processed | busy | latSum | latMax | errors | reserved |
+#   | record ... |
+#
+#   record : | size(u32) | subject(u16) | flag(u16) | enqueue ns(i64) | subject | data |
+#            aligned by 16 bytes
+#   head/tail are byte counters, never wrapped
+##-----------------------------------------------------------------------------
+_CTRL = _struct.Struct('<8Q')
+_REC = _struct.Struct('<IHHq')
+_ALIGN = 16
+
+_HEAD, _TAIL, _PROCESSED, _BUSY, _LATSUM, _LATMAX, _ERRORS = range(7)
+
+_FLAG_MSG = 0
+_FLAG_WRAP = 1
+_FLAG_STOP = 2
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) & ~(_ALIGN - 1)
+
+
+def _attach(name: str) -> _shm.SharedMemory:
+    # worker side, owner (parent) would unlink it
+    try:
+        return _shm.SharedMemory(name, track=False)
+    except TypeError:
+        # before Python 3.13, resource tracker is shared with parent
+        return _shm.SharedMemory(name)
+
+
+class _Ring:
+
+    def __init__(self, shm: _shm.SharedMemory, capacity: int):
+        self.shm = shm
+        self.buf = shm.buf
+        self.capacity = capacity
+        self.base = _CTRL.size
+
+    def get(self, x: int) -> int:
+        return _struct.unpack_from('<Q', self.buf, x * 8)[0]
+
+    def set(self, x: int, val: int):
+        _struct.pack_into('<Q', self.buf, x * 8, val)
+
+    def put(self, flag: int, subj: bytes, data, ts: int, wait: float) -> bool:
+        # producer, return False if ring is full after wait
+        need = _align(_REC.size + len(subj) + len(data))
+        head = self.get(_HEAD)
+        pos = head % self.capacity
+        skip = self.capacity - pos if pos + need > self.capacity else 0
+
+        deadline = None
+        while self.capacity - (head - self.get(_TAIL)) < skip + need:
+            if deadline is None:
+                deadline = _time.monotonic() + wait
+            elif _time.monotonic() >= deadline:
+                return False
+            _time.sleep(0.0001)
+
+        if skip > 0:
+            _REC.pack_into(self.buf, self.base + pos, 0, 0, _FLAG_WRAP, 0)
+            head = head + skip
+            pos = 0
+
+        off = self.base + pos + _REC.size
+        self.buf[off:off + len(subj)] = subj
+        off = off + len(subj)
+        self.buf[off:off + len(data)] = data
+        _REC.pack_into(self.buf, self.base + pos, len(data), len(subj), flag, ts)
+
+        self.set(_HEAD, head + need)
+
+        return True
+
+
+def _worker(name: str, capacity: int, sem, handler):
+
+    shm = _attach(name)
+    ring = _Ring(shm, capacity)
+    buf = ring.buf
+
+    status = tibrv_Open()
+    if status != TIBRV_OK:
+        shm.close()
+        return
+
+    try:
+        while True:
+            sem.acquire()
+
+            tail = ring.get(_TAIL)
+            pos = tail % capacity
+            size, nsubj, flag, ts = _REC.unpack_from(buf, ring.base + pos)
+            if flag == _FLAG_WRAP:
+                tail = tail + capacity - pos
+                ring.set(_TAIL, tail)
+                pos = 0
+                size, nsubj, flag, ts = _REC.unpack_from(buf, ring.base)
+
+            if flag == _FLAG_STOP:
+                return
+
+            off = ring.base + pos + _REC.size
+            subj = bytes(buf[off:off + nsubj]).decode()
+            off = off + nsubj
+
+            status, msg = tibrvMsg_CreateFromBytes(buf[off:off + size])
+
+            # release ring space, data was copied into msg
+            ring.set(_TAIL, tail + _align(_REC.size + nsubj + size))
+
+            t0 = _time.monotonic_ns()
+            if status != TIBRV_OK:
+                ring.set(_ERRORS, ring.get(_ERRORS) + 1)
+            else:
+                if nsubj > 0:
+                    tibrvMsg_SetSendSubject(msg, subj)
+
+                m = TibrvMsg(msg)
+                m._copied = False
+                try:
+                    handler(m)
+                except Exception:
+                    ring.set(_ERRORS, ring.get(_ERRORS) + 1)
+                finally:
+                    m.destroy()
+
+            t1 = _time.monotonic_ns()
+            lat = t1 - ts
+            ring.set(_BUSY, ring.get(_BUSY) + t1 - t0)
+            ring.set(_LATSUM, ring.get(_LATSUM) + lat)
+            if lat > ring.get(_LATMAX):
+                ring.set(_LATMAX, lat)
+            ring.set(_PROCESSED, ring.get(_PROCESSED) + 1)
+
+    finally:
+        del buf
+        ring.buf = None
+        shm.close()
+        tibrv_Close()
+
+
+##-----------------------------------------------------------------------------
+# TibrvProcessFanout
+##-----------------------------------------------------------------------------
+class TibrvProcessFanout:
+
+    WAIT = 1.0          # max wait when ring is full, then msg is dropped
+
+    def __init__(self, handler, n_workers: int = 4, key_fn = None,
+                 capacity: int = 1 << 20, method: str = 'spawn'):
+        # handler  : handler(msg), called in worker process
+        # key_fn   : key_fn(msg) -> hashable, str as field name, None is send subject
+        # capacity : bytes of ring per worker
+        # method   : multiprocessing start method
+        self._handler = handler
+        self._nWorkers = n_workers
+        self._keyFn = key_fn
+        self._capacity = capacity
+        self._method = method
+        self._workers = []
+        self._started = 0
+        self._err = None
+
+    def start(self) -> tibrv_status:
+
+        if len(self._workers) > 0:
+            status = TIBRV_ID_IN_USE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if self._handler is None or not callable(self._handler) or \
+           self._nWorkers is None or self._nWorkers <= 0 or \
+           self._capacity is None or self._capacity < 4096:
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if self._keyFn is None:
+            self._key = lambda msg: msg.sendSubject
+        elif isinstance(self._keyFn, str):
+            name = self._keyFn
+            self._key = lambda msg: msg.getStr(name)
+        elif callable(self._keyFn):
+            self._key = self._keyFn
+        else:
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        try:
+            ctx = _mp.get_context(self._method)
+        except ValueError:
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        capacity = _align(int(self._capacity))
+
+        for x in range(int(self._nWorkers)):
+            shm = _shm.SharedMemory(create=True, size=_CTRL.size + capacity)
+            ring = _Ring(shm, capacity)
+            _CTRL.pack_into(ring.buf, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+
+            sem = ctx.Semaphore(0)
+            proc = ctx.Process(target=_worker, args=(shm.name, capacity, sem, self._handler),
+                               name='TibrvFanout-{}'.format(x), daemon=True)
+
+            self._workers.append(dict(ring=ring, sem=sem, proc=proc,
+                                      sent=0, dropped=0, blocked=0))
+
+        for w in self._workers:
+            w['proc'].start()
+
+        self._started = _time.monotonic_ns()
+        self._err = None
+
+        return TIBRV_OK
+
+    def stop(self, timeout: float = 5.0) -> tibrv_status:
+        # msgs in rings are processed before worker exited
+
+        if len(self._workers) == 0:
+            status = TIBRV_NOT_INITIALIZED
+            self._err = TibrvStatus.error(status)
+            return status
+
+        for w in self._workers:
+            if w['ring'].put(_FLAG_STOP, b'', b'', 0, timeout):
+                w['sem'].release()
+
+        for w in self._workers:
+            w['proc'].join(timeout)
+            if w['proc'].is_alive():
+                w['proc'].terminate()
+                w['proc'].join()
+
+            ring = w['ring']
+            ring.buf = None
+            ring.shm.close()
+            ring.shm.unlink()
+
+        self._workers = []
+        self._err = None
+
+        return TIBRV_OK
+
+    def callback(self) -> TibrvMsgCallback:
+        # for TibrvListener, called in dispatcher thread
+        return TibrvMsgCallback(lambda ev, msg, closure: self.send(msg))
+
+    def worker(self, msg: TibrvMsg) -> int:
+        return hash(self._key(msg)) % len(self._workers)
+
+    def workers(self) -> int:
+        return len(self._workers)
+
+    def send(self, msg: TibrvMsg) -> tibrv_status:
+
+        if len(self._workers) == 0:
+            status = TIBRV_NOT_INITIALIZED
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if msg is None or msg.id() == 0:
+            status = TIBRV_INVALID_MSG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        try:
+            w = self._workers[self.worker(msg)]
+        except Exception:
+            w = self._workers[0]
+
+        status, data = tibrvMsg_GetAsBytes(msg.id())
+        if status != TIBRV_OK:
+            self._err = TibrvStatus.error(status)
+            return status
+
+        subj = msg.sendSubject
+        subj = subj.encode() if subj is not None else b''
+
+        ring = w['ring']
+        if _align(_REC.size + len(subj) + len(data)) > ring.capacity // 2:
+            w['dropped'] = w['dropped'] + 1
+            status = TIBRV_INSUFFICIENT_BUFFER
+            self._err = TibrvStatus.error(status)
+            return status
+
+        ts = _time.monotonic_ns()
+        if not ring.put(_FLAG_MSG, subj, data, ts, 0):
+            w['blocked'] = w['blocked'] + 1
+            if not ring.put(_FLAG_MSG, subj, data, ts, self.WAIT):
+                w['dropped'] = w['dropped'] + 1
+                status = TIBRV_INSUFFICIENT_BUFFER
+                self._err = TibrvStatus.error(status)
+                return status
+
+        w['sent'] = w['sent'] + 1
+        w['sem'].release()
+
+        return TIBRV_OK
+
+    def stats(self) -> list:
+
+        elapsed = max(1, _time.monotonic_ns() - self._started)
+        ret = []
+        for x, w in enumerate(self._workers):
+            ring = w['ring']
+            processed = ring.get(_PROCESSED)
+            ret.append(dict(worker=x, sent=w['sent'], processed=processed,
+                            depth=w['sent'] - processed,
+                            dropped=w['dropped'], blocked=w['blocked'],
+                            errors=ring.get(_ERRORS),
+                            latencyAvgUs=ring.get(_LATSUM) / processed / 1000.0 if processed > 0 else 0.0,
+                            latencyMaxUs=ring.get(_LATMAX) / 1000.0,
+                            utilization=ring.get(_BUSY) / elapsed))
+
+        return ret
+
+    def error(self) -> TibrvError:
+        return self._err
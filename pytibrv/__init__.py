@@ -52,6 +52,27 @@
 #   lib = find_library('tibrv')   -> 'd:\\tibco\\tibrv\\8.4.5\\bin\\tibrv.dll' 
 #   _rv = ctypes.windll.LoadLibrary(lib)
 # 
+# BACKEND
+#   TIBRV libraries are loaded by backend, default is 'native' (ctypes, as above)
+#
+#   PYTIBRV_BACKEND=memory              (environment variable)
+#   pytibrv.use_backend('memory')       (before import pytibrv.api)
+#
+#   'native'   : TIBRV C libraries
+#   'memory'   : pytibrv.memory, pure Python, for offline test and benchmark
+#   'pkg.mod'  : module with load(name) -> library object, for your own shim
+#
+#   use_backend() set PYTIBRV_BACKEND also, for child process (multiprocessing 'spawn')
+#
+# STATS
+#   count, status and latency for each TIBRV C function, see pytibrv/callstats.py
+#
+#   PYTIBRV_STATS=1                     (environment variable)
+#   pytibrv.use_stats(True)             (before import pytibrv.api)
+#
+#   pytibrv.stats()                     -> dict {C function: dict}
+#
+#   Disabled by default, library is not wrapped.
 #
 from .version import version as __version__
 __all__ = ['api', 'status', 'tport', 'queue', 'events', 'disp', 'msg']
@@ -60,6 +81,8 @@ __all__ = ['api', 'status', 'tport', 'queue', 'events', 'disp', 'msg']
 import ctypes as __ctypes
 from ctypes.util import find_library as __find_library
 import sys as __sys
+import os as __os
+import importlib as __importlib
 from platform import architecture as __arch
 
 #if __sys.version_info[0] < 3:
@@ -67,6 +90,8 @@ from platform import architecture as __arch
 
 # module variables
 _func = None                # ctype func cast, OS dependent
+_backend = __os.environ.get('PYTIBRV_BACKEND') or 'native'
+_stats = __os.environ.get('PYTIBRV_STATS', '') not in ('', '0')
 
 # detech OS and ARCH
 __lib_bit = lambda: '64' if __arch()[0] == '64bit' else ''
@@ -90,7 +115,69 @@ else:
     raise SystemError(__sys.platform + ' is not supported')
 
 
+def use_backend(name: str):
+    global _backend
+
+    if name is None or name == '':
+        name = 'native'
+
+    if name == _backend:
+        return
+
+    if __name__ + '.api' in __sys.modules:
+        raise RuntimeError('pytibrv.api was loaded with backend: ' + _backend)
+
+    _backend = name
+    __os.environ['PYTIBRV_BACKEND'] = name
+
+
+def backend() -> str:
+    return _backend
+
+
+def use_stats(enable: bool = True):
+    global _stats
+
+    enable = bool(enable)
+
+    if enable == _stats:
+        return
+
+    if __name__ + '.api' in __sys.modules:
+        raise RuntimeError('pytibrv.api was loaded with stats: ' + str(_stats))
+
+    _stats = enable
+    __os.environ['PYTIBRV_STATS'] = '1' if enable else '0'
+
+
+def stats(reset: bool = False) -> dict:
+    if not _stats:
+        return {}
+
+    from .callstats import snapshot
+    return snapshot(reset)
+
+
 def _load(name: str):
+
+    lib = __library(name)
+
+    if _stats:
+        from .callstats import wrap
+        lib = wrap(name, lib)
+
+    return lib
+
+
+def __library(name: str):
+
+    if _backend == 'memory':
+        from .memory import load
+        return load(name)
+
+    if _backend != 'native':
+        return __importlib.import_module(_backend).load(name)
+
     lib = None
 
     if __sys.platform[:5] == "linux" or __sys.platform[:3] == "aix":
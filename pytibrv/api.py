@@ -122,6 +122,8 @@
 #
 ##
 import ctypes as _ctypes
+import threading as _threading
+from collections import OrderedDict as _OrderedDict
 from . import _load, _func
 from .types import tibrv_status
 
@@ -192,6 +194,8 @@ _c_tibrvQueueHook = _func(None, _c_tibrvQueue, _ctypes.c_void_p)
 ##-----------------------------------------------------------------------------
 # HELPER FUNCTION
 #   _cstr               Python str          -> ctypes.c_char_p
+#   _cname              Python str          -> ctypes.c_char_p, cached
+#                       for field name, subject and inbox
 #   _pystr              ctypes.c_char_p     -> Python str
 #                       Python bytes        -> Python str
 ##-----------------------------------------------------------------------------
@@ -205,6 +209,76 @@ def _cstr(sz: str, codepage = None) -> str:
     else:
         return _c_tibrv_str(str(sz).encode(codepage))
 
+
+##
+# Name Cache
+#   field name and subject are repeated in every call
+#   ex: tibrvMsg_GetF64(msg, 'price') -> encode 'price' every time
+#
+#   _cname() keep the encoded c_char_p in a bounded LRU cache
+#   c_char_p returned is shared, DO NOT modify it
+#   only for default codec, for codepage, use _cstr()
+#
+class _NameCache:
+
+    def __init__(self, maxsize: int = 1024):
+        self._lock = _threading.Lock()
+        self._data = _OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, sz) -> _ctypes.c_char_p:
+        with self._lock:
+            try:
+                ret = self._data[sz]
+            except KeyError:
+                pass
+            except TypeError:
+                # unhashable
+                return _c_tibrv_str(str(sz).encode())
+            else:
+                self._data.move_to_end(sz)
+                self._hits = self._hits + 1
+                return ret
+
+            self._misses = self._misses + 1
+            ret = _c_tibrv_str(str(sz).encode())
+
+            if self._maxsize > 0:
+                self._data[sz] = ret
+                if len(self._data) > self._maxsize:
+                    self._data.popitem(last=False)
+
+            return ret
+
+    def info(self) -> dict:
+        with self._lock:
+            return dict(hits=self._hits, misses=self._misses,
+                        size=len(self._data), maxsize=self._maxsize)
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = max(0, int(maxsize))
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_name_cache = _NameCache()
+
+def _cname(sz: str) -> _ctypes.c_char_p:
+    if sz is None:
+        return None
+
+    return _name_cache.get(sz)
+
+
 def _ret(param: list, val: object = None, size: int = 1) -> None:
     while len(param) < size:
         param.append(None)
@@ -0,0 +1,209 @@
+##
+# pytibrv/callstats.py
+#   TIBRV Library for PYTHON
+#   call count, status and latency for each TIBRV C function
+#
+# DESCRIPTIONS
+# -----------------------------------------------------------------------------
+# 1. ENABLE
+#    PYTIBRV_STATS=1                    (environment variable)
+#    pytibrv.use_stats(True)            (before import pytibrv.api)
+#
+#    pytibrv._load() wrap the library (_rv, _rvcm, _rvft) when enabled,
+#    each C function is wrapped once, when it is declared (argtypes/restype).
+#
+#    When disabled, _load() return the library as is, no wrapper, no cost.
+#
+# 2. READ
+#    pytibrv.stats()                    -> dict {C function: dict}
+#    pytibrv.stats(reset=True)          -> read and reset
+#
+#       lib                     : 'tibrv', 'tibrvcm', 'tibrvft'
+#       count                   : calls
+#       errors                  : calls return non-OK status
+#       status                  : dict {status: calls}, non-OK only
+#       totalUs, avgUs, maxUs   : latency
+#       p50Us, p99Us            : upper bound of histogram bucket
+#       hist                    : list of (upperUs, calls), non-empty buckets only
+#
+#    Functions never called are not listed.
+#
+#    Latency is measured in Python, around the ctypes call, it includes ctypes
+#    argument conversion. For tibrvQueue_TimedDispatch, it includes the Python
+#    callbacks dispatched.
+#
+# 3. HISTOGRAM
+#    log2 buckets of nanoseconds, bucket k is [2^(k-1), 2^k) ns,
+#    last bucket is open ended (> 2^(HIST-2) ns, about 0.5 sec)
+#
+##
+import time as _time
+import threading as _threading
+
+HIST = 32
+
+_clock = _time.perf_counter_ns
+_funcs = {}                     # {name: _Stat}
+_lock = _threading.Lock()
+
+
+class _Stat:
+
+    __slots__ = ('lib', 'name', 'count', 'errors', 'status', 'total', 'max', 'hist', 'lock')
+
+    def __init__(self, lib: str, name: str):
+        self.lib = lib
+        self.name = name
+        self.lock = _threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.errors = 0
+        self.status = {}
+        self.total = 0
+        self.max = 0
+        self.hist = [0] * HIST
+
+    def add(self, ns: int, ret):
+        k = ns.bit_length()
+        if k >= HIST:
+            k = HIST - 1
+
+        with self.lock:
+            self.count = self.count + 1
+            self.total = self.total + ns
+            if ns > self.max:
+                self.max = ns
+            self.hist[k] = self.hist[k] + 1
+
+            # tibrv_status is int, c_char_p is bytes, void is None
+            if ret.__class__ is int and ret != 0:
+                self.errors = self.errors + 1
+                self.status[ret] = self.status.get(ret, 0) + 1
+
+    def snapshot(self, reset: bool) -> dict:
+        with self.lock:
+            count = self.count
+            errors = self.errors
+            status = dict(self.status)
+            total = self.total
+            max = self.max
+            hist = list(self.hist)
+            if reset:
+                self.reset()
+
+        ret = dict(lib=self.lib, count=count, errors=errors, status=status,
+                   totalUs=total / 1000.0,
+                   avgUs=total / count / 1000.0 if count > 0 else 0.0,
+                   maxUs=max / 1000.0,
+                   p50Us=_percentile(hist, count, 0.50),
+                   p99Us=_percentile(hist, count, 0.99),
+                   hist=[(_upper(k), n) for k, n in enumerate(hist) if n > 0])
+
+        return ret
+
+
+def _upper(k: int) -> float:
+    # upper bound of bucket k, in usec
+    if k >= HIST - 1:
+        return float('inf')
+    return (1 << k) / 1000.0
+
+
+def _percentile(hist: list, count: int, q: float) -> float:
+    if count == 0:
+        return 0.0
+
+    n = 0
+    for k, x in enumerate(hist):
+        n = n + x
+        if n >= count * q:
+            return _upper(k)
+
+    return _upper(HIST - 1)
+
+
+class _Function:
+    # looks like ctypes function pointer, argtypes/restype/errcheck pass to it
+
+    __slots__ = ('_func', '_stat', '__name__')
+
+    def __init__(self, func, stat: _Stat):
+        self._func = func
+        self._stat = stat
+        self.__name__ = stat.name
+
+    @property
+    def argtypes(self):
+        return self._func.argtypes
+
+    @argtypes.setter
+    def argtypes(self, value):
+        self._func.argtypes = value
+
+    @property
+    def restype(self):
+        return self._func.restype
+
+    @restype.setter
+    def restype(self, value):
+        self._func.restype = value
+
+    @property
+    def errcheck(self):
+        return self._func.errcheck
+
+    @errcheck.setter
+    def errcheck(self, value):
+        self._func.errcheck = value
+
+    def __call__(self, *args):
+        t = _clock()
+        ret = self._func(*args)
+        self._stat.add(_clock() - t, ret)
+        return ret
+
+
+class _Library:
+    # wrap library loaded by pytibrv._load()
+
+    def __init__(self, name: str, lib):
+        self._name = name
+        self._lib = lib
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        func = getattr(self._lib, name)
+
+        with _lock:
+            stat = _funcs.get(name)
+            if stat is None:
+                stat = _Stat(self._name, name)
+                _funcs[name] = stat
+
+        ret = _Function(func, stat)
+
+        # next time, found in __dict__, __getattr__ is not called
+        setattr(self, name, ret)
+
+        return ret
+
+
+def wrap(name: str, lib):
+    return _Library(name, lib)
+
+
+def snapshot(reset: bool = False) -> dict:
+    with _lock:
+        funcs = list(_funcs.values())
+
+    ret = {}
+    for stat in funcs:
+        if stat.count == 0:
+            continue
+        ret[stat.name] = stat.snapshot(reset)
+
+    return ret
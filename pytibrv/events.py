@@ -84,11 +84,23 @@
 #    If you use class function for callback, please user pytibrv Python Object Model
 #    ex: TibrvListener, TibrvMsgCallback  
 #    
+# 4. Vector Callback
+#    TIBRV collects consecutive messages with the SAME callback function pointer
+#    (and same groupId, for group vector listener) into one vector.
+#
+#    _c_tibrvEventVectorCallback(func) create a new function pointer
+#    To share one vector among listeners, create it once and pass it for all,
+#    ex:
+#       cb = _c_tibrvEventVectorCallback(my_func)
+#       tibrvEvent_CreateGroupVectorListener(que, cb, tx, 'A.>', None, 1)
+#       tibrvEvent_CreateGroupVectorListener(que, cb, tx, 'B.>', None, 1)
+#
 # FEATURES: * = un-implement
 # ------------------------------------------------------
 #   tibrvEvent_CreateListener
 #   tibrvEvent_CreateTime
 #   tibrvEvent_CreateVectorListener
+#   tibrvEvent_CreateGroupVectorListener
 #   tibrvEvent_DestroyEx
 #   tibrvEvent_GetListenerSubject
 #   tibrvEvent_GetListenerTransport
@@ -97,7 +109,6 @@
 #   tibrvEvent_GetQueue
 #   tibrvEvent_ResetTimerInterval
 #
-#  *tibrvEvent_CreateGroupVectorListener
 #  *tibrvEvent_CreateIO
 #  *tibrvEvent_GetIOSource
 #  *tibrvEvent_GetIOType
@@ -118,7 +129,7 @@ from .types import tibrv_status, tibrvTransport, tibrvQueue, tibrvEvent, tibrvEv
 from .status import TIBRV_OK, TIBRV_INVALID_EVENT, TIBRV_INVALID_ARG, TIBRV_INVALID_QUEUE, \
                     TIBRV_INVALID_TRANSPORT, TIBRV_INVALID_CALLBACK
 
-from .api import _rv, _cstr, _pystr, \
+from .api import _rv, _cname, _pystr, \
                  _c_tibrvTransport, _c_tibrvQueue, _c_tibrvEvent, _c_tibrvEventType, \
                  _c_tibrvEventOnComplete, _c_tibrvEventCallback, _c_tibrvEventVectorCallback, \
                  _c_tibrv_status, _c_tibrv_f64, _c_tibrv_str
@@ -189,7 +200,10 @@ def tibrvEvent_CreateListener(queue: tibrvQueue, callback: tibrvEventCallback, t
         return TIBRV_INVALID_QUEUE, None
 
     try:
-        cb = _c_tibrvEventCallback(callback)
+        if isinstance(callback, _c_tibrvEventCallback):
+            cb = callback
+        else:
+            cb = _c_tibrvEventCallback(callback)
     except:
         return TIBRV_INVALID_CALLBACK, None
 
@@ -199,7 +213,7 @@ def tibrvEvent_CreateListener(queue: tibrvQueue, callback: tibrvEventCallback, t
         return TIBRV_INVALID_TRANSPORT, None
 
     try:
-        subj = _cstr(subject)
+        subj = _cname(subject)
         cz = _ctypes.py_object(closure)
     except:
         return TIBRV_INVALID_ARG, None
@@ -245,7 +259,10 @@ def tibrvEvent_CreateVectorListener(queue: tibrvQueue, callback: tibrvEventVecto
         return TIBRV_INVALID_QUEUE, None
 
     try:
-        cb = _c_tibrvEventVectorCallback(callback)
+        if isinstance(callback, _c_tibrvEventVectorCallback):
+            cb = callback
+        else:
+            cb = _c_tibrvEventVectorCallback(callback)
     except:
         return TIBRV_INVALID_CALLBACK, None
 
@@ -255,7 +272,7 @@ def tibrvEvent_CreateVectorListener(queue: tibrvQueue, callback: tibrvEventVecto
         return TIBRV_INVALID_TRANSPORT, None
 
     try:
-        subj = _cstr(subject)
+        subj = _cname(subject)
         cz = _ctypes.py_object(closure)
     except:
         return TIBRV_INVALID_ARG, None
@@ -269,6 +286,68 @@ def tibrvEvent_CreateVectorListener(queue: tibrvQueue, callback: tibrvEventVecto
     return status, ev.value
 
 
+##
+_rv.tibrvEvent_CreateGroupVectorListener.argtypes = [_ctypes.POINTER(_c_tibrvEvent),
+                                                     _c_tibrvQueue,
+                                                     _c_tibrvEventVectorCallback,
+                                                     _c_tibrvTransport,
+                                                     _c_tibrv_str,
+                                                     _ctypes.py_object,
+                                                     _ctypes.c_void_p]
+_rv.tibrvEvent_CreateGroupVectorListener.restype = _c_tibrv_status
+
+def tibrvEvent_CreateGroupVectorListener(queue: tibrvQueue, callback: tibrvEventVectorCallback,
+                                         transport: tibrvTransport, subject: str,
+                                         closure = None, groupId: int = 0) -> (tibrv_status, tibrvEvent):
+
+    if queue is None or queue == 0:
+        return TIBRV_INVALID_QUEUE, None
+
+    if callback is None:
+        return TIBRV_INVALID_CALLBACK, None
+
+    if transport is None or transport == 0:
+        return TIBRV_INVALID_TRANSPORT, None
+
+    if subject is None:
+        return TIBRV_INVALID_ARG, None
+
+    ev = _c_tibrvEvent(0)
+
+    try:
+        que = _c_tibrvQueue(queue)
+    except:
+        return TIBRV_INVALID_QUEUE, None
+
+    try:
+        if isinstance(callback, _c_tibrvEventVectorCallback):
+            cb = callback
+        else:
+            cb = _c_tibrvEventVectorCallback(callback)
+    except:
+        return TIBRV_INVALID_CALLBACK, None
+
+    try:
+        tx = _c_tibrvTransport(transport)
+    except:
+        return TIBRV_INVALID_TRANSPORT, None
+
+    try:
+        subj = _cname(subject)
+        cz = _ctypes.py_object(closure)
+        grp = _ctypes.c_void_p(groupId)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvEvent_CreateGroupVectorListener(_ctypes.byref(ev), que, cb, tx, subj, cz, grp)
+
+    # save cb to prevent GC
+    if status == TIBRV_OK:
+        __reg(ev.value, cb, cz)
+
+    return status, ev.value
+
+
 ##
 _rv.tibrvEvent_CreateTimer.argtypes = [_ctypes.POINTER(_c_tibrvEvent),
                                        _c_tibrvQueue,
@@ -0,0 +1,298 @@
+##
+# pytibrv/fast.py
+#   TIBRV Library for PYTHON
+#   Unchecked fast-path for tibrvMsg_XXX, tibrvTransport_XXX, tibrvQueue_XXX
+#
+# DESCRIPTIONS
+# -----------------------------------------------------------------------------
+# 1. OPT-IN ONLY
+#    from pytibrv.fast import *
+#
+#    This module is NOT imported by pytibrv.api or pytibrv.Tibrv
+#
+# 2. NO VALIDATION
+#    The checked API (pytibrv.msg, pytibrv.tport, ...) validates every
+#    parameter, wraps it into ctypes object and converts str by _cstr()
+#    It costs several micro-seconds per call.
+#
+#    Functions here are the C functions, pre-bound with argtypes/restype
+#    which were set by the checked API modules.
+#    ctypes converts Python int/float/bytes by argtypes directly.
+#
+#    - field name, subject  : bytes, ex: b'price', b'TEST.A'
+#    - optIdentifier        : int, 0 for no field id
+#                             REQUIRED for AddXXX/UpdateXXX/RemoveField
+#    - message, transport   : int handle from checked API or fast.tibrvMsg_Create()
+#    - return               : raw tibrv_status, or (tibrv_status, value)
+#    - string value         : bytes, NOT decoded
+#
+#    There is no check for None/0, wrong type or str.
+#    A bad handle would be passed into TIBRV C library as it is.
+#    A str for c_char_p raise ctypes.ArgumentError
+#
+# 3. MIX WITH CHECKED API
+#    Handles are plain int, they are exchangeable with the checked API.
+#    Use checked API for create/destroy of transport/queue/event,
+#    and use fast path in the hot loop.
+#
+#    ex:
+#       status, tx = tibrvTransport_Create(None, None, None)    # checked
+#       status, msg = fast.tibrvMsg_Create()
+#       fast.tibrvMsg_SetSendSubject(msg, b'TEST')
+#       for x in data:
+#           fast.tibrvMsg_UpdateF64(msg, b'price', x, 0)
+#           fast.tibrvTransport_Send(tx, msg)
+#
+# FEATURES: * = un-implement
+# -----------------------------------------------------------------------------
+#   tibrvMsg_Create
+#   tibrvMsg_CreateEx
+#   tibrvMsg_CreateCopy
+#   tibrvMsg_Destroy
+#   tibrvMsg_Detach
+#   tibrvMsg_Reset
+#   tibrvMsg_Expand
+#   tibrvMsg_GetNumFields
+#   tibrvMsg_GetByteSize
+#   tibrvMsg_SetSendSubject
+#   tibrvMsg_GetSendSubject
+#   tibrvMsg_SetReplySubject
+#   tibrvMsg_GetReplySubject
+#   tibrvMsg_AddXXX                 XXX: Bool, I8 ~ F64, String, Msg
+#   tibrvMsg_UpdateXXX
+#   tibrvMsg_GetXXX
+#   tibrvMsg_AddXXXArray            XXX: I8 ~ F64, value is ctypes array
+#   tibrvMsg_UpdateXXXArray
+#   tibrvMsg_GetXXXArray            return list
+#   tibrvMsg_RemoveField
+#
+#   tibrvTransport_Send
+#   tibrvTransport_SendRequest
+#   tibrvTransport_SendReply
+#   tibrvTransport_CreateInbox
+#
+#   tibrvQueue_Dispatch
+#   tibrvQueue_Poll
+#   tibrvQueue_TimedDispatch
+#   tibrvQueue_GetCount
+#
+#  *tibrvMsg_XXXDateTime
+#  *tibrvMsg_XXXStringArray
+#  *tibrvMsg_XXXMsgArray
+#  *tibrvEvent_XXX                  callback registry is in pytibrv.events
+#
+##
+
+import ctypes as _ctypes
+
+# import checked API modules, to setup argtypes/restype of _rv
+from . import msg as _msg, tport as _tport, queue as _queue
+
+from .api import _rv, \
+                 _c_tibrvMsg, _c_tibrv_bool, _c_tibrv_str, \
+                 _c_tibrv_i8, _c_tibrv_u8, _c_tibrv_i16, _c_tibrv_u16, \
+                 _c_tibrv_i32, _c_tibrv_u32, _c_tibrv_i64, _c_tibrv_u64, \
+                 _c_tibrv_f32, _c_tibrv_f64, \
+                 _c_tibrv_i8_p, _c_tibrv_u8_p, _c_tibrv_i16_p, _c_tibrv_u16_p, \
+                 _c_tibrv_i32_p, _c_tibrv_u32_p, _c_tibrv_i64_p, _c_tibrv_u64_p, \
+                 _c_tibrv_f32_p, _c_tibrv_f64_p
+
+from .types import TIBRV_WAIT_FOREVER, TIBRV_NO_WAIT, TIBRV_SUBJECT_MAX
+
+_byref = _ctypes.byref
+
+##-----------------------------------------------------------------------------
+# Getter Factory
+#   ctypes out-parameter could not be pre-bound, wrap it by closure
+##-----------------------------------------------------------------------------
+def _get(func, c_type):
+
+    def get(message, fieldName, optIdentifier=0):
+        val = c_type()
+        status = func(message, fieldName, _byref(val), optIdentifier)
+        return status, val.value
+
+    return get
+
+
+def _get_array(func, c_type_p):
+
+    def get(message, fieldName, optIdentifier=0):
+        ptr = c_type_p()
+        n = _c_tibrv_u32()
+        status = func(message, fieldName, _byref(ptr), _byref(n), optIdentifier)
+        if n.value == 0:
+            return status, []
+        return status, ptr[:n.value]
+
+    return get
+
+
+def _get_str(func):
+
+    def get(obj):
+        sz = _c_tibrv_str()
+        status = func(obj, _byref(sz))
+        return status, sz.value
+
+    return get
+
+
+def _get_u32(func):
+
+    def get(obj):
+        n = _c_tibrv_u32()
+        status = func(obj, _byref(n))
+        return status, n.value
+
+    return get
+
+
+##-----------------------------------------------------------------------------
+# tibrvMsg
+##-----------------------------------------------------------------------------
+def tibrvMsg_Create():
+    val = _c_tibrvMsg()
+    status = _rv.tibrvMsg_Create(_byref(val))
+    return status, val.value
+
+
+def tibrvMsg_CreateEx(initialStorage):
+    val = _c_tibrvMsg()
+    status = _rv.tibrvMsg_CreateEx(_byref(val), initialStorage)
+    return status, val.value
+
+
+def tibrvMsg_CreateCopy(message):
+    val = _c_tibrvMsg()
+    status = _rv.tibrvMsg_CreateCopy(message, _byref(val))
+    return status, val.value
+
+
+tibrvMsg_Destroy            = _rv.tibrvMsg_Destroy
+tibrvMsg_Detach             = _rv.tibrvMsg_Detach
+tibrvMsg_Reset              = _rv.tibrvMsg_Reset
+tibrvMsg_Expand             = _rv.tibrvMsg_Expand
+tibrvMsg_GetNumFields       = _get_u32(_rv.tibrvMsg_GetNumFields)
+tibrvMsg_GetByteSize        = _get_u32(_rv.tibrvMsg_GetByteSize)
+
+tibrvMsg_SetSendSubject     = _rv.tibrvMsg_SetSendSubject
+tibrvMsg_GetSendSubject     = _get_str(_rv.tibrvMsg_GetSendSubject)
+tibrvMsg_SetReplySubject    = _rv.tibrvMsg_SetReplySubject
+tibrvMsg_GetReplySubject    = _get_str(_rv.tibrvMsg_GetReplySubject)
+
+# (message, fieldName, value, optIdentifier)
+tibrvMsg_AddBool            = _rv.tibrvMsg_AddBoolEx
+tibrvMsg_AddI8              = _rv.tibrvMsg_AddI8Ex
+tibrvMsg_AddU8              = _rv.tibrvMsg_AddU8Ex
+tibrvMsg_AddI16             = _rv.tibrvMsg_AddI16Ex
+tibrvMsg_AddU16             = _rv.tibrvMsg_AddU16Ex
+tibrvMsg_AddI32             = _rv.tibrvMsg_AddI32Ex
+tibrvMsg_AddU32             = _rv.tibrvMsg_AddU32Ex
+tibrvMsg_AddI64             = _rv.tibrvMsg_AddI64Ex
+tibrvMsg_AddU64             = _rv.tibrvMsg_AddU64Ex
+tibrvMsg_AddF32             = _rv.tibrvMsg_AddF32Ex
+tibrvMsg_AddF64             = _rv.tibrvMsg_AddF64Ex
+tibrvMsg_AddString          = _rv.tibrvMsg_AddStringEx
+tibrvMsg_AddMsg             = _rv.tibrvMsg_AddMsgEx
+
+tibrvMsg_UpdateBool         = _rv.tibrvMsg_UpdateBoolEx
+tibrvMsg_UpdateI8           = _rv.tibrvMsg_UpdateI8Ex
+tibrvMsg_UpdateU8           = _rv.tibrvMsg_UpdateU8Ex
+tibrvMsg_UpdateI16          = _rv.tibrvMsg_UpdateI16Ex
+tibrvMsg_UpdateU16          = _rv.tibrvMsg_UpdateU16Ex
+tibrvMsg_UpdateI32          = _rv.tibrvMsg_UpdateI32Ex
+tibrvMsg_UpdateU32          = _rv.tibrvMsg_UpdateU32Ex
+tibrvMsg_UpdateI64          = _rv.tibrvMsg_UpdateI64Ex
+tibrvMsg_UpdateU64          = _rv.tibrvMsg_UpdateU64Ex
+tibrvMsg_UpdateF32          = _rv.tibrvMsg_UpdateF32Ex
+tibrvMsg_UpdateF64          = _rv.tibrvMsg_UpdateF64Ex
+tibrvMsg_UpdateString       = _rv.tibrvMsg_UpdateStringEx
+tibrvMsg_UpdateMsg          = _rv.tibrvMsg_UpdateMsgEx
+
+# (message, fieldName, optIdentifier=0) -> (status, value)
+tibrvMsg_GetBool            = _get(_rv.tibrvMsg_GetBoolEx, _c_tibrv_bool)
+tibrvMsg_GetI8              = _get(_rv.tibrvMsg_GetI8Ex, _c_tibrv_i8)
+tibrvMsg_GetU8              = _get(_rv.tibrvMsg_GetU8Ex, _c_tibrv_u8)
+tibrvMsg_GetI16             = _get(_rv.tibrvMsg_GetI16Ex, _c_tibrv_i16)
+tibrvMsg_GetU16             = _get(_rv.tibrvMsg_GetU16Ex, _c_tibrv_u16)
+tibrvMsg_GetI32             = _get(_rv.tibrvMsg_GetI32Ex, _c_tibrv_i32)
+tibrvMsg_GetU32             = _get(_rv.tibrvMsg_GetU32Ex, _c_tibrv_u32)
+tibrvMsg_GetI64             = _get(_rv.tibrvMsg_GetI64Ex, _c_tibrv_i64)
+tibrvMsg_GetU64             = _get(_rv.tibrvMsg_GetU64Ex, _c_tibrv_u64)
+tibrvMsg_GetF32             = _get(_rv.tibrvMsg_GetF32Ex, _c_tibrv_f32)
+tibrvMsg_GetF64             = _get(_rv.tibrvMsg_GetF64Ex, _c_tibrv_f64)
+tibrvMsg_GetString          = _get(_rv.tibrvMsg_GetStringEx, _c_tibrv_str)
+tibrvMsg_GetMsg             = _get(_rv.tibrvMsg_GetMsgEx, _c_tibrvMsg)
+
+# (message, fieldName, value, numElements, optIdentifier)
+tibrvMsg_AddI8Array         = _rv.tibrvMsg_AddI8ArrayEx
+tibrvMsg_AddU8Array         = _rv.tibrvMsg_AddU8ArrayEx
+tibrvMsg_AddI16Array        = _rv.tibrvMsg_AddI16ArrayEx
+tibrvMsg_AddU16Array        = _rv.tibrvMsg_AddU16ArrayEx
+tibrvMsg_AddI32Array        = _rv.tibrvMsg_AddI32ArrayEx
+tibrvMsg_AddU32Array        = _rv.tibrvMsg_AddU32ArrayEx
+tibrvMsg_AddI64Array        = _rv.tibrvMsg_AddI64ArrayEx
+tibrvMsg_AddU64Array        = _rv.tibrvMsg_AddU64ArrayEx
+tibrvMsg_AddF32Array        = _rv.tibrvMsg_AddF32ArrayEx
+tibrvMsg_AddF64Array        = _rv.tibrvMsg_AddF64ArrayEx
+
+tibrvMsg_UpdateI8Array      = _rv.tibrvMsg_UpdateI8ArrayEx
+tibrvMsg_UpdateU8Array      = _rv.tibrvMsg_UpdateU8ArrayEx
+tibrvMsg_UpdateI16Array     = _rv.tibrvMsg_UpdateI16ArrayEx
+tibrvMsg_UpdateU16Array     = _rv.tibrvMsg_UpdateU16ArrayEx
+tibrvMsg_UpdateI32Array     = _rv.tibrvMsg_UpdateI32ArrayEx
+tibrvMsg_UpdateU32Array     = _rv.tibrvMsg_UpdateU32ArrayEx
+tibrvMsg_UpdateI64Array     = _rv.tibrvMsg_UpdateI64ArrayEx
+tibrvMsg_UpdateU64Array     = _rv.tibrvMsg_UpdateU64ArrayEx
+tibrvMsg_UpdateF32Array     = _rv.tibrvMsg_UpdateF32ArrayEx
+tibrvMsg_UpdateF64Array     = _rv.tibrvMsg_UpdateF64ArrayEx
+
+# (message, fieldName, optIdentifier=0) -> (status, list)
+tibrvMsg_GetI8Array         = _get_array(_rv.tibrvMsg_GetI8ArrayEx, _c_tibrv_i8_p)
+tibrvMsg_GetU8Array         = _get_array(_rv.tibrvMsg_GetU8ArrayEx, _c_tibrv_u8_p)
+tibrvMsg_GetI16Array        = _get_array(_rv.tibrvMsg_GetI16ArrayEx, _c_tibrv_i16_p)
+tibrvMsg_GetU16Array        = _get_array(_rv.tibrvMsg_GetU16ArrayEx, _c_tibrv_u16_p)
+tibrvMsg_GetI32Array        = _get_array(_rv.tibrvMsg_GetI32ArrayEx, _c_tibrv_i32_p)
+tibrvMsg_GetU32Array        = _get_array(_rv.tibrvMsg_GetU32ArrayEx, _c_tibrv_u32_p)
+tibrvMsg_GetI64Array        = _get_array(_rv.tibrvMsg_GetI64ArrayEx, _c_tibrv_i64_p)
+tibrvMsg_GetU64Array        = _get_array(_rv.tibrvMsg_GetU64ArrayEx, _c_tibrv_u64_p)
+tibrvMsg_GetF32Array        = _get_array(_rv.tibrvMsg_GetF32ArrayEx, _c_tibrv_f32_p)
+tibrvMsg_GetF64Array        = _get_array(_rv.tibrvMsg_GetF64ArrayEx, _c_tibrv_f64_p)
+
+# (message, fieldName, optIdentifier)
+tibrvMsg_RemoveField        = _rv.tibrvMsg_RemoveFieldEx
+
+
+##-----------------------------------------------------------------------------
+# tibrvTransport
+##-----------------------------------------------------------------------------
+tibrvTransport_Send         = _rv.tibrvTransport_Send
+tibrvTransport_SendReply    = _rv.tibrvTransport_SendReply
+
+
+def tibrvTransport_SendRequest(transport, message, idleTimeout):
+    r = _c_tibrvMsg()
+    status = _rv.tibrvTransport_SendRequest(transport, message, _byref(r), idleTimeout)
+    return status, r.value
+
+
+def tibrvTransport_CreateInbox(transport):
+    buf = _ctypes.create_string_buffer(TIBRV_SUBJECT_MAX)
+    status = _rv.tibrvTransport_CreateInbox(transport, buf, _ctypes.sizeof(buf))
+    return status, buf.value
+
+
+##-----------------------------------------------------------------------------
+# tibrvQueue
+##-----------------------------------------------------------------------------
+tibrvQueue_TimedDispatch    = _rv.tibrvQueue_TimedDispatch
+tibrvQueue_GetCount         = _get_u32(_rv.tibrvQueue_GetCount)
+
+
+def tibrvQueue_Dispatch(eventQueue):
+    return _rv.tibrvQueue_TimedDispatch(eventQueue, TIBRV_WAIT_FOREVER)
+
+
+def tibrvQueue_Poll(eventQueue):
+    return _rv.tibrvQueue_TimedDispatch(eventQueue, TIBRV_NO_WAIT)
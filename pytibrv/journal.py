@@ -0,0 +1,565 @@
+##
+# pytibrv/journal.py
+#   TIBRV Library for PYTHON
+#   message journal, memory-mapped segment files
+#
+# DESCRIPTIONS
+# -----------------------------------------------------------------------------
+# 1. FILES
+#    journal is a directory of segments
+#       00000000.jnl   data, memory-mapped, preallocated to segmentSize
+#       00000000.idx   side index, one entry per record
+#
+#    segment header (32 bytes)
+#       magic(4) | version(u16) | reserved(u16) | seq(u32) | created ns(i64) | end(u64)
+#       end is updated after each record, records after end are ignored
+#
+#    record (aligned by 8 bytes)
+#       timestamp ns(i64) | subject hash(u32) | subject len(u16) | reserved(u16) |
+#       data len(u32) | reserved(u32) | subject | data
+#
+#       data is wire format of message, tibrvMsg_GetAsBytes
+#       subject hash is zlib.crc32 of send subject
+#
+#    index entry (16 bytes)
+#       timestamp ns(i64) | subject hash(u32) | offset(u32)
+#
+#    index is rebuilt from segment when it is missing or behind (writer crashed)
+#
+# 2. WRITER
+#    jw = TibrvJournalWriter()
+#    jw.open('/data/md', segmentSize=64 << 20)
+#    jw.append(msg)                      -> copy msg.asBytes() into mmap once
+#    jw.write(data, subject, ts)         -> raw wire format
+#    jw.close()
+#
+#    timestamp is time.time_ns() by default, non-decreasing in a journal
+#    a new segment is created by open(), never append to exist segment
+#
+# 3. READER
+#    jr = TibrvJournalReader()
+#    jr.open('/data/md')
+#    for rec in jr.read(start=t0, end=t1, subject='MD.IBM'):
+#        rec.timestamp, rec.subject, rec.data
+#        msg = rec.message()             -> TibrvMsg, caller should destroy
+#    jr.close()
+#
+#    rec.data is readonly memoryview into mmap, NO copy,
+#    it is valid until reader was closed. copy it with bytes(rec.data) to keep
+#
+#    start/end : bisect by index, [start, end) in ns
+#    subject   : exact subject by hash of index, or wildcard ('*', '>')
+#
+##
+import os as _os
+import mmap as _mmap
+import zlib as _zlib
+import time as _time
+import struct as _struct
+import bisect as _bisect
+import array as _array
+
+from .status import TIBRV_OK, TIBRV_INVALID_ARG, TIBRV_INVALID_MSG, TIBRV_INVALID_FILE, \
+                   TIBRV_FILE_NOT_FOUND, TIBRV_IO_FAILED, TIBRV_ID_IN_USE, \
+                   TIBRV_NOT_INITIALIZED, TIBRV_INSUFFICIENT_BUFFER
+
+from .msg import tibrvMsg_GetAsBytes
+
+from .Tibrv import tibrv_status, TibrvStatus, TibrvError, TibrvMsg
+
+
+_MAGIC = b'PYRJ'
+_VERSION = 1
+
+_SEG = _struct.Struct('<4sHHIqQ4x')
+_SEG_END = 20                               # offset of end in segment header
+_END = _struct.Struct('<Q')
+_REC = _struct.Struct('<qIHHI4x')
+_IDX = _struct.Struct('<qII')
+
+_MIN_SEGMENT = 4096
+_MAX_SEGMENT = 1 << 32                      # offset in index is u32
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _subjHash(subj: bytes) -> int:
+    return _zlib.crc32(subj)
+
+
+def _segName(path: str, seq: int, ext: str) -> str:
+    return _os.path.join(path, '{:08d}.{}'.format(seq, ext))
+
+
+def _segments(path: str) -> list:
+    ret = []
+    for fn in _os.listdir(path):
+        name, ext = _os.path.splitext(fn)
+        if ext == '.jnl' and name.isdigit():
+            ret.append(int(name))
+
+    return sorted(ret)
+
+
+def _match(pattern: list, subj: str) -> bool:
+    # TIBRV wildcard, '*' for one element, '>' for the rest
+    elems = subj.split('.')
+    for x, p in enumerate(pattern):
+        if p == '>':
+            return len(elems) > x
+        if x >= len(elems):
+            return False
+        if p != '*' and p != elems[x]:
+            return False
+
+    return len(elems) == len(pattern)
+
+
+##-----------------------------------------------------------------------------
+# TibrvJournalWriter
+##-----------------------------------------------------------------------------
+class TibrvJournalWriter:
+
+    def __init__(self):
+        self._path = None
+        self._segSize = 0
+        self._seq = -1
+        self._fd = None
+        self._mm = None
+        self._idx = None
+        self._pos = 0
+        self._last = 0
+        self._records = 0
+        self._bytes = 0
+        self._segCount = 0
+        self._err = None
+
+    def open(self, path: str, segmentSize: int = 64 << 20) -> tibrv_status:
+
+        if self._mm is not None:
+            status = TIBRV_ID_IN_USE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if path is None or segmentSize is None or \
+           segmentSize < _MIN_SEGMENT or segmentSize > _MAX_SEGMENT:
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        try:
+            _os.makedirs(path, exist_ok=True)
+            segs = _segments(path)
+        except OSError:
+            status = TIBRV_IO_FAILED
+            self._err = TibrvStatus.error(status)
+            return status
+
+        self._path = path
+        self._segSize = _align(int(segmentSize))
+        self._seq = segs[-1] if len(segs) > 0 else -1
+
+        status = self._rotate()
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def close(self) -> tibrv_status:
+
+        if self._mm is None:
+            status = TIBRV_NOT_INITIALIZED
+            self._err = TibrvStatus.error(status)
+            return status
+
+        status = self._finish()
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def append(self, msg: TibrvMsg, subject: str = None, ts: int = None) -> tibrv_status:
+        # subject : default is send subject of msg
+
+        if msg is None or msg.id() == 0:
+            status = TIBRV_INVALID_MSG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        status, data = tibrvMsg_GetAsBytes(msg.id())
+        if status != TIBRV_OK:
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if subject is None:
+            subject = msg.sendSubject
+
+        try:
+            return self.write(data, subject, ts)
+        finally:
+            data.release()
+
+    def write(self, data, subject: str = None, ts: int = None) -> tibrv_status:
+        # data : wire format of message, bytes-like
+        # ts   : timestamp in ns, default is time.time_ns()
+
+        if self._mm is None:
+            status = TIBRV_NOT_INITIALIZED
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if data is None:
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        # bytes, not elements, of array.array/memoryview with itemsize > 1
+        try:
+            data = memoryview(data).cast('B')
+        except TypeError:
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        with data:
+            return self._write(data, subject, ts)
+
+    def _write(self, data: memoryview, subject: str, ts: int) -> tibrv_status:
+
+        subj = subject.encode() if subject is not None else b''
+        n = data.nbytes
+        need = _align(_REC.size + len(subj) + n)
+
+        if _SEG.size + need > self._segSize or len(subj) > 0xFFFF:
+            status = TIBRV_INSUFFICIENT_BUFFER
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if self._pos + need > self._segSize:
+            status = self._rotate()
+            if status != TIBRV_OK:
+                self._err = TibrvStatus.error(status)
+                return status
+
+        if ts is None:
+            ts = _time.time_ns()
+        if ts < self._last:
+            ts = self._last
+        self._last = ts
+
+        h = _subjHash(subj)
+        pos = self._pos
+        mm = self._mm
+
+        _REC.pack_into(mm, pos, ts, h, len(subj), 0, n)
+        off = pos + _REC.size
+        mm[off:off + len(subj)] = subj
+        off = off + len(subj)
+        mm[off:off + n] = data
+
+        self._pos = pos + need
+        _END.pack_into(mm, _SEG_END, self._pos)
+        self._idx.write(_IDX.pack(ts, h, pos))
+
+        self._records = self._records + 1
+        self._bytes = self._bytes + need
+
+        return TIBRV_OK
+
+    def flush(self) -> tibrv_status:
+        # msync data, write index to disk
+
+        if self._mm is None:
+            status = TIBRV_NOT_INITIALIZED
+            self._err = TibrvStatus.error(status)
+            return status
+
+        try:
+            self._mm.flush()
+            self._idx.flush()
+            status = TIBRV_OK
+        except (OSError, ValueError):
+            status = TIBRV_IO_FAILED
+
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def path(self) -> str:
+        return self._path
+
+    def stats(self) -> dict:
+        return dict(records=self._records, bytes=self._bytes,
+                    segments=self._segCount, segment=self._seq, position=self._pos)
+
+    def error(self) -> TibrvError:
+        return self._err
+
+    def _finish(self) -> tibrv_status:
+        # close current segment, truncate unused space
+        if self._mm is None:
+            return TIBRV_OK
+
+        status = TIBRV_OK
+        try:
+            self._mm.flush()
+            self._mm.close()
+            _os.ftruncate(self._fd, self._pos)
+            self._idx.close()
+        except (OSError, ValueError):
+            status = TIBRV_IO_FAILED
+        finally:
+            _os.close(self._fd)
+            self._mm = None
+            self._fd = None
+            self._idx = None
+
+        return status
+
+    def _rotate(self) -> tibrv_status:
+
+        status = self._finish()
+        if status != TIBRV_OK:
+            return status
+
+        seq = self._seq + 1
+        try:
+            fd = _os.open(_segName(self._path, seq, 'jnl'),
+                          _os.O_RDWR | _os.O_CREAT | _os.O_EXCL, 0o644)
+        except FileExistsError:
+            return TIBRV_ID_IN_USE
+        except OSError:
+            return TIBRV_IO_FAILED
+
+        try:
+            _os.ftruncate(fd, self._segSize)
+            mm = _mmap.mmap(fd, self._segSize)
+            idx = open(_segName(self._path, seq, 'idx'), 'wb')
+        except OSError:
+            _os.close(fd)
+            return TIBRV_IO_FAILED
+
+        _SEG.pack_into(mm, 0, _MAGIC, _VERSION, 0, seq, _time.time_ns(), _SEG.size)
+
+        self._fd = fd
+        self._mm = mm
+        self._idx = idx
+        self._seq = seq
+        self._pos = _SEG.size
+        self._segCount = self._segCount + 1
+
+        return TIBRV_OK
+
+
+##-----------------------------------------------------------------------------
+# TibrvJournalRecord
+##-----------------------------------------------------------------------------
+class TibrvJournalRecord:
+
+    __slots__ = ('timestamp', 'subject', 'data')
+
+    def __init__(self, timestamp: int, subject: str, data: memoryview):
+        self.timestamp = timestamp
+        self.subject = subject
+        self.data = data
+
+    def message(self) -> TibrvMsg:
+        # new TibrvMsg with send subject, caller should destroy it
+        msg = TibrvMsg.from_bytes(self.data)
+        if msg is not None and self.subject:
+            msg.sendSubject = self.subject
+
+        return msg
+
+
+##-----------------------------------------------------------------------------
+# TibrvJournalReader
+##-----------------------------------------------------------------------------
+class _Segment:
+
+    def __init__(self, seq: int, mm, view: memoryview, ts, hashes, offsets):
+        self.seq = seq
+        self.mm = mm
+        self.view = view
+        self.ts = ts
+        self.hashes = hashes
+        self.offsets = offsets
+
+
+class TibrvJournalReader:
+
+    def __init__(self):
+        self._path = None
+        self._segs = None
+        self._err = None
+
+    def open(self, path: str) -> tibrv_status:
+
+        if self._segs is not None:
+            status = TIBRV_ID_IN_USE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if path is None or not _os.path.isdir(path):
+            status = TIBRV_FILE_NOT_FOUND
+            self._err = TibrvStatus.error(status)
+            return status
+
+        segs = []
+        status = TIBRV_OK
+        try:
+            for seq in _segments(path):
+                seg = self._load(path, seq)
+                if seg is None:
+                    status = TIBRV_INVALID_FILE
+                    break
+                if len(seg.ts) > 0:
+                    segs.append(seg)
+        except OSError:
+            status = TIBRV_IO_FAILED
+
+        if status != TIBRV_OK:
+            self._unmap(segs)
+            self._err = TibrvStatus.error(status)
+            return status
+
+        self._path = path
+        self._segs = segs
+        self._err = None
+
+        return status
+
+    def close(self) -> tibrv_status:
+        # records (memoryview) read from this reader are invalid after close
+
+        if self._segs is None:
+            status = TIBRV_NOT_INITIALIZED
+            self._err = TibrvStatus.error(status)
+            return status
+
+        self._unmap(self._segs)
+        self._segs = None
+        self._err = None
+
+        return TIBRV_OK
+
+    def count(self) -> int:
+        if self._segs is None:
+            return 0
+
+        return sum(len(s.ts) for s in self._segs)
+
+    def first(self) -> int:
+        # timestamp of first record, None if empty
+        if not self._segs:
+            return None
+
+        return self._segs[0].ts[0]
+
+    def last(self) -> int:
+        # timestamp of last record, None if empty
+        if not self._segs:
+            return None
+
+        return self._segs[-1].ts[-1]
+
+    def read(self, start: int = None, end: int = None, subject: str = None):
+        # generator of TibrvJournalRecord, [start, end) in ns
+
+        if self._segs is None:
+            return
+
+        h = None
+        pattern = None
+        if subject is not None:
+            if '*' in subject or '>' in subject:
+                pattern = subject.split('.')
+            else:
+                h = _subjHash(subject.encode())
+
+        for seg in self._segs:
+            if end is not None and seg.ts[0] >= end:
+                return
+            if start is not None and seg.ts[-1] < start:
+                continue
+
+            x = 0 if start is None else _bisect.bisect_left(seg.ts, start)
+            y = len(seg.ts) if end is None else _bisect.bisect_left(seg.ts, end)
+
+            view = seg.view
+            for i in range(x, y):
+                if h is not None and seg.hashes[i] != h:
+                    continue
+
+                pos = seg.offsets[i]
+                ts, hh, nsubj, _, n = _REC.unpack_from(view, pos)
+                off = pos + _REC.size
+                subj = str(view[off:off + nsubj], 'utf-8')
+
+                if h is not None and subj != subject:
+                    # hash collision
+                    continue
+
+                if pattern is not None and not _match(pattern, subj):
+                    continue
+
+                off = off + nsubj
+                yield TibrvJournalRecord(ts, subj, view[off:off + n])
+
+    def error(self) -> TibrvError:
+        return self._err
+
+    def _load(self, path: str, seq: int) -> _Segment:
+
+        with open(_segName(path, seq, 'jnl'), 'rb') as f:
+            size = _os.fstat(f.fileno()).st_size
+            if size < _SEG.size:
+                return None
+            mm = _mmap.mmap(f.fileno(), size, access=_mmap.ACCESS_READ)
+
+        view = memoryview(mm)
+        magic, version, _, s, created, last = _SEG.unpack_from(view, 0)
+        if magic != _MAGIC or version != _VERSION or last > size:
+            view.release()
+            mm.close()
+            return None
+
+        ts = _array.array('q')
+        hashes = _array.array('I')
+        offsets = _array.array('I')
+
+        pos = _SEG.size
+        fn = _segName(path, seq, 'idx')
+        if _os.path.exists(fn):
+            with open(fn, 'rb') as f:
+                data = f.read()
+
+            for t, h, off in _IDX.iter_unpack(data[:len(data) - len(data) % _IDX.size]):
+                if off >= last:
+                    break
+                ts.append(t)
+                hashes.append(h)
+                offsets.append(off)
+
+            if len(offsets) > 0:
+                t, h, nsubj, _, n = _REC.unpack_from(view, offsets[-1])
+                pos = offsets[-1] + _align(_REC.size + nsubj + n)
+
+        # index is behind, writer crashed before index was written
+        while pos < last:
+            t, h, nsubj, _, n = _REC.unpack_from(view, pos)
+            ts.append(t)
+            hashes.append(h)
+            offsets.append(pos)
+            pos = pos + _align(_REC.size + nsubj + n)
+
+        return _Segment(seq, mm, view, ts, hashes, offsets)
+
+    def _unmap(self, segs: list):
+        for seg in segs:
+            try:
+                seg.view.release()
+                seg.mm.close()
+            except BufferError:
+                # records are still referenced, closed by GC
+                pass
@@ -0,0 +1,2201 @@
+##
+# pytibrv/memory.py
+#   TIBRV Library for PYTHON
+#   In-Memory Backend
+#
+# DESCRIPTIONS
+# -----------------------------------------------------------------------------
+# 1. A pure Python stand-in for libtibrv, selected by
+#       PYTIBRV_BACKEND=memory              (environment variable)
+#       pytibrv.use_backend('memory')       (before import pytibrv.api)
+#
+#    It is for offline test and benchmark only,
+#    there is no network, no rvd, no wire protocol.
+#
+# 2. It looks like a ctypes library to pytibrv API
+#    _rv.tibrvMsg_Create.argtypes = [...]        -> accepted and ignored
+#    _rv.tibrvMsg_Create(ctypes.byref(msg))      -> write to msg
+#
+#    BUT ctypes does not convert arguments here,
+#    the arguments are exactly what pytibrv API passed in,
+#    ctypes objects, byref() objects, or Python objects (pytibrv.fast)
+#
+# 3. Semantics
+#    (1) Transport
+#        transports with same service/network share one in-process bus
+#        TIBRV_PROCESS_TRANSPORT is a bus by itself
+#        inbox is point-to-point, only the creating transport could listen to
+#
+#    (2) Queue
+#        events are dispatched in FIFO order, limit policy is supported
+#        consecutive messages for vector listeners with same callback
+#        (and same group id) are dispatched as one vector
+#
+#    (3) Message
+#        message delivered to callback is destroyed after callback returned,
+#        unless it was detached.
+#
+#        message data is kept in Python objects,
+#        C pointers returned by tibrvMsg_GetXXXArray, GetAsBytes, ...
+#        are valid until the field/message was updated or destroyed.
+#
+#    (4) Timer
+#        one background thread post timer events into the queues
+#
+#    (5) Dispatcher
+#        Python thread, calling TimedDispatch on the dispatchable
+#
+#    (6) tibrvcm, tibrvft, tibrvcmq
+#        are loaded as empty libraries,
+#        all functions return TIBRV_NOT_PERMITTED
+#
+##
+import ctypes as _ctypes
+import heapq as _heapq
+import itertools as _itertools
+import os as _os
+import struct as _struct
+import threading as _threading
+import time as _time
+from collections import deque as _deque
+
+from .types import TIBRVMSG_MSG, TIBRVMSG_DATETIME, TIBRVMSG_OPAQUE, TIBRVMSG_STRING, \
+                   TIBRVMSG_BOOL, TIBRVMSG_I8, TIBRVMSG_U8, TIBRVMSG_I16, TIBRVMSG_U16, \
+                   TIBRVMSG_I32, TIBRVMSG_U32, TIBRVMSG_I64, TIBRVMSG_U64, \
+                   TIBRVMSG_F32, TIBRVMSG_F64, TIBRVMSG_IPPORT16, TIBRVMSG_IPADDR32, \
+                   TIBRVMSG_I8ARRAY, TIBRVMSG_U8ARRAY, TIBRVMSG_I16ARRAY, TIBRVMSG_U16ARRAY, \
+                   TIBRVMSG_I32ARRAY, TIBRVMSG_U32ARRAY, TIBRVMSG_I64ARRAY, TIBRVMSG_U64ARRAY, \
+                   TIBRVMSG_F32ARRAY, TIBRVMSG_F64ARRAY, TIBRVMSG_XML, \
+                   TIBRVMSG_STRINGARRAY, TIBRVMSG_MSGARRAY, \
+                   TIBRV_TIMER_EVENT, TIBRV_LISTEN_EVENT, \
+                   TIBRV_DEFAULT_QUEUE, TIBRV_PROCESS_TRANSPORT, \
+                   TIBRVQUEUE_DISCARD_NONE, TIBRVQUEUE_DISCARD_NEW, \
+                   TIBRVQUEUE_DISCARD_FIRST, TIBRVQUEUE_DISCARD_LAST
+
+# status.py imports api, which imports this module,
+# declare what we need here.
+_OK                     = 0
+_INIT_FAILURE           = 1
+_INVALID_TRANSPORT      = 2
+_INVALID_ARG            = 3
+_NOT_INITIALIZED        = 4
+_INVALID_SUBJECT        = 20
+_NOT_PERMITTED          = 27
+_INVALID_TYPE           = 31
+_NOT_FOUND              = 35
+_ID_IN_USE              = 36
+_ID_CONFLICT            = 37
+_CONVERSION_FAILED      = 38
+_INVALID_MSG            = 42
+_INVALID_INSTANCE       = 44
+_CORRUPT_MSG            = 45
+_TIMEOUT                = 50
+_INVALID_DISPATCHABLE   = 52
+_INVALID_DISPATCHER     = 53
+_INVALID_EVENT          = 60
+_INVALID_CALLBACK       = 61
+_INVALID_QUEUE          = 62
+_INVALID_QUEUE_GROUP    = 63
+_INSUFFICIENT_BUFFER    = 70
+_ARG_CONFLICT           = 5
+
+_STATUS_TEXT = {
+    0: 'Success',
+    1: 'Initialization failure',
+    2: 'Invalid transport',
+    3: 'Invalid argument',
+    4: 'Not initialized',
+    5: 'Argument conflict',
+    20: 'Invalid subject',
+    27: 'Not permitted',
+    31: 'Invalid type',
+    32: 'Invalid size',
+    33: 'Invalid count',
+    35: 'Not found',
+    36: 'ID in use',
+    37: 'ID conflict',
+    38: 'Conversion failed',
+    42: 'Invalid message',
+    43: 'Invalid field',
+    44: 'Invalid instance',
+    45: 'Corrupt message',
+    50: 'Timeout',
+    51: 'Interrupted',
+    52: 'Invalid dispatchable',
+    53: 'Invalid dispatcher',
+    60: 'Invalid event',
+    61: 'Invalid callback',
+    62: 'Invalid queue',
+    63: 'Invalid queue group',
+    64: 'Invalid time interval',
+    70: 'Insufficient buffer',
+    102: 'Queue limit',
+}
+
+_VERSION = b'8.4.5 (memory)'
+
+##-----------------------------------------------------------------------------
+# ctypes helper
+##-----------------------------------------------------------------------------
+_CArgObject = type(_ctypes.byref(_ctypes.c_int()))
+_SimpleCData = _ctypes.c_int.__mro__[1]
+
+
+def _v(x):
+    # ctypes scalar -> Python value
+    if isinstance(x, _SimpleCData):
+        return x.value
+    return x
+
+
+def _out(ref):
+    # byref(obj) / pointer(obj) -> obj
+    if type(ref) is _CArgObject:
+        return ref._obj
+    return ref.contents
+
+
+def _set_ptr(obj, addr):
+    # assign C address to a ctypes POINTER/c_char_p object
+    _ctypes.c_void_p.from_address(_ctypes.addressof(obj)).value = addr
+
+
+def _addr(p):
+    # ctypes array/pointer/int -> address
+    if p is None:
+        return 0
+    if isinstance(p, int):
+        return p
+    if isinstance(p, _ctypes._Pointer):
+        return _ctypes.cast(p, _ctypes.c_void_p).value or 0
+    if isinstance(p, _SimpleCData):
+        return p.value or 0
+    return _ctypes.addressof(p)
+
+
+def _bytes(x):
+    x = _v(x)
+    if x is None:
+        return None
+    if isinstance(x, bytes):
+        return x
+    if isinstance(x, str):
+        return x.encode()
+    return bytes(x)
+
+
+##-----------------------------------------------------------------------------
+# DATA TYPE
+##-----------------------------------------------------------------------------
+_SCALAR = {
+    TIBRVMSG_BOOL:      _ctypes.c_int,
+    TIBRVMSG_I8:        _ctypes.c_int8,
+    TIBRVMSG_U8:        _ctypes.c_uint8,
+    TIBRVMSG_I16:       _ctypes.c_int16,
+    TIBRVMSG_U16:       _ctypes.c_uint16,
+    TIBRVMSG_I32:       _ctypes.c_int32,
+    TIBRVMSG_U32:       _ctypes.c_uint32,
+    TIBRVMSG_I64:       _ctypes.c_int64,
+    TIBRVMSG_U64:       _ctypes.c_uint64,
+    TIBRVMSG_F32:       _ctypes.c_float,
+    TIBRVMSG_F64:       _ctypes.c_double,
+    TIBRVMSG_IPPORT16:  _ctypes.c_uint16,
+    TIBRVMSG_IPADDR32:  _ctypes.c_uint32,
+}
+
+_ARRAY = {
+    TIBRVMSG_I8ARRAY:   TIBRVMSG_I8,
+    TIBRVMSG_U8ARRAY:   TIBRVMSG_U8,
+    TIBRVMSG_I16ARRAY:  TIBRVMSG_I16,
+    TIBRVMSG_U16ARRAY:  TIBRVMSG_U16,
+    TIBRVMSG_I32ARRAY:  TIBRVMSG_I32,
+    TIBRVMSG_U32ARRAY:  TIBRVMSG_U32,
+    TIBRVMSG_I64ARRAY:  TIBRVMSG_I64,
+    TIBRVMSG_U64ARRAY:  TIBRVMSG_U64,
+    TIBRVMSG_F32ARRAY:  TIBRVMSG_F32,
+    TIBRVMSG_F64ARRAY:  TIBRVMSG_F64,
+}
+
+_INT_RANGE = {
+    TIBRVMSG_I8:        (-0x80, 0x7F),
+    TIBRVMSG_U8:        (0, 0xFF),
+    TIBRVMSG_I16:       (-0x8000, 0x7FFF),
+    TIBRVMSG_U16:       (0, 0xFFFF),
+    TIBRVMSG_I32:       (-0x80000000, 0x7FFFFFFF),
+    TIBRVMSG_U32:       (0, 0xFFFFFFFF),
+    TIBRVMSG_I64:       (-0x8000000000000000, 0x7FFFFFFFFFFFFFFF),
+    TIBRVMSG_U64:       (0, 0xFFFFFFFFFFFFFFFF),
+    TIBRVMSG_IPPORT16:  (0, 0xFFFF),
+    TIBRVMSG_IPADDR32:  (0, 0xFFFFFFFF),
+}
+
+_FLOAT = (TIBRVMSG_F32, TIBRVMSG_F64)
+
+_STRUCT = {
+    TIBRVMSG_BOOL: 'i', TIBRVMSG_I8: 'b', TIBRVMSG_U8: 'B', TIBRVMSG_I16: 'h', TIBRVMSG_U16: 'H',
+    TIBRVMSG_I32: 'i', TIBRVMSG_U32: 'I', TIBRVMSG_I64: 'q', TIBRVMSG_U64: 'Q',
+    TIBRVMSG_F32: 'f', TIBRVMSG_F64: 'd', TIBRVMSG_IPPORT16: 'H', TIBRVMSG_IPADDR32: 'I',
+}
+
+
+def _convert(value, src: int, dst: int):
+    # (status, value) , convert field value to requested scalar type
+    if src == dst:
+        return _OK, value
+
+    if dst == TIBRVMSG_STRING:
+        if src == TIBRVMSG_BOOL:
+            return _OK, b'TRUE' if value else b'FALSE'
+        if src in _SCALAR:
+            return _OK, repr(value).encode()
+        return _CONVERSION_FAILED, None
+
+    if src == TIBRVMSG_STRING:
+        try:
+            sz = value.decode()
+            value = float(sz) if dst in _FLOAT else int(sz, 0)
+        except ValueError:
+            return _CONVERSION_FAILED, None
+    elif src not in _SCALAR:
+        return _CONVERSION_FAILED, None
+
+    if dst == TIBRVMSG_BOOL:
+        return _OK, 1 if value else 0
+
+    if dst in _FLOAT:
+        return _OK, _SCALAR[dst](float(value)).value
+
+    if dst in _INT_RANGE:
+        n = int(value)
+        lo, hi = _INT_RANGE[dst]
+        if n < lo or n > hi:
+            return _CONVERSION_FAILED, None
+        return _OK, n
+
+    return _CONVERSION_FAILED, None
+
+
+##-----------------------------------------------------------------------------
+# HANDLES
+##-----------------------------------------------------------------------------
+_lock = _threading.RLock()
+_cv = _threading.Condition(_lock)
+
+_next_msg = _itertools.count(0x10000, 0x10)
+_next_id = _itertools.count(100)
+
+_msgs = {}              # tibrvMsg -> _Msg
+_objs = {}              # tibrvId  -> _Queue, _Group, _Event, _Transport, _Dispatcher
+_opened = 0
+
+
+##-----------------------------------------------------------------------------
+# MESSAGE
+##-----------------------------------------------------------------------------
+class _Field:
+    __slots__ = ('name', 'id', 'type', 'value', 'cbuf', 'conv', 'handle')
+
+    def __init__(self, name: bytes, id: int, type: int, value):
+        self.name = name
+        self.id = id
+        self.type = type
+        self.value = value
+        self.cbuf = None            # ctypes buffer, for returned C pointer
+        self.conv = None            # ctypes buffer, for converted array
+        self.handle = None          # nested tibrvMsg
+
+    def count(self) -> int:
+        if self.type in _ARRAY or self.type in (TIBRVMSG_STRINGARRAY, TIBRVMSG_MSGARRAY):
+            return len(self.value)
+        return 1
+
+    def size(self) -> int:
+        if self.type in _SCALAR:
+            return _ctypes.sizeof(_SCALAR[self.type])
+        if self.type in _ARRAY:
+            return _ctypes.sizeof(_SCALAR[_ARRAY[self.type]])
+        if self.type == TIBRVMSG_STRING:
+            return len(self.value) + 1
+        if self.type in (TIBRVMSG_OPAQUE, TIBRVMSG_XML):
+            return len(self.value)
+        if self.type == TIBRVMSG_DATETIME:
+            return 12
+        if self.type == TIBRVMSG_MSG:
+            return len(_encode(self.value))
+        return 0
+
+    def copy(self) -> '_Field':
+        v = self.value
+        if self.type == TIBRVMSG_MSG:
+            v = v.copy()
+        elif self.type == TIBRVMSG_MSGARRAY:
+            v = [m.copy() for m in v]
+        return _Field(self.name, self.id, self.type, v)
+
+    def release(self):
+        if self.handle is not None:
+            for h in self.handle:
+                _msgs.pop(h, None)
+            self.handle = None
+        self.cbuf = None
+        self.conv = None
+
+
+class _Msg:
+    __slots__ = ('fields', 'send', 'reply', 'owner', 'event', 'closure', 'cbuf', '__weakref__')
+
+    # owner
+    USER        = 0         # created by user, must destroy
+    CALLBACK    = 1         # delivered to callback, destroyed after callback
+    FIELD       = 2         # nested msg, owned by parent
+
+    def __init__(self):
+        self.fields = []
+        self.send = None
+        self.reply = None
+        self.owner = _Msg.USER
+        self.event = 0
+        self.closure = None
+        self.cbuf = None
+
+    def copy(self) -> '_Msg':
+        m = _Msg()
+        m.fields = [f.copy() for f in self.fields]
+        m.send = self.send
+        m.reply = self.reply
+        return m
+
+    def clear(self):
+        for f in self.fields:
+            f.release()
+        self.fields = []
+        self.cbuf = None
+
+    def find(self, name: bytes, id: int = 0, instance: int = 1):
+        if id:
+            for f in self.fields:
+                if f.id == id:
+                    return f
+            return None
+
+        for f in self.fields:
+            if f.name == name:
+                instance = instance - 1
+                if instance <= 0:
+                    return f
+        return None
+
+    def add(self, fld: _Field) -> int:
+        if fld.id:
+            for f in self.fields:
+                if f.id == fld.id:
+                    return _ID_CONFLICT
+        self.fields.append(fld)
+        self.cbuf = None
+        return _OK
+
+    def update(self, fld: _Field) -> int:
+        f = self.find(fld.name, fld.id)
+        if f is None:
+            return self.add(fld)
+
+        if f.type != fld.type:
+            return _INVALID_TYPE
+
+        f.release()
+        f.value = fld.value
+        self.cbuf = None
+        return _OK
+
+
+def _msg_new(m: _Msg, owner: int = _Msg.USER) -> int:
+    h = next(_next_msg)
+    m.owner = owner
+    _msgs[h] = m
+    return h
+
+
+def _msg_get(message):
+    h = _v(message)
+    if not h:
+        return None
+    return _msgs.get(h)
+
+
+def _msg_destroy(h: int):
+    m = _msgs.pop(h, None)
+    if m is not None:
+        m.clear()
+
+
+##
+# ConvertToString
+def _str_value(f: _Field) -> str:
+    t = f.type
+    v = f.value
+    if t == TIBRVMSG_STRING:
+        return '"' + v.decode(errors='replace') + '"'
+    if t == TIBRVMSG_BOOL:
+        return 'TRUE' if v else 'FALSE'
+    if t == TIBRVMSG_MSG:
+        return _str_msg(v)
+    if t == TIBRVMSG_DATETIME:
+        sec, nsec = v
+        tm = _time.gmtime(sec)
+        return _time.strftime('%Y-%m-%d %H:%M:%S', tm) + '.{:09d}Z'.format(nsec)
+    if t in _ARRAY:
+        return '[' + ' '.join(repr(x) for x in v) + ']'
+    if t == TIBRVMSG_STRINGARRAY:
+        return '[' + ' '.join('"' + x.decode(errors='replace') + '"' for x in v) + ']'
+    if t == TIBRVMSG_MSGARRAY:
+        return '[' + ' '.join(_str_msg(x) for x in v) + ']'
+    if t in (TIBRVMSG_OPAQUE, TIBRVMSG_XML):
+        return '[{:d} opaque bytes]'.format(len(v))
+    return repr(v)
+
+
+def _str_msg(m: _Msg) -> str:
+    ss = []
+    for f in m.fields:
+        name = f.name.decode(errors='replace') if f.name else ''
+        ss.append(name + '=' + _str_value(f))
+    return '{' + ' '.join(ss) + '}'
+
+
+##
+# Wire Format
+#   header  : magic(4) size(u32) count(u32)
+#   field   : name_len(u16) name id(u16) type(u8) data_len(u32) data
+_MAGIC = b'PYRV'
+_HEAD = _struct.Struct('<4sII')
+_FHEAD = _struct.Struct('<HHBI')
+
+
+def _encode_value(f: _Field) -> bytes:
+    t = f.type
+    v = f.value
+    if t in _STRUCT:
+        return _struct.pack('<' + _STRUCT[t], v)
+    if t in _ARRAY:
+        return _struct.pack('<{:d}{:s}'.format(len(v), _STRUCT[_ARRAY[t]]), *v)
+    if t in (TIBRVMSG_STRING, TIBRVMSG_OPAQUE, TIBRVMSG_XML):
+        return v
+    if t == TIBRVMSG_DATETIME:
+        return _struct.pack('<qI', v[0], v[1])
+    if t == TIBRVMSG_MSG:
+        return _encode(v)
+    if t == TIBRVMSG_STRINGARRAY:
+        return b''.join(_struct.pack('<I', len(x)) + x for x in v)
+    if t == TIBRVMSG_MSGARRAY:
+        ss = []
+        for x in v:
+            b = _encode(x)
+            ss.append(_struct.pack('<I', len(b)) + b)
+        return b''.join(ss)
+    return b''
+
+
+def _encode(m: _Msg) -> bytes:
+    ss = []
+    for f in m.fields:
+        name = f.name or b''
+        data = _encode_value(f)
+        ss.append(_FHEAD.pack(len(name), f.id, f.type, len(data)) + name + data)
+    body = b''.join(ss)
+    return _HEAD.pack(_MAGIC, _HEAD.size + len(body), len(m.fields)) + body
+
+
+def _decode_value(t: int, data: bytes):
+    if t in _STRUCT:
+        return _struct.unpack('<' + _STRUCT[t], data)[0]
+    if t in _ARRAY:
+        fmt = _STRUCT[_ARRAY[t]]
+        n = len(data) // _struct.calcsize(fmt)
+        return list(_struct.unpack('<{:d}{:s}'.format(n, fmt), data))
+    if t in (TIBRVMSG_STRING, TIBRVMSG_OPAQUE, TIBRVMSG_XML):
+        return bytes(data)
+    if t == TIBRVMSG_DATETIME:
+        return _struct.unpack('<qI', data)
+    if t == TIBRVMSG_MSG:
+        return _decode(data)
+    if t in (TIBRVMSG_STRINGARRAY, TIBRVMSG_MSGARRAY):
+        ret = []
+        pos = 0
+        while pos < len(data):
+            n = _struct.unpack_from('<I', data, pos)[0]
+            x = bytes(data[pos + 4: pos + 4 + n])
+            ret.append(x if t == TIBRVMSG_STRINGARRAY else _decode(x))
+            pos = pos + 4 + n
+        return ret
+    return bytes(data)
+
+
+def _decode(data: bytes) -> _Msg:
+    magic, size, count = _HEAD.unpack_from(data, 0)
+    if magic != _MAGIC:
+        raise ValueError('corrupt message')
+
+    m = _Msg()
+    pos = _HEAD.size
+    for x in range(count):
+        nlen, id, t, dlen = _FHEAD.unpack_from(data, pos)
+        pos = pos + _FHEAD.size
+        name = bytes(data[pos: pos + nlen])
+        pos = pos + nlen
+        value = _decode_value(t, data[pos: pos + dlen])
+        pos = pos + dlen
+        m.fields.append(_Field(name, id, t, value))
+    return m
+
+
+##-----------------------------------------------------------------------------
+# tibrv/tibrv.h, status.h
+##-----------------------------------------------------------------------------
+def tibrv_Open():
+    global _opened
+    with _cv:
+        _opened = _opened + 1
+        if _opened > 1:
+            return _OK
+
+        _objs[TIBRV_DEFAULT_QUEUE] = _Queue(TIBRV_DEFAULT_QUEUE, b'TIBRV_DEFAULT_QUEUE')
+        _objs[TIBRV_PROCESS_TRANSPORT] = _Transport(TIBRV_PROCESS_TRANSPORT, None, None, None)
+        _objs[TIBRV_PROCESS_TRANSPORT].bus = 'intra-process'
+
+    _timers.start()
+    return _OK
+
+
+def tibrv_Close():
+    global _opened
+    with _cv:
+        if _opened == 0:
+            return _NOT_INITIALIZED
+
+        _opened = _opened - 1
+        if _opened > 0:
+            return _OK
+
+        for obj in list(_objs.values()):
+            obj.close()
+        _objs.clear()
+        _cv.notify_all()
+
+    _timers.stop()
+    return _OK
+
+
+def tibrv_Version():
+    return _VERSION
+
+
+def tibrvStatus_GetText(status):
+    return _STATUS_TEXT.get(_v(status), 'Unknown status').encode()
+
+
+##-----------------------------------------------------------------------------
+# tibrv/msg.h
+##-----------------------------------------------------------------------------
+def tibrvMsg_Create(ref):
+    _out(ref).value = _msg_new(_Msg())
+    return _OK
+
+
+def tibrvMsg_CreateEx(ref, initialStorage):
+    return tibrvMsg_Create(ref)
+
+
+def tibrvMsg_Destroy(message):
+    m = _msg_get(message)
+    if m is None or m.owner != _Msg.USER:
+        return _INVALID_MSG
+
+    _msg_destroy(_v(message))
+    return _OK
+
+
+def tibrvMsg_Detach(message):
+    m = _msg_get(message)
+    if m is None or m.owner != _Msg.CALLBACK:
+        return _INVALID_MSG
+
+    m.owner = _Msg.USER
+    return _OK
+
+
+def tibrvMsg_CreateCopy(message, ref):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    _out(ref).value = _msg_new(m.copy())
+    return _OK
+
+
+def tibrvMsg_Reset(message):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    m.clear()
+    m.send = None
+    m.reply = None
+    return _OK
+
+
+def tibrvMsg_Expand(message, additionalStorage):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+    return _OK
+
+
+def tibrvMsg_SetSendSubject(message, subject):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    subj = _bytes(subject)
+    if not subj:
+        return _INVALID_SUBJECT
+
+    m.send = subj
+    return _OK
+
+
+def tibrvMsg_GetSendSubject(message, ref):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    if m.send is None:
+        return _NOT_FOUND
+
+    _out(ref).value = m.send
+    return _OK
+
+
+def tibrvMsg_SetReplySubject(message, subject):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    subj = _bytes(subject)
+    if not subj:
+        return _INVALID_SUBJECT
+
+    m.reply = subj
+    return _OK
+
+
+def tibrvMsg_GetReplySubject(message, ref):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    if m.reply is None:
+        return _NOT_FOUND
+
+    _out(ref).value = m.reply
+    return _OK
+
+
+def tibrvMsg_GetEvent(message, ref):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    _out(ref).value = m.event
+    return _OK
+
+
+def tibrvMsg_GetClosure(message, ref):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    obj = _out(ref)
+    if m.closure is None:
+        obj.value = None
+    elif isinstance(obj, _ctypes.py_object):
+        obj.value = m.closure
+    else:
+        obj.value = id(m.closure)
+    return _OK
+
+
+def tibrvMsg_GetNumFields(message, ref):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    _out(ref).value = len(m.fields)
+    return _OK
+
+
+def tibrvMsg_GetByteSize(message, ref):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    _out(ref).value = len(_encode(m))
+    return _OK
+
+
+def tibrvMsg_ConvertToString(message, ref):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    _out(ref).value = _str_msg(m).encode()
+    return _OK
+
+
+def tibrvMsg_GetCurrentTime(ref):
+    ns = _time.time_ns()
+    dt = _out(ref)
+    dt.sec = ns // 1000000000
+    dt.nsec = ns % 1000000000
+    return _OK
+
+
+def tibrvMsg_GetCurrentTimeString(local_time, gmt_time):
+    t = _time.time()
+    if local_time is not None:
+        local_time.value = _time.strftime('%Y-%m-%d %H:%M:%S', _time.localtime(t)).encode()
+    if gmt_time is not None:
+        gmt_time.value = _time.strftime('%Y-%m-%d %H:%M:%SZ', _time.gmtime(t)).encode()
+    return _OK
+
+
+def tibrvMsg_CreateFromBytes(ref, data):
+    addr = _addr(data)
+    if addr == 0:
+        return _INVALID_ARG
+
+    try:
+        magic, size, count = _HEAD.unpack(_ctypes.string_at(addr, _HEAD.size))
+        if magic != _MAGIC:
+            return _CORRUPT_MSG
+        m = _decode(_ctypes.string_at(addr, size))
+    except Exception:
+        return _CORRUPT_MSG
+
+    _out(ref).value = _msg_new(m)
+    return _OK
+
+
+def tibrvMsg_GetAsBytes(message, ref):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    if m.cbuf is None:
+        data = _encode(m)
+        m.cbuf = _ctypes.create_string_buffer(data, len(data))
+
+    _set_ptr(_out(ref), _ctypes.addressof(m.cbuf))
+    return _OK
+
+
+def tibrvMsg_GetAsBytesCopy(message, buf, size):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    data = _encode(m)
+    if _v(size) < len(data):
+        return _INSUFFICIENT_BUFFER
+
+    _ctypes.memmove(_addr(buf), data, len(data))
+    return _OK
+
+
+##
+# Field Add/Update/Get
+def _name(fieldName):
+    return _bytes(fieldName) or b''
+
+
+def _scalar_value(t: int, value):
+    v = _v(value)
+    if t in _FLOAT:
+        return _SCALAR[t](v).value
+    return _SCALAR[t](v).value
+
+
+def _array_value(t: int, value, count):
+    n = _v(count) or 0
+    if n == 0 or value is None:
+        return []
+    ct = _SCALAR[_ARRAY[t]]
+    return _ctypes.cast(_addr(value), _ctypes.POINTER(ct))[:n]
+
+
+def _make_field(t: int, name, value, id, count=None):
+    name = _name(name)
+    id = _v(id) or 0
+
+    if t in _SCALAR:
+        return _Field(name, id, t, _scalar_value(t, value))
+
+    if t in _ARRAY:
+        return _Field(name, id, t, _array_value(t, value, count))
+
+    if t == TIBRVMSG_STRING:
+        v = _bytes(value)
+        return _Field(name, id, t, v if v is not None else b'')
+
+    if t in (TIBRVMSG_OPAQUE, TIBRVMSG_XML):
+        return _Field(name, id, t, _ctypes.string_at(_addr(value), _v(count)))
+
+    if t == TIBRVMSG_DATETIME:
+        dt = _out(value) if type(value) is _CArgObject else value
+        if dt is None:
+            return _Field(name, id, t, (0, 0))
+        return _Field(name, id, t, (dt.sec, dt.nsec))
+
+    if t == TIBRVMSG_MSG:
+        m = _msg_get(value)
+        if m is None:
+            return None
+        return _Field(name, id, t, m.copy())
+
+    if t == TIBRVMSG_STRINGARRAY:
+        n = _v(count) or 0
+        if n == 0 or value is None:
+            return _Field(name, id, t, [])
+        p = _ctypes.cast(_addr(value), _ctypes.POINTER(_ctypes.c_char_p))
+        return _Field(name, id, t, [x or b'' for x in p[:n]])
+
+    if t == TIBRVMSG_MSGARRAY:
+        n = _v(count) or 0
+        if n == 0 or value is None:
+            return _Field(name, id, t, [])
+        p = _ctypes.cast(_addr(value), _ctypes.POINTER(_ctypes.c_void_p))
+        ret = []
+        for h in p[:n]:
+            m = _msgs.get(h)
+            if m is None:
+                return None
+            ret.append(m.copy())
+        return _Field(name, id, t, ret)
+
+    return None
+
+
+def _add(t: int, update: bool):
+    def func(message, fieldName, value, *args):
+        m = _msg_get(message)
+        if m is None:
+            return _INVALID_MSG
+
+        if len(args) == 2:
+            count, id = args
+        else:
+            count, id = None, args[0]
+
+        try:
+            fld = _make_field(t, fieldName, value, id, count)
+        except (TypeError, ValueError):
+            return _INVALID_ARG
+
+        if fld is None:
+            return _INVALID_ARG
+
+        if update:
+            return m.update(fld)
+        return m.add(fld)
+
+    return func
+
+
+def _nested(f: _Field, parent: _Msg):
+    # nested msg handle, owned by parent
+    if f.handle is None:
+        vals = [f.value] if f.type == TIBRVMSG_MSG else f.value
+        f.handle = [_msg_new(x, _Msg.FIELD) for x in vals]
+    return f.handle
+
+
+def _get(t: int):
+    def func(message, fieldName, ref, *args):
+        m = _msg_get(message)
+        if m is None:
+            return _INVALID_MSG
+
+        if len(args) == 2:
+            num, id = args
+        else:
+            num, id = None, args[0]
+
+        f = m.find(_name(fieldName), _v(id) or 0)
+        if f is None:
+            return _NOT_FOUND
+
+        obj = _out(ref)
+
+        if t in _SCALAR:
+            status, val = _convert(f.value, f.type, t)
+            if status == _OK:
+                obj.value = val
+            return status
+
+        if t == TIBRVMSG_STRING:
+            status, val = _convert(f.value, f.type, t)
+            if status == _OK:
+                obj.value = val
+            return status
+
+        if t == TIBRVMSG_DATETIME:
+            if f.type != t:
+                return _CONVERSION_FAILED
+            obj.sec, obj.nsec = f.value
+            return _OK
+
+        if t in _ARRAY and f.type in _ARRAY and f.type != t:
+            # numeric array conversion, element by element
+            vals = []
+            for x in f.value:
+                status, val = _convert(x, _ARRAY[f.type], _ARRAY[t])
+                if status != _OK:
+                    return status
+                vals.append(val)
+            cbuf = (_SCALAR[_ARRAY[t]] * len(vals))(*vals)
+            f.conv = cbuf
+            _set_ptr(obj, _ctypes.addressof(cbuf) if vals else 0)
+            _out(num).value = len(vals)
+            return _OK
+
+        if f.type != t:
+            return _CONVERSION_FAILED
+
+        if t == TIBRVMSG_MSG:
+            obj.value = _nested(f, m)[0]
+            return _OK
+
+        if t in _ARRAY:
+            if f.cbuf is None:
+                ct = _SCALAR[_ARRAY[t]]
+                f.cbuf = (ct * len(f.value))(*f.value)
+        elif t == TIBRVMSG_STRINGARRAY:
+            if f.cbuf is None:
+                f.cbuf = (_ctypes.c_char_p * len(f.value))(*f.value)
+        elif t == TIBRVMSG_MSGARRAY:
+            if f.cbuf is None:
+                f.cbuf = (_ctypes.c_void_p * len(f.value))(*_nested(f, m))
+
+        _set_ptr(obj, _ctypes.addressof(f.cbuf) if len(f.value) else 0)
+        _out(num).value = len(f.value)
+        return _OK
+
+    return func
+
+
+def _field_out(fld, f: _Field, m: _Msg):
+    fld.name = f.name
+    fld.id = f.id
+    fld.type = f.type
+    fld.size = f.size()
+    fld.count = f.count()
+
+    t = f.type
+    if t in _SCALAR:
+        attr = {TIBRVMSG_BOOL: 'boolean', TIBRVMSG_I8: 'i8', TIBRVMSG_U8: 'u8',
+                TIBRVMSG_I16: 'i16', TIBRVMSG_U16: 'u16', TIBRVMSG_I32: 'i32', TIBRVMSG_U32: 'u32',
+                TIBRVMSG_I64: 'i64', TIBRVMSG_U64: 'u64', TIBRVMSG_F32: 'f32', TIBRVMSG_F64: 'f64',
+                TIBRVMSG_IPPORT16: 'ipport16', TIBRVMSG_IPADDR32: 'ipaddr32'}[t]
+        setattr(fld.data, attr, f.value)
+    elif t == TIBRVMSG_STRING:
+        fld.data.str = f.value
+    elif t == TIBRVMSG_DATETIME:
+        fld.data.date.sec, fld.data.date.nsec = f.value
+    elif t == TIBRVMSG_MSG:
+        fld.data.msg = _nested(f, m)[0]
+    elif t in (TIBRVMSG_OPAQUE, TIBRVMSG_XML):
+        if f.cbuf is None:
+            f.cbuf = _ctypes.create_string_buffer(f.value, len(f.value))
+        fld.data.buf = _ctypes.addressof(f.cbuf)
+    else:
+        if f.cbuf is None:
+            if t in _ARRAY:
+                f.cbuf = (_SCALAR[_ARRAY[t]] * len(f.value))(*f.value)
+            elif t == TIBRVMSG_STRINGARRAY:
+                f.cbuf = (_ctypes.c_char_p * len(f.value))(*f.value)
+            else:
+                f.cbuf = (_ctypes.c_void_p * len(f.value))(*_nested(f, m))
+        fld.data.array = _ctypes.addressof(f.cbuf) if len(f.value) else None
+
+    return _OK
+
+
+def _field_in(fld):
+    t = fld.type
+    name = fld.name
+    id = fld.id
+    d = fld.data
+
+    if t in _SCALAR:
+        attr = {TIBRVMSG_BOOL: 'boolean', TIBRVMSG_I8: 'i8', TIBRVMSG_U8: 'u8',
+                TIBRVMSG_I16: 'i16', TIBRVMSG_U16: 'u16', TIBRVMSG_I32: 'i32', TIBRVMSG_U32: 'u32',
+                TIBRVMSG_I64: 'i64', TIBRVMSG_U64: 'u64', TIBRVMSG_F32: 'f32', TIBRVMSG_F64: 'f64',
+                TIBRVMSG_IPPORT16: 'ipport16', TIBRVMSG_IPADDR32: 'ipaddr32'}[t]
+        return _make_field(t, name, getattr(d, attr), id)
+    if t == TIBRVMSG_STRING:
+        return _make_field(t, name, d.str, id)
+    if t == TIBRVMSG_DATETIME:
+        return _make_field(t, name, d.date, id)
+    if t == TIBRVMSG_MSG:
+        return _make_field(t, name, d.msg, id)
+    if t in (TIBRVMSG_OPAQUE, TIBRVMSG_XML):
+        return _make_field(t, name, d.buf, id, fld.size)
+    return _make_field(t, name, d.array, id, fld.count)
+
+
+def tibrvMsg_AddFieldEx(message, ref):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    fld = _field_in(_out(ref))
+    if fld is None:
+        return _INVALID_ARG
+    return m.add(fld)
+
+
+def tibrvMsg_UpdateFieldEx(message, ref):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    fld = _field_in(_out(ref))
+    if fld is None:
+        return _INVALID_ARG
+    return m.update(fld)
+
+
+def tibrvMsg_GetFieldEx(message, fieldName, ref, id):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    f = m.find(_name(fieldName), _v(id) or 0)
+    if f is None:
+        return _NOT_FOUND
+
+    return _field_out(_out(ref), f, m)
+
+
+def tibrvMsg_GetFieldInstance(message, fieldName, ref, instance):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    n = _v(instance)
+    if n is None or n < 1:
+        return _INVALID_INSTANCE
+
+    f = m.find(_name(fieldName), 0, n)
+    if f is None:
+        return _NOT_FOUND
+
+    return _field_out(_out(ref), f, m)
+
+
+def tibrvMsg_GetFieldByIndex(message, ref, index):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    n = _v(index)
+    if n is None or n < 0 or n >= len(m.fields):
+        return _NOT_FOUND
+
+    return _field_out(_out(ref), m.fields[n], m)
+
+
+def tibrvMsg_RemoveFieldEx(message, fieldName, id):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    f = m.find(_name(fieldName), _v(id) or 0)
+    if f is None:
+        return _NOT_FOUND
+
+    m.fields.remove(f)
+    f.release()
+    m.cbuf = None
+    return _OK
+
+
+def tibrvMsg_RemoveFieldInstance(message, fieldName, instance):
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    n = _v(instance)
+    if n is None or n < 1:
+        return _INVALID_INSTANCE
+
+    f = m.find(_name(fieldName), 0, n)
+    if f is None:
+        return _NOT_FOUND
+
+    m.fields.remove(f)
+    f.release()
+    m.cbuf = None
+    return _OK
+
+
+_TYPE_NAME = {
+    'Bool': TIBRVMSG_BOOL, 'I8': TIBRVMSG_I8, 'U8': TIBRVMSG_U8, 'I16': TIBRVMSG_I16,
+    'U16': TIBRVMSG_U16, 'I32': TIBRVMSG_I32, 'U32': TIBRVMSG_U32, 'I64': TIBRVMSG_I64,
+    'U64': TIBRVMSG_U64, 'F32': TIBRVMSG_F32, 'F64': TIBRVMSG_F64,
+    'IPPort16': TIBRVMSG_IPPORT16, 'IPAddr32': TIBRVMSG_IPADDR32,
+    'String': TIBRVMSG_STRING, 'Msg': TIBRVMSG_MSG, 'DateTime': TIBRVMSG_DATETIME,
+    'Opaque': TIBRVMSG_OPAQUE, 'Xml': TIBRVMSG_XML,
+    'I8Array': TIBRVMSG_I8ARRAY, 'U8Array': TIBRVMSG_U8ARRAY,
+    'I16Array': TIBRVMSG_I16ARRAY, 'U16Array': TIBRVMSG_U16ARRAY,
+    'I32Array': TIBRVMSG_I32ARRAY, 'U32Array': TIBRVMSG_U32ARRAY,
+    'I64Array': TIBRVMSG_I64ARRAY, 'U64Array': TIBRVMSG_U64ARRAY,
+    'F32Array': TIBRVMSG_F32ARRAY, 'F64Array': TIBRVMSG_F64ARRAY,
+    'StringArray': TIBRVMSG_STRINGARRAY, 'MsgArray': TIBRVMSG_MSGARRAY,
+}
+
+_FUNCS = {}
+
+for _n, _t in _TYPE_NAME.items():
+    _FUNCS['tibrvMsg_Add' + _n + 'Ex'] = _add(_t, False)
+    _FUNCS['tibrvMsg_Update' + _n + 'Ex'] = _add(_t, True)
+    _FUNCS['tibrvMsg_Get' + _n + 'Ex'] = _get(_t)
+
+
+##-----------------------------------------------------------------------------
+# tibrv/queue.h, qgroup.h
+##-----------------------------------------------------------------------------
+class _Item:
+    __slots__ = ('event', 'msg')
+
+    def __init__(self, event, msg: int = 0):
+        self.event = event
+        self.msg = msg
+
+
+class _Queue:
+    def __init__(self, id: int, name: bytes = b'tibrvQueue'):
+        self.id = id
+        self.name = name
+        self.priority = 1
+        self.policy = TIBRVQUEUE_DISCARD_NONE
+        self.maxEvents = 0
+        self.discard = 0
+        self.items = _deque()
+        self.groups = []
+        self.hook = None
+        self.hook_closure = None
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+        while self.items:
+            item = self.items.popleft()
+            if item.msg:
+                _msg_destroy(item.msg)
+        for g in self.groups:
+            if self in g.queues:
+                g.queues.remove(self)
+        self.groups = []
+
+    def post(self, item: _Item) -> bool:
+        # call with _cv locked
+        if self.closed:
+            return False
+
+        if self.maxEvents > 0 and len(self.items) >= self.maxEvents:
+            amount = max(1, self.discard)
+            if self.policy == TIBRVQUEUE_DISCARD_NEW:
+                if item.msg:
+                    _msg_destroy(item.msg)
+                return False
+            elif self.policy == TIBRVQUEUE_DISCARD_FIRST:
+                for x in range(min(amount, len(self.items))):
+                    old = self.items.popleft()
+                    if old.msg:
+                        _msg_destroy(old.msg)
+            elif self.policy == TIBRVQUEUE_DISCARD_LAST:
+                for x in range(min(amount, len(self.items))):
+                    old = self.items.pop()
+                    if old.msg:
+                        _msg_destroy(old.msg)
+
+        self.items.append(item)
+        _cv.notify_all()
+        return True
+
+
+def _post(q: _Queue, item: _Item):
+    with _cv:
+        ok = q.post(item)
+        hook = q.hook
+        cz = q.hook_closure
+
+    if ok and hook:
+        hook(q.id, cz)
+
+
+def _take(q: _Queue):
+    # call with _cv locked, return list of items to run
+    while q.items:
+        item = q.items.popleft()
+        ev = item.event
+        if ev.closed:
+            if item.msg:
+                _msg_destroy(item.msg)
+            continue
+
+        if ev.vector is None:
+            return [item]
+
+        # collect consecutive items for same vector callback/group
+        ret = [item]
+        while q.items:
+            nx = q.items[0]
+            if nx.event.closed:
+                q.items.popleft()
+                if nx.msg:
+                    _msg_destroy(nx.msg)
+                continue
+            if nx.event.vector != ev.vector:
+                break
+            ret.append(q.items.popleft())
+        return ret
+
+    return None
+
+
+def _run(items):
+    ev = items[0].event
+
+    if ev.vector is not None:
+        handles = [x.msg for x in items]
+        arr = (_ctypes.c_void_p * len(handles))(*handles)
+        try:
+            ev.callback(arr, len(handles))
+        finally:
+            for h in handles:
+                m = _msgs.get(h)
+                if m is not None and m.owner == _Msg.CALLBACK:
+                    _msg_destroy(h)
+        return
+
+    item = items[0]
+    try:
+        ev.callback(ev.id, item.msg or None, ev.closure_id())
+    finally:
+        if item.msg:
+            m = _msgs.get(item.msg)
+            if m is not None and m.owner == _Msg.CALLBACK:
+                _msg_destroy(item.msg)
+
+
+def _wait_items(queues, timeout: float, stop = None):
+    # call with _cv locked
+    # return (status, items)
+    # stop() -> True, dispatcher was destroyed, take nothing
+    t = _v(timeout)
+    deadline = None if t is None or t < 0 else _time.monotonic() + t
+
+    while True:
+        if _opened == 0:
+            return _NOT_INITIALIZED, None
+
+        if stop is not None and stop():
+            return _INVALID_DISPATCHER, None
+
+        qs = queues()
+        if qs is None:
+            return _INVALID_QUEUE, None
+
+        for q in qs:
+            items = _take(q)
+            if items:
+                return _OK, items
+
+        if deadline is None:
+            _cv.wait()
+        else:
+            remain = deadline - _time.monotonic()
+            if remain <= 0:
+                return _TIMEOUT, None
+            _cv.wait(remain)
+
+
+def _dispatch(queues, timeout, stop = None) -> int:
+    with _cv:
+        status, items = _wait_items(queues, timeout, stop)
+
+    if status == _OK:
+        _run(items)
+
+    return status
+
+
+def _queue_of(queue):
+    def func():
+        q = _objs.get(_v(queue))
+        if not isinstance(q, _Queue) or q.closed:
+            return None
+        return [q]
+    return func
+
+
+def tibrvQueue_Create(ref):
+    id = next(_next_id)
+    with _cv:
+        _objs[id] = _Queue(id)
+    _out(ref).value = id
+    return _OK
+
+
+def tibrvQueue_TimedDispatch(queue, timeout):
+    if not isinstance(_objs.get(_v(queue)), _Queue):
+        return _INVALID_QUEUE
+    return _dispatch(_queue_of(queue), timeout)
+
+
+def tibrvQueue_TimedDispatchOneEvent(queue, timeout):
+    return tibrvQueue_TimedDispatch(queue, timeout)
+
+
+def tibrvQueue_DestroyEx(queue, callback, closure):
+    id = _v(queue)
+    with _cv:
+        q = _objs.get(id)
+        if not isinstance(q, _Queue) or id == TIBRV_DEFAULT_QUEUE:
+            return _INVALID_QUEUE
+        del _objs[id]
+        q.close()
+        _cv.notify_all()
+
+    if callback:
+        callback(id, closure)
+
+    return _OK
+
+
+def _queue(queue):
+    q = _objs.get(_v(queue))
+    if not isinstance(q, _Queue):
+        return None
+    return q
+
+
+def tibrvQueue_GetCount(queue, ref):
+    q = _queue(queue)
+    if q is None:
+        return _INVALID_QUEUE
+    _out(ref).value = len(q.items)
+    return _OK
+
+
+def tibrvQueue_GetPriority(queue, ref):
+    q = _queue(queue)
+    if q is None:
+        return _INVALID_QUEUE
+    _out(ref).value = q.priority
+    return _OK
+
+
+def tibrvQueue_SetPriority(queue, priority):
+    q = _queue(queue)
+    if q is None:
+        return _INVALID_QUEUE
+    q.priority = _v(priority)
+    return _OK
+
+
+def tibrvQueue_GetLimitPolicy(queue, policy, maxEvents, discardAmount):
+    q = _queue(queue)
+    if q is None:
+        return _INVALID_QUEUE
+    _out(policy).value = q.policy
+    _out(maxEvents).value = q.maxEvents
+    _out(discardAmount).value = q.discard
+    return _OK
+
+
+def tibrvQueue_SetLimitPolicy(queue, policy, maxEvents, discardAmount):
+    q = _queue(queue)
+    if q is None:
+        return _INVALID_QUEUE
+    q.policy = _v(policy)
+    q.maxEvents = _v(maxEvents)
+    q.discard = _v(discardAmount)
+    return _OK
+
+
+def tibrvQueue_SetName(queue, name):
+    q = _queue(queue)
+    if q is None:
+        return _INVALID_QUEUE
+    q.name = _bytes(name)
+    return _OK
+
+
+def tibrvQueue_GetName(queue, ref):
+    q = _queue(queue)
+    if q is None:
+        return _INVALID_QUEUE
+    _out(ref).value = q.name
+    return _OK
+
+
+def tibrvQueue_SetHook(queue, hook, closure):
+    q = _queue(queue)
+    if q is None:
+        return _INVALID_QUEUE
+    with _cv:
+        q.hook = hook if hook else None
+        q.hook_closure = _v(closure)
+    return _OK
+
+
+def tibrvQueue_GetHook(queue, ref):
+    q = _queue(queue)
+    if q is None:
+        return _INVALID_QUEUE
+    _set_ptr(_out(ref), _addr(q.hook) if q.hook else 0)
+    return _OK
+
+
+class _Group:
+    def __init__(self, id: int):
+        self.id = id
+        self.queues = []
+        self.closed = False
+        self.rr = 0
+
+    def close(self):
+        self.closed = True
+        for q in self.queues:
+            if self in q.groups:
+                q.groups.remove(self)
+        self.queues = []
+
+    def ordered(self):
+        # highest priority first, round robin for same priority
+        n = len(self.queues)
+        if n == 0:
+            return []
+        self.rr = (self.rr + 1) % n
+        qs = self.queues[self.rr:] + self.queues[:self.rr]
+        return sorted(qs, key=lambda q: -q.priority)
+
+
+def _group(group):
+    g = _objs.get(_v(group))
+    if not isinstance(g, _Group):
+        return None
+    return g
+
+
+def tibrvQueueGroup_Create(ref):
+    id = next(_next_id)
+    with _cv:
+        _objs[id] = _Group(id)
+    _out(ref).value = id
+    return _OK
+
+
+def tibrvQueueGroup_Destroy(group):
+    id = _v(group)
+    with _cv:
+        g = _group(id)
+        if g is None:
+            return _INVALID_QUEUE_GROUP
+        del _objs[id]
+        g.close()
+        _cv.notify_all()
+    return _OK
+
+
+def tibrvQueueGroup_Add(group, queue):
+    with _cv:
+        g = _group(group)
+        if g is None:
+            return _INVALID_QUEUE_GROUP
+        q = _queue(queue)
+        if q is None:
+            return _INVALID_QUEUE
+        if q in g.queues:
+            return _ID_IN_USE
+        g.queues.append(q)
+        q.groups.append(g)
+        _cv.notify_all()
+    return _OK
+
+
+def tibrvQueueGroup_Remove(group, queue):
+    with _cv:
+        g = _group(group)
+        if g is None:
+            return _INVALID_QUEUE_GROUP
+        q = _queue(queue)
+        if q is None:
+            return _INVALID_QUEUE
+        if q not in g.queues:
+            return _INVALID_QUEUE
+        g.queues.remove(q)
+        q.groups.remove(g)
+    return _OK
+
+
+def _group_of(group):
+    def func():
+        g = _objs.get(_v(group))
+        if not isinstance(g, _Group) or g.closed:
+            return None
+        return g.ordered()
+    return func
+
+
+def tibrvQueueGroup_TimedDispatch(group, timeout):
+    if _group(group) is None:
+        return _INVALID_QUEUE_GROUP
+    status = _dispatch(_group_of(group), timeout)
+    if status == _INVALID_QUEUE:
+        return _INVALID_QUEUE_GROUP
+    return status
+
+
+##-----------------------------------------------------------------------------
+# tibrv/events.h
+##-----------------------------------------------------------------------------
+class _Event:
+    def __init__(self, id: int, type: int, queue: _Queue, callback, closure):
+        self.id = id
+        self.type = type
+        self.queue = queue
+        self.callback = callback
+        self.closure = closure          # py_object, keep it alive
+        self.closed = False
+        self.vector = None              # (callback address, group id) for vector listener
+        self.tx = None
+        self.subject = None
+        self.pattern = None
+        self.interval = 0.0
+        self.waiter = None              # SendRequest
+        self.timer_gen = -1
+
+    def closure_id(self):
+        if self.closure is None:
+            return None
+        return id(self.closure.value) if isinstance(self.closure, _ctypes.py_object) else _v(self.closure)
+
+    def close(self):
+        self.closed = True
+        if self in _listeners:
+            _listeners.remove(self)
+
+
+_listeners = []
+
+
+def _pattern(subject: bytes):
+    if not subject:
+        return None
+    tokens = subject.split(b'.')
+    for x in range(len(tokens)):
+        tk = tokens[x]
+        if tk == b'' or (tk == b'>' and x != len(tokens) - 1):
+            return None
+    return tokens
+
+
+def _match(pattern, subject: bytes) -> bool:
+    tokens = subject.split(b'.')
+    for x in range(len(pattern)):
+        p = pattern[x]
+        if p == b'>':
+            return len(tokens) > x
+        if x >= len(tokens):
+            return False
+        if p != b'*' and p != tokens[x]:
+            return False
+    return len(tokens) == len(pattern)
+
+
+def _listen(ref, queue, callback, transport, subject, closure, vector=None):
+    q = _queue(queue)
+    if q is None or q.closed:
+        return _INVALID_QUEUE
+
+    if not callback:
+        return _INVALID_CALLBACK
+
+    tx = _objs.get(_v(transport))
+    if not isinstance(tx, _Transport):
+        return _INVALID_TRANSPORT
+
+    subj = _bytes(subject)
+    pattern = _pattern(subj)
+    if pattern is None:
+        return _INVALID_SUBJECT
+
+    id = next(_next_id)
+    ev = _Event(id, TIBRV_LISTEN_EVENT, q, callback, closure)
+    ev.tx = tx
+    ev.subject = subj
+    ev.pattern = pattern
+    ev.vector = vector
+
+    with _cv:
+        _objs[id] = ev
+        _listeners.append(ev)
+
+    _out(ref).value = id
+    return _OK
+
+
+def tibrvEvent_CreateListener(ref, queue, callback, transport, subject, closure):
+    return _listen(ref, queue, callback, transport, subject, closure)
+
+
+def tibrvEvent_CreateVectorListener(ref, queue, callback, transport, subject, closure):
+    if not callback:
+        return _INVALID_CALLBACK
+    return _listen(ref, queue, callback, transport, subject, closure, (_addr(callback), None))
+
+
+def tibrvEvent_CreateGroupVectorListener(ref, queue, callback, transport, subject, closure, groupId):
+    if not callback:
+        return _INVALID_CALLBACK
+    g = _v(groupId)
+    if isinstance(groupId, _ctypes.py_object):
+        g = id(groupId.value)
+    return _listen(ref, queue, callback, transport, subject, closure, (_addr(callback), g))
+
+
+def tibrvEvent_CreateTimer(ref, queue, callback, interval, closure):
+    q = _queue(queue)
+    if q is None or q.closed:
+        return _INVALID_QUEUE
+
+    if not callback:
+        return _INVALID_CALLBACK
+
+    t = _v(interval)
+    if t is None or t <= 0:
+        return 64       # TIBRV_INVALID_TIME_INTERVAL
+
+    id = next(_next_id)
+    ev = _Event(id, TIBRV_TIMER_EVENT, q, callback, closure)
+    ev.interval = t
+
+    with _cv:
+        _objs[id] = ev
+
+    _timers.add(ev)
+    _out(ref).value = id
+    return _OK
+
+
+def _event(event):
+    ev = _objs.get(_v(event))
+    if not isinstance(ev, _Event):
+        return None
+    return ev
+
+
+def tibrvEvent_DestroyEx(event, callback):
+    id = _v(event)
+    with _cv:
+        ev = _event(id)
+        if ev is None:
+            return _INVALID_EVENT
+        del _objs[id]
+        ev.close()
+
+    if callback:
+        callback(id, ev.closure_id())
+
+    return _OK
+
+
+def tibrvEvent_GetType(event, ref):
+    ev = _event(event)
+    if ev is None:
+        return _INVALID_EVENT
+    _out(ref).value = ev.type
+    return _OK
+
+
+def tibrvEvent_GetQueue(event, ref):
+    ev = _event(event)
+    if ev is None:
+        return _INVALID_EVENT
+    _out(ref).value = ev.queue.id
+    return _OK
+
+
+def tibrvEvent_GetListenerSubject(event, ref):
+    ev = _event(event)
+    if ev is None:
+        return _INVALID_EVENT
+    if ev.type != TIBRV_LISTEN_EVENT:
+        return _INVALID_EVENT
+    _out(ref).value = ev.subject
+    return _OK
+
+
+def tibrvEvent_GetListenerTransport(event, ref):
+    ev = _event(event)
+    if ev is None:
+        return _INVALID_EVENT
+    if ev.type != TIBRV_LISTEN_EVENT:
+        return _INVALID_EVENT
+    _out(ref).value = ev.tx.id
+    return _OK
+
+
+def tibrvEvent_GetTimerInterval(event, ref):
+    ev = _event(event)
+    if ev is None or ev.type != TIBRV_TIMER_EVENT:
+        return _INVALID_EVENT
+    _out(ref).value = ev.interval
+    return _OK
+
+
+def tibrvEvent_ResetTimerInterval(event, interval):
+    ev = _event(event)
+    if ev is None or ev.type != TIBRV_TIMER_EVENT:
+        return _INVALID_EVENT
+    t = _v(interval)
+    if t is None or t <= 0:
+        return 64
+    ev.interval = t
+    _timers.add(ev)
+    return _OK
+
+
+class _TimerThread:
+    def __init__(self):
+        self.heap = []
+        self.seq = _itertools.count()
+        self.thread = None
+        self.stopped = True
+        self.cv = _threading.Condition()
+
+    def start(self):
+        with self.cv:
+            if not self.stopped:
+                return
+            self.stopped = False
+            self.heap = []
+            self.thread = _threading.Thread(target=self.run, name='tibrv-timer', daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        with self.cv:
+            self.stopped = True
+            self.heap = []
+            self.cv.notify_all()
+
+    def add(self, ev: _Event):
+        with self.cv:
+            gen = next(self.seq)
+            ev.timer_gen = gen
+            _heapq.heappush(self.heap, (_time.monotonic() + ev.interval, gen, ev))
+            self.cv.notify_all()
+
+    def run(self):
+        while True:
+            with self.cv:
+                if self.stopped:
+                    return
+
+                if not self.heap:
+                    self.cv.wait()
+                    continue
+
+                due, gen, ev = self.heap[0]
+                now = _time.monotonic()
+                if due > now:
+                    self.cv.wait(due - now)
+                    continue
+
+                _heapq.heappop(self.heap)
+                if ev.closed or ev.timer_gen != gen:
+                    continue
+
+                _heapq.heappush(self.heap, (due + ev.interval, gen, ev))
+
+            _post(ev.queue, _Item(ev))
+
+
+_timers = _TimerThread()
+
+
+##-----------------------------------------------------------------------------
+# tibrv/tport.h
+##-----------------------------------------------------------------------------
+class _Transport:
+    def __init__(self, id: int, service: bytes, network: bytes, daemon: bytes):
+        self.id = id
+        self.service = service or b''
+        self.network = network or b''
+        self.daemon = daemon or b'7500'
+        self.description = None
+        self.bus = (self.service, self.network)
+        self.inbox = _itertools.count(1)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+_host = '{:08X}'.format(0x7F000001)
+
+
+def _deliver(tx: _Transport, m: _Msg) -> int:
+    subj = m.send
+    if subj is None:
+        return _INVALID_SUBJECT
+
+    inbox = subj.startswith(b'_INBOX.')
+    hooks = []
+
+    with _cv:
+        targets = []
+        for ev in _listeners:
+            if ev.closed or ev.tx.closed:
+                continue
+            if inbox:
+                if ev.tx is not tx:
+                    continue
+            elif ev.tx.bus != tx.bus:
+                continue
+            if _match(ev.pattern, subj):
+                targets.append(ev)
+
+        for ev in targets:
+            c = m.copy()
+            c.event = ev.id
+            c.closure = ev.closure.value if isinstance(ev.closure, _ctypes.py_object) else ev.closure
+            h = _msg_new(c, _Msg.CALLBACK)
+            if ev.waiter is not None:
+                ev.waiter(h)
+                continue
+            if ev.queue.post(_Item(ev, h)) and ev.queue.hook:
+                # hook is called with lock released
+                hooks.append((ev.queue.hook, ev.queue.id, ev.queue.hook_closure))
+
+    for hook, qid, cz in hooks:
+        hook(qid, cz)
+
+    return _OK
+
+
+def _transport(transport):
+    tx = _objs.get(_v(transport))
+    if not isinstance(tx, _Transport) or tx.closed:
+        return None
+    return tx
+
+
+def tibrvTransport_Create(ref, service, network, daemon):
+    if _opened == 0:
+        return _NOT_INITIALIZED
+
+    id = next(_next_id)
+    tx = _Transport(id, _bytes(service), _bytes(network), _bytes(daemon))
+    with _cv:
+        _objs[id] = tx
+    _out(ref).value = id
+    return _OK
+
+
+def tibrvTransport_Send(transport, message):
+    tx = _transport(transport)
+    if tx is None:
+        return _INVALID_TRANSPORT
+
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    return _deliver(tx, m)
+
+
+def _inbox(tx: _Transport) -> bytes:
+    return '_INBOX.{:s}.{:d}.{:d}.{:d}'.format(_host, _os.getpid(), tx.id, next(tx.inbox)).encode()
+
+
+def tibrvTransport_SendRequest(transport, message, ref, timeout):
+    tx = _transport(transport)
+    if tx is None:
+        return _INVALID_TRANSPORT
+
+    m = _msg_get(message)
+    if m is None:
+        return _INVALID_MSG
+
+    if m.send is None:
+        return _INVALID_SUBJECT
+
+    subj = _inbox(tx)
+    replies = []
+    done = _threading.Event()
+
+    def waiter(h):
+        if not replies:
+            replies.append(h)
+            done.set()
+        else:
+            _msg_destroy(h)
+
+    ev = _Event(next(_next_id), TIBRV_LISTEN_EVENT, None, None, None)
+    ev.tx = tx
+    ev.subject = subj
+    ev.pattern = _pattern(subj)
+    ev.waiter = waiter
+
+    with _cv:
+        _listeners.append(ev)
+
+    try:
+        m.reply = subj
+        status = _deliver(tx, m)
+        if status != _OK:
+            return status
+
+        t = _v(timeout)
+        if not done.wait(None if t is None or t < 0 else t):
+            return _TIMEOUT
+    finally:
+        with _cv:
+            ev.close()
+
+    h = replies[0]
+    _msgs[h].owner = _Msg.USER
+    _out(ref).value = h
+    return _OK
+
+
+def tibrvTransport_SendReply(transport, message, request):
+    tx = _transport(transport)
+    if tx is None:
+        return _INVALID_TRANSPORT
+
+    m = _msg_get(message)
+    req = _msg_get(request)
+    if m is None or req is None:
+        return _INVALID_MSG
+
+    if req.reply is None:
+        return _ARG_CONFLICT
+
+    r = m.copy()
+    r.send = req.reply
+    return _deliver(tx, r)
+
+
+def tibrvTransport_Destroy(transport):
+    id = _v(transport)
+    with _cv:
+        tx = _transport(id)
+        if tx is None or id == TIBRV_PROCESS_TRANSPORT:
+            return _INVALID_TRANSPORT
+        del _objs[id]
+        tx.close()
+    return _OK
+
+
+def tibrvTransport_CreateInbox(transport, buf, size):
+    tx = _transport(transport)
+    if tx is None:
+        return _INVALID_TRANSPORT
+
+    subj = _inbox(tx)
+    if len(subj) >= _v(size):
+        return _INVALID_ARG
+
+    buf.value = subj
+    return _OK
+
+
+def _tx_get(attr: str):
+    def func(transport, ref):
+        tx = _transport(transport)
+        if tx is None:
+            return _INVALID_TRANSPORT
+        _out(ref).value = getattr(tx, attr)
+        return _OK
+    return func
+
+
+_FUNCS['tibrvTransport_GetService'] = _tx_get('service')
+_FUNCS['tibrvTransport_GetNetwork'] = _tx_get('network')
+_FUNCS['tibrvTransport_GetDaemon'] = _tx_get('daemon')
+_FUNCS['tibrvTransport_GetDescription'] = _tx_get('description')
+
+
+def tibrvTransport_SetDescription(transport, description):
+    tx = _transport(transport)
+    if tx is None:
+        return _INVALID_TRANSPORT
+    tx.description = _bytes(description)
+    return _OK
+
+
+def tibrvTransport_RequestReliability(transport, reliability):
+    tx = _transport(transport)
+    if tx is None:
+        return _INVALID_TRANSPORT
+    return _OK
+
+
+##-----------------------------------------------------------------------------
+# tibrv/disp.h
+##-----------------------------------------------------------------------------
+class _Dispatcher:
+    def __init__(self, id: int, dispatchable: int, timeout: float):
+        self.id = id
+        self.dispatchable = dispatchable
+        self.timeout = timeout
+        self.name = b'dispatcher'
+        self.closed = False
+        self.thread = _threading.Thread(target=self.run, name='tibrv-dispatcher-{:d}'.format(id),
+                                        daemon=True)
+
+    def stopped(self) -> bool:
+        return self.closed
+
+    def run(self):
+        while not self.closed:
+            obj = _objs.get(self.dispatchable)
+            if isinstance(obj, _Queue):
+                status = _dispatch(_queue_of(self.dispatchable), self.timeout, self.stopped)
+            elif isinstance(obj, _Group):
+                status = _dispatch(_group_of(self.dispatchable), self.timeout, self.stopped)
+            else:
+                return
+
+            if status == _TIMEOUT and self.timeout >= 0:
+                return
+            if status not in (_OK, _TIMEOUT):
+                return
+
+    def close(self):
+        self.closed = True
+
+
+def tibrvDispatcher_CreateEx(ref, dispatchable, idleTimeout):
+    obj = _objs.get(_v(dispatchable))
+    if not isinstance(obj, (_Queue, _Group)):
+        return _INVALID_DISPATCHABLE
+
+    id = next(_next_id)
+    t = _v(idleTimeout)
+    disp = _Dispatcher(id, obj.id, t if t is not None else -1.0)
+    with _cv:
+        _objs[id] = disp
+    disp.thread.start()
+    _out(ref).value = id
+    return _OK
+
+
+def _dispatcher(dispatcher):
+    disp = _objs.get(_v(dispatcher))
+    if not isinstance(disp, _Dispatcher):
+        return None
+    return disp
+
+
+def tibrvDispatcher_Join(dispatcher):
+    disp = _dispatcher(dispatcher)
+    if disp is None:
+        return _INVALID_DISPATCHER
+    if disp.thread is not _threading.current_thread():
+        disp.thread.join()
+    return _OK
+
+
+def tibrvDispatcher_Destroy(dispatcher):
+    id = _v(dispatcher)
+    with _cv:
+        disp = _dispatcher(id)
+        if disp is None:
+            return _INVALID_DISPATCHER
+        del _objs[id]
+        disp.close()
+        _cv.notify_all()
+    return _OK
+
+
+def tibrvDispatcher_SetName(dispatcher, name):
+    disp = _dispatcher(dispatcher)
+    if disp is None:
+        return _INVALID_DISPATCHER
+    disp.name = _bytes(name)
+    return _OK
+
+
+def tibrvDispatcher_GetName(dispatcher, ref):
+    disp = _dispatcher(dispatcher)
+    if disp is None:
+        return _INVALID_DISPATCHER
+    _out(ref).value = disp.name
+    return _OK
+
+
+##-----------------------------------------------------------------------------
+# LIBRARY
+##-----------------------------------------------------------------------------
+class _Function:
+    # looks like ctypes function pointer for pytibrv API
+    def __init__(self, name: str, impl):
+        self.__name__ = name
+        self.impl = impl
+        self.argtypes = None
+        self.restype = None
+        self.errcheck = None
+
+    def __call__(self, *args):
+        return self.impl(*args)
+
+
+def _not_permitted(*args):
+    return _NOT_PERMITTED
+
+
+def _version(*args):
+    return _VERSION
+
+
+class MemoryLibrary:
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, name: str):
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        if self._name == 'tibrv':
+            impl = _FUNCS.get(name) or globals().get(name)
+            if not callable(impl) or not name.startswith('tibrv'):
+                impl = _not_permitted
+        elif name.endswith('_Version'):
+            impl = _version
+        else:
+            impl = _not_permitted
+
+        func = _Function(name, impl)
+        setattr(self, name, func)
+        return func
+
+
+def load(name: str) -> MemoryLibrary:
+    return MemoryLibrary(name)
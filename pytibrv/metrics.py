@@ -0,0 +1,747 @@
+##
+# pytibrv/metrics.py
+#   TIBRV Library for PYTHON
+#   throughput and latency of listener callbacks, depth of queues
+#
+# DESCRIPTIONS
+# -----------------------------------------------------------------------------
+# 1. TibrvListenerMetrics
+#    mt = TibrvListenerMetrics(bySubject=True, timestamp='SENT')
+#    lst.create(que, mt.callback(my_cb, 'MD'), tx, 'MD.>')
+#
+#    mt.callback(cb, name) wrap cb (TibrvMsgCallback or callable), like as
+#    TibrvShardedDispatcher.callback(). name is the listener in metrics,
+#    None is the listener subject (at first msg).
+#
+#    bySubject  : break down by send subject also, at most maxSubjects,
+#                 subjects over maxSubjects are counted as '_other'
+#    timestamp  : send time of msg, for queue wait (dispatched - sent)
+#                 str      : field name, DATETIME, F64 (epoch seconds) or
+#                            I64/U64 (epoch nanoseconds)
+#                 callable : timestamp(msg) -> epoch nanoseconds or None
+#                 None     : no queue wait
+#
+#    queue wait is measured by wall clock (time.time_ns), sender and receiver
+#    clocks should be synchronized (NTP/PTP).
+#
+# 2. Snapshot
+#    mt.snapshot(reset=False) -> dict {listener: dict}
+#       count, errors       : msgs, callbacks raised exception
+#       rate                : msgs/sec, since created or reset
+#       callbackUs          : dict(count, avg, max, p50, p90, p99)
+#       waitUs              : same as callbackUs, msgs with timestamp only
+#       subjects            : dict {subject: dict}, bySubject only
+#    mt.reset()
+#
+# 3. Histogram
+#    log-linear, 4 linear buckets per power of 2 nanoseconds, error < 25%
+#    percentiles are upper bound of the bucket
+#
+# 4. Prometheus
+#    mt.exposition()                        -> str, text format 0.0.4
+#    mt.serve(port, addr='127.0.0.1')       -> HTTP thread, GET /metrics
+#    mt.shutdown()
+#
+#       pytibrv_listener_messages_total{listener,subject}
+#       pytibrv_listener_errors_total{listener,subject}
+#       pytibrv_listener_callback_seconds{listener,subject}   histogram
+#       pytibrv_listener_wait_seconds{listener,subject}       histogram
+#
+#    subject label is for bySubject only.
+#    histogram buckets are power of 2 seconds, from 2^-20 (~1 usec) to 2^6.
+#
+#    mt.serve(port, others=[mon])           -> listener and queue metrics in one page
+#
+# 5. TibrvQueueMonitor
+#    mon = TibrvQueueMonitor(interval=1.0, high=0.8, low=0.5, horizon=10.0)
+#    mon.add(que)                           -> capacity from tibrvQueue_GetLimitPolicy
+#    mon.add(que2, 'DATA', maxEvents=5000)  -> capacity of queue without limit
+#    mon.hook(cb)                           -> cb(name, alert, stats)
+#    mon.create()                           -> sample by TibrvTimer, own queue and dispatcher
+#    mon.stats()                            -> dict {name: dict}
+#    mon.destroy()
+#
+#       depth, min, max     : events in queue, sampled
+#       ewma                : of depth, alpha is weight of new sample
+#       growth              : events/sec (ewma), negative is draining
+#       drainRate           : -growth when draining, else 0
+#       timeToOverflow      : seconds to maxEvents at current growth, None if not growing
+#       timeToDrain         : seconds to empty at current drain rate, None if not draining
+#       hookErrors          : hooks raised exception
+#       lastHookError       : last exception raised by hook, None if none
+#
+#    alerts, once per crossing:
+#       'high'      : depth >= high * maxEvents
+#       'normal'    : depth <= low * maxEvents, after 'high'
+#       'overflow'  : timeToOverflow < horizon, TIBRVQUEUE_DISCARD_XXX would drop events soon
+#
+#    mon.exposition() gauges
+#       pytibrv_queue_depth{queue}, pytibrv_queue_depth_max, pytibrv_queue_depth_ewma,
+#       pytibrv_queue_growth_rate, pytibrv_queue_max_events,
+#       pytibrv_queue_time_to_overflow_seconds
+#    counter
+#       pytibrv_queue_hook_errors_total{queue}
+#
+##
+import time as _time
+import threading as _threading
+import http.server as _http
+
+from .types import TIBRVMSG_DATETIME, TIBRVMSG_F64, TIBRVMSG_I64, TIBRVMSG_U64
+
+from .types import tibrv_status, TIBRVQUEUE_DISCARD_NONE
+
+from .status import TIBRV_OK, TIBRV_INVALID_ARG, TIBRV_INVALID_QUEUE, \
+                   TIBRV_INVALID_EVENT, TIBRV_ID_IN_USE
+
+from .queue import tibrvQueue_GetCount, tibrvQueue_GetLimitPolicy
+
+from .Tibrv import TibrvStatus, TibrvError, TibrvMsg, TibrvMsgCallback, TibrvQueue, \
+                   TibrvTimer, TibrvTimerCallback, TibrvDispatcher
+
+
+SUB_BITS = 2
+SUB = 1 << SUB_BITS
+BUCKETS = 48 * SUB              # up to 2^48 ns, ~3 days
+
+_clock = _time.perf_counter_ns
+_wall = _time.time_ns
+
+
+##-----------------------------------------------------------------------------
+# Histogram
+##-----------------------------------------------------------------------------
+def _bucket(ns: int) -> int:
+    if ns < SUB:
+        return ns if ns > 0 else 0
+
+    shift = ns.bit_length() - SUB_BITS - 1
+    ret = (shift + 1) * SUB + (ns >> shift) - SUB
+
+    return ret if ret < BUCKETS else BUCKETS - 1
+
+
+def _upper(k: int) -> int:
+    # upper bound of bucket k, ns, exclusive
+    if k < SUB:
+        return k + 1
+
+    shift = k // SUB - 1
+    return ((k % SUB + SUB) << shift) + (1 << shift)
+
+
+class _Histogram:
+
+    __slots__ = ('count', 'sum', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0
+        self.max = 0
+        self.buckets = [0] * BUCKETS
+
+    def add(self, ns: int):
+        self.count = self.count + 1
+        self.sum = self.sum + ns
+        if ns > self.max:
+            self.max = ns
+        k = _bucket(ns)
+        self.buckets[k] = self.buckets[k] + 1
+
+    def copy(self):
+        ret = _Histogram()
+        ret.count = self.count
+        ret.sum = self.sum
+        ret.max = self.max
+        ret.buckets = list(self.buckets)
+        return ret
+
+    def percentile(self, q: float) -> int:
+        if self.count == 0:
+            return 0
+
+        n = 0
+        for k, x in enumerate(self.buckets):
+            n = n + x
+            if n >= self.count * q:
+                return min(_upper(k), self.max)
+
+        return self.max
+
+    def cumulative(self, bounds: list) -> list:
+        # count of value < bound, for each bound (ns)
+        ret = []
+        n = 0
+        k = 0
+        for b in bounds:
+            while k < BUCKETS and _upper(k) <= b:
+                n = n + self.buckets[k]
+                k = k + 1
+            ret.append(n)
+        return ret
+
+    def summary(self) -> dict:
+        return dict(count=self.count,
+                    avg=self.sum / self.count / 1000.0 if self.count > 0 else 0.0,
+                    max=self.max / 1000.0,
+                    p50=self.percentile(0.50) / 1000.0,
+                    p90=self.percentile(0.90) / 1000.0,
+                    p99=self.percentile(0.99) / 1000.0)
+
+
+##-----------------------------------------------------------------------------
+# Series : one listener, or one subject of listener
+##-----------------------------------------------------------------------------
+class _Series:
+
+    __slots__ = ('count', 'errors', 'callback', 'wait', 'subjects')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.callback = _Histogram()
+        self.wait = _Histogram()
+        self.subjects = None
+
+    def add(self, ns: int, wait: int, error: bool):
+        self.count = self.count + 1
+        if error:
+            self.errors = self.errors + 1
+        self.callback.add(ns)
+        if wait is not None:
+            self.wait.add(wait if wait > 0 else 0)
+
+    def copy(self):
+        ret = _Series()
+        ret.count = self.count
+        ret.errors = self.errors
+        ret.callback = self.callback.copy()
+        ret.wait = self.wait.copy()
+        if self.subjects is not None:
+            ret.subjects = {k: v.copy() for k, v in self.subjects.items()}
+        return ret
+
+    def summary(self, elapsed: float) -> dict:
+        ret = dict(count=self.count, errors=self.errors,
+                   rate=self.count / elapsed if elapsed > 0 else 0.0,
+                   callbackUs=self.callback.summary(),
+                   waitUs=self.wait.summary())
+        if self.subjects is not None:
+            ret['subjects'] = {k: v.summary(elapsed) for k, v in self.subjects.items()}
+        return ret
+
+
+##-----------------------------------------------------------------------------
+# Prometheus HTTP
+##-----------------------------------------------------------------------------
+class _Exporter:
+
+    _server = None
+    _thread = None
+
+    def exposition(self) -> str:
+        return ''
+
+    def serve(self, port: int, addr: str = '127.0.0.1', others: list = None):
+        # GET /metrics in daemon thread, port 0 for any free port
+        # others : more TibrvListenerMetrics/TibrvQueueMonitor in same page
+        if self._server is not None:
+            return self._server
+
+        exporters = [self] + list(others or [])
+
+        class _Handler(_http.BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+
+                data = ''.join(x.exposition() for x in exporters).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = _http.ThreadingHTTPServer((addr, port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = _threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self._server
+
+    def address(self) -> tuple:
+        if self._server is None:
+            return None
+        return self._server.server_address
+
+    def shutdown(self):
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+
+class TibrvListenerMetrics(_Exporter):
+
+    OTHER = '_other'
+
+    # prometheus histogram buckets, seconds
+    BOUNDS = [2.0 ** x for x in range(-20, 7)]
+
+    def __init__(self, bySubject: bool = False, timestamp = None, maxSubjects: int = 1000):
+        self._bySubject = bySubject
+        self._timestamp = timestamp
+        self._maxSubjects = maxSubjects
+        self._lock = _threading.Lock()
+        self._series = {}
+        self._names = {}
+        self._since = _clock()
+
+    def callback(self, cb, name: str = None) -> TibrvMsgCallback:
+        # cb   : TibrvMsgCallback or callable(event, msg, closure)
+        # name : listener in metrics, None is listener subject
+
+        if not isinstance(cb, TibrvMsgCallback):
+            cb = TibrvMsgCallback(cb)
+
+        return TibrvMsgCallback(lambda ev, msg, closure: self._measure(cb, name, ev, msg, closure))
+
+    def snapshot(self, reset: bool = False) -> dict:
+        with self._lock:
+            now = _clock()
+            elapsed = (now - self._since) / 1e9
+            series = {k: v.copy() for k, v in self._series.items()}
+            if reset:
+                self._reset(now)
+
+        return {k: v.summary(elapsed) for k, v in series.items()}
+
+    def reset(self):
+        with self._lock:
+            self._reset(_clock())
+
+    def exposition(self) -> str:
+        with self._lock:
+            series = {k: v.copy() for k, v in self._series.items()}
+
+        rows = []
+        for name, sr in series.items():
+            if sr.subjects is None:
+                rows.append(({'listener': name}, sr))
+            else:
+                for subj, ss in sr.subjects.items():
+                    rows.append(({'listener': name, 'subject': subj}, ss))
+
+        ret = []
+
+        ret.append('# HELP pytibrv_listener_messages_total Messages dispatched to callback.')
+        ret.append('# TYPE pytibrv_listener_messages_total counter')
+        for labels, sr in rows:
+            ret.append('pytibrv_listener_messages_total{} {}'.format(_labels(labels), sr.count))
+
+        ret.append('# HELP pytibrv_listener_errors_total Callbacks raised exception.')
+        ret.append('# TYPE pytibrv_listener_errors_total counter')
+        for labels, sr in rows:
+            ret.append('pytibrv_listener_errors_total{} {}'.format(_labels(labels), sr.errors))
+
+        self._histogram(ret, 'pytibrv_listener_callback_seconds', 'Callback execution time.',
+                        [(labels, sr.callback) for labels, sr in rows])
+
+        if self._timestamp is not None:
+            self._histogram(ret, 'pytibrv_listener_wait_seconds', 'Send to callback time.',
+                            [(labels, sr.wait) for labels, sr in rows])
+
+        return '\n'.join(ret) + '\n'
+
+    def _reset(self, now: int):
+        self._series = {}
+        self._since = now
+
+    def _histogram(self, ret: list, metric: str, help: str, rows: list):
+        bounds = [int(b * 1e9) for b in self.BOUNDS]
+
+        ret.append('# HELP {} {}'.format(metric, help))
+        ret.append('# TYPE {} histogram'.format(metric))
+
+        for labels, h in rows:
+            for b, n in zip(self.BOUNDS, h.cumulative(bounds)):
+                ret.append('{}_bucket{} {}'.format(metric, _labels(labels, le=repr(b)), n))
+            ret.append('{}_bucket{} {}'.format(metric, _labels(labels, le='+Inf'), h.count))
+            ret.append('{}_sum{} {}'.format(metric, _labels(labels), repr(h.sum / 1e9)))
+            ret.append('{}_count{} {}'.format(metric, _labels(labels), h.count))
+
+    def _name(self, name: str, ev) -> str:
+        if name is not None:
+            return name
+
+        if ev is None:
+            return ''
+
+        key = ev.id()
+        ret = self._names.get(key)
+        if ret is None:
+            ret = ev.subject() or ''
+            self._names[key] = ret
+
+        return ret
+
+    def _wait(self, msg: TibrvMsg, now: int) -> int:
+        ts = self._timestamp
+
+        if callable(ts):
+            t = ts(msg)
+            return None if t is None else now - t
+
+        fld = msg.getField(ts)
+        if fld is None:
+            return None
+
+        if fld.type == TIBRVMSG_DATETIME:
+            return now - (fld.data.sec * 1000000000 + fld.data.nsec)
+        if fld.type == TIBRVMSG_F64:
+            return now - int(fld.data * 1e9)
+        if fld.type == TIBRVMSG_I64 or fld.type == TIBRVMSG_U64:
+            return now - fld.data
+
+        return None
+
+    def _measure(self, cb: TibrvMsgCallback, name: str, ev, msg: TibrvMsg, closure):
+        # dispatcher thread
+        wait = None
+        if self._timestamp is not None and msg is not None:
+            wait = self._wait(msg, _wall())
+
+        subj = None
+        if self._bySubject and msg is not None:
+            subj = msg.sendSubject
+
+        t = _clock()
+        error = True
+        try:
+            cb.callback(ev, msg, closure)
+            error = False
+        finally:
+            ns = _clock() - t
+            self._add(self._name(name, ev), subj, ns, wait, error)
+
+    def _add(self, name: str, subj: str, ns: int, wait: int, error: bool):
+        with self._lock:
+            sr = self._series.get(name)
+            if sr is None:
+                sr = _Series()
+                self._series[name] = sr
+
+            sr.add(ns, wait, error)
+
+            if subj is None:
+                return
+
+            if sr.subjects is None:
+                sr.subjects = {}
+
+            ss = sr.subjects.get(subj)
+            if ss is None:
+                if len(sr.subjects) >= self._maxSubjects:
+                    subj = self.OTHER
+                    ss = sr.subjects.get(subj)
+                if ss is None:
+                    ss = _Series()
+                    sr.subjects[subj] = ss
+
+            ss.add(ns, wait, error)
+
+
+def _labels(labels: dict, **kwargs) -> str:
+    items = list(labels.items()) + list(kwargs.items())
+    return '{' + ','.join('{}="{}"'.format(k, _escape(v)) for k, v in items) + '}'
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+##-----------------------------------------------------------------------------
+# Queue Monitor
+##-----------------------------------------------------------------------------
+class _QueueStat:
+
+    def __init__(self, que: TibrvQueue, name: str, maxEvents: int):
+        self.que = que
+        self.name = name
+        self.maxEvents = maxEvents          # None is limit policy of queue
+        self.policy = TIBRVQUEUE_DISCARD_NONE
+        self.limit = 0
+        self.samples = 0
+        self.depth = 0
+        self.min = 0
+        self.max = 0
+        self.ewma = 0.0
+        self.growth = 0.0                   # msgs/sec, ewma, negative is draining
+        self.last = None                    # perf_counter_ns of last sample
+        self.high = False
+        self.overflow = False
+        self.status = TIBRV_OK
+        self.hookErrors = 0
+        self.lastHookError = None
+
+    def capacity(self) -> int:
+        if self.maxEvents is not None:
+            return self.maxEvents
+        return self.limit
+
+    def stats(self) -> dict:
+        cap = self.capacity()
+        growth = self.growth
+
+        tto = None
+        if cap > 0 and growth > 0:
+            tto = max(0.0, (cap - self.depth) / growth)
+
+        ttd = None
+        if growth < 0:
+            ttd = self.depth / -growth
+
+        return dict(depth=self.depth, min=self.min, max=self.max, ewma=self.ewma,
+                    growth=growth, drainRate=-growth if growth < 0 else 0.0,
+                    timeToOverflow=tto, timeToDrain=ttd,
+                    maxEvents=cap, policy=self.policy,
+                    high=self.high, samples=self.samples, status=self.status,
+                    hookErrors=self.hookErrors, lastHookError=self.lastHookError)
+
+
+class TibrvQueueMonitor(_Exporter):
+
+    def __init__(self, interval: float = 1.0, alpha: float = 0.2,
+                 high: float = 0.8, low: float = 0.5, horizon: float = 10.0):
+        # interval : seconds between samples
+        # alpha    : weight of new sample in ewma
+        # high/low : fraction of maxEvents, alert 'high' when depth >= high,
+        #            'normal' when depth <= low again
+        # horizon  : alert 'overflow' when time to overflow < horizon seconds
+        self._interval = interval
+        self._alpha = alpha
+        self._high = high
+        self._low = low
+        self._horizon = horizon
+        self._lock = _threading.Lock()
+        self._queues = {}
+        self._hooks = []
+        self._que = None
+        self._timer = None
+        self._disp = None
+        self._err = None
+
+    def add(self, que: TibrvQueue, name: str = None, maxEvents: int = None) -> tibrv_status:
+        # name      : queue in stats, None is queue name
+        # maxEvents : capacity for alerts, None is limit policy of queue,
+        #             set it for queue without limit (TIBRVQUEUE_DISCARD_NONE)
+
+        if que is None or not isinstance(que, TibrvQueue) or que.id() == 0:
+            status = TIBRV_INVALID_QUEUE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if name is None:
+            name = que.name or str(que.id())
+
+        with self._lock:
+            if name in self._queues:
+                status = TIBRV_ID_IN_USE
+                self._err = TibrvStatus.error(status)
+                return status
+
+            self._queues[name] = _QueueStat(que, name, maxEvents)
+
+        status = TIBRV_OK
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def remove(self, name: str):
+        with self._lock:
+            self._queues.pop(name, None)
+
+    def hook(self, cb):
+        # cb(name, alert, stats), alert is 'high', 'normal' or 'overflow'
+        #    called in sampling thread
+        self._hooks.append(cb)
+
+    def create(self) -> tibrv_status:
+        # sample on TibrvTimer, in own queue and dispatcher
+
+        if self._timer is not None:
+            status = TIBRV_ID_IN_USE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if self._interval is None or self._interval <= 0:
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        que = TibrvQueue()
+        status = que.create('TibrvQueueMonitor')
+        if status != TIBRV_OK:
+            self._err = TibrvStatus.error(status)
+            return status
+
+        timer = TibrvTimer()
+        status = timer.create(que, TibrvTimerCallback(lambda ev, msg, closure: self.sample()),
+                              self._interval)
+        if status != TIBRV_OK:
+            que.destroy()
+            self._err = TibrvStatus.error(status)
+            return status
+
+        disp = TibrvDispatcher()
+        status = disp.create(que)
+        if status != TIBRV_OK:
+            timer.destroy()
+            que.destroy()
+            self._err = TibrvStatus.error(status)
+            return status
+
+        self._que = que
+        self._timer = timer
+        self._disp = disp
+
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def destroy(self) -> tibrv_status:
+        if self._timer is None:
+            status = TIBRV_INVALID_EVENT
+            self._err = TibrvStatus.error(status)
+            return status
+
+        status = self._timer.destroy()
+        self._disp.destroy()
+        self._que.destroy()
+
+        self._timer = None
+        self._disp = None
+        self._que = None
+
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def sample(self):
+        # sample all queues now, called by timer
+
+        with self._lock:
+            queues = list(self._queues.values())
+
+        alerts = []
+        now = _clock()
+
+        for qs in queues:
+            status, depth = tibrvQueue_GetCount(qs.que.id())
+            qs.status = status
+            if status != TIBRV_OK:
+                continue
+
+            status, policy, limit, discard = tibrvQueue_GetLimitPolicy(qs.que.id())
+            if status == TIBRV_OK:
+                qs.policy = policy
+                qs.limit = limit
+
+            with self._lock:
+                self._update(qs, depth, now, alerts)
+
+        for qs, alert, stats in alerts:
+            for cb in self._hooks:
+                try:
+                    cb(qs.name, alert, stats)
+                except Exception as e:
+                    # sampling goes on, failure is counted and kept
+                    with self._lock:
+                        qs.hookErrors = qs.hookErrors + 1
+                        qs.lastHookError = e
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {name: qs.stats() for name, qs in self._queues.items()}
+
+    def exposition(self) -> str:
+        stats = self.stats()
+
+        ret = []
+        gauges = [
+            ('pytibrv_queue_depth', 'depth', 'Events in queue.'),
+            ('pytibrv_queue_depth_max', 'max', 'Max events in queue, sampled.'),
+            ('pytibrv_queue_depth_ewma', 'ewma', 'EWMA of events in queue.'),
+            ('pytibrv_queue_growth_rate', 'growth', 'Events/sec, negative is draining.'),
+            ('pytibrv_queue_max_events', 'maxEvents', 'Limit of queue, 0 is unlimited.'),
+            ('pytibrv_queue_time_to_overflow_seconds', 'timeToOverflow', 'Estimated seconds to reach max events.'),
+        ]
+
+        for metric, key, help in gauges:
+            ret.append('# HELP {} {}'.format(metric, help))
+            ret.append('# TYPE {} gauge'.format(metric))
+            for name, st in stats.items():
+                if st[key] is None:
+                    continue
+                ret.append('{}{} {}'.format(metric, _labels({'queue': name}), repr(float(st[key]))))
+
+        ret.append('# HELP pytibrv_queue_hook_errors_total Alert hooks raised exception.')
+        ret.append('# TYPE pytibrv_queue_hook_errors_total counter')
+        for name, st in stats.items():
+            ret.append('pytibrv_queue_hook_errors_total{} {}'.format(_labels({'queue': name}), st['hookErrors']))
+
+        return '\n'.join(ret) + '\n'
+
+    def error(self) -> TibrvError:
+        return self._err
+
+    def _update(self, qs: _QueueStat, depth: int, now: int, alerts: list):
+        a = self._alpha
+
+        if qs.samples == 0:
+            qs.min = depth
+            qs.max = depth
+            qs.ewma = float(depth)
+        else:
+            qs.min = min(qs.min, depth)
+            qs.max = max(qs.max, depth)
+            qs.ewma = a * depth + (1.0 - a) * qs.ewma
+
+            dt = (now - qs.last) / 1e9
+            if dt > 0:
+                rate = (depth - qs.depth) / dt
+                if qs.samples == 1:
+                    qs.growth = rate
+                else:
+                    qs.growth = a * rate + (1.0 - a) * qs.growth
+
+        qs.samples = qs.samples + 1
+        qs.depth = depth
+        qs.last = now
+
+        cap = qs.capacity()
+        if cap <= 0:
+            return
+
+        if not qs.high and depth >= cap * self._high:
+            qs.high = True
+            alerts.append((qs, 'high', qs.stats()))
+        elif qs.high and depth <= cap * self._low:
+            qs.high = False
+            alerts.append((qs, 'normal', qs.stats()))
+
+        tto = qs.stats()['timeToOverflow']
+        if not qs.overflow and tto is not None and tto < self._horizon:
+            qs.overflow = True
+            alerts.append((qs, 'overflow', qs.stats()))
+        elif qs.overflow and (tto is None or tto >= self._horizon):
+            qs.overflow = False
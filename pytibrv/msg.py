@@ -32,6 +32,30 @@
 #    TibrvMsg.getI32()       -> tibrvMsg_GetI32()
 #    TibrvMsg.listI32()      -> tibrvMsg_GetI32Array()
 #
+#    For numeric array, tibrvMsg_AddXXXArray(), tibrvMsg_UpdateXXXArray()
+#    also accept buffer, ex: array.array, numpy.ndarray, memoryview
+#    the buffer is passed to TIBRV directly, without list[] or copy.
+#
+#    buffer must be C-contiguous, and format/item size must match the field type
+#    ex:
+#       tibrvMsg_AddF64Array(msg, 'CURVE', array.array('d', ...))           -> OK
+#       tibrvMsg_AddF64Array(msg, 'CURVE', numpy.zeros(10, numpy.float64))  -> OK
+#       tibrvMsg_AddF64Array(msg, 'CURVE', numpy.zeros(10, numpy.float32))  -> TIBRV_INVALID_ARG
+#       tibrvMsg_AddI32Array(msg, 'IDS',   array.array('q', ...))           -> TIBRV_INVALID_ARG
+#
+#    read-only buffer (ex: bytes) would be copied once.
+#
+#    tibrvMsg_GetXXXArray() copy each element into list[], it is slow for large array.
+#    tibrvMsg_GetXXXArrayView() return memoryview over the TIBRV array, no copy.
+#
+#       status, view = tibrvMsg_GetF64ArrayView(msg, 'CURVE')
+#       view[0], len(view), numpy.frombuffer(view, numpy.float64)
+#
+#    memoryview is read-only, and it refers the memory inside TIBRV message
+#    it is valid until the message was updated, reset or destroyed.
+#    for message in callback, it means until callback returned.
+#    DONT access it after that, or it would be SEGMENT FAULT
+#
 # 3. Data Type Conversion
 #    ctypes provide data check
 #    ex:
@@ -149,6 +173,14 @@
 #
 #         Subject, Field Name NOT Support Code Page Conversion
 #
+# 5. Wire Format
+#    tibrvMsg_GetAsBytes()      -> readonly memoryview in TIBRV, NO copy
+#                                  valid until the message was updated, reset or destroyed
+#    tibrvMsg_GetAsBytesCopy()  -> bytes, or copy into buffer
+#    tibrvMsg_CreateFromBytes() -> new message, data is copied by TIBRV
+#
+#    Send/Reply Subject are NOT included in wire format
+#
 #
 # FEATURES: * = un-implement
 # -----------------------------------------------------------------------------
@@ -157,6 +189,7 @@
 #   tibrvMsg_Create
 #   tibrvMsg_CreateCopy
 #   tibrvMsg_CreateEx
+#   tibrvMsg_DecodeAll
 #   tibrvMsg_Destroy
 #   tibrvMsg_Detach
 #   tibrvMsg_Expend
@@ -165,6 +198,7 @@
 #   tibrvMsg_GetCurrentTime
 #   tibrvMsg_GetEvent
 #   tibrvMsg_GetXXX
+#   tibrvMsg_GetXXXArrayView
 #   tibrvMsg_GetFieldByIndex
 #   tibrvMsg_GetFieldInstance
 #   tibrvMsg_GetNumFields
@@ -176,12 +210,12 @@
 #   tibrvMsg_SetReplySubject
 #   tibrvMsg_SetSendSubject
 #   tibrvMsg_UpdateXXX
+#   tibrvMsg_GetAsBytes
+#   tibrvMsg_CreateFromBytes
+#   tibrvMsg_GetAsBytesCopy
 #
 #  *DataType: Opaque, Xml, IPPort16, IPAddress32
 #  *tibrvMsg_ClearReference
-#  *tibrvMsg_CreateFromBytes
-#  *tibrvMsg_GetAsBytes
-#  *tibrvMsg_GetAsBytesCopy
 #  *tibrvMsg_MarkReference
 #  *tibrvMsg_SetHandler
 #  *tibrbMsg_Write
@@ -198,17 +232,22 @@
 #
 
 import ctypes as _ctypes
+import sys as _sys
 
 from .types import tibrv_status, tibrvMsg, tibrvMsgDateTime, tibrvMsgField, tibrvEvent,\
                    TIBRVMSG_I8, TIBRVMSG_U8, TIBRVMSG_I16, TIBRVMSG_U16, \
                    TIBRVMSG_I32, TIBRVMSG_U32, TIBRVMSG_I64, TIBRVMSG_U64, \
                    TIBRVMSG_F32, TIBRVMSG_F64, TIBRVMSG_STRING, TIBRVMSG_MSG, \
-                   TIBRVMSG_DATETIME, \
+                   TIBRVMSG_DATETIME, TIBRVMSG_OPAQUE, TIBRVMSG_BOOL, TIBRVMSG_XML, \
+                   TIBRVMSG_IPPORT16, TIBRVMSG_IPADDR32, \
+                   TIBRVMSG_I8ARRAY, TIBRVMSG_U8ARRAY, TIBRVMSG_I16ARRAY, TIBRVMSG_U16ARRAY, \
+                   TIBRVMSG_I32ARRAY, TIBRVMSG_U32ARRAY, TIBRVMSG_I64ARRAY, TIBRVMSG_U64ARRAY, \
+                   TIBRVMSG_F32ARRAY, TIBRVMSG_F64ARRAY, TIBRVMSG_STRINGARRAY, TIBRVMSG_MSGARRAY, \
                    TIBRVMSG_DATETIME_STRING_SIZE
 
 from .status import TIBRV_OK, TIBRV_INVALID_ARG, TIBRV_INVALID_MSG
 
-from .api import _rv, _cstr, _pystr, \
+from .api import _rv, _cstr, _cname, _pystr, \
                  _c_tibrv_status, _c_tibrvMsg, _c_tibrvEvent, _c_tibrv_bool, \
                  _c_tibrv_i8, _c_tibrv_u8, _c_tibrv_i16, _c_tibrv_u16, \
                  _c_tibrv_i32, _c_tibrv_u32, _c_tibrv_i64, _c_tibrv_u64, \
@@ -271,7 +310,7 @@ class _c_tibrvMsgField(_ctypes.Structure):
         if fld is None:
             return
 
-        self.name = _cstr(fld.name)
+        self.name = _cname(fld.name)
         self.size = fld.size
         self.count = fld.count
         self.id = fld.id
@@ -298,66 +337,145 @@ class _c_tibrvMsgField(_ctypes.Structure):
         obj._id = self.id
         obj._type = self.type
 
-        if obj.type == TIBRVMSG_I8:
-            obj.int8 = self.data.i8.value
+        if obj.type == TIBRVMSG_STRING:
+            # obj.str/setter will assign obj._size = len()
+            # it is str length, not bytes
+            # len('ABC中文') -> 5 UTF char, bytes = 10
+            obj.str = _pystr(self.data.str, codepage)
             return
 
-        if obj.type == TIBRVMSG_U8:
-            obj.uint8 = self.data.u8.value
+        if obj.type == TIBRVMSG_MSG:
+            # NOW return tibrvMsg = int
+            obj.msg = self.data.msg
             return
 
-        if obj.type == TIBRVMSG_I16:
-            obj.int16 = self.data.i16.value
-            return
+        decode = _field_decoder.get(obj.type)
+        if decode is not None:
+            obj._data = decode(self, codepage)
 
-        if obj.type == TIBRVMSG_U16:
-            obj.uint16 = self.data.u16.value
-            return
 
-        if obj.type == TIBRVMSG_I32:
-            obj.int32 = self.data.i32.value
-            return
+##-----------------------------------------------------------------------------
+# Array
+#   _array_view : memoryview over the array inside TIBRV message, no copy
+#                 it is valid until message was updated, reset or destroyed
+#   _c_array    : list[] or buffer to ctypes array, for tibrvMsg_AddXXXArray
+##-----------------------------------------------------------------------------
+def _array_view(val, num: int, c_type, fmt: str) -> memoryview:
 
-        if obj.type == TIBRVMSG_U32:
-            obj.uint32 = self.data.U32.value
-            return
+    addr = _ctypes.cast(val, _ctypes.c_void_p).value
 
-        if obj.type == TIBRVMSG_I64:
-            obj.int64 = self.data.i64
-            return
+    if num == 0 or addr is None:
+        return memoryview(b'').cast(fmt)
 
-        if obj.type == TIBRVMSG_U64:
-            obj.uint64 = self.data.u64.value
-            return
+    # ctypes exports '<d', '<i', ..., which memoryview could not index
+    # cast to native format by bytes
+    buf = (c_type * num).from_address(addr)
 
-        if obj.type == TIBRVMSG_F32:
-            obj.f32 = self.data.f32.value
-            return
+    return memoryview(buf).cast('B').cast(fmt).toreadonly()
 
-        if obj.type == TIBRVMSG_F64:
-            obj.f64 = self.data.f64.value
-            return
 
-        if obj.type == TIBRVMSG_STRING:
-            # obj.str/setter will assign obj._size = len()
-            # it is str length, not bytes
-            # len('ABC中文') -> 5 UTF char, bytes = 10
-            obj.str = _pystr(self.data.str, codepage)
-            return
+# format of buffer protocol, see module struct
+_ARRAY_SIGNED   = 'bhilq'
+_ARRAY_UNSIGNED = 'BHILQ'
+_ARRAY_FLOAT    = 'fd'
+_ARRAY_ORDER    = '<' if _sys.byteorder == 'little' else '>'
 
-        if obj.type == TIBRVMSG_MSG:
-            # NOW return tibrvMsg = int
-            obj.msg = self.data.msg
-            return
+def _c_array(value, c_type, formats: str):
+    # list[]  -> ctypes array, construct element by element
+    # buffer  -> ctypes array over the buffer, no copy
+    #            array.array, numpy.ndarray, memoryview, ...
+    #
+    # return (ctypes array, count) or raise TypeError/ValueError
+    if type(value) is list:
+        n = len(value)
+        return (c_type * n)(*value), n
+
+    view = memoryview(value)
+
+    fmt = view.format
+    if len(fmt) == 2 and (fmt[0] in '@=' or fmt[0] == _ARRAY_ORDER):
+        fmt = fmt[1:]
+
+    if len(fmt) != 1 or fmt not in formats:
+        raise TypeError('array format ' + view.format + ' is not supported')
+
+    if view.itemsize != _ctypes.sizeof(c_type):
+        raise TypeError('array item size {} is not {}'.format(view.itemsize, _ctypes.sizeof(c_type)))
+
+    if not view.c_contiguous:
+        raise ValueError('array is not contiguous')
+
+    n = view.nbytes // view.itemsize
+
+    if view.readonly:
+        # ctypes could not refer a read-only buffer, copy it once
+        return (c_type * n).from_buffer_copy(view), n
+
+    return (c_type * n).from_buffer(view), n
 
-        if obj.type == TIBRVMSG_DATETIME:
-            dt = tibrvMsgDateTime()
-            dt.sec = self.data.date.sec.value
-            dt.nsec = self.date.date.nsec.value
-            obj.data = dt
-            return
 
-        # TODO array
+##-----------------------------------------------------------------------------
+# Field Decoder
+#   type -> function(_c_tibrvMsgField, codepage), return Python object
+#   TIBRVMSG_MSG, TIBRVMSG_MSGARRAY return tibrvMsg (int)
+##-----------------------------------------------------------------------------
+def _decode_array(c_type):
+    c_type_p = _ctypes.POINTER(c_type)
+
+    def decode(fld, codepage):
+        # slice of pointer is done by ctypes, not Python loop
+        return _ctypes.cast(fld.data.array, c_type_p)[:fld.count]
+
+    return decode
+
+def _decode_datetime(fld, codepage):
+    dt = tibrvMsgDateTime()
+    fld.data.date.castTo(dt)
+    return dt
+
+def _decode_bytes(fld, codepage):
+    if fld.size == 0:
+        return b''
+    return _ctypes.string_at(fld.data.buf, fld.size)
+
+def _decode_string_array(fld, codepage):
+    ret = _ctypes.cast(fld.data.array, _ctypes.POINTER(_c_tibrv_str))[:fld.count]
+    for x in range(len(ret)):
+        ret[x] = _pystr(ret[x], codepage)
+    return ret
+
+_field_decoder = {
+    TIBRVMSG_MSG:           lambda fld, codepage: fld.data.msg,
+    TIBRVMSG_DATETIME:      _decode_datetime,
+    TIBRVMSG_OPAQUE:        _decode_bytes,
+    TIBRVMSG_STRING:        lambda fld, codepage: _pystr(fld.data.str, codepage),
+    TIBRVMSG_BOOL:          lambda fld, codepage: fld.data.boolean != 0,
+    TIBRVMSG_I8:            lambda fld, codepage: fld.data.i8,
+    TIBRVMSG_U8:            lambda fld, codepage: fld.data.u8,
+    TIBRVMSG_I16:           lambda fld, codepage: fld.data.i16,
+    TIBRVMSG_U16:           lambda fld, codepage: fld.data.u16,
+    TIBRVMSG_I32:           lambda fld, codepage: fld.data.i32,
+    TIBRVMSG_U32:           lambda fld, codepage: fld.data.u32,
+    TIBRVMSG_I64:           lambda fld, codepage: fld.data.i64,
+    TIBRVMSG_U64:           lambda fld, codepage: fld.data.u64,
+    TIBRVMSG_F32:           lambda fld, codepage: fld.data.f32,
+    TIBRVMSG_F64:           lambda fld, codepage: fld.data.f64,
+    TIBRVMSG_IPPORT16:      lambda fld, codepage: fld.data.ipport16,
+    TIBRVMSG_IPADDR32:      lambda fld, codepage: fld.data.ipaddr32,
+    TIBRVMSG_I8ARRAY:       _decode_array(_c_tibrv_i8),
+    TIBRVMSG_U8ARRAY:       _decode_array(_c_tibrv_u8),
+    TIBRVMSG_I16ARRAY:      _decode_array(_c_tibrv_i16),
+    TIBRVMSG_U16ARRAY:      _decode_array(_c_tibrv_u16),
+    TIBRVMSG_I32ARRAY:      _decode_array(_c_tibrv_i32),
+    TIBRVMSG_U32ARRAY:      _decode_array(_c_tibrv_u32),
+    TIBRVMSG_I64ARRAY:      _decode_array(_c_tibrv_i64),
+    TIBRVMSG_U64ARRAY:      _decode_array(_c_tibrv_u64),
+    TIBRVMSG_F32ARRAY:      _decode_array(_c_tibrv_f32),
+    TIBRVMSG_F64ARRAY:      _decode_array(_c_tibrv_f64),
+    TIBRVMSG_XML:           _decode_bytes,
+    TIBRVMSG_STRINGARRAY:   _decode_string_array,
+    TIBRVMSG_MSGARRAY:      _decode_array(_c_tibrvMsg),
+}
 
 
 ##-----------------------------------------------------------------------------
@@ -508,7 +626,7 @@ def tibrvMsg_SetSendSubject(message:tibrvMsg, subject: str) -> tibrv_status:
         return TIBRV_INVALID_MSG
 
     try:
-        sz = _cstr(subject)
+        sz = _cname(subject)
     except:
         return TIBRV_INVALID_ARG
 
@@ -555,7 +673,7 @@ def tibrvMsg_SetReplySubject(message: tibrvMsg, subject: str) -> tibrv_status:
         return TIBRV_INVALID_MSG
 
     try:
-        sz = _cstr(subject)
+        sz = _cname(subject)
     except:
         return TIBRV_INVALID_ARG
 
@@ -619,12 +737,16 @@ def tibrvMsg_GetClosure(message: tibrvMsg) -> (tibrv_status, object):
         return TIBRV_INVALID_MSG, None
 
     ret = None
-    cz = _ctypes.py_object
+    cz = _ctypes.py_object()
     status = _rv.tibrvMsg_GetClosure(msg, _ctypes.byref(cz))
 
     # cast to Python Object
     if status == TIBRV_OK:
-        ret = _ctypes.cast(cz, _ctypes.py_object).value
+        try:
+            ret = cz.value
+        except ValueError:
+            # NULL closure
+            ret = None
 
     return status, ret
 
@@ -668,6 +790,111 @@ def tibrvMsg_GetByteSize(message: tibrvMsg) -> (tibrv_status, int):
     return status, n.value
 
 
+##
+_rv.tibrvMsg_GetAsBytes.argtypes = [_c_tibrvMsg, _ctypes.POINTER(_ctypes.c_void_p)]
+_rv.tibrvMsg_GetAsBytes.restype = _c_tibrv_status
+
+def tibrvMsg_GetAsBytes(message: tibrvMsg) -> (tibrv_status, memoryview):
+    # return readonly memoryview over the message data in TIBRV, NO copy
+    # it is valid until the message was updated, reset or destroyed
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    ptr = _ctypes.c_void_p(0)
+    status = _rv.tibrvMsg_GetAsBytes(msg, _ctypes.byref(ptr))
+    if status != TIBRV_OK:
+        return status, None
+
+    n = _c_tibrv_u32(0)
+    status = _rv.tibrvMsg_GetByteSize(msg, _ctypes.byref(n))
+    if status != TIBRV_OK:
+        return status, None
+
+    buf = (_ctypes.c_char * n.value).from_address(ptr.value)
+
+    return status, memoryview(buf).cast('B').toreadonly()
+
+
+##
+_rv.tibrvMsg_GetAsBytesCopy.argtypes = [_c_tibrvMsg, _ctypes.c_void_p, _c_tibrv_u32]
+_rv.tibrvMsg_GetAsBytesCopy.restype = _c_tibrv_status
+
+def tibrvMsg_GetAsBytesCopy(message: tibrvMsg, buffer = None) -> (tibrv_status, bytes):
+    # buffer is None : return bytes
+    # buffer         : writable buffer (bytearray, mmap, ...), copy into it
+    #                  return memoryview of buffer[:size]
+    #                  TIBRV_INSUFFICIENT_BUFFER if buffer is too small
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    n = _c_tibrv_u32(0)
+    status = _rv.tibrvMsg_GetByteSize(msg, _ctypes.byref(n))
+    if status != TIBRV_OK:
+        return status, None
+
+    if buffer is None:
+        buf = _ctypes.create_string_buffer(n.value)
+        status = _rv.tibrvMsg_GetAsBytesCopy(msg, buf, n)
+        if status != TIBRV_OK:
+            return status, None
+
+        return status, buf.raw[:n.value]
+
+    try:
+        mv = memoryview(buffer).cast('B')
+        buf = (_ctypes.c_char * mv.nbytes).from_buffer(mv)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvMsg_GetAsBytesCopy(msg, buf, _c_tibrv_u32(len(buf)))
+    del buf
+    if status != TIBRV_OK:
+        return status, None
+
+    return status, mv[:n.value]
+
+
+##
+_rv.tibrvMsg_CreateFromBytes.argtypes = [_ctypes.POINTER(_c_tibrvMsg), _ctypes.c_void_p]
+_rv.tibrvMsg_CreateFromBytes.restype = _c_tibrv_status
+
+def tibrvMsg_CreateFromBytes(data) -> (tibrv_status, tibrvMsg):
+    # data : bytes, bytearray or memoryview from tibrvMsg_GetAsBytes
+    #        TIBRV copy the data into new message
+
+    if data is None:
+        return TIBRV_INVALID_ARG, None
+
+    try:
+        mv = memoryview(data).cast('B')
+        if mv.readonly:
+            buf = (_ctypes.c_char * mv.nbytes).from_buffer_copy(mv)
+        else:
+            buf = (_ctypes.c_char * mv.nbytes).from_buffer(mv)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    if len(buf) == 0:
+        return TIBRV_INVALID_ARG, None
+
+    msg = _c_tibrvMsg(0)
+    status = _rv.tibrvMsg_CreateFromBytes(_ctypes.byref(msg), buf)
+
+    return status, msg.value
+
+
 ##
 _rv.tibrvMsg_ConvertToString.argtypes = [_c_tibrvMsg, _ctypes.POINTER(_c_tibrv_str)]
 _rv.tibrvMsg_ConvertToString.restype = _c_tibrv_status
@@ -748,7 +975,7 @@ def tibrvMsg_AddDateTime(message: tibrvMsg, fieldName: str, value: tibrvMsgDateT
         return TIBRV_INVALID_ARG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         dt = _c_tibrvMsgDateTime(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -784,7 +1011,7 @@ def tibrvMsg_UpdateDateTime(message: tibrvMsg, fieldName: str, value: tibrvMsgDa
         return TIBRV_INVALID_ARG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         dt = _c_tibrvMsgDateTime(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -819,7 +1046,7 @@ def tibrvMsg_GetDateTime(message: tibrvMsg, fieldName: str,
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrvMsgDateTime()
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -852,7 +1079,7 @@ def tibrvMsg_AddBool(message: tibrvMsg, fieldName: str, value: bool, optIdentifi
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_bool(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -880,7 +1107,7 @@ def tibrvMsg_UpdateBool(message: tibrvMsg, fieldName: str, value: bool, optIdent
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_bool(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -914,7 +1141,7 @@ def tibrvMsg_GetBool(message: tibrvMsg, fieldName: str, optIdentifier: int = 0)
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_bool()
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -946,7 +1173,7 @@ def tibrvMsg_AddI8(message: tibrvMsg, fieldName: str, value: int, optIdentifier:
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i8(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -974,7 +1201,7 @@ def tibrvMsg_UpdateI8(message: tibrvMsg, fieldName: str, value: int, optIdentifi
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i8(int(value))
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1008,7 +1235,7 @@ def tibrvMsg_GetI8(message: tibrvMsg, fieldName: str, optIdentifier: int = 0) ->
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i8()
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1045,7 +1272,7 @@ def tibrvMsg_AddI8Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -1054,12 +1281,8 @@ def tibrvMsg_AddI8Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_AddI8ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_i8 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_i8, _ARRAY_SIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -1092,7 +1315,7 @@ def tibrvMsg_UpdateI8Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -1101,12 +1324,8 @@ def tibrvMsg_UpdateI8Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_UpdateI8ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_i8 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_i8, _ARRAY_SIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -1140,7 +1359,7 @@ def tibrvMsg_GetI8Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i8_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -1157,6 +1376,39 @@ def tibrvMsg_GetI8Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     return status, ret
 
 
+##
+def tibrvMsg_GetI8ArrayView(message: tibrvMsg, fieldName: str,
+                            optIdentifier: int = 0) -> (tibrv_status, memoryview):
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    if fieldName is None or optIdentifier is None:
+        return TIBRV_INVALID_ARG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    ret = None
+
+    try:
+        name = _cname(fieldName)
+        val = _c_tibrv_i8_p()
+        num = _c_tibrv_u32(0)
+        id = _c_tibrv_u16(optIdentifier)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvMsg_GetI8ArrayEx(msg, name, _ctypes.byref(val), _ctypes.byref(num), id)
+
+    if status == TIBRV_OK:
+        ret = _array_view(val, num.value, _c_tibrv_i8, 'b')
+
+    return status, ret
+
+
 ##
 _rv.tibrvMsg_AddU8Ex.argtypes = [_c_tibrvMsg, _c_tibrv_str, _c_tibrv_u8, _c_tibrv_u16]
 _rv.tibrvMsg_AddU8Ex.restype = _c_tibrv_status
@@ -1176,7 +1428,7 @@ def tibrvMsg_AddU8(message: tibrvMsg, fieldName: str, value: int,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u8(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1205,7 +1457,7 @@ def tibrvMsg_UpdateU8(message: tibrvMsg, fieldName: str, value: int,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u8(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1238,7 +1490,7 @@ def tibrvMsg_GetU8(message: tibrvMsg, fieldName: str, optIdentifier: int = 0) ->
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u8()
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1275,7 +1527,7 @@ def tibrvMsg_AddU8Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -1284,12 +1536,8 @@ def tibrvMsg_AddU8Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_AddU8ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_u8 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_u8, _ARRAY_UNSIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -1322,7 +1570,7 @@ def tibrvMsg_UpdateU8Array(message:tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -1331,12 +1579,8 @@ def tibrvMsg_UpdateU8Array(message:tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_UpdateU8ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_u8 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_u8, _ARRAY_UNSIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -1370,7 +1614,7 @@ def tibrvMsg_GetU8Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u8_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -1387,6 +1631,39 @@ def tibrvMsg_GetU8Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     return status, ret
 
 
+##
+def tibrvMsg_GetU8ArrayView(message: tibrvMsg, fieldName: str,
+                            optIdentifier: int = 0) -> (tibrv_status, memoryview):
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    if fieldName is None or optIdentifier is None:
+        return TIBRV_INVALID_ARG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    ret = None
+
+    try:
+        name = _cname(fieldName)
+        val = _c_tibrv_u8_p()
+        num = _c_tibrv_u32(0)
+        id = _c_tibrv_u16(optIdentifier)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvMsg_GetU8ArrayEx(msg, name, _ctypes.byref(val), _ctypes.byref(num), id)
+
+    if status == TIBRV_OK:
+        ret = _array_view(val, num.value, _c_tibrv_u8, 'B')
+
+    return status, ret
+
+
 ##
 _rv.tibrvMsg_AddI16Ex.argtypes = [_c_tibrvMsg, _c_tibrv_str, _c_tibrv_i16, _c_tibrv_u16]
 _rv.tibrvMsg_AddI16Ex.restype = _c_tibrv_status
@@ -1405,7 +1682,7 @@ def tibrvMsg_AddI16(message: tibrvMsg, fieldName: str, value: int, optIdentifier
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i16(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1433,7 +1710,7 @@ def tibrvMsg_UpdateI16(message: tibrvMsg, fieldName: str, value: int, optIdentif
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i16(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1467,7 +1744,7 @@ def tibrvMsg_GetI16(message: tibrvMsg, fieldName: str, optIdentifier: int = 0) -
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i16(0)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1504,7 +1781,7 @@ def tibrvMsg_AddI16Array(message: tibrvMsg, fieldName: str, value: list, optIden
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -1513,12 +1790,8 @@ def tibrvMsg_AddI16Array(message: tibrvMsg, fieldName: str, value: list, optIden
         status = _rv.tibrvMsg_AddI16ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_i16 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_i16, _ARRAY_SIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -1551,7 +1824,7 @@ def tibrvMsg_UpdateI16Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -1560,12 +1833,8 @@ def tibrvMsg_UpdateI16Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_UpdateI16ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_i16 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_i16, _ARRAY_SIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -1600,7 +1869,7 @@ def tibrvMsg_GetI16Array(message: tibrvMsg, fieldName:str, optIdentifier:int = 0
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i16_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -1617,6 +1886,39 @@ def tibrvMsg_GetI16Array(message: tibrvMsg, fieldName:str, optIdentifier:int = 0
     return status, ret
 
 
+##
+def tibrvMsg_GetI16ArrayView(message: tibrvMsg, fieldName: str,
+                             optIdentifier: int = 0) -> (tibrv_status, memoryview):
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    if fieldName is None or optIdentifier is None:
+        return TIBRV_INVALID_ARG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    ret = None
+
+    try:
+        name = _cname(fieldName)
+        val = _c_tibrv_i16_p()
+        num = _c_tibrv_u32(0)
+        id = _c_tibrv_u16(optIdentifier)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvMsg_GetI16ArrayEx(msg, name, _ctypes.byref(val), _ctypes.byref(num), id)
+
+    if status == TIBRV_OK:
+        ret = _array_view(val, num.value, _c_tibrv_i16, 'h')
+
+    return status, ret
+
+
 ##
 _rv.tibrvMsg_AddU16Ex.argtypes = [_c_tibrvMsg, _c_tibrv_str, _c_tibrv_u16, _c_tibrv_u16]
 _rv.tibrvMsg_AddU16Ex.restype = _c_tibrv_status
@@ -1635,7 +1937,7 @@ def tibrvMsg_AddU16(message: tibrvMsg, fieldName:str, value:int, optIdentifier:i
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u16(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1664,7 +1966,7 @@ def tibrvMsg_UpdateU16(message: tibrvMsg, fieldName: str, value: int,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u16(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1698,7 +2000,7 @@ def tibrvMsg_GetU16(message:tibrvMsg, fieldName:str, optIdentifier:int = 0) -> (
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u16(0)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1735,7 +2037,7 @@ def tibrvMsg_AddU16Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -1744,12 +2046,8 @@ def tibrvMsg_AddU16Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_AddU16ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_u16 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_u16, _ARRAY_UNSIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -1782,7 +2080,7 @@ def tibrvMsg_UpdateU16Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -1791,12 +2089,8 @@ def tibrvMsg_UpdateU16Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_UpdateU16ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_u16 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_u16, _ARRAY_UNSIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -1830,7 +2124,7 @@ def tibrvMsg_GetU16Array(message:tibrvMsg, fieldName:str, optIdentifier:int = 0)
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u16_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -1847,6 +2141,39 @@ def tibrvMsg_GetU16Array(message:tibrvMsg, fieldName:str, optIdentifier:int = 0)
     return status, ret
 
 
+##
+def tibrvMsg_GetU16ArrayView(message: tibrvMsg, fieldName: str,
+                             optIdentifier: int = 0) -> (tibrv_status, memoryview):
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    if fieldName is None or optIdentifier is None:
+        return TIBRV_INVALID_ARG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    ret = None
+
+    try:
+        name = _cname(fieldName)
+        val = _c_tibrv_u16_p()
+        num = _c_tibrv_u32(0)
+        id = _c_tibrv_u16(optIdentifier)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvMsg_GetU16ArrayEx(msg, name, _ctypes.byref(val), _ctypes.byref(num), id)
+
+    if status == TIBRV_OK:
+        ret = _array_view(val, num.value, _c_tibrv_u16, 'H')
+
+    return status, ret
+
+
 ##
 _rv.tibrvMsg_AddI32Ex.argtypes = [_c_tibrvMsg, _c_tibrv_str, _c_tibrv_i32, _c_tibrv_u16]
 _rv.tibrvMsg_AddI32Ex.restype = _c_tibrv_status
@@ -1865,7 +2192,7 @@ def tibrvMsg_AddI32(message:tibrvMsg, fieldName:str, value:int, optIdentifier:in
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i32(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1893,7 +2220,7 @@ def tibrvMsg_UpdateI32(message:tibrvMsg, fieldName:str, value:int, optIdentifier
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i32(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1927,7 +2254,7 @@ def tibrvMsg_GetI32(message:tibrvMsg, fieldName:str, optIdentifier:int = 0) -> (
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i32(0)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -1965,7 +2292,7 @@ def tibrvMsg_AddI32Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -1974,12 +2301,8 @@ def tibrvMsg_AddI32Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_AddI32ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_i32 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_i32, _ARRAY_SIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -2012,7 +2335,7 @@ def tibrvMsg_UpdateI32Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -2021,12 +2344,8 @@ def tibrvMsg_UpdateI32Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_UpdateI32ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_i32 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_i32, _ARRAY_SIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -2060,7 +2379,7 @@ def tibrvMsg_GetI32Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i32_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -2077,6 +2396,39 @@ def tibrvMsg_GetI32Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     return status, ret
 
 
+##
+def tibrvMsg_GetI32ArrayView(message: tibrvMsg, fieldName: str,
+                             optIdentifier: int = 0) -> (tibrv_status, memoryview):
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    if fieldName is None or optIdentifier is None:
+        return TIBRV_INVALID_ARG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    ret = None
+
+    try:
+        name = _cname(fieldName)
+        val = _c_tibrv_i32_p()
+        num = _c_tibrv_u32(0)
+        id = _c_tibrv_u16(optIdentifier)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvMsg_GetI32ArrayEx(msg, name, _ctypes.byref(val), _ctypes.byref(num), id)
+
+    if status == TIBRV_OK:
+        ret = _array_view(val, num.value, _c_tibrv_i32, 'i')
+
+    return status, ret
+
+
 ##
 _rv.tibrvMsg_AddU32Ex.argtypes = [_c_tibrvMsg, _c_tibrv_str, _c_tibrv_u32, _c_tibrv_u16]
 _rv.tibrvMsg_AddU32Ex.restype = _c_tibrv_status
@@ -2096,7 +2448,7 @@ def tibrvMsg_AddU32(message: tibrvMsg, fieldName: str, value: int,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u32(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -2125,7 +2477,7 @@ def tibrvMsg_UpdateU32(message: tibrvMsg, fieldName: str, value: int,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u32(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -2159,7 +2511,7 @@ def tibrvMsg_GetU32(message: tibrvMsg, fieldName: str, optIdentifier: int = 0) -
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u32()
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -2196,7 +2548,7 @@ def tibrvMsg_AddU32Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -2205,12 +2557,8 @@ def tibrvMsg_AddU32Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_AddU32ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_ctypes.c_uint32 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_u32, _ARRAY_UNSIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -2243,7 +2591,7 @@ def tibrvMsg_UpdateU32Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -2252,12 +2600,8 @@ def tibrvMsg_UpdateU32Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_UpdateU32ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_ctypes.c_uint32 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_u32, _ARRAY_UNSIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -2291,7 +2635,7 @@ def tibrvMsg_GetU32Array(message:tibrvMsg, fieldName:str, optIdentifier:int = 0)
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u32_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -2308,6 +2652,39 @@ def tibrvMsg_GetU32Array(message:tibrvMsg, fieldName:str, optIdentifier:int = 0)
     return status, ret
 
 
+##
+def tibrvMsg_GetU32ArrayView(message: tibrvMsg, fieldName: str,
+                             optIdentifier: int = 0) -> (tibrv_status, memoryview):
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    if fieldName is None or optIdentifier is None:
+        return TIBRV_INVALID_ARG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    ret = None
+
+    try:
+        name = _cname(fieldName)
+        val = _c_tibrv_u32_p()
+        num = _c_tibrv_u32(0)
+        id = _c_tibrv_u16(optIdentifier)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvMsg_GetU32ArrayEx(msg, name, _ctypes.byref(val), _ctypes.byref(num), id)
+
+    if status == TIBRV_OK:
+        ret = _array_view(val, num.value, _c_tibrv_u32, 'I')
+
+    return status, ret
+
+
 ##
 _rv.tibrvMsg_AddI64Ex.argtypes = [_c_tibrvMsg,
                                   _c_tibrv_str,
@@ -2330,7 +2707,7 @@ def tibrvMsg_AddI64(message:tibrvMsg, fieldName: str, value: int, optIdentifier:
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i64(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -2363,7 +2740,7 @@ def tibrvMsg_UpdateI64(message: tibrvMsg, fieldName: str, value: int,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i64(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -2397,7 +2774,7 @@ def tibrvMsg_GetI64(message: tibrvMsg, fieldName: str, optIdentifier: int = 0) -
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i64(0)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -2434,7 +2811,7 @@ def tibrvMsg_AddI64Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -2443,12 +2820,8 @@ def tibrvMsg_AddI64Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_AddI64ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_i64 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_i64, _ARRAY_SIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -2481,7 +2854,7 @@ def tibrvMsg_UpdateI64Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -2490,12 +2863,8 @@ def tibrvMsg_UpdateI64Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_UpdateI64ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_i64 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_i64, _ARRAY_SIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -2529,7 +2898,7 @@ def tibrvMsg_GetI64Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_i64_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -2546,6 +2915,39 @@ def tibrvMsg_GetI64Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     return status, ret
 
 
+##
+def tibrvMsg_GetI64ArrayView(message: tibrvMsg, fieldName: str,
+                             optIdentifier: int = 0) -> (tibrv_status, memoryview):
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    if fieldName is None or optIdentifier is None:
+        return TIBRV_INVALID_ARG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    ret = None
+
+    try:
+        name = _cname(fieldName)
+        val = _c_tibrv_i64_p()
+        num = _c_tibrv_u32(0)
+        id = _c_tibrv_u16(optIdentifier)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvMsg_GetI64ArrayEx(msg, name, _ctypes.byref(val), _ctypes.byref(num), id)
+
+    if status == TIBRV_OK:
+        ret = _array_view(val, num.value, _c_tibrv_i64, 'q')
+
+    return status, ret
+
+
 ##
 _rv.tibrvMsg_AddU64Ex.argtypes = [_c_tibrvMsg, _c_tibrv_str, _c_tibrv_u64, _c_tibrv_u16]
 _rv.tibrvMsg_AddU64Ex.restype = _c_tibrv_status
@@ -2564,7 +2966,7 @@ def tibrvMsg_AddU64(message: tibrvMsg, fieldName: str, value: int, optIdentifier
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u64(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -2593,7 +2995,7 @@ def tibrvMsg_UpdateU64(message: tibrvMsg, fieldName: str, value: int,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u64(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -2627,7 +3029,7 @@ def tibrvMsg_GetU64(message: tibrvMsg, fieldName: str, optIdentifier: int = 0) -
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u64()
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -2664,7 +3066,7 @@ def tibrvMsg_AddU64Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -2673,12 +3075,8 @@ def tibrvMsg_AddU64Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_AddU64ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_u64 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_u64, _ARRAY_UNSIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -2711,7 +3109,7 @@ def tibrvMsg_UpdateU64Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -2720,12 +3118,8 @@ def tibrvMsg_UpdateU64Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_UpdateU64ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_u64 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_u64, _ARRAY_UNSIGNED)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -2759,7 +3153,7 @@ def tibrvMsg_GetU64Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_u64_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -2777,6 +3171,39 @@ def tibrvMsg_GetU64Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     return status, ret
 
 
+##
+def tibrvMsg_GetU64ArrayView(message: tibrvMsg, fieldName: str,
+                             optIdentifier: int = 0) -> (tibrv_status, memoryview):
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    if fieldName is None or optIdentifier is None:
+        return TIBRV_INVALID_ARG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    ret = None
+
+    try:
+        name = _cname(fieldName)
+        val = _c_tibrv_u64_p()
+        num = _c_tibrv_u32(0)
+        id = _c_tibrv_u16(optIdentifier)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvMsg_GetU64ArrayEx(msg, name, _ctypes.byref(val), _ctypes.byref(num), id)
+
+    if status == TIBRV_OK:
+        ret = _array_view(val, num.value, _c_tibrv_u64, 'Q')
+
+    return status, ret
+
+
 ##
 _rv.tibrvMsg_AddF32Ex.argtypes = [_c_tibrvMsg,
                                   _c_tibrv_str,
@@ -2800,7 +3227,7 @@ def tibrvMsg_AddF32(message: tibrvMsg, fieldName: str, value: float,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_f32(value)
         id = _c_tibrv_u16(optIdentifier)
 
@@ -2834,7 +3261,7 @@ def tibrvMsg_UpdateF32(message: tibrvMsg, fieldName: str, value: float,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_f32(value)
         id = _c_tibrv_u16(optIdentifier)
 
@@ -2869,7 +3296,7 @@ def tibrvMsg_GetF32(message: tibrvMsg, fieldName: str, optIdentifier: int = 0) -
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_f32(0.0)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -2906,7 +3333,7 @@ def tibrvMsg_AddF32Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -2915,12 +3342,8 @@ def tibrvMsg_AddF32Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_AddF32ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_f32 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_f32, _ARRAY_FLOAT)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -2953,7 +3376,7 @@ def tibrvMsg_UpdateF32Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -2962,12 +3385,8 @@ def tibrvMsg_UpdateF32Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_UpdateF32ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_f32 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_f32, _ARRAY_FLOAT)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -3001,7 +3420,7 @@ def tibrvMsg_GetF32Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_f32_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -3019,6 +3438,39 @@ def tibrvMsg_GetF32Array(message: tibrvMsg, fieldName: str, optIdentifier: int =
     return status, ret
 
 
+##
+def tibrvMsg_GetF32ArrayView(message: tibrvMsg, fieldName: str,
+                             optIdentifier: int = 0) -> (tibrv_status, memoryview):
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    if fieldName is None or optIdentifier is None:
+        return TIBRV_INVALID_ARG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    ret = None
+
+    try:
+        name = _cname(fieldName)
+        val = _c_tibrv_f32_p()
+        num = _c_tibrv_u32(0)
+        id = _c_tibrv_u16(optIdentifier)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvMsg_GetF32ArrayEx(msg, name, _ctypes.byref(val), _ctypes.byref(num), id)
+
+    if status == TIBRV_OK:
+        ret = _array_view(val, num.value, _c_tibrv_f32, 'f')
+
+    return status, ret
+
+
 ##
 _rv.tibrvMsg_AddF64Ex.argtypes = [_c_tibrvMsg, _c_tibrv_str, _c_tibrv_f64, _c_tibrv_u16]
 _rv.tibrvMsg_AddF64Ex.restype = _c_tibrv_status
@@ -3038,7 +3490,7 @@ def tibrvMsg_AddF64(message: tibrvMsg, fieldName: str, value: float,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_f64(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -3071,7 +3523,7 @@ def tibrvMsg_UpdateF64(message: tibrvMsg, fieldName: str, value: float,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_f64(value)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -3105,7 +3557,7 @@ def tibrvMsg_GetF64(message: tibrvMsg, fieldName: str, optIdentifier: int = 0) -
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_f64(0.0)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -3142,7 +3594,7 @@ def tibrvMsg_AddF64Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -3151,12 +3603,8 @@ def tibrvMsg_AddF64Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_AddF64ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_f64 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_f64, _ARRAY_FLOAT)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -3189,7 +3637,7 @@ def tibrvMsg_UpdateF64Array(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -3198,12 +3646,8 @@ def tibrvMsg_UpdateF64Array(message: tibrvMsg, fieldName: str, value: list,
         status = _rv.tibrvMsg_UpdateF64ArrayEx(msg, name, None, 0, id)
         return status
 
-    if type(value) is not list:
-        return TIBRV_INVALID_ARG
-
     try:
-        n = len(value)
-        val = (_c_tibrv_f64 * n)(*value)
+        val, n = _c_array(value, _c_tibrv_f64, _ARRAY_FLOAT)
         num = _c_tibrv_u32(n)
     except:
         return TIBRV_INVALID_ARG
@@ -3238,7 +3682,7 @@ def tibrvMsg_GetF64Array(message: tibrvMsg, fieldName: str,
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_f64_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -3255,6 +3699,39 @@ def tibrvMsg_GetF64Array(message: tibrvMsg, fieldName: str,
     return status, ret
 
 
+##
+def tibrvMsg_GetF64ArrayView(message: tibrvMsg, fieldName: str,
+                             optIdentifier: int = 0) -> (tibrv_status, memoryview):
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    if fieldName is None or optIdentifier is None:
+        return TIBRV_INVALID_ARG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    ret = None
+
+    try:
+        name = _cname(fieldName)
+        val = _c_tibrv_f64_p()
+        num = _c_tibrv_u32(0)
+        id = _c_tibrv_u16(optIdentifier)
+    except:
+        return TIBRV_INVALID_ARG, None
+
+    status = _rv.tibrvMsg_GetF64ArrayEx(msg, name, _ctypes.byref(val), _ctypes.byref(num), id)
+
+    if status == TIBRV_OK:
+        ret = _array_view(val, num.value, _c_tibrv_f64, 'd')
+
+    return status, ret
+
+
 ##
 _rv.tibrvMsg_AddStringEx.argtypes = [_c_tibrvMsg,
                                      _c_tibrv_str,
@@ -3278,7 +3755,7 @@ def tibrvMsg_AddString(message: tibrvMsg, fieldName: str, value: str,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _cstr(value, codepage)
         id = _c_tibrv_u16(optIdentifier)
 
@@ -3312,7 +3789,7 @@ def tibrvMsg_UpdateString(message: tibrvMsg, fieldName: str, value: str,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _cstr(value, codepage)
         id = _c_tibrv_u16(optIdentifier)
 
@@ -3348,7 +3825,7 @@ def tibrvMsg_GetString(message: tibrvMsg, fieldName: str, optIdentifier: int = 0
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_str(0)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -3385,7 +3862,7 @@ def tibrvMsg_AddStringArray(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -3434,7 +3911,7 @@ def tibrvMsg_UpdateStringArray(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -3485,7 +3962,7 @@ def tibrvMsg_GetStringArray(message: tibrvMsg, fieldName: str, optIdentifier: in
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrv_str_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -3525,7 +4002,7 @@ def tibrvMsg_AddMsg(message: tibrvMsg, fieldName: str, value: tibrvMsg,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
         val = _c_tibrvMsg(value)
     except:
@@ -3556,7 +4033,7 @@ def tibrvMsg_UpdateMsg(message: tibrvMsg, fieldName: str, value: tibrvMsg,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
         val = _c_tibrvMsg(value)
     except:
@@ -3589,7 +4066,7 @@ def tibrvMsg_GetMsg(message: tibrvMsg, fieldName: str, optIdentifier: int = 0) -
     ret = None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrvMsg(0)
         id = _c_tibrv_u16(optIdentifier)
     except:
@@ -3625,7 +4102,7 @@ def tibrvMsg_AddMsgArray(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -3672,7 +4149,7 @@ def tibrvMsg_UpdateMsgArray(message: tibrvMsg, fieldName: str, value: list,
         return TIBRV_INVALID_MSG
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         id = _c_tibrv_u16(optIdentifier)
     except:
         return TIBRV_INVALID_ARG
@@ -3720,7 +4197,7 @@ def tibrvMsg_GetMsgArray(message: tibrvMsg, fieldName: str, optIdentifier: int =
         return TIBRV_INVALID_MSG, None
 
     try:
-        name = _cstr(fieldName)
+        name = _cname(fieldName)
         val = _c_tibrvMsg_p()
         num = _c_tibrv_u32(0)
         id = _c_tibrv_u16(optIdentifier)
@@ -3797,7 +4274,7 @@ def tibrvMsg_GetField(message: tibrvMsg, fieldName: str, optIdentifier: int = 0)
 
     ret = None
     msg = _c_tibrvMsg(message)
-    name = _cstr(fieldName)
+    name = _cname(fieldName)
     val = _c_tibrvMsgField()
     id = _c_tibrv_u16(optIdentifier)
 
@@ -3832,7 +4309,7 @@ def tibrvMsg_GetFieldInstance(message: tibrvMsg, fieldName: str, fieldAddr: tibr
         return TIBRV_INVALID_ARG
 
     msg = _c_tibrvMsg(message)
-    name = _cstr(fieldName)
+    name = _cname(fieldName)
     val = _c_tibrvMsgField()
     inst = _c_tibrv_u32(instance)
 
@@ -3870,6 +4347,151 @@ def tibrvMsg_GetFieldByIndex(message: tibrvMsg, fieldIndex: int ) -> (tibrv_stat
     return status, ret
 
 
+##
+def _decode_msg(msg: int, fld: _c_tibrvMsgField, ref, codepage) -> (tibrv_status, dict):
+
+    num = _c_tibrv_u32(0)
+    status = _rv.tibrvMsg_GetNumFields(msg, _ctypes.byref(num))
+    if status != TIBRV_OK:
+        return status, None
+
+    ret = {}
+    repeated = None
+
+    for x in range(num.value):
+        status = _rv.tibrvMsg_GetFieldByIndex(msg, ref, x)
+        if status != TIBRV_OK:
+            return status, None
+
+        # Field Name NOT Support Code Page Conversion
+        name = fld.name
+        name = '' if name is None else name.decode()
+        t = fld.type
+
+        # fld would be overwritten by nested msg
+        if t == TIBRVMSG_MSG:
+            status, val = _decode_msg(fld.data.msg, fld, ref, codepage)
+            if status != TIBRV_OK:
+                return status, None
+
+        elif t == TIBRVMSG_MSGARRAY:
+            val = _field_decoder[t](fld, codepage)
+            for k in range(len(val)):
+                status, val[k] = _decode_msg(val[k], fld, ref, codepage)
+                if status != TIBRV_OK:
+                    return status, None
+
+        else:
+            decode = _field_decoder.get(t)
+            if decode is None:
+                # TIBRVMSG_ENCRYPTED, user defined type
+                val = None
+            else:
+                val = decode(fld, codepage)
+
+        if name not in ret:
+            ret[name] = val
+        elif repeated is not None and name in repeated:
+            ret[name] = ret[name] + (val,)
+        else:
+            if repeated is None:
+                repeated = set()
+            repeated.add(name)
+            ret[name] = (ret[name], val)
+
+    return TIBRV_OK, ret
+
+
+def tibrvMsg_DecodeAll(message: tibrvMsg, codepage: str = None) -> (tibrv_status, dict):
+    # decode all fields in one pass -> dict
+    #
+    #   scalar      -> int, float, bool, str
+    #   array       -> list
+    #   DATETIME    -> tibrvMsgDateTime
+    #   OPAQUE, XML -> bytes
+    #   MSG         -> dict, MSGARRAY -> list of dict
+    #
+    #   repeated field name -> tuple of all instances
+    #   field without name  -> key is ''
+
+    if message is None or message == 0:
+        return TIBRV_INVALID_MSG, None
+
+    try:
+        msg = _c_tibrvMsg(message)
+    except:
+        return TIBRV_INVALID_MSG, None
+
+    fld = _c_tibrvMsgField()
+
+    return _decode_msg(msg.value, fld, _ctypes.byref(fld), codepage)
+
+
+##
+# Precompiled Getter
+#   name, id and output buffer are prepared once,
+#   return function(message: int) -> (tibrv_status, value)
+#
+#   output buffer is reused, the getter is NOT thread-safe
+#
+_getter_func = {
+    TIBRVMSG_BOOL:      (_rv.tibrvMsg_GetBoolEx, _c_tibrv_bool),
+    TIBRVMSG_I8:        (_rv.tibrvMsg_GetI8Ex, _c_tibrv_i8),
+    TIBRVMSG_U8:        (_rv.tibrvMsg_GetU8Ex, _c_tibrv_u8),
+    TIBRVMSG_I16:       (_rv.tibrvMsg_GetI16Ex, _c_tibrv_i16),
+    TIBRVMSG_U16:       (_rv.tibrvMsg_GetU16Ex, _c_tibrv_u16),
+    TIBRVMSG_I32:       (_rv.tibrvMsg_GetI32Ex, _c_tibrv_i32),
+    TIBRVMSG_U32:       (_rv.tibrvMsg_GetU32Ex, _c_tibrv_u32),
+    TIBRVMSG_I64:       (_rv.tibrvMsg_GetI64Ex, _c_tibrv_i64),
+    TIBRVMSG_U64:       (_rv.tibrvMsg_GetU64Ex, _c_tibrv_u64),
+    TIBRVMSG_F32:       (_rv.tibrvMsg_GetF32Ex, _c_tibrv_f32),
+    TIBRVMSG_F64:       (_rv.tibrvMsg_GetF64Ex, _c_tibrv_f64),
+    TIBRVMSG_STRING:    (_rv.tibrvMsg_GetStringEx, _c_tibrv_str),
+    TIBRVMSG_MSG:       (_rv.tibrvMsg_GetMsgEx, _c_tibrvMsg),
+    TIBRVMSG_DATETIME:  (_rv.tibrvMsg_GetDateTimeEx, _c_tibrvMsgDateTime),
+}
+
+def _getter(fieldType: int, fieldName: str, optIdentifier: int = 0, codepage: str = None):
+
+    if fieldType not in _getter_func:
+        raise TypeError('field type {} is not supported'.format(fieldType))
+
+    func, c_type = _getter_func[fieldType]
+
+    name = _cname(fieldName)
+    id = _c_tibrv_u16(optIdentifier)
+    val = c_type()
+    ref = _ctypes.byref(val)
+
+    if fieldType == TIBRVMSG_STRING:
+        def get(message):
+            status = func(message, name, ref, id)
+            if status != TIBRV_OK:
+                return status, None
+            return status, _pystr(val.value, codepage)
+
+    elif fieldType == TIBRVMSG_BOOL:
+        def get(message):
+            status = func(message, name, ref, id)
+            return status, val.value != 0
+
+    elif fieldType == TIBRVMSG_DATETIME:
+        def get(message):
+            status = func(message, name, ref, id)
+            if status != TIBRV_OK:
+                return status, None
+            dt = tibrvMsgDateTime()
+            val.castTo(dt)
+            return status, dt
+
+    else:
+        def get(message):
+            status = func(message, name, ref, id)
+            return status, val.value
+
+    return get
+
+
 ##
 _rv.tibrvMsg_RemoveFieldEx.argtypes = [_c_tibrvMsg, _c_tibrv_str, _c_tibrv_u16]
 _rv.tibrvMsg_RemoveFieldEx.restype = _c_tibrv_status
@@ -3886,7 +4508,7 @@ def tibrvMsg_RemoveField(message: tibrvMsg, fieldName: str, optIdentifier: int =
         return TIBRV_INVALID_ARG
 
     msg = _c_tibrvMsg(message)
-    name = _cstr(fieldName)
+    name = _cname(fieldName)
     id = _c_tibrv_u16(int(optIdentifier))
 
     status = _rv.tibrvMsg_RemoveFieldEx(msg, name, id)
@@ -3909,7 +4531,7 @@ def tibrvMsg_RemoveFieldInstance(message: tibrvMsg, fieldName: str, instance: in
         return TIBRV_INVALID_ARG
 
     msg = _c_tibrvMsg(message)
-    name = _cstr(fieldName)
+    name = _cname(fieldName)
     inst = _c_tibrv_u32(instance)
 
     status = _rv.tibrvMsg_RemoveFieldInstance(msg, name, inst)
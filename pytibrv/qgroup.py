@@ -0,0 +1,161 @@
+##
+# pytibrv/qgroup.py
+#   TIBRV Library for PYTHON
+#   tibrvQueueGroup_XXX
+#
+# DESCRIPTIONS
+# -----------------------------------------------------------------------------
+# 1. QUEUE GROUP
+#    A queue group is a dispatchable, like as a queue.
+#    Dispatch a group would dispatch the queue with highest priority first,
+#    (tibrvQueue_SetPriority), queues with same priority are round-robin.
+#
+#    ex: one dispatcher, control messages are dispatched ahead of bulk data
+#       status, grp = tibrvQueueGroup_Create()
+#       tibrvQueue_SetPriority(ctrl, 10)
+#       tibrvQueue_SetPriority(data, 1)
+#       tibrvQueueGroup_Add(grp, ctrl)
+#       tibrvQueueGroup_Add(grp, data)
+#       status, disp = tibrvDispatcher_Create(grp)
+#
+# FEATURES: * = un-implement
+# -----------------------------------------------------------------------------
+#   tibrvQueueGroup_Create
+#   tibrvQueueGroup_Destroy
+#   tibrvQueueGroup_Add
+#   tibrvQueueGroup_Remove
+#   tibrvQueueGroup_Dispatch
+#   tibrvQueueGroup_Poll
+#   tibrvQueueGroup_TimedDispatch
+#
+##
+import ctypes as _ctypes
+
+from .types import tibrv_status, tibrvQueue, tibrvQueueGroup, \
+                   TIBRV_WAIT_FOREVER, TIBRV_NO_WAIT
+
+from .status import TIBRV_INVALID_QUEUE, TIBRV_INVALID_QUEUE_GROUP, TIBRV_INVALID_ARG
+
+from .api import _rv, _c_tibrvQueue, _c_tibrvQueueGroup, _c_tibrv_status, _c_tibrv_f64
+
+##-----------------------------------------------------------------------------
+# TIBRV API : tibrv/qgroup.h
+##-----------------------------------------------------------------------------
+
+##
+_rv.tibrvQueueGroup_Create.argtypes = [_ctypes.POINTER(_c_tibrvQueueGroup)]
+_rv.tibrvQueueGroup_Create.restype = _c_tibrv_status
+
+def tibrvQueueGroup_Create() -> (tibrv_status, tibrvQueueGroup):
+
+    grp = _c_tibrvQueueGroup(0)
+
+    status = _rv.tibrvQueueGroup_Create(_ctypes.byref(grp))
+
+    return status, grp.value
+
+
+##
+_rv.tibrvQueueGroup_Destroy.argtypes = [_c_tibrvQueueGroup]
+_rv.tibrvQueueGroup_Destroy.restype = _c_tibrv_status
+
+def tibrvQueueGroup_Destroy(eventQueueGroup: tibrvQueueGroup) -> tibrv_status:
+
+    if eventQueueGroup is None or eventQueueGroup == 0:
+        return TIBRV_INVALID_QUEUE_GROUP
+
+    try:
+        grp = _c_tibrvQueueGroup(eventQueueGroup)
+    except:
+        return TIBRV_INVALID_QUEUE_GROUP
+
+    status = _rv.tibrvQueueGroup_Destroy(grp)
+
+    return status
+
+
+##
+_rv.tibrvQueueGroup_Add.argtypes = [_c_tibrvQueueGroup, _c_tibrvQueue]
+_rv.tibrvQueueGroup_Add.restype = _c_tibrv_status
+
+def tibrvQueueGroup_Add(eventQueueGroup: tibrvQueueGroup, eventQueue: tibrvQueue) -> tibrv_status:
+
+    if eventQueueGroup is None or eventQueueGroup == 0:
+        return TIBRV_INVALID_QUEUE_GROUP
+
+    if eventQueue is None or eventQueue == 0:
+        return TIBRV_INVALID_QUEUE
+
+    try:
+        grp = _c_tibrvQueueGroup(eventQueueGroup)
+    except:
+        return TIBRV_INVALID_QUEUE_GROUP
+
+    try:
+        que = _c_tibrvQueue(eventQueue)
+    except:
+        return TIBRV_INVALID_QUEUE
+
+    status = _rv.tibrvQueueGroup_Add(grp, que)
+
+    return status
+
+
+##
+_rv.tibrvQueueGroup_Remove.argtypes = [_c_tibrvQueueGroup, _c_tibrvQueue]
+_rv.tibrvQueueGroup_Remove.restype = _c_tibrv_status
+
+def tibrvQueueGroup_Remove(eventQueueGroup: tibrvQueueGroup, eventQueue: tibrvQueue) -> tibrv_status:
+
+    if eventQueueGroup is None or eventQueueGroup == 0:
+        return TIBRV_INVALID_QUEUE_GROUP
+
+    if eventQueue is None or eventQueue == 0:
+        return TIBRV_INVALID_QUEUE
+
+    try:
+        grp = _c_tibrvQueueGroup(eventQueueGroup)
+    except:
+        return TIBRV_INVALID_QUEUE_GROUP
+
+    try:
+        que = _c_tibrvQueue(eventQueue)
+    except:
+        return TIBRV_INVALID_QUEUE
+
+    status = _rv.tibrvQueueGroup_Remove(grp, que)
+
+    return status
+
+
+##
+_rv.tibrvQueueGroup_TimedDispatch.argtypes = [_c_tibrvQueueGroup, _c_tibrv_f64]
+_rv.tibrvQueueGroup_TimedDispatch.restype = _c_tibrv_status
+
+def tibrvQueueGroup_TimedDispatch(eventQueueGroup: tibrvQueueGroup, waitTime: float) -> tibrv_status:
+
+    if eventQueueGroup is None or eventQueueGroup == 0:
+        return TIBRV_INVALID_QUEUE_GROUP
+
+    if waitTime is None:
+        return TIBRV_INVALID_ARG
+
+    try:
+        grp = _c_tibrvQueueGroup(eventQueueGroup)
+    except:
+        return TIBRV_INVALID_QUEUE_GROUP
+
+    try:
+        t = _c_tibrv_f64(waitTime)
+    except:
+        return TIBRV_INVALID_ARG
+
+    status = _rv.tibrvQueueGroup_TimedDispatch(grp, t)
+
+    return status
+
+def tibrvQueueGroup_Dispatch(eventQueueGroup: tibrvQueueGroup) -> tibrv_status:
+    return tibrvQueueGroup_TimedDispatch(eventQueueGroup, TIBRV_WAIT_FOREVER)
+
+def tibrvQueueGroup_Poll(eventQueueGroup: tibrvQueueGroup) -> tibrv_status:
+    return tibrvQueueGroup_TimedDispatch(eventQueueGroup, TIBRV_NO_WAIT)
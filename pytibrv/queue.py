@@ -15,6 +15,12 @@
 #        que = TibrvQueue()             -> que is DEFAULT QUE now
 #        que.create('MY QUE')           -> que is new, NOT DEFAULT QUE
 #
+# 2. QUEUE HOOK
+#    hook(queue, closure) is called by TIBRV internal thread,
+#    when an event was put into queue.
+#    It SHOULD NOT dispatch the queue, just notify other thread to dispatch.
+#    closure is void*, use tibrvClosure() to cast to Python object
+#
 # FEATURES: * = un-implement
 # -----------------------------------------------------------------------------
 #   tibrvQueue_Create
@@ -30,10 +36,10 @@
 #   tibrvQueue_SetPriority
 #   tibrvQueue_TimedDispatch
 #   tibrvQueue_TimedDispatchOneEvent
+#   tibrvQueue_SetHook
+#   tibrvQueue_GetHook
 #
-#  *tibrvQueue_SetHook
-#  *tibrvQueue_GetHook
-#  *tibrvQueue_RemoveHook
+#  *tibrvQueue_RemoveHook           -> tibrvQueue_SetHook(que, None)
 #
 #
 # CHANGED LOGS
@@ -47,7 +53,7 @@
 ##
 import ctypes as _ctypes
 from .types import tibrv_status, tibrvQueue, tibrvQueueLimitPolicy, \
-                   tibrvQueueOnComplete, \
+                   tibrvQueueOnComplete, tibrvQueueHook, \
                    TIBRV_WAIT_FOREVER, TIBRV_NO_WAIT, \
                    TIBRV_DEFAULT_QUEUE
 
@@ -71,6 +77,10 @@ def __reg(key, func, closure):
 
     return
 
+# queue hook
+# key = tibrvQueue
+__hook = {}
+
 
 ##-----------------------------------------------------------------------------
 # TIBRV API : tibrv/queue.h
@@ -363,3 +373,68 @@ def tibrvQueue_GetName(eventQueue: tibrvQueue) -> (tibrv_status, str):
 
     return status, _pystr(sz)
 
+
+##
+_rv.tibrvQueue_SetHook.argtypes = [_c_tibrvQueue, _c_tibrvQueueHook, _ctypes.py_object]
+_rv.tibrvQueue_SetHook.restype = _c_tibrv_status
+
+def tibrvQueue_SetHook(eventQueue: tibrvQueue, eventQueueHook: tibrvQueueHook,
+                       closure = None) -> tibrv_status:
+
+    if eventQueue is None or eventQueue == 0:
+        return TIBRV_INVALID_QUEUE
+
+    try:
+        que = _c_tibrvQueue(eventQueue)
+    except:
+        return TIBRV_INVALID_QUEUE
+
+    # None to remove hook
+    if eventQueueHook is None:
+        cb = _c_tibrvQueueHook(0)
+    else:
+        try:
+            cb = _c_tibrvQueueHook(eventQueueHook)
+        except:
+            return TIBRV_INVALID_CALLBACK
+
+    cz = _ctypes.py_object(closure)
+
+    status = _rv.tibrvQueue_SetHook(que, cb, cz)
+
+    # save cb/closure to prevent GC
+    if status == TIBRV_OK:
+        if eventQueueHook is None:
+            __hook.pop(eventQueue, None)
+        else:
+            __hook[eventQueue] = (cb, cz, eventQueueHook)
+
+    return status
+
+
+##
+_rv.tibrvQueue_GetHook.argtypes = [_c_tibrvQueue, _ctypes.POINTER(_c_tibrvQueueHook)]
+_rv.tibrvQueue_GetHook.restype = _c_tibrv_status
+
+def tibrvQueue_GetHook(eventQueue: tibrvQueue) -> (tibrv_status, tibrvQueueHook):
+
+    if eventQueue is None or eventQueue == 0:
+        return TIBRV_INVALID_QUEUE, None
+
+    try:
+        que = _c_tibrvQueue(eventQueue)
+    except:
+        return TIBRV_INVALID_QUEUE, None
+
+    cb = _c_tibrvQueueHook()
+
+    status = _rv.tibrvQueue_GetHook(que, _ctypes.byref(cb))
+    if status != TIBRV_OK:
+        return status, None
+
+    # return the Python function registered
+    ret = __hook.get(eventQueue)
+    if ret is None or not cb:
+        return status, None
+
+    return status, ret[2]
@@ -0,0 +1,229 @@
+##
+# pytibrv/replay.py
+#   TIBRV Library for PYTHON
+#   replay recorded messages (pytibrv.journal) through TibrvTx
+#
+# DESCRIPTIONS
+# -----------------------------------------------------------------------------
+# 1. TibrvReplayer
+#    rp = TibrvReplayer(tx)
+#    status = rp.replay(jr, speed=1.0)                  -> original gaps
+#    status = rp.replay(jr, speed=10.0)                 -> 10x faster
+#    status = rp.replay(jr, speed=0)                    -> as fast as possible
+#    status = rp.replay(jr, speed=0, rate=5000)         -> max 5000 msgs/sec
+#    rp.stats()
+#
+#    source : TibrvJournalReader, or iterable of TibrvJournalRecord
+#             start/end/subject are passed to TibrvJournalReader.read()
+#
+#    replay() is blocking, call rp.stop() from other thread (or callback) to stop
+#
+# 2. Subject Remapping and Filtering
+#    remap  : dict {subject: new subject} or remap(subject) -> subject
+#             None returned by remap(), msg is skipped
+#    accept : accept(rec) -> bool, False to skip
+#             called before msg is created from bytes
+#
+#    ex: replay production feed to test subjects
+#       rp.replay(jr, remap=lambda s: 'TEST.' + s if s.startswith('MD.') else None)
+#
+# 3. Scheduling
+#    time.perf_counter_ns() (monotonic), sleep until 1 ms before due time,
+#    then spin. Lateness is (sent - due) of each msg.
+#
+#    rp.stats() -> dict
+#       sent, skipped, errors   : msgs
+#       elapsed                 : seconds
+#       rate                    : achieved msgs/sec
+#       lateAvgUs, lateMaxUs    : lateness, speed > 0 or rate > 0
+#       late                    : msgs later than 1 ms
+#
+##
+import time as _time
+import threading as _threading
+
+from .status import TIBRV_OK, TIBRV_INVALID_ARG, TIBRV_INVALID_TRANSPORT, \
+                   TIBRV_ID_IN_USE, TIBRV_CORRUPT_MSG
+
+from .msg import tibrvMsg_CreateFromBytes, tibrvMsg_Destroy
+
+from .Tibrv import tibrv_status, TibrvStatus, TibrvError, TibrvTx, TibrvMsg
+
+from .journal import TibrvJournalReader
+
+
+class TibrvReplayer:
+
+    SPIN = 1000000          # ns, spin instead of sleep when due time is near
+    LATE = 1000000          # ns, count as late
+
+    def __init__(self, tx: TibrvTx):
+        self._tx = tx
+        self._running = False
+        self._stop = _threading.Event()
+        self._stats = None
+        self._err = None
+        self._reset()
+
+    def replay(self, source, speed: float = 1.0, rate: float = 0,
+               start: int = None, end: int = None, subject: str = None,
+               remap = None, accept = None) -> tibrv_status:
+        # speed : scale of inter-arrival gaps, 2.0 is twice faster, 0 is as fast as possible
+        # rate  : max msgs/sec, 0 is unlimited
+
+        if self._running:
+            status = TIBRV_ID_IN_USE
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if self._tx is None or not isinstance(self._tx, TibrvTx) or self._tx.id() == 0:
+            status = TIBRV_INVALID_TRANSPORT
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if source is None or speed is None or speed < 0 or rate is None or rate < 0:
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if remap is None:
+            mapper = None
+        elif isinstance(remap, dict):
+            mapper = lambda s: remap.get(s, s)
+        elif callable(remap):
+            mapper = remap
+        else:
+            status = TIBRV_INVALID_ARG
+            self._err = TibrvStatus.error(status)
+            return status
+
+        if isinstance(source, TibrvJournalReader):
+            records = source.read(start, end, subject)
+        else:
+            records = iter(source)
+
+        self._running = True
+        self._stop.clear()
+        self._reset()
+
+        try:
+            status = self._run(records, speed, rate, mapper, accept)
+        finally:
+            self._running = False
+
+        self._err = TibrvStatus.error(status)
+
+        return status
+
+    def stop(self):
+        self._stop.set()
+
+    def running(self) -> bool:
+        return self._running
+
+    def stats(self) -> dict:
+        st = self._stats
+        elapsed = st['elapsed'] / 1e9
+        timed = st['timed']
+
+        return dict(sent=st['sent'], skipped=st['skipped'], errors=st['errors'],
+                    elapsed=elapsed,
+                    rate=st['sent'] / elapsed if elapsed > 0 else 0.0,
+                    lateAvgUs=st['lateSum'] / timed / 1000.0 if timed > 0 else 0.0,
+                    lateMaxUs=st['lateMax'] / 1000.0,
+                    late=st['late'])
+
+    def error(self) -> TibrvError:
+        return self._err
+
+    def _reset(self):
+        self._stats = dict(sent=0, skipped=0, errors=0, elapsed=0,
+                           timed=0, lateSum=0, lateMax=0, late=0)
+
+    def _wait(self, due: int, clock) -> int:
+        # return lateness in ns
+        while True:
+            now = clock()
+            left = due - now
+            if left <= 0:
+                return -left
+
+            if left > self.SPIN:
+                # wake up early, or stop()
+                if self._stop.wait((left - self.SPIN) / 1e9):
+                    return 0
+
+    def _run(self, records, speed: float, rate: float, mapper, accept) -> tibrv_status:
+
+        clock = _time.perf_counter_ns
+        st = self._stats
+        tx = self._tx
+        gap = int(1e9 / rate) if rate > 0 else 0
+        scale = 1.0 / speed if speed > 0 else 0.0
+
+        status = TIBRV_OK
+        t0 = clock()
+        first = None
+        due = t0
+
+        for rec in records:
+            if self._stop.is_set():
+                break
+
+            if accept is not None and not accept(rec):
+                st['skipped'] = st['skipped'] + 1
+                continue
+
+            subj = rec.subject
+            if mapper is not None:
+                subj = mapper(subj)
+                if subj is None:
+                    st['skipped'] = st['skipped'] + 1
+                    continue
+
+            if not subj:
+                st['skipped'] = st['skipped'] + 1
+                continue
+
+            # due time, original gap scaled, then rate limit
+            prev = due
+            if scale > 0:
+                if first is None:
+                    first = rec.timestamp
+                due = t0 + int((rec.timestamp - first) * scale)
+            if gap > 0 and st['sent'] > 0:
+                due = max(due, prev + gap)
+
+            s, msg = tibrvMsg_CreateFromBytes(rec.data)
+            if s != TIBRV_OK:
+                st['errors'] = st['errors'] + 1
+                status = TIBRV_CORRUPT_MSG
+                continue
+
+            if scale > 0 or gap > 0:
+                late = self._wait(due, clock)
+                st['timed'] = st['timed'] + 1
+                st['lateSum'] = st['lateSum'] + late
+                if late > st['lateMax']:
+                    st['lateMax'] = late
+                if late > self.LATE:
+                    st['late'] = st['late'] + 1
+
+                if self._stop.is_set():
+                    tibrvMsg_Destroy(msg)
+                    break
+
+            m = TibrvMsg(msg)
+            m._copied = False
+            s = tx.send(m, subj)
+            m.destroy()
+
+            if s == TIBRV_OK:
+                st['sent'] = st['sent'] + 1
+            else:
+                st['errors'] = st['errors'] + 1
+                status = s
+
+        st['elapsed'] = clock() - t0
+
+        return status
@@ -1,9 +1,11 @@
 
 import ctypes
+import array
 
 from pytibrv.api import *
 from pytibrv.status import *
 from pytibrv.msg import *
+import pytibrv.fast as fast
 import unittest
 
 class MsgTest(unittest.TestCase):
@@ -320,6 +322,281 @@ class MsgTest(unittest.TestCase):
         self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
         assert data == ret
 
+    def test_array_view(self):
+
+        status, msg = tibrvMsg_Create()
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        # I32
+        data = [1,-2,3,-4,5]
+        status = tibrvMsg_UpdateI32Array(msg, 'I32', data)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, ret = tibrvMsg_GetI32ArrayView(msg, 'I32')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertIsInstance(ret, memoryview)
+        self.assertTrue(ret.readonly)
+        self.assertEqual('i', ret.format)
+        self.assertEqual(data, ret.tolist())
+
+        # U64
+        data = [1,2,0xFFFFFFFFFFFFFFFF]
+        status = tibrvMsg_UpdateU64Array(msg, 'U64', data)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, ret = tibrvMsg_GetU64ArrayView(msg, 'U64')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(data, ret.tolist())
+
+        # F64
+        data = [1.1,2.2,3.3,4.4,5.5]
+        status = tibrvMsg_UpdateF64Array(msg, 'F64', data)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, ret = tibrvMsg_GetF64ArrayView(msg, 'F64')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(len(data), len(ret))
+        self.assertEqual(data[4], ret[4])
+        self.assertEqual(data, ret.tolist())
+
+        # empty
+        status = tibrvMsg_UpdateF64Array(msg, 'EMPTY', [])
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, ret = tibrvMsg_GetF64ArrayView(msg, 'EMPTY')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(0, len(ret))
+
+        # not found
+        status, ret = tibrvMsg_GetF64ArrayView(msg, 'NOT_EXIST')
+        self.assertEqual(TIBRV_NOT_FOUND, status, tibrvStatus_GetText(status))
+        self.assertIsNone(ret)
+
+        status = tibrvMsg_Destroy(msg)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+    def test_array_buffer(self):
+
+        status, msg = tibrvMsg_Create()
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        # array.array
+        data = array.array('d', [1.1,2.2,3.3,4.4,5.5])
+        status = tibrvMsg_AddF64Array(msg, 'F64', data)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, ret = tibrvMsg_GetF64Array(msg, 'F64')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(data.tolist(), ret)
+
+        data = array.array('i', [1,-2,3])
+        status = tibrvMsg_UpdateI32Array(msg, 'I32', data)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, ret = tibrvMsg_GetI32Array(msg, 'I32')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(data.tolist(), ret)
+
+        # read-only buffer
+        data = b'\x01\x02\x03'
+        status = tibrvMsg_UpdateU8Array(msg, 'U8', data)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, ret = tibrvMsg_GetU8Array(msg, 'U8')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual([1,2,3], ret)
+
+        # memoryview
+        data = memoryview(array.array('q', [1,2,3]))
+        status = tibrvMsg_UpdateI64Array(msg, 'I64', data)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        # format mismatch
+        status = tibrvMsg_UpdateF64Array(msg, 'F64', array.array('f', [1.0]))
+        self.assertEqual(TIBRV_INVALID_ARG, status, tibrvStatus_GetText(status))
+
+        status = tibrvMsg_UpdateI32Array(msg, 'I32', array.array('I', [1]))
+        self.assertEqual(TIBRV_INVALID_ARG, status, tibrvStatus_GetText(status))
+
+        status = tibrvMsg_UpdateI32Array(msg, 'I32', array.array('q', [1]))
+        self.assertEqual(TIBRV_INVALID_ARG, status, tibrvStatus_GetText(status))
+
+        # not contiguous
+        data = memoryview(array.array('d', [1.0,2.0,3.0,4.0]))[::2]
+        status = tibrvMsg_UpdateF64Array(msg, 'F64', data)
+        self.assertEqual(TIBRV_INVALID_ARG, status, tibrvStatus_GetText(status))
+
+        # not array
+        status = tibrvMsg_UpdateF64Array(msg, 'F64', 'ABC')
+        self.assertEqual(TIBRV_INVALID_ARG, status, tibrvStatus_GetText(status))
+
+        status = tibrvMsg_Destroy(msg)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+    def test_decode(self):
+
+        status, msg = tibrvMsg_Create()
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, sub = tibrvMsg_Create()
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status = tibrvMsg_AddString(sub, 'NAME', 'SUB')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, dt = tibrvMsg_GetCurrentTime()
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        tibrvMsg_AddI8(msg, 'I8', -1)
+        tibrvMsg_AddU64(msg, 'U64', 0xFFFFFFFFFFFFFFFF)
+        tibrvMsg_AddF64(msg, 'F64', 1.5)
+        tibrvMsg_AddBool(msg, 'BOOL', True)
+        tibrvMsg_AddString(msg, 'STR', 'TEST')
+        tibrvMsg_AddDateTime(msg, 'DT', dt)
+        tibrvMsg_AddI32Array(msg, 'I32', [1,2,3])
+        tibrvMsg_AddF32Array(msg, 'F32', [0.5,1.5])
+        tibrvMsg_AddStringArray(msg, 'SA', ['A','B'])
+        tibrvMsg_AddMsg(msg, 'MSG', sub)
+        tibrvMsg_AddMsgArray(msg, 'MA', [sub, sub])
+        tibrvMsg_AddI32(msg, 'DUP', 1)
+        tibrvMsg_AddI32(msg, 'DUP', 2)
+
+        status, ret = tibrvMsg_DecodeAll(msg)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        self.assertEqual(-1, ret['I8'])
+        self.assertEqual(0xFFFFFFFFFFFFFFFF, ret['U64'])
+        self.assertEqual(1.5, ret['F64'])
+        self.assertEqual(True, ret['BOOL'])
+        self.assertEqual('TEST', ret['STR'])
+        self.assertEqual(dt, ret['DT'])
+        self.assertEqual([1,2,3], ret['I32'])
+        self.assertEqual([0.5,1.5], ret['F32'])
+        self.assertEqual(['A','B'], ret['SA'])
+        self.assertEqual({'NAME': 'SUB'}, ret['MSG'])
+        self.assertEqual([{'NAME': 'SUB'}, {'NAME': 'SUB'}], ret['MA'])
+        self.assertEqual((1, 2), ret['DUP'])
+
+        # datetime by tibrvMsgField
+        status, fld = tibrvMsg_GetField(msg, 'DT')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(dt, fld.data)
+
+        status, fld = tibrvMsg_GetField(msg, 'I32')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual([1,2,3], fld.data)
+
+        status, ret = tibrvMsg_DecodeAll(0)
+        self.assertEqual(TIBRV_INVALID_MSG, status, tibrvStatus_GetText(status))
+
+        tibrvMsg_Destroy(sub)
+        tibrvMsg_Destroy(msg)
+
+    def test_fast(self):
+
+        status, msg = fast.tibrvMsg_Create()
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status = fast.tibrvMsg_SetSendSubject(msg, b'TEST.FAST')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status = fast.tibrvMsg_AddF64(msg, b'F64', 1.5, 0)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        status = fast.tibrvMsg_AddI32(msg, b'I32', -1, 0)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        status = fast.tibrvMsg_AddString(msg, b'STR', b'TEST', 0)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        data = (ctypes.c_int32 * 3)(1, 2, 3)
+        status = fast.tibrvMsg_AddI32Array(msg, b'ARR', data, 3, 0)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status = fast.tibrvMsg_UpdateF64(msg, b'F64', 2.5, 0)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        # handle is exchangeable with checked API
+        status, ret = tibrvMsg_GetF64(msg, 'F64')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(2.5, ret)
+
+        status, ret = fast.tibrvMsg_GetF64(msg, b'F64')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(2.5, ret)
+
+        status, ret = fast.tibrvMsg_GetI32(msg, b'I32')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(-1, ret)
+
+        status, ret = fast.tibrvMsg_GetString(msg, b'STR')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(b'TEST', ret)
+
+        status, ret = fast.tibrvMsg_GetI32Array(msg, b'ARR')
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual([1, 2, 3], ret)
+
+        status, ret = fast.tibrvMsg_GetSendSubject(msg)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(b'TEST.FAST', ret)
+
+        status, ret = fast.tibrvMsg_GetNumFields(msg)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(4, ret)
+
+        # raw status, no exception
+        status, ret = fast.tibrvMsg_GetF64(msg, b'NOT_EXIST')
+        self.assertEqual(TIBRV_NOT_FOUND, status, tibrvStatus_GetText(status))
+
+        status = fast.tibrvMsg_Reset(msg)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, ret = fast.tibrvMsg_GetNumFields(msg)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertEqual(0, ret)
+
+        status = fast.tibrvMsg_Destroy(msg)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+    def test_bytes(self):
+
+        status, msg = tibrvMsg_Create()
+        tibrvMsg_AddI32(msg, 'I32', 123)
+        tibrvMsg_AddString(msg, 'STR', 'TEST')
+
+        status, data = tibrvMsg_GetAsBytes(msg)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        self.assertTrue(data.readonly)
+
+        status, size = tibrvMsg_GetByteSize(msg)
+        self.assertEqual(size, len(data))
+
+        status, cc = tibrvMsg_CreateFromBytes(data)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, ret = tibrvMsg_GetI32(cc, 'I32')
+        self.assertEqual(123, ret)
+        status, ret = tibrvMsg_GetString(cc, 'STR')
+        self.assertEqual('TEST', ret)
+
+        tibrvMsg_Destroy(cc)
+
+        # copy of bytes
+        status, cc = tibrvMsg_CreateFromBytes(bytes(data))
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+        status, ret = tibrvMsg_GetI32(cc, 'I32')
+        self.assertEqual(123, ret)
+
+        tibrvMsg_Destroy(cc)
+
+        status, cc = tibrvMsg_CreateFromBytes(None)
+        self.assertEqual(TIBRV_INVALID_ARG, status, tibrvStatus_GetText(status))
+
+        status, cc = tibrvMsg_CreateFromBytes(b'')
+        self.assertEqual(TIBRV_INVALID_ARG, status, tibrvStatus_GetText(status))
+
+        del data
+        tibrvMsg_Destroy(msg)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,58 @@
+from pytibrv.status import *
+from pytibrv.api import *
+from pytibrv.queue import *
+from pytibrv.qgroup import *
+import unittest
+
+class QueueGroupTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        status = tibrv_Open()
+        assert status == TIBRV_OK, tibrvStatus_GetText(status)
+
+    @classmethod
+    def tearDownClass(cls):
+        tibrv_Close()
+
+    def test_create(self):
+
+        status, grp = tibrvQueueGroup_Create()
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, que1 = tibrvQueue_Create()
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status, que2 = tibrvQueue_Create()
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status = tibrvQueueGroup_Add(grp, que1)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status = tibrvQueueGroup_Add(grp, que2)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status = tibrvQueueGroup_Poll(grp)
+        self.assertEqual(TIBRV_TIMEOUT, status, tibrvStatus_GetText(status))
+
+        status = tibrvQueueGroup_TimedDispatch(grp, 0.1)
+        self.assertEqual(TIBRV_TIMEOUT, status, tibrvStatus_GetText(status))
+
+        status = tibrvQueueGroup_Remove(grp, que1)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status = tibrvQueueGroup_Add(grp, 0)
+        self.assertEqual(TIBRV_INVALID_QUEUE, status, tibrvStatus_GetText(status))
+
+        status = tibrvQueueGroup_Destroy(grp)
+        self.assertEqual(TIBRV_OK, status, tibrvStatus_GetText(status))
+
+        status = tibrvQueueGroup_Poll(grp)
+        self.assertEqual(TIBRV_INVALID_QUEUE_GROUP, status, tibrvStatus_GetText(status))
+
+        tibrvQueue_Destroy(que1)
+        tibrvQueue_Destroy(que2)
+
+
+if __name__ == "__main__" :
+    unittest.main(verbosity=2)
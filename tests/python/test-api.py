@@ -19,5 +19,96 @@ class VersionTest(unittest.TestCase):
         self.assertIsNotNone(ver)
         #self.assertEqual('8.4.5', ver)
 
+    def test_name_cache(self):
+
+        Tibrv.nameCacheClear()
+        Tibrv.nameCache(2)
+
+        msg = TibrvMsg.create()
+        msg.addF64('A', 1.0)
+        msg.addF64('B', 2.0)
+        self.assertEqual(1.0, msg.getF64('A'))
+        self.assertEqual(2.0, msg.getF64('B'))
+
+        info = Tibrv.nameCache()
+        self.assertEqual(2, info['hits'])
+        self.assertEqual(2, info['misses'])
+        self.assertEqual(2, info['size'])
+
+        # evict 'A', LRU
+        msg.addF64('C', 3.0)
+        self.assertEqual(2, Tibrv.nameCache()['size'])
+        self.assertEqual(1.0, msg.getF64('A'))
+        self.assertEqual(4, Tibrv.nameCache()['misses'])
+
+        # codepage for value is not cached
+        msg.setStr('S', 'TEST', codepage='big5')
+        self.assertEqual('TEST', msg.getStr('S', codepage='big5'))
+
+        # disable
+        Tibrv.nameCache(0)
+        self.assertEqual(3.0, msg.getF64('C'))
+        self.assertEqual(0, Tibrv.nameCache()['size'])
+
+        msg.destroy()
+        Tibrv.nameCache(1024)
+        Tibrv.nameCacheClear()
+    def test_backend(self):
+
+        import pytibrv
+        self.assertIn(pytibrv.backend(), ['native', 'memory'])
+
+        # same backend, nothing changed
+        pytibrv.use_backend(pytibrv.backend())
+
+        # api was loaded
+        other = 'native' if pytibrv.backend() == 'memory' else 'memory'
+        with self.assertRaises(RuntimeError):
+            pytibrv.use_backend(other)
+
+    def test_stats(self):
+
+        import os
+        import sys
+        import json
+        import subprocess
+        import pytibrv
+        import pytibrv.api
+
+        if not pytibrv._stats:
+            # disabled, library is not wrapped
+            self.assertEqual({}, pytibrv.stats())
+            self.assertNotIn('callstats', type(pytibrv.api._rv).__module__)
+
+        # enabled in child process
+        code = '\n'.join([
+            'import json, pytibrv',
+            'from pytibrv.Tibrv import *',
+            'Tibrv.open()',
+            'msg = TibrvMsg.create()',
+            'msg.setI32("A", 1)',
+            'msg.getI32("A")',
+            'msg.getI32("B")',
+            'msg.destroy()',
+            'Tibrv.close()',
+            'print(json.dumps(pytibrv.stats()))',
+        ])
+
+        env = dict(os.environ, PYTIBRV_STATS='1')
+        out = subprocess.check_output([sys.executable, '-c', code], env=env)
+        ret = json.loads(out.decode().splitlines()[-1])
+
+        self.assertEqual(1, ret['tibrvMsg_Create']['count'])
+        self.assertEqual('tibrv', ret['tibrvMsg_Create']['lib'])
+        self.assertEqual(0, ret['tibrvMsg_Create']['errors'])
+
+        st = ret['tibrvMsg_GetI32Ex']
+        self.assertEqual(2, st['count'])
+        self.assertEqual(1, st['errors'])
+        self.assertEqual({str(TIBRV_NOT_FOUND): 1}, st['status'])
+        self.assertEqual(2, sum(n for upper, n in st['hist']))
+        self.assertGreaterEqual(st['maxUs'], st['avgUs'])
+
+
 if __name__ == "__main__" :
    unittest.main(verbosity=2)
@@ -0,0 +1,109 @@
+import asyncio
+from pytibrv.Tibrv import *
+from pytibrv.TibrvAsync import *
+import unittest
+
+class AsyncTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        status = Tibrv.open()
+        if status != TIBRV_OK:
+            raise TibrvError(status)
+
+    @classmethod
+    def tearDownClass(cls):
+        Tibrv.close()
+
+    def test_messages(self):
+
+        async def run():
+            tx = TibrvTx()
+            status = tx.create(None, None, None)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            que = AsyncTibrvQueue()
+            status = que.create('TEST.ASYNC')
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            subj = tx.inbox()
+            lst = AsyncTibrvListener()
+            status = lst.create(que, tx, subj)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            m = TibrvMsg.create()
+            for x in range(3):
+                m.setI32('SEQ', x)
+                status = tx.send(m, subj)
+                self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            ret = []
+            msgs = lst.messages()
+            async for msg in msgs:
+                ret.append(msg.getI32('SEQ'))
+                if len(ret) == 3:
+                    break
+            await msgs.aclose()
+
+            self.assertEqual([0, 1, 2], ret)
+
+            # stop messages() when listener destroyed
+            m.setI32('SEQ', 3)
+            tx.send(m, subj)
+            await asyncio.sleep(0.1)
+            lst.destroy()
+
+            ret = [msg async for msg in lst.messages()]
+            self.assertEqual([], ret)
+
+            m.destroy()
+            que.destroy()
+            tx.destroy()
+
+        asyncio.run(asyncio.wait_for(run(), 10))
+
+    def test_callback(self):
+
+        async def run():
+            tx = TibrvTx()
+            status = tx.create(None, None, None)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            que = AsyncTibrvQueue()
+            status = que.create('TEST.ASYNC.CB', batch=2)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            loop = asyncio.get_running_loop()
+            done = loop.create_future()
+            recv = []
+
+            def callback(event, msg, closure):
+                # called in loop thread
+                self.assertIs(loop, asyncio.get_running_loop())
+                recv.append(msg.getI32('SEQ'))
+                if len(recv) == 5:
+                    done.set_result(True)
+
+            subj = tx.inbox()
+            lst = TibrvListener()
+            status = lst.create(que, TibrvMsgCallback(callback), tx, subj)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            m = TibrvMsg.create()
+            for x in range(5):
+                m.setI32('SEQ', x)
+                tx.send(m, subj)
+
+            await done
+            self.assertEqual([0, 1, 2, 3, 4], recv)
+
+            m.destroy()
+            lst.destroy()
+            que.destroy()
+            tx.destroy()
+
+        asyncio.run(asyncio.wait_for(run(), 10))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,4 +1,5 @@
 import time
+import threading
 from pytibrv.Tibrv import *
 import unittest
 
@@ -33,6 +34,160 @@ class DispatcherTest(unittest.TestCase):
         del disp
         del que
 
+    def test_destroy(self):
+
+        tx = TibrvTx()
+        tx.create(None, None, None)
+        que = TibrvQueue()
+        que.create('TEST.DISP.DESTROY')
+
+        recv = []
+        lst = TibrvListener()
+        lst.create(que, TibrvMsgCallback(lambda ev, msg, cz: recv.append(1)), tx, 'TEST.DISP.DESTROY')
+
+        disp = TibrvDispatcher()
+        status = disp.create(que)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        msg = TibrvMsg.create()
+        tx.send(msg, 'TEST.DISP.DESTROY')
+        for x in range(100):
+            if recv:
+                break
+            time.sleep(0.01)
+        self.assertEqual(1, len(recv))
+
+        # no dispatch after destroy
+        status = disp.destroy()
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        tx.send(msg, 'TEST.DISP.DESTROY')
+        time.sleep(0.2)
+        self.assertEqual(1, len(recv))
+        self.assertEqual(1, que.count())
+
+        msg.destroy()
+        lst.destroy()
+        que.destroy()
+        tx.destroy()
+
+    def test_sharded(self):
+
+        tx = TibrvTx()
+        status = tx.create(None, None, None)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        que = TibrvQueue()
+        que.create('TEST.SHARD')
+
+        seen = {}
+        threads = {}
+
+        def on_msg(event, msg, closure):
+            sym = msg.getStr('SYM')
+            seen.setdefault(sym, []).append(msg.getI32('SEQ'))
+            threads.setdefault(sym, set()).add(threading.get_ident())
+
+        sd = TibrvShardedDispatcher(4, 'SYM')
+        status = sd.create(que, 0.1)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(4, sd.workers())
+
+        lst = TibrvListener()
+        status = lst.create(que, sd.callback(on_msg), tx, 'TEST.SHARD.>')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        msg = TibrvMsg.create()
+        for x in range(200):
+            for sym in ['A', 'B', 'C', 'D', 'E']:
+                msg.setStr('SYM', sym)
+                msg.setI32('SEQ', x)
+                tx.send(msg, 'TEST.SHARD.' + sym)
+
+        for x in range(500):
+            if sum(s['processed'] for s in sd.stats()) == 1000:
+                break
+            time.sleep(0.01)
+
+        stats = sd.stats()
+        self.assertEqual(1000, sum(s['processed'] for s in stats))
+        self.assertEqual(0, sum(s['dropped'] for s in stats))
+
+        # order per key, one worker per key
+        for sym in ['A', 'B', 'C', 'D', 'E']:
+            self.assertEqual(list(range(200)), seen[sym])
+            self.assertEqual(1, len(threads[sym]))
+
+        lst.destroy()
+        sd.destroy()
+        msg.destroy()
+        que.destroy()
+        tx.destroy()
+
+    def test_sharded_pressure(self):
+
+        tx = TibrvTx()
+        tx.create(None, None, None)
+
+        que = TibrvQueue()
+        que.create('TEST.SHARD')
+
+        gate = threading.Event()
+        signals = []
+
+        def on_msg(event, msg, closure):
+            gate.wait()
+
+        def on_pressure(shard, depth, high):
+            signals.append((shard, high))
+
+        sd = TibrvShardedDispatcher(1, None, 10, TibrvQueue.DISCARD_NEW)
+        status = sd.create([que], 0.1, on_pressure)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        lst = TibrvListener()
+        lst.create(que, sd.callback(on_msg), tx, 'TEST.SHARD')
+
+        # worker is blocked in callback
+        msg = TibrvMsg.create()
+        tx.send(msg, 'TEST.SHARD')
+        for x in range(500):
+            s = sd.stats()[0]
+            if s['maxDepth'] == 1 and s['depth'] == 0:
+                break
+            time.sleep(0.01)
+
+        for x in range(49):
+            tx.send(msg, 'TEST.SHARD')
+
+        for x in range(500):
+            s = sd.stats()[0]
+            if s['dropped'] + s['depth'] == 49:
+                break
+            time.sleep(0.01)
+
+        # 1 in callback, 10 in buffer
+        s = sd.stats()[0]
+        self.assertEqual(10, s['depth'])
+        self.assertEqual(39, s['dropped'])
+        self.assertEqual([0], sd.pressure())
+        self.assertEqual([(0, True)], signals)
+
+        gate.set()
+        for x in range(500):
+            if sd.stats()[0]['processed'] == 11:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(11, sd.stats()[0]['processed'])
+        self.assertEqual([], sd.pressure())
+        self.assertEqual([(0, True), (0, False)], signals)
+
+        lst.destroy()
+        sd.destroy()
+        msg.destroy()
+        que.destroy()
+        tx.destroy()
+
 
 if __name__ == "__main__" :
     unittest.main(verbosity=2)
@@ -1,4 +1,5 @@
 import datetime
+import pickle
 import time
 from pytibrv.Tibrv import *
 import unittest
@@ -69,6 +70,174 @@ class EventTest(unittest.TestCase, TibrvMsgCallback):
         del que
         del tx
 
+    def test_vector(self):
+
+        tx = TibrvTx()
+        status = tx.create(None, None, None)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        que = TibrvQueue()
+        status = que.create('TEST.VECTOR')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        batches = []
+        kept = []
+
+        def vector(event, msgs, closure):
+            self.assertIsInstance(event, TibrvVectorListener)
+            self.assertEqual('CLOSURE', closure)
+            batches.append([m.getI32('SEQ') for m in msgs])
+
+            # keep one msg after callback returned
+            if len(kept) == 0:
+                status = msgs[0].detach()
+                self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+                kept.append(msgs[0])
+
+        subj = tx.inbox()
+        lst = TibrvVectorListener()
+        status = lst.create(que, TibrvMsgVectorCallback(vector), tx, subj, 'CLOSURE')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        # created already, event is not replaced
+        ev = lst.id()
+        status = lst.create(que, TibrvMsgVectorCallback(vector), tx, subj, 'CLOSURE')
+        self.assertEqual(TIBRV_ID_IN_USE, status)
+        self.assertEqual(ev, lst.id())
+
+        m = TibrvMsg.create()
+        for x in range(5):
+            m.setI32('SEQ', x)
+            status = tx.send(m, subj)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        # one dispatch, deliver all pending msgs in one batch
+        status = que.timedDispatch(1.0)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual([[0, 1, 2, 3, 4]], batches)
+
+        m.setI32('SEQ', 5)
+        tx.send(m, subj)
+        que.timedDispatch(1.0)
+        self.assertEqual([5], batches[1])
+
+        # detached msg is not reused by next batch
+        self.assertEqual(0, kept[0].getI32('SEQ'))
+        kept[0].destroy()
+
+        st = lst.stats()
+        self.assertEqual(2, st['batches'])
+        self.assertEqual(6, st['messages'])
+        self.assertEqual(1, st['last'])
+        self.assertEqual(5, st['max'])
+
+        m.destroy()
+        lst.destroy()
+        que.destroy()
+        tx.destroy()
+
+    def test_array_view(self):
+
+        tx = TibrvTx()
+        status = tx.create(None, None, None)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        que = TibrvQueue()
+        status = que.create('TEST.VIEW')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        kept = []
+
+        def on_msg(event, msg, closure):
+            view = msg.listF64('F64', as_array=True)
+            if msg.getI32('SEQ') == 0:
+                # released after callback
+                kept.append((msg, view, None))
+            else:
+                # exported (as numpy.asarray), msg is detached
+                kept.append((msg, view, pickle.PickleBuffer(view)))
+
+        subj = tx.inbox()
+        lst = TibrvListener()
+        status = lst.create(que, TibrvMsgCallback(on_msg), tx, subj)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        m = TibrvMsg.create()
+        m.setF64('F64', [1.0, 2.0])
+        for x in range(2):
+            m.setI32('SEQ', x)
+            tx.send(m, subj)
+            que.timedDispatch(1.0)
+        m.destroy()
+
+        msg, view, buf = kept[0]
+        with self.assertRaises(ValueError):
+            view.tolist()
+
+        msg, view, buf = kept[1]
+        self.assertEqual([1.0, 2.0], view.tolist())
+        self.assertEqual(TIBRV_NOT_PERMITTED, msg.destroy())
+        buf.release()
+        self.assertEqual(TIBRV_OK, msg.destroy())
+
+        lst.destroy()
+        que.destroy()
+        tx.destroy()
+
+    def test_group_vector(self):
+
+        tx = TibrvTx()
+        status = tx.create(None, None, None)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        que = TibrvQueue()
+        status = que.create('TEST.GROUP')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        batches = []
+
+        def group(grp, msgs, subjects, closure):
+            self.assertIs(lst, grp)
+            self.assertEqual('CLOSURE', closure)
+            batches.append([(s, m.getI32('SEQ')) for m, s in zip(msgs, subjects)])
+
+        lst = TibrvGroupVectorListener()
+        status = lst.create(que, TibrvMsgGroupCallback(group), tx, ['TEST.G.A', 'TEST.G.B'], 'CLOSURE')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        status = lst.add('TEST.G.C')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(3, len(lst))
+
+        status = lst.add('TEST.G.C')
+        self.assertEqual(TIBRV_ID_IN_USE, status)
+
+        m = TibrvMsg.create()
+        for x, subj in enumerate(['TEST.G.A', 'TEST.G.B', 'TEST.G.C', 'TEST.G.A']):
+            m.setI32('SEQ', x)
+            tx.send(m, subj)
+
+        # msgs of all subjects in one batch
+        status = que.timedDispatch(1.0)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual([[('TEST.G.A', 0), ('TEST.G.B', 1), ('TEST.G.C', 2), ('TEST.G.A', 3)]],
+                         batches)
+
+        status = lst.remove('TEST.G.B')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(['TEST.G.A', 'TEST.G.C'], sorted(lst.subjects()))
+
+        m.setI32('SEQ', 9)
+        tx.send(m, 'TEST.G.B')
+        status = que.timedDispatch(0.1)
+        self.assertEqual(TIBRV_TIMEOUT, status, TibrvStatus.text(status))
+        self.assertEqual(1, lst.stats()['batches'])
+        self.assertEqual(4, lst.stats()['max'])
+
+        m.destroy()
+        lst.destroy()
+        que.destroy()
+        tx.destroy()
 
 
 if __name__ == "__main__" :
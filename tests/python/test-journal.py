@@ -0,0 +1,140 @@
+import os
+import tempfile
+from pytibrv.Tibrv import *
+from pytibrv.journal import *
+import unittest
+
+class JournalTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        status = Tibrv.open()
+        if status != TIBRV_OK:
+            raise TibrvError(status)
+
+    @classmethod
+    def tearDownClass(cls):
+        Tibrv.close()
+
+    def test_journal(self):
+
+        with tempfile.TemporaryDirectory() as path:
+
+            jw = TibrvJournalWriter()
+            status = jw.open(path, 4096)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            msg = TibrvMsg.create()
+            for x in range(300):
+                msg.setI32('SEQ', x)
+                msg.sendSubject = 'TEST.JNL.{}'.format('ABC'[x % 3])
+                status = jw.append(msg, ts=1000 + x)
+                self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            msg.destroy()
+
+            stats = jw.stats()
+            self.assertEqual(300, stats['records'])
+            self.assertTrue(stats['segments'] > 1)
+
+            status = jw.close()
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            jr = TibrvJournalReader()
+            status = jr.open(path)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            self.assertEqual(300, jr.count())
+            self.assertEqual(1000, jr.first())
+            self.assertEqual(1299, jr.last())
+
+            # all, in order
+            ret = [rec.timestamp for rec in jr.read()]
+            self.assertEqual(list(range(1000, 1300)), ret)
+
+            # by time, [start, end)
+            ret = list(jr.read(start=1100, end=1110))
+            self.assertEqual(10, len(ret))
+
+            rec = ret[0]
+            self.assertEqual(1100, rec.timestamp)
+            self.assertEqual('TEST.JNL.B', rec.subject)
+            self.assertTrue(isinstance(rec.data, memoryview))
+
+            m = rec.message()
+            self.assertEqual(100, m.getI32('SEQ'))
+            self.assertEqual('TEST.JNL.B', m.sendSubject)
+            m.destroy()
+
+            # by subject
+            ret = [rec.timestamp - 1000 for rec in jr.read(subject='TEST.JNL.C')]
+            self.assertEqual(list(range(2, 300, 3)), ret)
+
+            ret = list(jr.read(start=1150, subject='TEST.JNL.A'))
+            self.assertEqual(50, len(ret))
+
+            self.assertEqual(300, len(list(jr.read(subject='TEST.JNL.*'))))
+            self.assertEqual(300, len(list(jr.read(subject='TEST.>'))))
+            self.assertEqual(0, len(list(jr.read(subject='TEST.*'))))
+            self.assertEqual(0, len(list(jr.read(subject='TEST.JNL.X'))))
+
+            del ret, rec
+            jr.close()
+
+            # index is rebuilt from segment
+            for fn in os.listdir(path):
+                if fn.endswith('.idx'):
+                    os.remove(os.path.join(path, fn))
+
+            jr = TibrvJournalReader()
+            status = jr.open(path)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+            self.assertEqual(300, jr.count())
+            ret = [rec.timestamp for rec in jr.read(start=1290)]
+            self.assertEqual(list(range(1290, 1300)), ret)
+            jr.close()
+
+    def test_write_buffer(self):
+
+        import array
+
+        with tempfile.TemporaryDirectory() as path:
+
+            jw = TibrvJournalWriter()
+            jw.open(path, 4096)
+
+            # length in bytes, not items
+            data = array.array('i', range(10))
+            status = jw.write(data, 'TEST.ARRAY', 1)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            status = jw.write(memoryview(data).cast('B').cast('H'), 'TEST.ARRAY', 2)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+            jw.close()
+
+            jr = TibrvJournalReader()
+            jr.open(path)
+            ret = list(jr.read())
+            self.assertEqual(2, len(ret))
+            self.assertEqual(data.tobytes(), ret[0].data.tobytes())
+            self.assertEqual(data.tobytes(), ret[1].data.tobytes())
+
+            del ret
+            jr.close()
+
+    def test_invalid(self):
+
+        jw = TibrvJournalWriter()
+        status = jw.write(b'1234', 'TEST')
+        self.assertEqual(TIBRV_NOT_INITIALIZED, status, TibrvStatus.text(status))
+
+        status = jw.open(None)
+        self.assertEqual(TIBRV_INVALID_ARG, status, TibrvStatus.text(status))
+
+        jr = TibrvJournalReader()
+        status = jr.open('/NOT/EXIST')
+        self.assertEqual(TIBRV_FILE_NOT_FOUND, status, TibrvStatus.text(status))
+
+
+if __name__ == "__main__" :
+    unittest.main(verbosity=2)
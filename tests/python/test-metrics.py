@@ -0,0 +1,254 @@
+import sys
+import time
+import urllib.request
+from pytibrv.Tibrv import *
+from pytibrv.metrics import *
+import unittest
+
+class MetricsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        status = Tibrv.open()
+        if status != TIBRV_OK:
+            raise TibrvError(status)
+
+    @classmethod
+    def tearDownClass(cls):
+        Tibrv.close()
+
+    def setUp(self):
+        self.tx = TibrvTx()
+        self.tx.create(None, None, None)
+
+        self.que = TibrvQueue()
+        self.que.create('TEST.METRICS')
+
+        self.lst = []
+
+    def tearDown(self):
+        for lst in self.lst:
+            lst.destroy()
+        self.que.destroy()
+        self.tx.destroy()
+
+    def listen(self, callback, subj: str):
+        lst = TibrvListener()
+        status = lst.create(self.que, callback, self.tx, subj)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.lst.append(lst)
+
+    def send(self, subj: str, n: int, sent = None):
+        msg = TibrvMsg.create()
+        for x in range(n):
+            msg.setI32('SEQ', x)
+            if sent is not None:
+                msg.setI64('SENT', sent)
+            self.tx.send(msg, subj)
+        msg.destroy()
+
+    def drain(self):
+        while self.que.poll() == TIBRV_OK:
+            pass
+
+    def test_listener(self):
+
+        mt = TibrvListenerMetrics(bySubject=True, maxSubjects=2)
+        recv = []
+
+        def on_msg(event, msg, closure):
+            recv.append(msg.getI32('SEQ'))
+            time.sleep(0.001)
+
+        self.listen(mt.callback(on_msg), 'TEST.A.>')
+        self.listen(mt.callback(on_msg, 'B'), 'TEST.B')
+
+        self.send('TEST.A.1', 5)
+        self.send('TEST.A.2', 3)
+        self.send('TEST.A.3', 2)
+        self.send('TEST.B', 4)
+        self.drain()
+        self.assertEqual(14, len(recv))
+
+        ret = mt.snapshot()
+        self.assertEqual(['TEST.A.>', 'B'], sorted(ret.keys(), reverse=True))
+
+        a = ret['TEST.A.>']
+        self.assertEqual(10, a['count'])
+        self.assertEqual(0, a['errors'])
+        self.assertGreater(a['rate'], 0)
+
+        # 2 subjects, others counted as _other
+        self.assertEqual({'TEST.A.1': 5, 'TEST.A.2': 3, '_other': 2},
+                         {k: v['count'] for k, v in a['subjects'].items()})
+
+        cb = a['callbackUs']
+        self.assertEqual(10, cb['count'])
+        self.assertGreaterEqual(cb['avg'], 1000)
+        self.assertTrue(cb['p50'] <= cb['p99'] <= cb['max'], cb)
+
+        # no timestamp
+        self.assertEqual(0, a['waitUs']['count'])
+
+        # reset
+        mt.snapshot(reset=True)
+        self.assertEqual({}, mt.snapshot())
+
+    def test_wait(self):
+
+        mt = TibrvListenerMetrics(timestamp='SENT')
+        self.listen(mt.callback(lambda ev, msg, cz: None, 'W'), 'TEST.W')
+
+        # sent 50 ms ago
+        self.send('TEST.W', 5, time.time_ns() - 50000000)
+        self.drain()
+
+        w = mt.snapshot()['W']['waitUs']
+        self.assertEqual(5, w['count'])
+        self.assertTrue(50000 <= w['avg'] < 1000000, w)
+        self.assertTrue(w['p50'] >= 40000, w)
+
+        # by callable, msg without SENT
+        mt = TibrvListenerMetrics(timestamp=lambda msg: msg.getI64('SENT', default=None))
+        self.listen(mt.callback(lambda ev, msg, cz: None, 'W'), 'TEST.X')
+        self.send('TEST.X', 3)
+        self.drain()
+
+        ret = mt.snapshot()['W']
+        self.assertEqual(3, ret['count'])
+        self.assertEqual(0, ret['waitUs']['count'])
+
+    def test_error(self):
+
+        mt = TibrvListenerMetrics()
+
+        def on_msg(event, msg, closure):
+            if msg.getI32('SEQ') % 2 == 1:
+                raise ValueError('odd')
+
+        cb = mt.callback(on_msg, 'E')
+        self.listen(cb, 'TEST.E')
+        self.send('TEST.E', 4)
+
+        # exception is reported by ctypes as unraisable, not raised from poll()
+        raised = []
+        hook = sys.unraisablehook
+        sys.unraisablehook = lambda unraisable: raised.append(unraisable.exc_type)
+        try:
+            for x in range(4):
+                self.que.poll()
+        finally:
+            sys.unraisablehook = hook
+
+        self.assertEqual([ValueError, ValueError], raised)
+
+        ret = mt.snapshot()['E']
+        self.assertEqual(4, ret['count'])
+        self.assertEqual(2, ret['errors'])
+
+    def test_prometheus(self):
+
+        mt = TibrvListenerMetrics(timestamp='SENT')
+        self.listen(mt.callback(lambda ev, msg, cz: None, 'P'), 'TEST.P')
+        self.send('TEST.P', 3, time.time_ns())
+        self.drain()
+
+        text = mt.exposition()
+        self.assertIn('# TYPE pytibrv_listener_messages_total counter', text)
+        self.assertIn('pytibrv_listener_messages_total{listener="P"} 3', text)
+        self.assertIn('pytibrv_listener_callback_seconds_bucket{listener="P",le="+Inf"} 3', text)
+        self.assertIn('pytibrv_listener_callback_seconds_count{listener="P"} 3', text)
+        self.assertIn('pytibrv_listener_wait_seconds_count{listener="P"} 3', text)
+
+        # buckets are cumulative
+        counts = [int(line.split()[-1]) for line in text.splitlines()
+                  if line.startswith('pytibrv_listener_callback_seconds_bucket')]
+        self.assertEqual(counts, sorted(counts))
+
+        mt.serve(0)
+        try:
+            addr, port = mt.address()
+            with urllib.request.urlopen('http://127.0.0.1:{}/metrics'.format(port)) as r:
+                self.assertEqual(200, r.status)
+                self.assertIn('pytibrv_listener_messages_total{listener="P"} 3', r.read().decode())
+        finally:
+            mt.shutdown()
+
+        self.assertIsNone(mt.address())
+
+    def test_queue_monitor(self):
+
+        que = TibrvQueue()
+        que.create('TEST.MONITOR')
+        que.setPolicy(TibrvQueue.DISCARD_FIRST, 100, 10)
+        lst = TibrvListener()
+        lst.create(que, TibrvMsgCallback(), self.tx, 'TEST.Q')
+
+        alerts = []
+        mon = TibrvQueueMonitor(horizon=1000.0)
+        mon.hook(lambda name, alert, stats: alerts.append((name, alert, stats['depth'])))
+
+        # broken hook, counted, other hooks still called
+        def broken(name, alert, stats):
+            raise ValueError(alert)
+        mon.hook(broken)
+        self.assertEqual(TIBRV_OK, mon.add(que))
+        self.assertEqual(TIBRV_ID_IN_USE, mon.add(que))
+        self.assertEqual(TIBRV_INVALID_QUEUE, mon.add(None))
+
+        # growing : 10 -> 50 -> 85
+        for n in [10, 40, 35]:
+            self.send('TEST.Q', n)
+            time.sleep(0.01)
+            mon.sample()
+
+        st = mon.stats()['TEST.MONITOR']
+        self.assertEqual(85, st['depth'])
+        self.assertEqual(10, st['min'])
+        self.assertEqual(85, st['max'])
+        self.assertTrue(10 < st['ewma'] < 85, st)
+        self.assertGreater(st['growth'], 0)
+        self.assertEqual(100, st['maxEvents'])
+        self.assertIsNotNone(st['timeToOverflow'])
+        self.assertIsNone(st['timeToDrain'])
+        self.assertEqual([('TEST.MONITOR', 'overflow', 50), ('TEST.MONITOR', 'high', 85)], alerts)
+        self.assertEqual(2, st['hookErrors'])
+        self.assertIsInstance(st['lastHookError'], ValueError)
+        self.assertEqual('high', str(st['lastHookError']))
+
+        # draining : 85 -> 40
+        for x in range(45):
+            que.poll()
+        time.sleep(0.01)
+        mon.sample()
+
+        st = mon.stats()['TEST.MONITOR']
+        self.assertEqual(40, st['depth'])
+        self.assertEqual(('TEST.MONITOR', 'normal', 40), alerts[-1])
+
+        text = mon.exposition()
+        self.assertIn('pytibrv_queue_depth{queue="TEST.MONITOR"} 40.0', text)
+        self.assertIn('pytibrv_queue_max_events{queue="TEST.MONITOR"} 100.0', text)
+        self.assertIn('pytibrv_queue_hook_errors_total{queue="TEST.MONITOR"} 3', text)
+
+        lst.destroy()
+        que.destroy()
+
+    def test_queue_monitor_timer(self):
+
+        mon = TibrvQueueMonitor(interval=0.05)
+        mon.add(self.que, 'Q', maxEvents=1000)
+
+        status = mon.create()
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(TIBRV_ID_IN_USE, mon.create())
+
+        time.sleep(0.5)
+        status = mon.destroy()
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        self.assertGreaterEqual(mon.stats()['Q']['samples'], 3)
+
+
+if __name__ == "__main__" :
+    unittest.main(verbosity=2)
@@ -1,7 +1,14 @@
 from pytibrv.Tibrv import *
 from ctypes import c_float
+import array
+import pickle
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 class MsgTest(unittest.TestCase):
 
     @classmethod
@@ -361,5 +368,298 @@ class MsgTest(unittest.TestCase):
         msg2.destroy()
         msg3.destroy()
 
+    def test_array_view(self):
+
+        msg = TibrvMsg.create()
+        self.assertIsNotNone(msg)
+
+        data = [1.1,2.2,3.3,4.4,5.5]
+        status = msg.setF64('F64', data)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        # no copy, memoryview
+        ret = msg.listF64('F64', as_array=True)
+        self.assertIsInstance(ret, memoryview)
+        self.assertIsNotNone(ret)
+        self.assertEqual(len(data), len(ret))
+        self.assertEqual(data, ret.tolist())
+
+        ret = msg.list(tibrv_f64, 'F64', as_array=True)
+        self.assertEqual(data, ret.tolist())
+
+        # copy once
+        cp = msg.listF64('F64', as_array=True, copy=True)
+        self.assertEqual(data, cp.tolist())
+
+        ret = msg.listF64('NOT_EXIST', as_array=True, default=None)
+        self.assertIsNone(ret)
+
+        # views dropped by caller are not kept by message
+        for x in range(1000):
+            msg.listF64('F64', as_array=True)
+        self.assertLessEqual(len(msg._views), 64)
+
+        # view was released, copy is still alive
+        view = msg.listF64('F64', as_array=True)
+        msg.destroy()
+        self.assertEqual(data, cp.tolist())
+
+        with self.assertRaises(ValueError):
+            view.tolist()
+
+    def test_array_view_exported(self):
+
+        msg = TibrvMsg.create()
+        data = [1.1,2.2,3.3]
+        msg.setF64('F64', data)
+
+        # view exported (as numpy.asarray), could not be released
+        view = msg.listF64('F64', as_array=True)
+        buf = pickle.PickleBuffer(view)
+
+        msg.reset()
+        self.assertEqual(TIBRV_NOT_PERMITTED, msg.error().code())
+        self.assertEqual(data, view.tolist())
+
+        status = msg.destroy()
+        self.assertEqual(TIBRV_NOT_PERMITTED, status, TibrvStatus.text(status))
+        self.assertNotEqual(0, msg.id())
+        self.assertEqual(data, view.tolist())
+
+        # export dropped, view is released with message
+        buf.release()
+        status = msg.destroy()
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        with self.assertRaises(ValueError):
+            view.tolist()
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_array_numpy(self):
+
+        msg = TibrvMsg.create()
+        data = [1.1,2.2,3.3]
+        msg.setF64('F64', data)
+
+        # copy is numpy.ndarray, alive after destroy
+        cp = msg.listF64('F64', as_array=True, copy=True)
+        self.assertIsInstance(cp, numpy.ndarray)
+
+        # no copy is memoryview, numpy.asarray() blocks reset/destroy
+        view = msg.listF64('F64', as_array=True)
+        self.assertIsInstance(view, memoryview)
+        arr = numpy.asarray(view)
+        self.assertEqual(data, arr.tolist())
+
+        msg.reset()
+        self.assertEqual(TIBRV_NOT_PERMITTED, msg.error().code())
+        self.assertEqual(TIBRV_NOT_PERMITTED, msg.destroy())
+        self.assertEqual(data, arr.tolist())
+
+        del arr
+        self.assertEqual(TIBRV_OK, msg.destroy())
+        self.assertEqual(data, cp.tolist())
+        with self.assertRaises(ValueError):
+            view.tolist()
+
+    def test_array_buffer(self):
+
+        msg = TibrvMsg.create()
+        self.assertIsNotNone(msg)
+
+        data = array.array('d', [1.1,2.2,3.3,4.4,5.5])
+        status = msg.addF64('F64', data)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(data.tolist(), msg.listF64('F64'))
+
+        data = array.array('H', [1,2,3])
+        status = msg.set(tibrv_u16, 'U16', data)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(data.tolist(), msg.listU16('U16'))
+
+        # format mismatch
+        status = msg.setF64('F64', array.array('f', [1.0]))
+        self.assertEqual(TIBRV_INVALID_ARG, status, TibrvStatus.text(status))
+
+        msg.destroy()
+
+    def test_dict(self):
+
+        msg = TibrvMsg.create()
+        self.assertIsNotNone(msg)
+        self.assertEqual({}, msg.toDict())
+
+        sub = TibrvMsg.create()
+        sub.setStr('NAME', 'SUB')
+
+        msg.setI32('I32', 123)
+        msg.setStr('STR', 'TEST')
+        msg.setF64('F64', [1.1,2.2])
+        msg.setMsg('MSG', sub)
+
+        ret = msg.toDict()
+        self.assertEqual({'I32': 123, 'STR': 'TEST', 'F64': [1.1,2.2], 'MSG': {'NAME': 'SUB'}}, ret)
+
+        sub.destroy()
+        msg.destroy()
+
+    def test_projection(self):
+
+        msg = TibrvMsg.create()
+        self.assertIsNotNone(msg)
+
+        msg.setF64('BID', 1.1)
+        msg.setF64('ASK', 1.2)
+        msg.setI32('SIZE', 100)
+        msg.setStr('SYMBOL', 'TEST')
+
+        proj = TibrvMsgProjection(['BID', 'ASK', ('SIZE', tibrv_i32), ('SYMBOL', tibrv_str),
+                                   ('LAST', tibrv_f64, 0.0), 'HIGH'])
+        self.assertEqual(6, len(proj))
+
+        ret = proj.extract(msg)
+        self.assertEqual((1.1, 1.2, 100, 'TEST', 0.0, None), ret)
+        self.assertIsNone(proj.error())
+
+        # TIBRV conversion
+        proj = TibrvMsgProjection([('SIZE', tibrv_f64), ('SIZE', tibrv_str)])
+        self.assertEqual((100.0, '100'), proj.extract(msg))
+
+        # conversion failed -> default
+        proj = TibrvMsgProjection([('SYMBOL', tibrv_i32, -1)])
+        self.assertEqual((-1,), proj.extract(msg))
+        self.assertEqual(TIBRV_CONVERSION_FAILED, proj.error().code())
+
+        with self.assertRaises(TypeError):
+            TibrvMsgProjection([('BID', float)])
+
+        msg.destroy()
+
+    def test_schema(self):
+
+        @tibrv_message
+        class Leg:
+            symbol: tibrv_str
+            qty: tibrv_i32 = 0
+
+        @tibrv_message
+        class Order:
+            price: tibrv_f64
+            qty: tibrv_i32
+            buy: bool
+            curve: list[tibrv_f64]
+            tags: list[tibrv_str]
+            main: Leg
+            legs: list[Leg]
+            note: tibrv_str = 'NONE'
+
+        self.assertEqual(['symbol', 'qty'], Leg.__tibrv_schema__.fields())
+
+        leg1 = Leg()
+        leg1.symbol = 'A'
+        leg1.qty = 1
+
+        leg2 = Leg()
+        leg2.symbol = 'B'
+
+        order = Order()
+        order.price = 1.5
+        order.qty = 100
+        order.buy = True
+        order.curve = array.array('d', [1.1, 2.2])
+        order.tags = ['X', 'Y']
+        order.main = leg1
+        order.legs = [leg1, leg2]
+
+        msg = Order.encode(order)
+        self.assertIsNotNone(msg)
+
+        # same as TibrvMsg.addXXX
+        self.assertEqual(1.5, msg.getF64('price'))
+        self.assertEqual(100, msg.getI32('qty'))
+        self.assertEqual([1.1, 2.2], msg.listF64('curve'))
+        self.assertEqual(['X', 'Y'], msg.listStr('tags'))
+        self.assertEqual('A', msg.getMsg('main').getStr('symbol'))
+        self.assertEqual('NONE', msg.getStr('note'))
+
+        ret = Order.decode(msg)
+        self.assertIsInstance(ret, Order)
+        self.assertEqual(1.5, ret.price)
+        self.assertEqual(100, ret.qty)
+        self.assertEqual(True, ret.buy)
+        self.assertEqual([1.1, 2.2], ret.curve)
+        self.assertEqual(['X', 'Y'], ret.tags)
+        self.assertEqual('A', ret.main.symbol)
+        self.assertEqual(['A', 'B'], [x.symbol for x in ret.legs])
+        self.assertEqual([1, 0], [x.qty for x in ret.legs])
+        self.assertEqual('NONE', ret.note)
+
+        msg.destroy()
+
+        self.assertIsNone(Order.__tibrv_schema__.error())
+
+        # invalid array
+        order.curve = array.array('f', [1.0])
+        self.assertIsNone(Order.encode(order))
+        self.assertEqual(TIBRV_INVALID_ARG, Order.__tibrv_schema__.error().code())
+
+        self.assertIsNone(Order.decode(0))
+        self.assertEqual(TIBRV_INVALID_MSG, Order.__tibrv_schema__.error().code())
+
+        with self.assertRaises(TypeError):
+            @tibrv_message
+            class Invalid:
+                price: float
+    def test_bytes(self):
+
+        msg = TibrvMsg.create()
+        msg.setI32('I32', 123)
+        msg.setStr('STR', 'TEST')
+        msg.setF64('F64', [1.5, 2.5])
+        msg.sendSubject = 'TEST.BYTES'
+        msg.replySubject = 'TEST.REPLY'
+
+        # no copy
+        view = msg.asBytes()
+        self.assertIsNotNone(view)
+        self.assertEqual(msg.bytes(), len(view))
+
+        data = bytes(msg)
+        self.assertEqual(bytes(view), data)
+
+        cc = TibrvMsg.from_bytes(data)
+        self.assertIsNotNone(cc)
+        self.assertEqual(123, cc.getI32('I32'))
+        self.assertEqual('TEST', cc.getStr('STR'))
+        self.assertEqual([1.5, 2.5], cc.listF64('F64'))
+        cc.destroy()
+
+        cc = TibrvMsg.from_bytes(view)
+        self.assertEqual(123, cc.getI32('I32'))
+        cc.destroy()
+
+        self.assertIsNone(TibrvMsg.from_bytes(b''))
+
+        # copy into buffer
+        buf = bytearray(len(data) + 10)
+        status, ret = tibrvMsg_GetAsBytesCopy(msg.id(), buf)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(data, bytes(ret))
+
+        status, ret = tibrvMsg_GetAsBytesCopy(msg.id(), bytearray(4))
+        self.assertEqual(TIBRV_INSUFFICIENT_BUFFER, status, TibrvStatus.text(status))
+
+        # pickle with subjects
+        cc = pickle.loads(pickle.dumps(msg))
+        self.assertEqual(123, cc.getI32('I32'))
+        self.assertEqual('TEST.BYTES', cc.sendSubject)
+        self.assertEqual('TEST.REPLY', cc.replySubject)
+        cc.destroy()
+
+        # view was released
+        msg.destroy()
+        with self.assertRaises(ValueError):
+            view.tobytes()
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
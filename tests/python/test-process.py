@@ -0,0 +1,102 @@
+import os
+import time
+import multiprocessing
+from pytibrv.Tibrv import *
+from pytibrv.TibrvProcess import *
+import unittest
+
+class Collector:
+    # handler in worker process, picklable
+    def __init__(self, out):
+        self.out = out
+
+    def __call__(self, msg: TibrvMsg):
+        self.out.put((msg.sendSubject, msg.getStr('SYM'), msg.getI32('SEQ'), os.getpid()))
+
+
+class ProcessFanoutTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        status = Tibrv.open()
+        if status != TIBRV_OK:
+            raise TibrvError(status)
+
+    @classmethod
+    def tearDownClass(cls):
+        Tibrv.close()
+
+    def test_fanout(self):
+
+        # fork: workers share TIBRV library loaded by test runner
+        ctx = multiprocessing.get_context('fork')
+        out = ctx.Queue()
+
+        fan = TibrvProcessFanout(Collector(out), 3, 'SYM', capacity=4096, method='fork')
+        status = fan.start()
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(3, fan.workers())
+
+        tx = TibrvTx()
+        tx.create(None, None, None)
+
+        que = TibrvQueue()
+        que.create('TEST.FANOUT')
+
+        lst = TibrvListener()
+        status = lst.create(que, fan.callback(), tx, 'TEST.FANOUT.>')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        syms = ['A', 'B', 'C', 'D', 'E', 'F']
+        msg = TibrvMsg.create()
+        for x in range(100):
+            for sym in syms:
+                msg.setStr('SYM', sym)
+                msg.setI32('SEQ', x)
+                tx.send(msg, 'TEST.FANOUT.' + sym)
+
+        while que.poll() == TIBRV_OK:
+            pass
+
+        ret = [out.get(timeout=10) for x in range(600)]
+
+        seen = {}
+        pids = {}
+        for subj, sym, seq, pid in ret:
+            self.assertEqual('TEST.FANOUT.' + sym, subj)
+            seen.setdefault(sym, []).append(seq)
+            pids.setdefault(sym, set()).add(pid)
+
+        # order per key, one worker per key
+        for sym in syms:
+            self.assertEqual(list(range(100)), seen[sym])
+            self.assertEqual(1, len(pids[sym]))
+
+        for x in range(100):
+            stats = fan.stats()
+            if sum(s['processed'] for s in stats) == 600:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(600, sum(s['sent'] for s in stats))
+        self.assertEqual(600, sum(s['processed'] for s in stats))
+        self.assertEqual(0, sum(s['errors'] for s in stats))
+        self.assertEqual(0, sum(s['dropped'] for s in stats))
+        for s in stats:
+            self.assertEqual(0, s['depth'])
+            if s['processed'] > 0:
+                self.assertTrue(s['latencyMaxUs'] >= s['latencyAvgUs'] > 0)
+                self.assertTrue(0.0 < s['utilization'] < 1.0)
+
+        status = fan.stop()
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(0, fan.workers())
+
+        lst.destroy()
+        msg.destroy()
+        que.destroy()
+        tx.destroy()
+
+
+if __name__ == "__main__" :
+    unittest.main(verbosity=2)
@@ -0,0 +1,135 @@
+import time
+from pytibrv.Tibrv import *
+import unittest
+
+class QueueGroupTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        status = Tibrv.open()
+        if status != TIBRV_OK:
+            raise TibrvError(status)
+
+    @classmethod
+    def tearDownClass(cls):
+        Tibrv.close()
+
+    def test_create(self):
+
+        grp = TibrvQueueGroup()
+        status = grp.create()
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        que = TibrvQueue()
+        status = que.create('TEST')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        status = grp.add(que)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual([que], grp.queues())
+
+        # add twice
+        status = grp.add(que)
+        self.assertEqual(TIBRV_ID_IN_USE, status, TibrvStatus.text(status))
+
+        # empty
+        status = grp.poll()
+        self.assertEqual(TIBRV_TIMEOUT, status, TibrvStatus.text(status))
+
+        status = grp.remove(que)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual([], grp.queues())
+
+        status = grp.destroy()
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        status = grp.destroy()
+        self.assertEqual(TIBRV_INVALID_QUEUE_GROUP, status, TibrvStatus.text(status))
+
+        que.destroy()
+
+    def test_priority(self):
+
+        tx = TibrvTx()
+        status = tx.create(None, None, None)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        # control traffic ahead of bulk data
+        ctrl = TibrvQueue()
+        ctrl.create('CTRL')
+        ctrl.priority = 10
+
+        data = TibrvQueue()
+        data.create('DATA')
+        data.priority = 1
+
+        grp = TibrvQueueGroup()
+        grp.create()
+        grp.add(data)
+        grp.add(ctrl)
+
+        order = []
+
+        def on_msg(event, msg, closure):
+            order.append(closure)
+
+        cb = TibrvMsgCallback(on_msg)
+
+        lst1 = TibrvListener()
+        status = lst1.create(ctrl, cb, tx, 'TEST.QGROUP.CTRL', 'CTRL')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        lst2 = TibrvListener()
+        status = lst2.create(data, cb, tx, 'TEST.QGROUP.DATA', 'DATA')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        # bulk data first, then control
+        msg = TibrvMsg.create()
+        for x in range(1000):
+            msg.setI32('seq', x)
+            tx.send(msg, 'TEST.QGROUP.DATA')
+
+        for x in range(10):
+            msg.setI32('seq', x)
+            tx.send(msg, 'TEST.QGROUP.CTRL')
+
+        for x in range(100):
+            if ctrl.count() == 10 and data.count() == 1000:
+                break
+            time.sleep(0.01)
+
+        while grp.poll() == TIBRV_OK:
+            pass
+
+        self.assertEqual(1010, len(order))
+        self.assertEqual(['CTRL'] * 10, order[:10])
+        self.assertEqual(['DATA'] * 1000, order[10:])
+
+        # one dispatcher for the group
+        order.clear()
+        disp = TibrvDispatcher()
+        status = disp.create(grp, 0.1)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        tx.send(msg, 'TEST.QGROUP.DATA')
+        tx.send(msg, 'TEST.QGROUP.CTRL')
+
+        for x in range(100):
+            if len(order) == 2:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(['CTRL', 'DATA'], sorted(order))
+
+        disp.destroy()
+        lst1.destroy()
+        lst2.destroy()
+        msg.destroy()
+        grp.destroy()
+        ctrl.destroy()
+        data.destroy()
+        tx.destroy()
+
+
+if __name__ == "__main__" :
+    unittest.main(verbosity=2)
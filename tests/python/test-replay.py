@@ -0,0 +1,135 @@
+import time
+import threading
+import tempfile
+from pytibrv.Tibrv import *
+from pytibrv.journal import *
+from pytibrv.replay import *
+import unittest
+
+class ReplayTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        status = Tibrv.open()
+        if status != TIBRV_OK:
+            raise TibrvError(status)
+
+    @classmethod
+    def tearDownClass(cls):
+        Tibrv.close()
+
+    def setUp(self):
+        self.path = tempfile.TemporaryDirectory()
+
+        # 50 msgs, 2 ms apart
+        jw = TibrvJournalWriter()
+        jw.open(self.path.name, 1 << 16)
+        msg = TibrvMsg.create()
+        for x in range(50):
+            msg.setI32('SEQ', x)
+            msg.sendSubject = 'MD.{}'.format('AB'[x % 2])
+            jw.append(msg, ts=x * 2000000)
+        msg.destroy()
+        jw.close()
+
+        self.jr = TibrvJournalReader()
+        self.jr.open(self.path.name)
+
+        self.tx = TibrvTx()
+        self.tx.create(None, None, None)
+
+        self.que = TibrvQueue()
+        self.que.create('TEST.REPLAY')
+
+        self.recv = []
+
+        def on_msg(event, msg, closure):
+            self.recv.append((msg.sendSubject, msg.getI32('SEQ')))
+
+        self.lst = TibrvListener()
+        self.lst.create(self.que, TibrvMsgCallback(on_msg), self.tx, 'TEST.>')
+
+    def tearDown(self):
+        self.lst.destroy()
+        self.que.destroy()
+        self.tx.destroy()
+        self.jr.close()
+        self.path.cleanup()
+
+    def drain(self):
+        while self.que.poll() == TIBRV_OK:
+            pass
+
+    def test_speed(self):
+
+        rp = TibrvReplayer(self.tx)
+
+        # 98 ms recorded, 2x -> 49 ms
+        status = rp.replay(self.jr, speed=2.0, remap=lambda s: 'TEST.' + s)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        stats = rp.stats()
+        self.assertEqual(50, stats['sent'])
+        self.assertTrue(0.045 <= stats['elapsed'] < 0.5, stats)
+        self.assertTrue(stats['lateMaxUs'] >= stats['lateAvgUs'] >= 0)
+
+        self.drain()
+        self.assertEqual(50, len(self.recv))
+        self.assertEqual(('TEST.MD.A', 0), self.recv[0])
+        self.assertEqual(list(range(50)), [x[1] for x in self.recv])
+
+    def test_fast(self):
+
+        rp = TibrvReplayer(self.tx)
+
+        # as fast as possible, remap by dict, filter
+        status = rp.replay(self.jr, speed=0, remap={'MD.A': 'TEST.A'},
+                           accept=lambda rec: rec.subject == 'MD.A')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        stats = rp.stats()
+        self.assertEqual(25, stats['sent'])
+        self.assertEqual(25, stats['skipped'])
+        self.assertTrue(stats['elapsed'] < 0.045, stats)
+        self.assertTrue(stats['rate'] > 0)
+
+        self.drain()
+        self.assertEqual([('TEST.A', x) for x in range(0, 50, 2)], self.recv)
+
+    def test_rate(self):
+
+        rp = TibrvReplayer(self.tx)
+
+        # max 1000 msgs/sec, 10 msgs -> 9 ms at least
+        recs = list(self.jr.read(subject='MD.B'))[:10]
+        status = rp.replay(recs, speed=0, rate=1000, remap=lambda s: 'TEST.' + s)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        stats = rp.stats()
+        self.assertEqual(10, stats['sent'])
+        self.assertTrue(stats['elapsed'] >= 0.009, stats)
+        del recs
+
+        self.drain()
+        self.assertEqual([('TEST.MD.B', x) for x in range(1, 20, 2)], self.recv)
+
+    def test_stop(self):
+
+        rp = TibrvReplayer(self.tx)
+
+        # recorded 98 ms, 100x slower, stopped by other thread
+        timer = threading.Timer(0.02, rp.stop)
+        timer.start()
+
+        t = time.perf_counter()
+        status = rp.replay(self.jr, speed=0.01, remap=lambda s: 'TEST.' + s)
+        t = time.perf_counter() - t
+
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertTrue(t < 1.0)
+        self.assertEqual(1, rp.stats()['sent'])
+        self.assertFalse(rp.running())
+
+
+if __name__ == "__main__" :
+    unittest.main(verbosity=2)
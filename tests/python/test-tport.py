@@ -1,3 +1,5 @@
+import asyncio
+import time
 from pytibrv.Tibrv import *
 import unittest
 
@@ -97,6 +99,249 @@ class TransportTest(unittest.TestCase):
         del msg
         del tx
 
+    def test_pool(self):
+        tx = TibrvTx()
+        status = tx.create(None, None, None)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        pool = TibrvMsgPool(2)
+
+        with pool.message() as msg:
+            msg.setStr('DATA', 'TEST')
+            status = tx.send(msg, 'TEST.A')
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+            # not returned by send in with-block
+            self.assertEqual('TEST', msg.getStr('DATA'))
+            self.assertEqual(1, pool.stats()['inUse'])
+
+        st = pool.stats()
+        self.assertEqual(0, st['inUse'])
+        self.assertEqual(1, st['free'])
+        self.assertEqual(1, st['created'])
+
+        # reused and reset
+        msg = pool.acquire()
+        self.assertEqual(0, msg.count())
+        self.assertEqual(1, pool.stats()['reused'])
+
+        msg.setStr('DATA', 'TEST')
+        status = tx.send(msg, 'TEST.B')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(0, pool.stats()['inUse'])
+
+        # high water mark, over size
+        msgs = [pool.acquire() for x in range(3)]
+        for m in msgs:
+            m.destroy()
+
+        st = pool.stats()
+        self.assertEqual(3, st['highWater'])
+        self.assertEqual(0, st['inUse'])
+        self.assertEqual(2, st['free'])
+        self.assertEqual(1, st['dropped'])
+
+        # not from this pool
+        m = TibrvMsg.create()
+        self.assertEqual(TIBRV_INVALID_MSG, pool.release(m))
+        m.destroy()
+
+        pool.destroy()
+        self.assertEqual(0, pool.stats()['free'])
+
+        del tx
+
+    def test_request_future(self):
+        tx = TibrvTx()
+        status = tx.create(None, None, None)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        # responder
+        def echo(event, msg, closure):
+            reply = TibrvMsg.create()
+            reply.setI32('SEQ', msg.getI32('SEQ'))
+            tx.sendReply(reply, msg)
+            reply.destroy()
+
+        que = TibrvQueue()
+        que.create('TEST.ECHO')
+        lst = TibrvListener()
+        status = lst.create(que, TibrvMsgCallback(echo), tx, 'TEST.ECHO')
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        disp = TibrvDispatcher()
+        disp.create(que)
+
+        futs = []
+        for x in range(100):
+            msg = TibrvMsg.create()
+            msg.setI32('SEQ', x)
+            futs.append(tx.requestFuture(msg, 5.0, 'TEST.ECHO'))
+            msg.destroy()
+
+        for x in range(100):
+            status, reply = futs[x].result(10.0)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+            self.assertEqual(x, reply.getI32('SEQ'))
+            reply.destroy()
+
+        # no responder
+        msg = TibrvMsg.create()
+        status, reply = tx.requestFuture(msg, 0.2, 'TEST.NOBODY').result(10.0)
+        self.assertEqual(TIBRV_TIMEOUT, status, TibrvStatus.text(status))
+        self.assertIsNone(reply)
+
+        # await
+        async def run():
+            msg.setI32('SEQ', 100)
+            return await asyncio.gather(*[tx.request(msg, 5.0, 'TEST.ECHO') for x in range(10)])
+
+        ret = asyncio.run(run())
+        self.assertEqual(10, len(ret))
+        for status, reply in ret:
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+            self.assertEqual(100, reply.getI32('SEQ'))
+            reply.destroy()
+
+        msg.destroy()
+        lst.destroy()
+        disp.destroy()
+        que.destroy()
+        tx.destroy()
+
+    def test_gather(self):
+        tx = TibrvTx()
+        status = tx.create(None, None, None)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        # 3 responders
+        def responder(event, msg, closure):
+            reply = TibrvMsg.create()
+            reply.setStr('NAME', closure)
+            tx.sendReply(reply, msg)
+            reply.destroy()
+
+        que = TibrvQueue()
+        que.create('TEST.GATHER')
+        lsts = []
+        for name in ['A', 'B', 'C']:
+            lst = TibrvListener()
+            status = lst.create(que, TibrvMsgCallback(responder), tx, 'TEST.GATHER', name)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+            lsts.append(lst)
+
+        disp = TibrvDispatcher()
+        disp.create(que)
+
+        msg = TibrvMsg.create()
+
+        # all replies in deadline
+        status, replies = tx.gather(msg, 'TEST.GATHER', 0.5)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(['A', 'B', 'C'], sorted([r.getStr('NAME') for r in replies]))
+        for r in replies:
+            r.destroy()
+
+        # first N, completed before timeout
+        t = time.time()
+        status, replies = tx.gather(msg, 'TEST.GATHER', 10.0, 2)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+        self.assertEqual(2, len(replies))
+        self.assertLess(time.time() - t, 5.0)
+        for r in replies:
+            r.destroy()
+
+        # no responder
+        status, replies = tx.gather(msg, 'TEST.NOBODY', 0.2)
+        self.assertEqual(TIBRV_TIMEOUT, status, TibrvStatus.text(status))
+        self.assertEqual([], replies)
+
+        # no timeout and no maxReplies, never completed
+        status, replies = tx.gather(msg, 'TEST.GATHER', None)
+        self.assertEqual(TIBRV_INVALID_ARG, status)
+        status, replies = tx.gather(msg, 'TEST.GATHER', TIBRV_WAIT_FOREVER)
+        self.assertEqual(TIBRV_INVALID_ARG, status)
+        self.assertEqual(0, tx._requester.pending())
+
+        # async iterator, exit early
+        async def run():
+            names = []
+            async for reply in tx.gatherIter(msg, 'TEST.GATHER', 10.0):
+                names.append(reply.getStr('NAME'))
+                if len(names) == 2:
+                    break
+            return names
+
+        self.assertEqual(2, len(asyncio.run(run())))
+        self.assertEqual(0, tx._requester.pending())
+
+        msg.destroy()
+        for lst in lsts:
+            lst.destroy()
+        disp.destroy()
+        que.destroy()
+        tx.destroy()
+
+    def test_inbox_pool(self):
+        tx = TibrvTx()
+        status = tx.create(None, None, None)
+        self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+
+        def echo(event, msg, closure):
+            reply = TibrvMsg.create()
+            reply.setI32('SEQ', msg.getI32('SEQ'))
+            tx.sendReply(reply, msg)
+            reply.destroy()
+
+        que = TibrvQueue()
+        que.create('TEST.POOL')
+        lst = TibrvListener()
+        lst.create(que, TibrvMsgCallback(echo), tx, 'TEST.POOL')
+        disp = TibrvDispatcher()
+        disp.create(que)
+
+        pool = tx.createInboxPool(4, 0.0)
+        self.assertIs(pool, tx.inboxPool())
+
+        msg = TibrvMsg.create()
+        for x in range(10):
+            msg.setI32('SEQ', x)
+            status, reply = tx.requestFuture(msg, 5.0, 'TEST.POOL').result(10.0)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+            self.assertEqual(x, reply.getI32('SEQ'))
+            reply.destroy()
+
+        st = pool.stats()
+        self.assertEqual(1, st['created'])
+        self.assertEqual(9, st['reused'])
+        self.assertEqual(0, st['leased'])
+        self.assertEqual(10, st['leaseCount'])
+        self.assertGreater(st['leaseMaxUs'], 0)
+
+        # exhausted, temporary inbox
+        futs = [tx.requestFuture(msg, 5.0, 'TEST.POOL') for x in range(6)]
+        for f in futs:
+            status, reply = f.result(10.0)
+            self.assertEqual(TIBRV_OK, status, TibrvStatus.text(status))
+            reply.destroy()
+
+        st = pool.stats()
+        self.assertEqual(2, st['exhausted'])
+        self.assertEqual(4, st['total'])
+        self.assertEqual(4, st['free'])
+
+        # timeout, inbox discarded
+        status, reply = tx.requestFuture(msg, 0.1, 'TEST.NOBODY').result(10.0)
+        self.assertEqual(TIBRV_TIMEOUT, status, TibrvStatus.text(status))
+        st = pool.stats()
+        self.assertEqual(1, st['discarded'])
+        self.assertEqual(3, st['total'])
+
+        msg.destroy()
+        lst.destroy()
+        disp.destroy()
+        que.destroy()
+        tx.destroy()
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)